@@ -0,0 +1,81 @@
+"""
+한투 분봉 응답 → OHLCV DataFrame 변환 벤치마크 (행별 pydantic 모델 vs 컬럼 단위 변환)
+
+    $ python -m benchmarks.hantu_frames --rows 12000 --repeat 5
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.hantu.frames import domestic_minute_chart_frame
+from src.hantu.model.domestic.chart import MinuteChartOutput2
+
+
+def make_rows(count: int) -> list[dict[str, str]]:
+    start = datetime(2024, 1, 2, 9, 0)
+    return [
+        {
+            "stck_bsop_date": (start + timedelta(minutes=i)).strftime("%Y%m%d"),
+            "stck_cntg_hour": (start + timedelta(minutes=i)).strftime("%H%M%S"),
+            "stck_prpr": str(71000 + i % 100),
+            "stck_oprc": "70900",
+            "stck_hgpr": "71100",
+            "stck_lwpr": "70800",
+            "cntg_vol": "1200",
+            "acml_tr_pbmn": "85200000",
+        }
+        for i in range(count)
+    ]
+
+
+def via_models(rows: list[dict[str, str]]) -> pd.DataFrame:
+    """변경 전 방식: 행마다 모델을 만들고 필드를 하나씩 float로 변환"""
+    candles = [MinuteChartOutput2.model_validate(row) for row in rows]
+    index = [datetime.strptime(candle.stck_bsop_date + candle.stck_cntg_hour, "%Y%m%d%H%M%S") for candle in candles]
+    data = [
+        {
+            "open": float(candle.stck_oprc),
+            "high": float(candle.stck_hgpr),
+            "low": float(candle.stck_lwpr),
+            "close": float(candle.stck_prpr),
+            "volume": float(candle.cntg_vol),
+            "value": float(candle.acml_tr_pbmn),
+        }
+        for candle in candles
+    ]
+    return pd.DataFrame(data, index=pd.DatetimeIndex(index)).sort_index()
+
+
+def best_of(fn: Callable[[list[dict[str, str]]], pd.DataFrame], rows: list[dict[str, str]], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="한투 분봉 DataFrame 변환 벤치마크")
+    parser.add_argument("--rows", type=int, default=12000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    pd.testing.assert_frame_equal(via_models(rows), domestic_minute_chart_frame(rows), check_freq=False)
+
+    before = best_of(via_models, rows, args.repeat)
+    after = best_of(domestic_minute_chart_frame, rows, args.repeat)
+
+    print(f"rows={args.rows}")
+    print(f"{'models':<10} {before * 1000:8.2f}ms  {before / args.rows * 1e6:6.2f}µs/row")
+    print(f"{'columnar':<10} {after * 1000:8.2f}ms  {after / args.rows * 1e6:6.2f}µs/row")
+    print(f"speedup    {before / after:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
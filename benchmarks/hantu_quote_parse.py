@@ -0,0 +1,64 @@
+"""
+한투 현재가 응답 검증 마이크로벤치마크
+
+요청 한 번에 드는 응답 처리 시간(네트워크 제외)을 비교합니다.
+- full: _validate_response(res.json()) 후 전체 모델 검증 (get_stock_price, get_current_price)
+- slim: 응답 바이트를 필요한 필드만 가진 모델로 한 번에 검증 (get_stock_quote, get_last_price)
+
+    $ python -m benchmarks.hantu_quote_parse --number 20000
+"""
+
+import argparse
+import json
+import timeit
+from functools import partial
+
+from requests import Response
+
+from src.hantu.base_api import HantuBaseAPI
+from src.hantu.model.domestic import stock_price
+from src.hantu.model.overseas.price import OverseasCurrentPriceResponse, OverseasLastPriceResponse
+
+
+def make_response(body: dict) -> Response:
+    res = Response()
+    res.status_code = 200
+    res._content = json.dumps(body).encode()
+    return res
+
+
+def domestic_body() -> dict:
+    output = {name: "71000" for name, field in stock_price.StockPriceOutput.model_fields.items() if field.is_required() or name.startswith("stck_")}
+    output |= {name: "0" for name in stock_price.StockPriceOutput.model_fields if name not in output}
+    return {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", "output": output}
+
+
+def overseas_body() -> dict:
+    output = dict.fromkeys(OverseasCurrentPriceResponse.model_fields["output"].annotation.model_fields, "150.25")
+    return {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", "output": output}
+
+
+def full(res: Response, model: type) -> object:
+    HantuBaseAPI._validate_response(res)
+    return model.model_validate(res.json())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="한투 현재가 응답 검증 마이크로벤치마크")
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    cases = {
+        "domestic": (make_response(domestic_body()), stock_price.ResponseBody, stock_price.QuoteResponseBody),
+        "overseas": (make_response(overseas_body()), OverseasCurrentPriceResponse, OverseasLastPriceResponse),
+    }
+
+    print(f"number={args.number}")
+    for name, (res, full_model, slim_model) in cases.items():
+        before = min(timeit.repeat(partial(full, res, full_model), number=args.number, repeat=5))
+        after = min(timeit.repeat(partial(HantuBaseAPI._validate_json, res, slim_model), number=args.number, repeat=5))
+        print(f"{name:<9} full {before / args.number * 1e6:7.2f}us/call  slim {after / args.number * 1e6:7.2f}us/call  speedup {before / after:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
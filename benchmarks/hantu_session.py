@@ -0,0 +1,131 @@
+"""
+한투 순차 현재가 조회 벤치마크 (커넥션 풀 세션 vs 호출마다 새 연결)
+
+로컬 HTTP 서버를 띄우고 HantuDomesticAPI.get_stock_price를 순차로 호출합니다.
+서버는 새 연결마다 --handshake초를 기다려 실제 서버의 TCP/TLS 핸드셰이크 비용을 흉내 냅니다.
+
+    $ python -m benchmarks.hantu_session --calls 100 --handshake 0.03
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from src.common.http_session import create_session
+from src.config import HantuConfig
+from src.hantu.domestic_api import HantuDomesticAPI
+from src.hantu.model.domestic.account_type import AccountType
+from src.hantu.rate_limiter import HantuRateLimiter
+
+STOCK_PRICE_RESPONSE = {
+    "rt_cd": "0",
+    "msg_cd": "MCA00000",
+    "msg1": "정상처리 되었습니다.",
+    "output": {
+        "stck_prpr": "71000",
+        "stck_oprc": "70500",
+        "stck_hgpr": "71500",
+        "stck_lwpr": "70000",
+        "stck_mxpr": "91000",
+        "stck_llam": "49000",
+        "stck_sdpr": "70000",
+        "prdy_vrss": "1000",
+        "prdy_vrss_sign": "2",
+        "prdy_ctrt": "1.43",
+        "acml_vol": "15000000",
+        "acml_tr_pbmn": "1065000000000",
+    },
+}
+
+
+class OneShotSession:
+    """호출마다 모듈 수준 requests.get/post를 쓰는 세션 (변경 전 동작)"""
+
+    def get(self, url: str, **kwargs: object) -> requests.Response:
+        return requests.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs: object) -> requests.Response:
+        return requests.post(url, **kwargs)
+
+
+def make_server(handshake: float) -> ThreadingHTTPServer:
+    body = json.dumps(STOCK_PRICE_RESPONSE).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            time.sleep(handshake)
+            super().setup()
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, message_format: str, *args: object) -> None:
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+
+
+def make_api(url_base: str, session: requests.Session | OneShotSession) -> HantuDomesticAPI:
+    config = HantuConfig(
+        CANO="00000000",
+        ACNT_PRDT_CD="01",
+        APP_KEY="app_key",
+        APP_SECRET="app_secret",
+        URL_BASE=url_base,
+        TOKEN_PATH="/tmp/hantu_benchmark_token.json",
+        V_CANO="00000000",
+        V_ACNT_PRDT_CD="01",
+        V_APP_KEY="app_key",
+        V_APP_SECRET="app_secret",
+        V_URL_BASE=url_base,
+        V_TOKEN_PATH="/tmp/hantu_benchmark_token.json",
+    )
+    # 연결 비용만 비교하도록 요청 수 제한은 끈다
+    api = HantuDomesticAPI(config, AccountType.REAL, session=session, rate_limiter=HantuRateLimiter(rate=1_000_000))
+    api._get_token = lambda: "benchmark_token"
+    return api
+
+
+def run(api: HantuDomesticAPI, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        api.get_stock_price("005930")
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="한투 순차 현재가 조회 벤치마크")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--handshake", type=float, default=0.03)
+    args = parser.parse_args()
+
+    server = make_server(args.handshake)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url_base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        before = run(make_api(url_base, OneShotSession()), args.calls)
+        after = run(make_api(url_base, create_session()), args.calls)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"calls={args.calls} handshake={args.handshake}s")
+    print(f"{'new conn':<10} total={before:6.2f}s  {before / args.calls * 1000:7.2f}ms/call")
+    print(f"{'session':<10} total={after:6.2f}s  {after / args.calls * 1000:7.2f}ms/call")
+    print(f"speedup    {before / after:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
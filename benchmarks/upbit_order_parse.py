@@ -0,0 +1,68 @@
+"""
+주문 조회 응답 파싱 마이크로벤치마크
+
+체결 대기 폴링에서 응답마다 전체 OrderResult를 만드는 경우(from_dict)와
+상태만 읽는 경우(parse_state)의 호출당 시간을 비교합니다.
+
+    $ python -m benchmarks.upbit_order_parse --trades 5 --number 50000
+"""
+
+import argparse
+import timeit
+
+from src.upbit.model.order import OrderResult
+
+
+def order_response(trades: int) -> dict:
+    return {
+        "uuid": "9ca023a5-851b-4fec-9f0a-48cd83c2eaae",
+        "side": "bid",
+        "ord_type": "price",
+        "price": "1000000",
+        "state": "wait",
+        "market": "KRW-BTC",
+        "created_at": "2025-10-10T14:00:00+09:00",
+        "volume": None,
+        "remaining_volume": None,
+        "reserved_fee": "500",
+        "remaining_fee": "0",
+        "paid_fee": "500",
+        "locked": "0",
+        "executed_volume": "0.01",
+        "trades_count": trades,
+        "trades": [
+            {
+                "market": "KRW-BTC",
+                "uuid": f"trade-{index}",
+                "price": "100000000",
+                "volume": "0.002",
+                "funds": "200000",
+                "trend": "up",
+                "created_at": "2025-10-10T14:00:01+09:00",
+                "side": "bid",
+            }
+            for index in range(trades)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="주문 조회 응답 파싱 마이크로벤치마크")
+    parser.add_argument("--trades", type=int, default=5)
+    parser.add_argument("--number", type=int, default=50_000)
+    args = parser.parse_args()
+
+    data = order_response(args.trades)
+    results = {
+        "from_dict": min(timeit.repeat(lambda: OrderResult.from_dict(data), number=args.number, repeat=5)),
+        "parse_state": min(timeit.repeat(lambda: OrderResult.parse_state(data), number=args.number, repeat=5)),
+    }
+
+    print(f"trades={args.trades} number={args.number}")
+    for name, elapsed in results.items():
+        print(f"{name:<12} {elapsed / args.number * 1e6:8.3f}us/call")
+    print(f"speedup      {results['from_dict'] / results['parse_state']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+업비트 시뮬레이터 부하 테스트
+
+로컬 시뮬레이터를 띄우고 UpbitAPI를 리다이렉트한 뒤, 여러 티커에 대해 tick 하나에서 하는 일
+(현재가 일괄 조회, 티커별 캔들 조회, 매수 주문 + 체결 대기)을 동시에 실행하고 지연 시간을 출력합니다.
+
+    $ python -m benchmarks.upbit_simulator_load --tickers 200 --latency 0.02 --fill-delay 0.1
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from src.upbit.simulator import SimulatorConfig, UpbitSimulator
+from src.upbit.upbit_api import CandleInterval, UpbitAPI
+
+
+def measure(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def report(name: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0]
+    print(f"{name:<12} n={len(latencies):<5} p50={statistics.median(latencies) * 1000:8.1f}ms p95={p95 * 1000:8.1f}ms max={latencies[-1] * 1000:8.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="업비트 시뮬레이터 부하 테스트")
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--fill-delay", type=float, default=0.05)
+    parser.add_argument("--reject-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    tickers = [f"KRW-T{index:04d}" for index in range(args.tickers)]
+    config = SimulatorConfig(latency=args.latency, fill_delay=args.fill_delay, reject_rate=args.reject_rate)
+
+    with UpbitSimulator(config) as simulator:
+        UpbitAPI.redirect(simulator.base_url)
+        api = UpbitAPI(simulator.config_for_api())
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            prices = measure(lambda: UpbitAPI.get_current_prices(tickers))
+            candles = list(executor.map(lambda ticker: measure(lambda: UpbitAPI.get_candles(ticker, CandleInterval.MINUTE_60, count=24)), tickers))
+            orders = list(executor.map(lambda ticker: measure(lambda: api.buy_market_order_and_wait(ticker, 10_000)), tickers))
+        elapsed = time.perf_counter() - started
+
+        print(f"tickers={args.tickers} workers={args.workers} latency={args.latency}s fill_delay={args.fill_delay}s total={elapsed:.2f}s")
+        report("prices", [prices])
+        report("candles", candles)
+        report("order+wait", orders)
+        print(f"simulator stats: {simulator.exchange.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,14 @@ import logging
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from src.common.clock import SystemClock
 from src.common.slack.client import SlackClient
-from src.config import SlackConfig
+from src.config import SlackConfig, UpbitConfig
+from src.constants import KST
 from src.strategy import o_dol_strategy
+from src.strategy.order.order_tracker import OrderTracker
+from src.upbit.upbit_api import UpbitAPI
+from src.upbit.upbit_websocket import DEFAULT_WEBSOCKET_URL, UpbitOrderStream, UpbitTickerFeed
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -13,6 +18,11 @@ logger = logging.getLogger(__name__)
 # TODO: DB 설정
 total_balance = 100_000_000
 allocated_balance = 1_000_000
+tickers = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-USDT"]
+
+
+# 주문은 체결을 기다리지 않고 넣고, 체결은 백그라운드에서 캐시에 반영한다 (None이면 체결까지 대기)
+order_tracker: OrderTracker | None = None
 
 
 def run_strategies() -> None:
@@ -23,10 +33,20 @@ def run_strategies() -> None:
         slack_client = SlackClient(SlackConfig())
         slack_client.send_debug("암호화폐 자동 매매 실행")
 
-        tickers = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-USDT"]
+        clock = SystemClock(KST)
+        cache_states = o_dol_strategy.load_cache_states()
+        # 매수 시그널 확인용 현재가는 tick마다 한 번의 요청으로 조회한다 (오후에는 매도만 하므로 불필요)
+        prices = o_dol_strategy.load_prices(tickers) if clock.is_morning() else {}
+
         for ticker in tickers:
+            if not o_dol_strategy.has_pending_work(ticker, cache_states, clock):
+                logger.info(f"{ticker} 실행할 작업 없음")
+                continue
+
             try:
-                o_dol_strategy.run(ticker=ticker, total_balance=total_balance, allocated_balance=allocated_balance)
+                o_dol_strategy.run(
+                    ticker=ticker, total_balance=total_balance, allocated_balance=allocated_balance, cache_states=cache_states, prices=prices, order_tracker=order_tracker
+                )
                 logger.info(f"{ticker} 전략 실행 완료")
             except Exception as e:
                 logger.error(f"{ticker} 전략 실행 실패: {e}", exc_info=True)
@@ -40,6 +60,26 @@ def run_strategies() -> None:
 if __name__ == "__main__":
     logger.info("암호화폐 자동 매매 스케줄러 시작")
 
+    # UPBIT_BASE_URL/UPBIT_WEBSOCKET_URL이 있으면 로컬 시뮬레이터 등으로 요청을 보낸다
+    upbit_config = UpbitConfig()  # type: ignore
+    if upbit_config.upbit_base_url:
+        UpbitAPI.redirect(upbit_config.upbit_base_url)
+    websocket_url = upbit_config.upbit_websocket_url or DEFAULT_WEBSOCKET_URL
+
+    # 실시간 시세 피드 (연결 전이거나 끊긴 동안은 REST로 조회)
+    price_feed = UpbitTickerFeed(tickers, url=websocket_url)
+    price_feed.start()
+    UpbitAPI.price_feed = price_feed
+
+    # 주문 체결 스트림 (끊긴 동안은 REST 폴링으로 주문 완료 확인)
+    order_stream = UpbitOrderStream(upbit_config.upbit_access_key, upbit_config.upbit_secret_key, url=f"{websocket_url}/private")
+    order_stream.start()
+    UpbitAPI.order_stream = order_stream
+
+    # 체결 스트림의 완료 이벤트 또는 주기적인 일괄 조회로 체결을 반영
+    order_tracker = o_dol_strategy.create_order_tracker()
+    order_tracker.start()
+
     # 스케줄러 초기화
     scheduler = BlockingScheduler()
 
@@ -61,3 +101,7 @@ if __name__ == "__main__":
         scheduler.start()
     except (KeyboardInterrupt, SystemExit):
         logger.info("스케줄러 종료")
+    finally:
+        price_feed.stop()
+        order_tracker.stop()
+        order_stream.stop()
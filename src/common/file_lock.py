@@ -0,0 +1,174 @@
+"""파일 잠금
+
+fcntl advisory lock으로 여러 프로세스가 같은 파일(캐시, 토큰, 차트 등)을 동시에 읽고 쓰는 것을 막습니다.
+"""
+
+import fcntl
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TIMEOUT = 10.0
+DEFAULT_POLL_INTERVAL = 0.01
+LOCK_FILE_SUFFIX = ".lock"
+
+
+class CacheLockTimeoutError(Exception):
+    """
+    캐시 잠금 타임아웃 에러
+
+    지정한 시간 안에 잠금을 획득하지 못한 경우 발생하는 에러입니다.
+    """
+
+    def __init__(self, key: str, timeout: float) -> None:
+        self.key = key
+        self.timeout = timeout
+        super().__init__(f"캐시 잠금 획득 시간 초과 ({timeout}초): {key}")
+
+
+@dataclass
+class LockMetrics:
+    """
+    잠금 경합 지표
+
+    Attributes:
+        acquired: 잠금 획득 횟수
+        contended: 바로 획득하지 못하고 대기한 횟수
+        timeouts: 타임아웃 횟수
+        total_wait_seconds: 누적 대기 시간(초)
+        max_wait_seconds: 최대 대기 시간(초)
+    """
+
+    acquired: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, wait_seconds: float, contended: bool, timed_out: bool = False) -> None:
+        """잠금 시도 결과를 기록합니다."""
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.acquired += 1
+        if contended:
+            self.contended += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+
+@dataclass
+class _HeldLock:
+    file: IO[bytes]
+    exclusive: bool
+    depth: int = 1
+
+
+class FileLock:
+    """
+    키 단위 advisory 파일 잠금
+
+    읽기는 공유 잠금(LOCK_SH), 쓰기는 배타 잠금(LOCK_EX)을 사용합니다.
+    같은 스레드에서 이미 잡은 잠금은 재진입할 수 있으므로
+    load → 주문 → save 트랜잭션 전체를 감싼 뒤 내부에서 다시 잠금을 요청해도 교착되지 않습니다.
+    """
+
+    def __init__(self, lock_dir: Path, timeout: float = DEFAULT_LOCK_TIMEOUT, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """
+        Args:
+            lock_dir: 잠금 파일을 저장할 디렉토리
+            timeout: 기본 잠금 대기 시간(초)
+            poll_interval: 잠금 재시도 간격(초)
+        """
+        self._lock_dir = lock_dir
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self._local = threading.local()
+        self._metrics: dict[str, LockMetrics] = {}
+        self._metrics_lock = threading.Lock()
+
+    @property
+    def metrics(self) -> dict[str, LockMetrics]:
+        """키별 잠금 경합 지표"""
+        with self._metrics_lock:
+            return dict(self._metrics)
+
+    @contextmanager
+    def acquire(self, key: str, exclusive: bool = True, timeout: float | None = None) -> Iterator[None]:
+        """
+        키에 대한 잠금을 획득합니다.
+
+        Args:
+            key: 잠금 키 (예: "KRW-BTC_volatility")
+            exclusive: True면 배타 잠금, False면 공유 잠금
+            timeout: 잠금 대기 시간(초). None이면 기본값 사용
+
+        Raises:
+            CacheLockTimeoutError: 시간 안에 잠금을 획득하지 못한 경우
+            RuntimeError: 공유 잠금을 보유한 상태에서 배타 잠금을 요청한 경우
+        """
+        held = self._held_locks()
+        current = held.get(key)
+
+        if current:
+            if exclusive and not current.exclusive:
+                raise RuntimeError(f"공유 잠금을 보유한 상태에서 배타 잠금을 요청할 수 없습니다: {key}")
+            current.depth += 1
+            try:
+                yield
+            finally:
+                current.depth -= 1
+            return
+
+        lock_file = self._open(key, exclusive, self._timeout if timeout is None else timeout)
+        held[key] = _HeldLock(file=lock_file, exclusive=exclusive)
+        try:
+            yield
+        finally:
+            del held[key]
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def _open(self, key: str, exclusive: bool, timeout: float) -> IO[bytes]:
+        self._lock_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = (self._lock_dir / f"{key}{LOCK_FILE_SUFFIX}").open("a+b")
+        operation = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB
+
+        start_time = time.monotonic()
+        contended = False
+
+        while True:
+            try:
+                fcntl.flock(lock_file, operation)
+                self._record(key, time.monotonic() - start_time, contended)
+                return lock_file
+            except BlockingIOError:
+                contended = True
+
+            elapsed = time.monotonic() - start_time
+            if elapsed >= timeout:
+                lock_file.close()
+                self._record(key, elapsed, contended, timed_out=True)
+                logger.warning(f"캐시 잠금 타임아웃: {key} ({elapsed:.2f}초)")
+                raise CacheLockTimeoutError(key, timeout)
+
+            time.sleep(self._poll_interval)
+
+    def _record(self, key: str, wait_seconds: float, contended: bool, timed_out: bool = False) -> None:
+        with self._metrics_lock:
+            self._metrics.setdefault(key, LockMetrics()).record(wait_seconds, contended, timed_out)
+
+        if contended and not timed_out:
+            logger.debug(f"캐시 잠금 경합: {key} ({wait_seconds:.3f}초 대기)")
+
+    def _held_locks(self) -> dict[str, _HeldLock]:
+        if not hasattr(self._local, "held"):
+            self._local.held = {}
+        return self._local.held
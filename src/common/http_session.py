@@ -0,0 +1,50 @@
+"""
+HTTP 세션
+
+모듈 수준의 requests.get/post는 호출마다 TCP/TLS 연결을 새로 맺습니다.
+거래소 클라이언트는 여기서 만든 keep-alive 커넥션 풀 세션 하나를 재사용합니다.
+"""
+
+from collections.abc import Collection
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = (3.05, 10.0)  # (connect, read) 초
+DEFAULT_RETRIES = 3
+DEFAULT_POOL_SIZE = 16
+# 429는 재시도하지 않는다. 요청 수 제한기를 거치지 않고 재시도하면 남은 요청 수만 더 쓰므로
+# 거래소 클라이언트가 제한기로 물러난 뒤 다시 보낸다
+DEFAULT_RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def create_session(
+    retries: int = DEFAULT_RETRIES,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    status_forcelist: Collection[int] = DEFAULT_RETRY_STATUSES,
+) -> requests.Session:
+    """
+    keep-alive 커넥션 풀과 재시도 정책을 가진 세션 생성
+
+    재시도는 GET 요청에만 적용합니다. 주문(POST)은 멱등하지 않으므로 재시도하지 않습니다.
+
+    Args:
+        retries: 연결 실패, status_forcelist 응답 시 최대 재시도 횟수
+        pool_size: 호스트당 최대 커넥션 수
+        status_forcelist: 재시도할 응답 상태 코드
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.2,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,137 @@
+"""메트릭 수집
+
+카운터와 지연 시간 히스토그램을 교체 가능한 싱크(sink)로 내보냅니다.
+기본은 아무것도 하지 않는 NullMetricsSink이며, 필요할 때 InMemoryMetricsSink나
+외부 모니터링 시스템용 구현을 주입합니다.
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Protocol
+
+# 지연 시간 히스토그램 버킷 상한(초)
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class MetricsSink(Protocol):
+    """메트릭 싱크 인터페이스"""
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        """카운터를 증가시킵니다."""
+        ...
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """히스토그램에 관측값을 기록합니다."""
+        ...
+
+
+class NullMetricsSink:
+    """아무것도 기록하지 않는 기본 싱크"""
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        pass
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        pass
+
+
+@dataclass
+class Histogram:
+    """
+    누적 버킷 히스토그램
+
+    Attributes:
+        buckets: 버킷 상한값 (오름차순)
+        counts: 버킷별 관측 횟수 (마지막 원소는 +Inf 버킷)
+        count: 전체 관측 횟수
+        total: 관측값 합계
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+
+class InMemoryMetricsSink:
+    """
+    프로세스 메모리에 메트릭을 보관하는 싱크
+
+    스레드 안전하며 테스트나 주기적인 덤프(로그, 슬랙 등)에 사용합니다.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._buckets = buckets
+        self._counters: dict[MetricKey, int] = {}
+        self._histograms: dict[MetricKey, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram(buckets=self._buckets)
+            self._histograms[key].observe(value)
+
+    def counter(self, name: str, **labels: str) -> int:
+        """
+        카운터 값을 조회합니다.
+
+        라벨을 일부만 지정하면 나머지 라벨은 합산합니다.
+        """
+        with self._lock:
+            return sum(value for key, value in self._counters.items() if self._matches(key, name, labels))
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        """라벨이 정확히 일치하는 히스토그램을 조회합니다."""
+        with self._lock:
+            return self._histograms.get(self._key(name, labels))
+
+    @staticmethod
+    def _key(name: str, labels: dict[str, str]) -> MetricKey:
+        return name, tuple(sorted(labels.items()))
+
+    @staticmethod
+    def _matches(key: MetricKey, name: str, labels: dict[str, str]) -> bool:
+        key_name, key_labels = key
+        return key_name == name and set(labels.items()) <= set(key_labels)
+
+
+@contextmanager
+def timed(sink: MetricsSink, name: str, **labels: str) -> Iterator[None]:
+    """
+    블록 실행 시간을 히스토그램에 기록합니다.
+
+    Examples:
+        >>> with timed(sink, "cache.load.seconds", namespace="data", ticker="KRW-BTC"):
+        ...     load()
+    """
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        sink.observe(name, time.perf_counter() - start_time, **labels)
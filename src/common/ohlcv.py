@@ -0,0 +1,39 @@
+"""OHLCV DataFrame 공통 스키마
+
+업비트와 한국투자증권의 봉 데이터를 같은 컬럼·타입의 DataFrame으로 다루기 위한 스키마입니다.
+"""
+
+import pandera.pandas as pa
+from pandera.typing import Series
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume", "value")
+
+
+class OhlcvSchema(pa.DataFrameModel):
+    """
+    거래소 공통 OHLCV DataFrame 스키마
+
+    업비트 캔들(CandleSchema)과 한투 차트/캔들 DataFrame이 같은 컬럼을 쓰도록 하는 기준 스키마
+
+    Columns:
+        open: 시가
+        high: 고가
+        low: 저가
+        close: 종가
+        volume: 거래량
+        value: 거래 대금
+
+    Index:
+        DatetimeIndex: 봉 시작 일시 (KST, tz-naive)
+    """
+
+    open: Series[float]
+    high: Series[float]
+    low: Series[float]
+    close: Series[float]
+    volume: Series[float]
+    value: Series[float]
+
+    class Config:
+        strict = True  # 정의되지 않은 컬럼 허용 안함
+        coerce = True  # 자동 타입 변환
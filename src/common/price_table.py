@@ -0,0 +1,75 @@
+"""
+실시간 시세 피드가 채우는 종목별 마지막 체결가 테이블
+
+피드 스레드가 쓰고, 전략과 주문 헬퍼는 REST 호출 없이 테이블에서 현재가를 읽습니다.
+"""
+
+import time
+from dataclasses import dataclass
+
+DEFAULT_MAX_PRICE_AGE = 10.0  # 이 시간(초) 동안 갱신되지 않은 가격은 오래된 값으로 간주
+
+
+@dataclass(frozen=True, slots=True)
+class PriceTick:
+    """
+    종목의 마지막 체결가
+
+    Attributes:
+        ticker: 종목 ID (업비트 마켓 ID, 한투 종목코드 등)
+        price: 체결가
+        trade_timestamp: 체결 시각 (ms, 거래소 기준)
+        received_at: 수신 시각 (time.monotonic)
+    """
+
+    ticker: str
+    price: float
+    trade_timestamp: int
+    received_at: float
+
+
+class LastPriceTable:
+    """
+    종목별 마지막 체결가 테이블
+
+    쓰기는 피드 스레드 하나에서만 일어나고 항목은 불변 객체로 통째로 교체하므로
+    읽는 쪽은 잠금 없이 딕셔너리 조회 한 번으로 값을 얻습니다.
+    """
+
+    def __init__(self) -> None:
+        self._ticks: dict[str, PriceTick] = {}
+
+    def update(self, tick: PriceTick) -> None:
+        """
+        체결가를 갱신합니다.
+
+        여러 스트림의 도착 순서가 섞일 수 있으므로 더 오래된 체결로는 덮어쓰지 않습니다.
+        """
+        current = self._ticks.get(tick.ticker)
+        if current is None or tick.trade_timestamp >= current.trade_timestamp:
+            self._ticks[tick.ticker] = tick
+
+    def get_tick(self, ticker: str) -> PriceTick | None:
+        return self._ticks.get(ticker)
+
+    def get(self, ticker: str, max_age: float = DEFAULT_MAX_PRICE_AGE) -> float | None:
+        """
+        현재가 조회
+
+        Args:
+            ticker: 종목 ID
+            max_age: 허용할 최대 경과 시간(초)
+
+        Returns:
+            현재가, 값이 없거나 max_age보다 오래되었으면 None
+        """
+        tick = self._ticks.get(ticker)
+        if tick is None or time.monotonic() - tick.received_at > max_age:
+            return None
+
+        return tick.price
+
+    def age(self, ticker: str) -> float | None:
+        """마지막 갱신 후 경과 시간(초), 값이 없으면 None"""
+        tick = self._ticks.get(ticker)
+        return None if tick is None else time.monotonic() - tick.received_at
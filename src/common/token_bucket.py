@@ -0,0 +1,65 @@
+"""토큰 버킷
+
+거래소별 요청 수 제한기(업비트, 한국투자증권)가 공통으로 사용하는 예약 방식 토큰 버킷입니다.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    예약 방식 토큰 버킷
+
+    reserve()는 토큰을 먼저 차감하고(음수가 될 수 있음) 토큰이 채워질 때까지 기다려야 하는 시간을 반환합니다.
+    실제 대기는 호출하는 쪽에서 time.sleep 또는 asyncio.sleep으로 합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """
+        Args:
+            rate: 초당 토큰 충전 수
+            capacity: 최대 토큰 수 (None이면 rate와 같음, 즉 최대 1초 분량)
+        """
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else rate
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약합니다.
+
+        Returns:
+            요청 전에 기다려야 하는 시간(초)
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self._rate)
+
+    def sync(self, remaining: float) -> None:
+        """
+        서버가 알려준 남은 요청 수로 토큰을 낮춥니다.
+
+        다른 프로세스나 서버 측 집계 때문에 서버 값이 더 작을 수 있으므로 작은 쪽을 따릅니다.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, remaining)
+
+    def drain(self) -> None:
+        """429 응답을 받은 경우 남은 토큰을 모두 비웁니다."""
+        self.sync(0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
@@ -0,0 +1,180 @@
+"""
+실시간 WebSocket 스트림 공통 연결 관리
+
+스트림은 별도 스레드의 이벤트 루프에서 동작하고, 연결이 끊기면 지수 백오프로 재연결합니다.
+처리 중 예외가 난 메시지는 연결을 끊지 않고 버리며 ws.message_error 메트릭으로 남깁니다.
+거래소별 스트림(업비트, 한투)은 구독 메시지와 수신 메시지 처리만 구현합니다.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from websockets.asyncio.client import ClientConnection, connect
+
+from src.common.metrics import MetricsSink, NullMetricsSink
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PING_INTERVAL = 30.0
+INITIAL_RECONNECT_DELAY = 0.5
+MAX_RECONNECT_DELAY = 30.0
+
+
+class WebSocketStream(ABC):
+    """
+    WebSocket 스트림 공통 연결 관리
+
+    서브클래스는 구독 메시지와 수신 메시지 처리만 구현합니다.
+    """
+
+    _thread_prefix = "ws"  # 스레드 이름 접두사
+
+    def __init__(
+        self,
+        url: str,
+        metrics_sink: MetricsSink | None = None,
+        initial_reconnect_delay: float = INITIAL_RECONNECT_DELAY,
+        max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+    ) -> None:
+        """
+        Args:
+            url: WebSocket URL
+            metrics_sink: 재연결 횟수 등을 기록할 메트릭 싱크
+            initial_reconnect_delay: 첫 재연결 대기 시간(초)
+            max_reconnect_delay: 최대 재연결 대기 시간(초)
+        """
+        self._url = url
+        self._metrics = metrics_sink or NullMetricsSink()
+        self._initial_reconnect_delay = initial_reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._connection: ClientConnection | None = None
+        self._thread: threading.Thread | None = None
+        self._connected = threading.Event()
+        self._connections = 0
+        self._last_message_at: float | None = None
+
+    @property
+    @abstractmethod
+    def _stream_name(self) -> str:
+        """스트림 이름 (스레드 이름, 메트릭 라벨에 사용)"""
+        pass
+
+    @abstractmethod
+    def _subscribe_messages(self) -> list[str]:
+        """연결 직후 차례로 보낼 구독 메시지 목록 (재연결마다 새로 생성)"""
+        pass
+
+    @abstractmethod
+    def _handle_message(self, message: str | bytes) -> str | None:
+        """
+        수신한 메시지 처리
+
+        Returns:
+            서버로 바로 돌려보낼 메시지 (예: 애플리케이션 수준 PINGPONG), 없으면 None
+        """
+        pass
+
+    def _connect_headers(self) -> dict[str, str]:
+        """연결 시 보낼 추가 헤더 (재연결마다 새로 생성)"""
+        return {}
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    @property
+    def connections(self) -> int:
+        """지금까지 연결에 성공한 횟수 (재연결 여부를 확인할 때 이전 값과 비교)"""
+        return self._connections
+
+    def start(self) -> None:
+        """스트림 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(ready,), name=f"{self._thread_prefix}-{self._stream_name}", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """연결을 닫고 스트림 스레드를 종료합니다."""
+        if self._thread is None or self._loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def wait_connected(self, timeout: float | None = None) -> bool:
+        """연결될 때까지 대기합니다."""
+        return self._connected.wait(timeout)
+
+    def last_message_age(self) -> float | None:
+        """마지막 메시지 수신 후 경과 시간(초), 수신 전이면 None"""
+        return None if self._last_message_at is None else time.monotonic() - self._last_message_at
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._stop_event = asyncio.Event()
+        ready.set()
+
+        try:
+            self._loop.run_until_complete(self._run())
+        finally:
+            self._loop.close()
+
+    async def _run(self) -> None:
+        assert self._stop_event is not None
+        delay = self._initial_reconnect_delay
+
+        while not self._stop_event.is_set():
+            try:
+                async with connect(self._url, additional_headers=self._connect_headers(), ping_interval=DEFAULT_PING_INTERVAL) as connection:
+                    self._connection = connection
+                    for subscribe_message in self._subscribe_messages():
+                        await connection.send(subscribe_message)
+                    self._connections += 1
+                    self._connected.set()
+                    delay = self._initial_reconnect_delay
+                    logger.info(f"{self._stream_name} 스트림 연결")
+
+                    async for message in connection:
+                        try:
+                            reply = self._handle_message(message)
+                        except Exception:
+                            # 잘못된 메시지 하나로 연결을 끊으면 재연결이 반복되므로 해당 메시지만 버린다
+                            logger.exception(f"{self._stream_name} 스트림 메시지 처리 실패: {message!r:.200}")
+                            self._metrics.increment("ws.message_error", stream=self._stream_name)
+                            continue
+                        if reply is not None:
+                            await connection.send(reply)
+            except Exception as e:
+                logger.warning(f"{self._stream_name} 스트림 연결 끊김: {e}")
+            finally:
+                self._connection = None
+                self._connected.clear()
+
+            if self._stop_event.is_set():
+                break
+
+            self._metrics.increment("ws.reconnect", stream=self._stream_name)
+            try:
+                # 여러 프로세스가 동시에 재연결하지 않도록 지터를 준다
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay * random.uniform(0.5, 1.0))
+            except TimeoutError:
+                pass
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    async def _shutdown(self) -> None:
+        assert self._stop_event is not None
+        self._stop_event.set()
+        if self._connection is not None:
+            await self._connection.close()
@@ -24,6 +24,10 @@ class UpbitConfig(BaseSettings):
 
     upbit_secret_key: str = Field(..., min_length=1, description="업비트 시크릿 키", alias="UPBIT_SECRET_KEY")
 
+    upbit_base_url: str | None = Field(None, description="업비트 REST API 기본 URL (로컬 시뮬레이터 등으로 바꿀 때만 설정)", alias="UPBIT_BASE_URL")
+
+    upbit_websocket_url: str | None = Field(None, description="업비트 WebSocket URL (로컬 시뮬레이터 등으로 바꿀 때만 설정)", alias="UPBIT_WEBSOCKET_URL")
+
 
 class HantuConfig(BaseSettings):
     """한국투자증권 API 설정"""
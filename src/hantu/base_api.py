@@ -1,29 +1,72 @@
 import logging
-from pathlib import Path
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 import requests
+from pydantic import ValidationError
 from requests import Response
 
+from src.common.http_session import DEFAULT_TIMEOUT, create_session
 from src.config import HantuConfig
-from src.hantu.model import access_token
+from src.hantu.model import approval_key
 from src.hantu.model.domestic.account_type import AccountType
+from src.hantu.model.quote_batch import QuoteBatch, QuoteResponse
+from src.hantu.model.result_code import ResultCodeBody
+from src.hantu.rate_limiter import HantuRateLimiter, default_rate_limiter, is_rate_limited
+from src.hantu.token_manager import HantuTokenManager
 
 logger = logging.getLogger(__name__)
 
+# KIS는 초당 요청 수 초과도 500으로 응답하므로 500은 세션에서 재시도하지 않고 요청 수 제한기가 물러난 뒤 재시도한다
+HANTU_RETRY_STATUSES = (502, 503, 504)
+MAX_RATE_LIMIT_RETRIES = 3
+
+# 응답 헤더 tr_cont가 이 값이면 다음 페이지가 있다
+NEXT_PAGE_FLAGS = frozenset({"M", "F"})
+NEXT_PAGE_REQUEST_FLAG = "N"  # 다음 페이지 요청 시 요청 헤더 tr_cont
+
+DEFAULT_QUOTE_WORKERS = 8  # 여러 종목 현재가를 동시에 조회할 최대 스레드 수
+
+P = TypeVar("P")  # 페이지
+C = TypeVar("C")  # 연속 조회 커서
+Q = TypeVar("Q", bound=QuoteResponse)  # 종목별 현재가 응답
+B = TypeVar("B", bound=ResultCodeBody)  # rt_cd 필드를 가진 응답 바디
+
+
+def create_hantu_session() -> requests.Session:
+    """한투 API용 커넥션 풀 세션"""
+    return create_session(status_forcelist=HANTU_RETRY_STATUSES)
+
 
 class HantuBaseAPI:
     """한국투자증권 API 베이스 클라이언트
 
     국내/해외 API에서 공통으로 사용하는 기능을 제공합니다.
+    요청은 keep-alive 커넥션 풀을 가진 세션으로 보내므로 호출마다 연결을 새로 맺지 않습니다.
+    모든 요청은 계좌 타입별 요청 수 제한기를 거치며, 초당 요청 수 초과 응답을 받으면 물러난 뒤 다시 보냅니다.
 
     Args:
         config: 한투 API 설정
         account_type: 계좌 타입 (REAL: 실제 계좌, VIRTUAL: 가상 계좌)
+        session: 공유할 HTTP 세션. None이면 새로 생성
+        timeout: 요청 타임아웃 (connect, read) 초
+        rate_limiter: 요청 수 제한기. None이면 계좌 타입별 프로세스 공용 제한기
     """
 
-    def __init__(self, config: HantuConfig, account_type: AccountType = AccountType.REAL) -> None:
+    def __init__(
+        self,
+        config: HantuConfig,
+        account_type: AccountType = AccountType.REAL,
+        session: requests.Session | None = None,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        rate_limiter: HantuRateLimiter | None = None,
+    ) -> None:
         self.config = config
         self.account_type = account_type
+        self.session = session or create_hantu_session()
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or default_rate_limiter(account_type)
 
         # 계좌 타입에 따라 적절한 설정 선택
         if account_type == AccountType.REAL:
@@ -41,45 +84,138 @@ class HantuBaseAPI:
             self.url_base = config.v_url_base
             self.token_path = config.v_token_path
 
-    def _make_token(self) -> str:
-        """OAuth2 액세스 토큰 생성"""
-        request_body = access_token.RequestBody(appkey=self.app_key, appsecret=self.app_secret)
+        # 같은 토큰 파일을 쓰는 국내/해외 API는 토큰 관리자를 공유한다
+        self.token_manager = HantuTokenManager.shared(self.url_base, self.app_key, self.app_secret, self.token_path, session=self.session, timeout=self.timeout)
 
-        res = requests.post(url=f"{self.url_base}/oauth2/tokenP", data=request_body.model_dump_json())
+    def _get_token(self) -> str:
+        """접근 토큰 (메모리에 캐시되고 만료 전에 백그라운드에서 갱신된다)"""
+        return self.token_manager.access_token()
 
-        if res.status_code == 200:
-            response_body = access_token.ResponseBody.model_validate(res.json())
+    def get_approval_key(self) -> str:
+        """
+        실시간(WebSocket) 접속키 발급
 
-            # 부모 디렉토리 생성
-            token_file = Path(self.token_path)
-            token_file.parent.mkdir(parents=True, exist_ok=True)
+        접속키는 WebSocket 연결마다 구독 메시지 헤더에 넣으며, 재연결할 때마다 새로 발급받습니다.
 
-            # ResponseBody 전체를 JSON으로 저장
-            token_file.write_text(response_body.model_dump_json())
+        Returns:
+            웹소켓 접속키
 
-            logger.debug(f"TOKEN : {response_body.access_token}")
-            return response_body.access_token
-        else:
-            logger.error("Get Authentification token fail!")
-            raise Exception()
+        Raises:
+            Exception: 발급 실패 시
+        """
+        request_body = approval_key.RequestBody(appkey=self.app_key, secretkey=self.app_secret)
+        res = self._post(f"{self.url_base}/oauth2/Approval", headers={"content-type": "application/json; utf-8"}, data=request_body.model_dump_json())
 
-    def _get_token(self) -> str:
-        """토큰 로드, 없거나 만료되면 새로 생성"""
-        token_file = Path(self.token_path)
+        if not res or res.status_code != 200:
+            logger.error(f"Error Code : {res.status_code} | {res.text}")
+            raise Exception(f"웹소켓 접속키 발급 실패: {res.status_code}")
+
+        return approval_key.ResponseBody.model_validate(res.json()).approval_key
+
+    def _get(self, url: str, headers: dict[str, Any], params: dict[str, Any]) -> Response:
+        """세션으로 GET 요청 (연결 실패, 502/503/504 응답은 세션의 재시도 정책을 따른다)"""
+        return self._send(self.session.get, url, headers=headers, params=params)
+
+    def _post(self, url: str, headers: dict[str, Any], data: str) -> Response:
+        """
+        세션으로 POST 요청
+
+        주문은 멱등하지 않으므로 세션에서 재시도하지 않습니다.
+        초당 요청 수 초과 응답은 주문이 접수되지 않은 것이므로 물러난 뒤 다시 보냅니다.
+        """
+        return self._send(self.session.post, url, headers=headers, data=data)
 
-        if not token_file.exists():
-            return self._make_token()
+    def _send(self, send: Callable[..., Response], url: str, **kwargs: object) -> Response:
+        """요청 수 제한기를 거쳐 요청하고, 초당 요청 수 초과 응답이면 물러난 뒤 다시 요청합니다."""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire()
+            res = send(url, timeout=self.timeout, **kwargs)
 
-        try:
-            data = access_token.ResponseBody.model_validate_json(token_file.read_text())
-        except Exception:
-            return self._make_token()
+            if attempt == MAX_RATE_LIMIT_RETRIES or not is_rate_limited(res):
+                return res
 
-        # 만료 체크
-        if data.is_expired():
-            return self._make_token()
+            self.rate_limiter.backoff(attempt)
 
-        return data.access_token
+        return res
+
+    def _paginate(
+        self,
+        fetch: Callable[[str, C | None], Response],
+        parse: Callable[[Response], P],
+        next_cursor: Callable[[P], C],
+    ) -> Iterator[P]:
+        """
+        연속 조회 페이지를 하나씩 반환합니다.
+
+        응답 헤더 tr_cont가 M/F인 동안 다음 페이지를 요청하며, 페이지를 다 모으지 않고 받는 대로 넘기므로
+        호출하는 쪽이 필요한 만큼만 읽고 멈출 수 있습니다.
+
+        Args:
+            fetch: (요청 tr_cont, 커서) → 응답. 첫 페이지는 ("", None)으로 호출
+            parse: 응답 → 페이지
+            next_cursor: 페이지 → 다음 페이지 커서 (예: CTX_AREA_FK100/NK100)
+
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        continuation_flag, cursor = "", None
+
+        while True:
+            res = fetch(continuation_flag, cursor)
+            self._validate_response(res)
+
+            page = parse(res)
+            yield page
+
+            if res.headers.get("tr_cont", "") not in NEXT_PAGE_FLAGS:
+                return
+
+            continuation_flag, cursor = NEXT_PAGE_REQUEST_FLAG, next_cursor(page)
+
+    @staticmethod
+    def _fetch_quotes(fetch: Callable[[str], Q], symbols: Iterable[str], max_workers: int) -> QuoteBatch[Q]:
+        """
+        종목별 조회를 스레드로 동시에 실행합니다.
+
+        요청 간격은 요청 수 제한기가 맞추므로 스레드 수를 늘려도 초당 요청 수 제한을 넘지 않습니다.
+        한 종목이 실패해도 나머지 종목은 계속 조회합니다.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        batch: QuoteBatch[Q] = QuoteBatch()
+        if not symbols:
+            return batch
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols)), thread_name_prefix="hantu-quote") as executor:
+            futures = {symbol: executor.submit(fetch, symbol) for symbol in symbols}
+
+        for symbol, future in futures.items():
+            try:
+                batch.quotes[symbol] = future.result()
+            except Exception as e:
+                logger.warning(f"현재가 조회 실패: {symbol} ({e})")
+                batch.errors[symbol] = e
+
+        return batch
+
+    @staticmethod
+    def _validate_json(res: Response, model: type[B]) -> B:
+        """
+        응답 바이트를 바로 모델로 검증합니다.
+
+        _validate_response는 res.json()으로 응답을 한 번 더 읽으므로, 현재가처럼 자주 부르는 조회는
+        rt_cd를 가진 모델로 한 번에 읽고 검사합니다. 에러 응답이면 _validate_response와 같은 예외를 던집니다.
+        """
+        if res and res.status_code == 200:
+            try:
+                body = model.model_validate_json(res.content)
+            except ValidationError:
+                body = None
+            if body is not None and body.rt_cd == "0":
+                return body
+
+        HantuBaseAPI._validate_response(res)
+        # 정상 응답인데 모델과 맞지 않는 경우 ValidationError
+        return model.model_validate_json(res.content)
 
     @staticmethod
     def _validate_response(res: Response) -> None:
@@ -0,0 +1,273 @@
+"""
+한투 국내주식 차트 구간 조회
+
+일/주/월/년봉 API는 한 번에 최대 100개, 분봉 API는 조회 시각 직전 최대 120개만 반환합니다.
+HantuChartHistory는 (시작, 종료) 구간을 API 한 번에 담기는 하위 구간으로 나눠 동시에 조회하고,
+결과를 중복 없이 시각 오름차순인 숫자 DataFrame 하나로 합칩니다.
+동시 요청 수와 관계없이 요청 간격은 HantuDomesticAPI의 요청 수 제한기가 맞춥니다.
+
+ChartStore를 넘기면 조회를 마친 구간은 디스크에서 읽고, 빠진 구간만 API로 조회합니다.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+
+import pandas as pd
+
+from src.common.clock import Clock, SystemClock
+from src.hantu.chart_store import ChartStore, Span
+from src.hantu.domestic_api import HantuDomesticAPI
+from src.hantu.frames import empty_ohlcv_frame
+from src.hantu.model.domestic.chart import ChartInterval, PriceType
+from src.hantu.model.domestic.market_code import MarketCode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+MAX_DAILY_BARS = 100  # 일/주/월/년봉 1회 최대 조회 건수
+MAX_MINUTE_BARS = 120  # 분봉 1회 최대 조회 건수
+
+# 정규장 시간 (분봉 조회 시각 계산용)
+MARKET_OPEN = time(9, 0)
+MARKET_CLOSE = time(15, 30)
+
+# 하위 구간 길이: 어느 날짜에서 시작해도 봉이 MAX_DAILY_BARS개를 넘지 않는 길이
+DAILY_WINDOW_SPANS = {
+    ChartInterval.DAY: timedelta(days=MAX_DAILY_BARS),  # 영업일 수 <= 달력 일수
+    ChartInterval.WEEK: timedelta(weeks=MAX_DAILY_BARS - 1),
+    ChartInterval.MONTH: timedelta(days=28 * (MAX_DAILY_BARS - 1)),
+    ChartInterval.YEAR: timedelta(days=365 * (MAX_DAILY_BARS - 1)),
+}
+
+DAY = timedelta(days=1)
+MINUTE = timedelta(minutes=1)
+
+
+class HantuChartHistory:
+    """
+    국내주식 차트를 기간 단위로 조회하는 조회기
+
+    Examples:
+        >>> history = HantuChartHistory(HantuDomesticAPI(config), store=ChartStore())
+        >>> daily = history.daily("005930", date(2020, 1, 1), date(2024, 12, 31))
+        >>> minute = history.minute("005930", datetime(2024, 12, 2, 9), datetime(2024, 12, 6, 15, 30))
+    """
+
+    def __init__(self, api: HantuDomesticAPI, max_workers: int = DEFAULT_MAX_WORKERS, store: ChartStore | None = None, clock: Clock | None = None) -> None:
+        """
+        Args:
+            api: 국내주식 API 클라이언트
+            max_workers: 동시에 조회할 최대 하위 구간 수
+            store: 조회 결과를 저장할 로컬 저장소 (None이면 저장하지 않음)
+            clock: 확정된 구간을 판단할 시계 (기본값: SystemClock)
+        """
+        self._api = api
+        self._max_workers = max_workers
+        self._store = store
+        self._clock = clock or SystemClock()
+
+    def daily(
+        self,
+        ticker: str,
+        start: date,
+        end: date,
+        interval: ChartInterval = ChartInterval.DAY,
+        price_type: PriceType = PriceType.ADJUSTED,
+        market_code: MarketCode = MarketCode.KRX,
+    ) -> pd.DataFrame:
+        """
+        일/주/월/년봉 기간 조회
+
+        Args:
+            ticker: 종목코드 (예: 005930)
+            start: 조회 시작일자 (포함)
+            end: 조회 종료일자 (포함)
+            interval: 차트 주기 (기본값: DAY - 일봉)
+            price_type: 가격 타입 (기본값: ADJUSTED - 수정주가)
+            market_code: 시장 분류 코드 (기본값: KRX)
+
+        Returns:
+            OhlcvSchema 형태의 영업일자 오름차순 DataFrame
+
+        Raises:
+            ValueError: start가 end보다 늦은 경우
+        """
+        if start > end:
+            raise ValueError(f"조회 시작일자가 종료일자보다 늦습니다: {start} > {end}")
+
+        def fetch(span_start: datetime, span_end: datetime) -> pd.DataFrame:
+            windows = daily_windows(span_start.date(), span_end.date(), interval)
+            return merge_frames(self._map(lambda window: self._api.get_daily_chart_frame(ticker, *window, interval, price_type, market_code), windows))
+
+        # 오늘 봉은 장중에 바뀌므로 어제까지만 확정된 구간으로 기록한다
+        settled_until = datetime.combine(self._clock.today() - DAY, time())
+        key = f"{ticker}_{market_code.value}_{interval.value}{price_type.value}"
+        return self._load_or_fetch(key, datetime.combine(start, time()), datetime.combine(end, time()), DAY, settled_until, fetch)
+
+    def minute(self, ticker: str, start: datetime, end: datetime, market_code: MarketCode = MarketCode.KRX) -> pd.DataFrame:
+        """
+        1분봉 기간 조회
+
+        주말은 조회하지 않으며, 휴장일은 빈 응답으로 건너뜁니다.
+
+        Args:
+            ticker: 종목코드 (예: 005930)
+            start: 조회 시작 시각 (포함)
+            end: 조회 종료 시각 (포함)
+            market_code: 시장 분류 코드 (기본값: KRX)
+
+        Returns:
+            OhlcvSchema 형태의 체결 시각 오름차순 DataFrame (value는 당일 누적 거래대금)
+
+        Raises:
+            ValueError: start가 end보다 늦은 경우
+        """
+        if start > end:
+            raise ValueError(f"조회 시작 시각이 종료 시각보다 늦습니다: {start} > {end}")
+
+        def fetch(span_start: datetime, span_end: datetime) -> pd.DataFrame:
+            cursors = minute_cursors(span_start, span_end)
+            return merge_frames(self._map(lambda cursor: self._api.get_minute_chart_frame(ticker, cursor.date(), cursor.time(), market_code), cursors))
+
+        # 현재 분봉은 아직 만들어지는 중이므로 직전 분까지만 확정된 구간으로 기록한다
+        settled_until = self._clock.now().replace(tzinfo=None, second=0, microsecond=0) - MINUTE
+        key = f"{ticker}_{market_code.value}_minute"
+        return self._load_or_fetch(key, start, end, MINUTE, settled_until, fetch)
+
+    def _load_or_fetch(
+        self,
+        key: str,
+        start: datetime,
+        end: datetime,
+        step: timedelta,
+        settled_until: datetime,
+        fetch: Callable[[datetime, datetime], pd.DataFrame],
+    ) -> pd.DataFrame:
+        if self._store is None:
+            return fetch(start, end).loc[start:end]
+
+        with self._store.lock(key):
+            stored, spans = self._store.load(key)
+            gaps = subtract_spans(start, end, spans, step)
+            if not gaps:
+                logger.debug(f"차트 저장소에서 조회: {key} {start} ~ {end}")
+                return merge_frames([stored]).loc[start:end]
+
+            frame = merge_frames([stored, *(fetch(gap_start, gap_end) for gap_start, gap_end in gaps)])
+            settled = [(gap_start, min(gap_end, settled_until)) for gap_start, gap_end in gaps if gap_start <= settled_until]
+            self._store.save(key, frame, merge_spans([*spans, *settled], step))
+
+        return frame.loc[start:end]
+
+    def _map[T, R](self, fn: Callable[[T], R], items: list[T]) -> list[R]:
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(items)), thread_name_prefix="hantu-chart") as executor:
+            return list(executor.map(fn, items))
+
+
+def daily_windows(start: date, end: date, interval: ChartInterval) -> list[tuple[date, date]]:
+    """
+    API 한 번에 담기는 (시작일자, 종료일자) 하위 구간 목록 (최신 구간부터)
+
+    Args:
+        start: 조회 시작일자 (포함)
+        end: 조회 종료일자 (포함)
+        interval: 차트 주기
+    """
+    span = DAILY_WINDOW_SPANS[interval]
+    windows = []
+
+    window_end = end
+    while window_end >= start:
+        window_start = max(start, window_end - span + DAY)
+        windows.append((window_start, window_end))
+        window_end = window_start - DAY
+
+    return windows
+
+
+def minute_cursors(start: datetime, end: datetime) -> list[datetime]:
+    """
+    분봉 조회 시각 목록 (최신 시각부터)
+
+    각 조회 시각은 직전 MAX_MINUTE_BARS분의 분봉을 반환하므로, 영업일마다 정규장 안에서
+    MAX_MINUTE_BARS분 간격으로 조회 시각을 잡습니다. 주말은 건너뜁니다.
+
+    Args:
+        start: 조회 시작 시각 (포함)
+        end: 조회 종료 시각 (포함)
+    """
+    step = MAX_MINUTE_BARS * MINUTE
+    cursors = []
+
+    day = end.date()
+    while day >= start.date():
+        if day.weekday() < 5:
+            session_start = max(start, datetime.combine(day, MARKET_OPEN))
+            cursor = min(end, datetime.combine(day, MARKET_CLOSE))
+            while cursor >= session_start:
+                cursors.append(cursor)
+                cursor -= step
+        day -= DAY
+
+    return cursors
+
+
+def merge_frames(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    여러 DataFrame을 합칩니다.
+
+    하위 구간이 겹치는 곳의 중복 시각은 나중 DataFrame의 값을 남기고, 시각 오름차순으로 정렬합니다.
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return empty_ohlcv_frame()
+
+    merged = pd.concat(frames)
+    return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+
+def subtract_spans(start: datetime, end: datetime, spans: list[Span], step: timedelta) -> list[Span]:
+    """
+    [start, end]에서 spans가 덮지 않는 구간 목록
+
+    Args:
+        start: 구간 시작 (포함)
+        end: 구간 종료 (포함)
+        spans: 이미 덮인 구간 목록
+        step: 구간 단위 (일봉: 1일, 분봉: 1분)
+    """
+    gaps = []
+    cursor = start
+
+    for span_start, span_end in merge_spans(spans, step):
+        if span_end < cursor:
+            continue
+        if span_start > end:
+            break
+        if span_start > cursor:
+            gaps.append((cursor, span_start - step))
+        cursor = span_end + step
+
+    if cursor <= end:
+        gaps.append((cursor, end))
+
+    return gaps
+
+
+def merge_spans(spans: list[Span], step: timedelta) -> list[Span]:
+    """겹치거나 step 간격으로 맞닿은 구간을 하나로 합친 정렬된 구간 목록"""
+    merged: list[Span] = []
+
+    for span_start, span_end in sorted(spans):
+        if merged and span_start <= merged[-1][1] + step:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], span_end))
+        else:
+            merged.append((span_start, span_end))
+
+    return merged
@@ -0,0 +1,93 @@
+"""
+한투 차트 로컬 저장소
+
+조회한 차트를 종목·차트 종류별 CSV 파일로 저장하고, 조회를 마친 구간을 같은 이름의 JSON 파일에 기록합니다.
+HantuChartHistory는 기록된 구간은 디스크에서 읽고, 빠진 구간만 API로 조회합니다.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from src.common.file_lock import DEFAULT_LOCK_TIMEOUT, FileLock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHART_STORE_DIR = ".cache/hantu_chart"
+DEFAULT_LOCK_DIR_NAME = ".lock"
+
+Span = tuple[datetime, datetime]  # 양 끝을 포함하는 구간
+
+
+class ChartStore:
+    """
+    차트 DataFrame과 조회를 마친 구간을 파일로 저장하는 저장소
+
+    Examples:
+        >>> store = ChartStore()
+        >>> with store.lock("005930_D0"):
+        ...     frame, covered = store.load("005930_D0")
+        ...     store.save("005930_D0", frame, covered)
+    """
+
+    def __init__(self, root_dir: str = DEFAULT_CHART_STORE_DIR, lock_timeout: float = DEFAULT_LOCK_TIMEOUT) -> None:
+        """
+        Args:
+            root_dir: 차트 파일을 저장할 디렉토리 경로
+            lock_timeout: 키 잠금 대기 시간(초)
+        """
+        self._root_dir = Path(root_dir)
+        self._file_lock = FileLock(self._root_dir / DEFAULT_LOCK_DIR_NAME, timeout=lock_timeout)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """키 단위 배타 잠금 (load → 조회 → save 사이에 다른 프로세스가 끼어들지 않도록)"""
+        with self._file_lock.acquire(key):
+            yield
+
+    def load(self, key: str) -> tuple[pd.DataFrame, list[Span]]:
+        """
+        저장된 차트와 조회를 마친 구간을 읽습니다.
+
+        Returns:
+            (시각 인덱스 DataFrame, 구간 목록). 저장된 것이 없거나 읽을 수 없으면 빈 DataFrame과 빈 목록
+        """
+        frame_path, spans_path = self._paths(key)
+        if not frame_path.exists() or not spans_path.exists():
+            return pd.DataFrame(), []
+
+        try:
+            frame = pd.read_csv(frame_path, index_col=0, parse_dates=[0])
+            spans = [(datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in json.loads(spans_path.read_text())]
+        except (OSError, ValueError) as e:
+            logger.warning(f"차트 저장소 읽기 실패, 새로 조회합니다: {key} ({e})")
+            return pd.DataFrame(), []
+
+        return frame, spans
+
+    def save(self, key: str, frame: pd.DataFrame, spans: list[Span]) -> None:
+        """
+        차트와 조회를 마친 구간을 저장합니다.
+
+        구간 파일을 차트 파일보다 나중에 바꿔, 중간에 실패해도 기록된 구간의 데이터는 항상 파일에 있습니다.
+        """
+        frame_path, spans_path = self._paths(key)
+        frame_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._write_atomic(frame_path, frame.to_csv())
+        self._write_atomic(spans_path, json.dumps([[start.isoformat(), end.isoformat()] for start, end in spans]))
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self._root_dir / f"{key}.csv", self._root_dir / f"{key}.json"
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
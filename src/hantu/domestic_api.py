@@ -1,17 +1,20 @@
 import logging
-import time
+from collections.abc import Iterable, Iterator
 from datetime import date
 from datetime import time as time_obj
 
-import requests
+import pandas as pd
+from requests import Response
 
 from src.common.order_direction import OrderDirection
-from src.hantu.base_api import HantuBaseAPI
+from src.hantu import frames
+from src.hantu.base_api import DEFAULT_QUOTE_WORKERS, HantuBaseAPI
 from src.hantu.model.domestic import balance, chart, order, psbl_order, stock_price
 from src.hantu.model.domestic.account_type import AccountType
 from src.hantu.model.domestic.chart import ChartInterval, PriceType
 from src.hantu.model.domestic.market_code import MarketCode
 from src.hantu.model.domestic.order import OrderDivision
+from src.hantu.model.quote_batch import QuoteBatch
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +37,14 @@ class HantuDomesticAPI(HantuBaseAPI):
         Returns:
             balance.BalanceResponse: output1(개별 종목 보유 정보), output2(계좌 전체 정보)
         """
-        output1, output2 = self._get_balance_recursive()
+        output1: list[balance.ResponseBodyoutput1] = []
+        output2: list[balance.ResponseBodyoutput2] = []
+
+        for page in self.iter_balance_pages():
+            output1.extend(page.output1)
+            # output2는 마지막 페이지의 값을 사용 (계좌 전체 정보)
+            output2 = page.output2
+
         return balance.BalanceResponse(output1=output1, output2=output2)
 
     def get_psbl_order(
@@ -82,7 +92,7 @@ class HantuDomesticAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
+        res = self._get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
 
         self._validate_response(res)
 
@@ -98,6 +108,28 @@ class HantuDomesticAPI(HantuBaseAPI):
         Returns:
             stock_price.ResponseBody: 주식 현재가 시세 정보
         """
+        res = self._request_stock_price(ticker, market_code)
+
+        self._validate_response(res)
+
+        return stock_price.ResponseBody.model_validate(res.json())
+
+    def get_stock_quote(self, ticker: str, market_code: MarketCode = MarketCode.KRX) -> stock_price.QuoteResponseBody:
+        """주식 현재가 시세 조회 (주요 시세 필드만)
+
+        전체 79개 필드 대신 현재가/시가/고가/저가/거래량 등만 응답 바이트에서 바로 검증합니다.
+        전략처럼 현재가를 자주 조회하는 곳에서 사용합니다.
+
+        Args:
+            ticker: 종목코드 (예: 005930)
+            market_code: 시장 분류 코드 (기본값: MarketCode.KRX)
+
+        Returns:
+            stock_price.QuoteResponseBody: 주요 시세 필드
+        """
+        return self._validate_json(self._request_stock_price(ticker, market_code), stock_price.QuoteResponseBody)
+
+    def _request_stock_price(self, ticker: str, market_code: MarketCode) -> Response:
         url = f"{self.url_base}/uapi/domestic-stock/v1/quotations/inquire-price"
 
         header = stock_price.RequestHeader(
@@ -112,11 +144,27 @@ class HantuDomesticAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
+        return self._get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
 
-        self._validate_response(res)
+    def get_stock_prices(
+        self,
+        tickers: Iterable[str],
+        market_code: MarketCode = MarketCode.KRX,
+        max_workers: int = DEFAULT_QUOTE_WORKERS,
+    ) -> QuoteBatch[stock_price.ResponseBody]:
+        """여러 종목 현재가 시세 동시 조회
 
-        return stock_price.ResponseBody.model_validate(res.json())
+        종목별 조회를 동시에 실행하며, 요청 간격은 계좌 타입별 요청 수 제한기가 맞춥니다.
+
+        Args:
+            tickers: 종목코드 목록 (예: ["005930", "000660"])
+            market_code: 시장 분류 코드 (기본값: MarketCode.KRX)
+            max_workers: 동시에 조회할 최대 종목 수
+
+        Returns:
+            QuoteBatch[stock_price.ResponseBody]: 종목별 시세와 실패한 종목의 예외
+        """
+        return self._fetch_quotes(lambda ticker: self.get_stock_price(ticker, market_code), tickers, max_workers)
 
     def sell_market_order(self, ticker: str, quantity: int) -> order.ResponseBody:
         """시장가 매도 주문
@@ -227,32 +275,35 @@ class HantuDomesticAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.post(url, headers=header.model_dump(by_alias=True), data=body.model_dump_json())
+        res = self._post(url, headers=header.model_dump(by_alias=True), data=body.model_dump_json())
 
         self._validate_response(res)
 
         return order.ResponseBody.model_validate(res.json())
 
-    def _get_balance_recursive(
-        self,
-        ctx_area_fk100: str = "",
-        ctx_area_nk100: str = "",
-        continuation_flag: str = "",
-        accumulated_output1: list[balance.ResponseBodyoutput1] | None = None,
-    ) -> tuple[list[balance.ResponseBodyoutput1], list[balance.ResponseBodyoutput2]]:
-        """주식 잔고 조회 (연속 조회 지원) - 내부 메서드
+    def iter_balance_pages(self) -> Iterator[balance.ResponseBody]:
+        """주식 잔고 페이지 단위 조회
 
-        Args:
-            ctx_area_fk100: 연속조회검색조건100 (내부적으로 사용)
-            ctx_area_nk100: 연속조회키100 (내부적으로 사용)
-            continuation_flag: 연속거래여부 (내부적으로 사용)
-            accumulated_output1: 누적된 output1 (내부적으로 사용)
+        CTX_AREA_FK100/NK100 커서를 따라 페이지를 하나씩 요청해서 반환합니다.
+        output2(계좌 전체 정보)는 마지막 페이지의 값이 최신입니다.
 
         Returns:
-            Tuple[List[ResponseBodyoutput1], List[ResponseBodyoutput2]]: (종목 리스트, 계좌 정보)
+            Iterator[balance.ResponseBody]: 페이지별 잔고 응답
         """
-        if accumulated_output1 is None:
-            accumulated_output1 = []
+        return self._paginate(
+            fetch=self._fetch_balance_page,
+            parse=lambda res: balance.ResponseBody.model_validate(res.json()),
+            next_cursor=lambda page: (page.ctx_area_fk100, page.ctx_area_nk100),
+        )
+
+    def _fetch_balance_page(self, continuation_flag: str, cursor: tuple[str, str] | None) -> Response:
+        """주식 잔고 한 페이지 요청
+
+        Args:
+            continuation_flag: 연속거래여부 (첫 페이지: "", 다음 페이지: "N")
+            cursor: (연속조회검색조건100, 연속조회키100). 첫 페이지는 None
+        """
+        ctx_area_fk100, ctx_area_nk100 = cursor or ("", "")
 
         url = f"{self.url_base}/uapi/domestic-stock/v1/trading/inquire-balance"
 
@@ -261,7 +312,7 @@ class HantuDomesticAPI(HantuBaseAPI):
             appkey=self.app_key,
             appsecret=self.app_secret,
             tr_id=("TTTC8434R" if self.account_type == AccountType.REAL else "VTTC8434R"),
-            tr_cont=continuation_flag if continuation_flag else "",
+            tr_cont=continuation_flag,
         )
 
         param = balance.RequestQueryParam(
@@ -272,33 +323,7 @@ class HantuDomesticAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
-
-        self._validate_response(res)
-
-        response_body = balance.ResponseBody.model_validate(res.json())
-
-        # 현재 페이지 데이터 누적
-        accumulated_output1.extend(response_body.output1)
-        # output2는 마지막 페이지의 값을 사용 (계좌 전체 정보)
-        accumulated_output2 = response_body.output2
-
-        # 연속 조회 필요 여부 확인
-        response_tr_cont = res.headers.get("tr_cont", "")
-
-        if response_tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            # API 호출 간격 (과부하 방지)
-            time.sleep(0.1)
-            # 재귀 호출로 다음 페이지 가져오기
-            return self._get_balance_recursive(
-                ctx_area_fk100=response_body.ctx_area_fk100,
-                ctx_area_nk100=response_body.ctx_area_nk100,
-                continuation_flag="N",
-                accumulated_output1=accumulated_output1,
-            )
-        else:
-            # 모든 페이지 수집 완료
-            return accumulated_output1, accumulated_output2
+        return self._get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
 
     def get_daily_chart(
         self,
@@ -322,6 +347,43 @@ class HantuDomesticAPI(HantuBaseAPI):
         Returns:
             chart.DailyChartResponseBody: 일/주/월/년봉 차트 데이터
         """
+        return chart.DailyChartResponseBody.model_validate(self._request_daily_chart(ticker, start_date, end_date, interval, price_type, market_code))
+
+    def get_daily_chart_frame(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        interval: ChartInterval = ChartInterval.DAY,
+        price_type: PriceType = PriceType.ADJUSTED,
+        market_code: MarketCode = MarketCode.KRX,
+    ) -> pd.DataFrame:
+        """일/주/월/년봉 차트를 OHLCV DataFrame으로 조회
+
+        행마다 모델을 만들지 않고 응답 JSON을 바로 숫자 DataFrame으로 변환합니다.
+
+        Args:
+            ticker: 종목코드 (예: 005930)
+            start_date: 조회 시작일자 (date 객체)
+            end_date: 조회 종료일자 (date 객체, 최대 100개)
+            interval: 차트 주기 (기본값: DAY - 일봉)
+            price_type: 가격 타입 (기본값: ADJUSTED - 수정주가)
+            market_code: 시장 분류 코드 (기본값: KRX)
+
+        Returns:
+            pd.DataFrame: OhlcvSchema 형태의 영업일자 오름차순 DataFrame
+        """
+        return frames.domestic_daily_chart_frame(self._request_daily_chart(ticker, start_date, end_date, interval, price_type, market_code)["output2"])
+
+    def _request_daily_chart(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        interval: ChartInterval,
+        price_type: PriceType,
+        market_code: MarketCode,
+    ) -> dict:
         url = f"{self.url_base}/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
 
         header = chart.DailyChartRequestHeader(
@@ -340,11 +402,11 @@ class HantuDomesticAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
+        res = self._get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
 
         self._validate_response(res)
 
-        return chart.DailyChartResponseBody.model_validate(res.json())
+        return res.json()
 
     def get_minute_chart(self, ticker: str, target_date: date, target_time: time_obj, market_code: MarketCode = MarketCode.KRX) -> chart.MinuteChartResponseBody:
         """분봉 차트 조회
@@ -360,6 +422,27 @@ class HantuDomesticAPI(HantuBaseAPI):
         Returns:
             chart.MinuteChartResponseBody: 분봉 차트 데이터
         """
+        return chart.MinuteChartResponseBody.model_validate(self._request_minute_chart(ticker, target_date, target_time, market_code))
+
+    def get_minute_chart_frame(self, ticker: str, target_date: date, target_time: time_obj, market_code: MarketCode = MarketCode.KRX) -> pd.DataFrame:
+        """분봉 차트를 OHLCV DataFrame으로 조회
+
+        행마다 모델을 만들지 않고 응답 JSON을 바로 숫자 DataFrame으로 변환합니다.
+
+        - 한 번 호출에 최대 120건
+
+        Args:
+            ticker: 종목코드 (예: 005930)
+            target_date: 조회 일자 (date 객체)
+            target_time: 조회 시간 (time 객체)
+            market_code: 시장 분류 코드 (기본값: KRX)
+
+        Returns:
+            pd.DataFrame: OhlcvSchema 형태의 체결 시각 오름차순 DataFrame (value는 당일 누적 거래대금)
+        """
+        return frames.domestic_minute_chart_frame(self._request_minute_chart(ticker, target_date, target_time, market_code)["output2"])
+
+    def _request_minute_chart(self, ticker: str, target_date: date, target_time: time_obj, market_code: MarketCode) -> dict:
         url = f"{self.url_base}/uapi/domestic-stock/v1/quotations/inquire-time-dailychartprice"
 
         header = chart.MinuteChartRequestHeader(
@@ -376,11 +459,11 @@ class HantuDomesticAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
+        res = self._get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
 
         self._validate_response(res)
 
-        return chart.MinuteChartResponseBody.model_validate(res.json())
+        return res.json()
 
     # TR_ID 매핑 (계좌 타입, 주문 방향) -> TR_ID
     ORDER_TR_ID_MAP = {
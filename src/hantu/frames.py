@@ -0,0 +1,138 @@
+"""
+한투 응답 → 숫자 DataFrame 변환
+
+한투 API는 모든 숫자를 문자열로 반환합니다. 행마다 pydantic 모델을 만들고 필드를 하나씩 float로 바꾸는 대신,
+응답 JSON의 레코드 목록을 그대로 DataFrame으로 만든 뒤 컬럼 단위로 한 번에 숫자로 변환합니다.
+봉 데이터는 공통 OhlcvSchema(업비트 CandleSchema와 같은 컬럼)로 맞춥니다.
+"""
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.common.ohlcv import OHLCV_COLUMNS
+
+Record = Mapping[str, str]
+
+# 응답 필드 → OHLCV 컬럼
+DOMESTIC_DAILY_CHART_COLUMNS = {
+    "stck_oprc": "open",
+    "stck_hgpr": "high",
+    "stck_lwpr": "low",
+    "stck_clpr": "close",
+    "acml_vol": "volume",
+    "acml_tr_pbmn": "value",
+}
+DOMESTIC_MINUTE_CHART_COLUMNS = {
+    "stck_oprc": "open",
+    "stck_hgpr": "high",
+    "stck_lwpr": "low",
+    "stck_prpr": "close",
+    "cntg_vol": "volume",
+    "acml_tr_pbmn": "value",  # 당일 누적 거래대금
+}
+OVERSEAS_DAILY_CANDLE_COLUMNS = {
+    "open": "open",
+    "high": "high",
+    "low": "low",
+    "clos": "close",
+    "tvol": "volume",
+    "tamt": "value",
+}
+OVERSEAS_MINUTE_CANDLE_COLUMNS = {
+    "open": "open",
+    "high": "high",
+    "low": "low",
+    "last": "close",
+    "evol": "volume",
+    "eamt": "value",
+}
+
+
+def numeric_frame(records: Sequence[Record], fields: Sequence[str]) -> pd.DataFrame:
+    """
+    레코드 목록에서 지정한 필드만 float 컬럼으로 변환합니다.
+
+    빈 문자열이나 숫자가 아닌 값, 없는 필드는 NaN이 됩니다.
+
+    Args:
+        records: 응답 JSON의 레코드(dict) 목록 (예: output2)
+        fields: 변환할 필드 이름 목록
+
+    Returns:
+        fields 순서의 컬럼을 가진 DataFrame (인덱스는 레코드 순서)
+    """
+    return pd.DataFrame({field: _to_float(_column(records, field)) for field in fields}, columns=list(fields))
+
+
+def ohlcv_frame(records: Sequence[Record], columns: Mapping[str, str], date_field: str, time_field: str | None = None) -> pd.DataFrame:
+    """
+    봉 레코드 목록을 OhlcvSchema 형태의 DataFrame으로 변환합니다.
+
+    일시를 해석할 수 없는 레코드(빈 행)는 버리고, 중복 일시는 하나만 남깁니다.
+
+    Args:
+        records: 봉 레코드 목록
+        columns: 응답 필드 → OHLCV 컬럼
+        date_field: 일자 필드 (YYYYMMDD)
+        time_field: 시간 필드 (HHMMSS). 일봉 이상은 None
+
+    Returns:
+        OHLCV_COLUMNS 컬럼과 일시 인덱스를 가진 시각 오름차순 DataFrame
+    """
+    if not records:
+        return empty_ohlcv_frame()
+
+    index = _to_datetime_index(_column(records, date_field), None if time_field is None else _column(records, time_field))
+    frame = pd.DataFrame({column: _to_float(_column(records, field)) for field, column in columns.items()}, index=index)[list(OHLCV_COLUMNS)]
+
+    frame = frame[frame.index.notna()]
+    return frame[~frame.index.duplicated(keep="last")].sort_index()
+
+
+def empty_ohlcv_frame() -> pd.DataFrame:
+    """봉이 없을 때 반환하는 빈 OHLCV DataFrame"""
+    return pd.DataFrame(columns=list(OHLCV_COLUMNS), index=pd.DatetimeIndex([]), dtype=float)
+
+
+def domestic_daily_chart_frame(records: Sequence[Record]) -> pd.DataFrame:
+    """국내주식 일/주/월/년봉 output2 → OHLCV DataFrame (영업일자 인덱스)"""
+    return ohlcv_frame(records, DOMESTIC_DAILY_CHART_COLUMNS, "stck_bsop_date")
+
+
+def domestic_minute_chart_frame(records: Sequence[Record]) -> pd.DataFrame:
+    """국내주식 분봉 output2 → OHLCV DataFrame (체결 시각 인덱스, value는 당일 누적 거래대금)"""
+    return ohlcv_frame(records, DOMESTIC_MINUTE_CHART_COLUMNS, "stck_bsop_date", "stck_cntg_hour")
+
+
+def overseas_daily_candle_frame(records: Sequence[Record]) -> pd.DataFrame:
+    """해외주식 일/주/월/년 캔들 output1 → OHLCV DataFrame (일자 인덱스)"""
+    return ohlcv_frame(records, OVERSEAS_DAILY_CANDLE_COLUMNS, "xymd")
+
+
+def overseas_minute_candle_frame(records: Sequence[Record]) -> pd.DataFrame:
+    """해외주식 분봉 output2 → OHLCV DataFrame (한국 시각 인덱스)"""
+    return ohlcv_frame(records, OVERSEAS_MINUTE_CANDLE_COLUMNS, "kymd", "khms")
+
+
+def _column(records: Sequence[Record], field: str) -> list[str | None]:
+    return [record.get(field) for record in records]
+
+
+def _to_float(values: list[str | None]) -> np.ndarray:
+    try:
+        # 정상 응답은 C 수준 변환 한 번으로 끝난다
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        # 빈 문자열 등 숫자가 아닌 값이 섞인 경우에만 느린 경로로 NaN 처리
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=float)
+
+
+def _to_datetime_index(dates: list[str | None], times: list[str | None] | None) -> pd.DatetimeIndex:
+    # 일자는 중복이 많아 to_datetime의 캐시가 잘 듣고, 시각(HHMMSS)은 정수 연산으로 초 단위 오프셋을 만든다
+    index = pd.to_datetime(pd.Series(dates, dtype=object), format="%Y%m%d", errors="coerce")
+    if times is not None:
+        hhmmss = _to_float(times)
+        index = index + pd.to_timedelta(hhmmss // 10000 * 3600 + hhmmss // 100 % 100 * 60 + hhmmss % 100, unit="s")
+    return pd.DatetimeIndex(index)
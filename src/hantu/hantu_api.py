@@ -1,4 +1,7 @@
+import requests
+
 from src.config import HantuConfig
+from src.hantu.base_api import create_hantu_session
 from src.hantu.domestic_api import HantuDomesticAPI
 from src.hantu.model.domestic.account_type import AccountType
 from src.hantu.overseas_api import HantuOverseasAPI
@@ -8,6 +11,7 @@ class HantuAPI:
     """한국투자증권 API 통합 클라이언트 (Facade)
 
     국내 주식과 해외 주식 API를 통합하여 제공합니다.
+    두 클라이언트는 하나의 HTTP 세션(커넥션 풀)과 접근 토큰을 공유합니다.
 
     Args:
         config: 한투 API 설정
@@ -33,11 +37,13 @@ class HantuAPI:
         >>> )
     """
 
-    def __init__(self, config: HantuConfig, account_type: AccountType = AccountType.REAL) -> None:
+    def __init__(self, config: HantuConfig, account_type: AccountType = AccountType.REAL, session: requests.Session | None = None) -> None:
         """
         Args:
             config: 한투 API 설정
             account_type: 계좌 타입 (REAL: 실제 계좌, VIRTUAL: 가상 계좌)
+            session: 공유할 HTTP 세션. None이면 새로 생성
         """
-        self.domestic = HantuDomesticAPI(config, account_type)
-        self.overseas = HantuOverseasAPI(config, account_type)
+        self.session = session or create_hantu_session()
+        self.domestic = HantuDomesticAPI(config, account_type, session=self.session)
+        self.overseas = HantuOverseasAPI(config, account_type, session=self.session)
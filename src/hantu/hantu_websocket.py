@@ -0,0 +1,365 @@
+"""
+한투 실시간 WebSocket 스트림
+
+HantuRealtimeFeed는 KIS 실시간 WebSocket 하나로 다음을 구독합니다.
+
+- 국내주식 실시간체결가(H0STCNT0), 해외주식 실시간지연체결가(HDFSCNT0): 종목별 마지막 체결가를 LastPriceTable에 유지
+- 국내/해외주식 실시간체결통보(H0STCNI0/H0GSCNI0, 모의투자 H0STCNI9/H0GSCNI9): 주문번호별 체결 내역을 FillTable에 유지
+
+주문 헬퍼와 전략은 REST 호출 없이 테이블에서 현재가와 체결 수량을 읽고, 값이 없거나 오래되었으면 REST로 대체합니다.
+연결 관리(재연결, 스레드)는 업비트 스트림과 같은 WebSocketStream을 사용합니다.
+
+실시간 데이터는 "암호화여부|TR_ID|데이터건수|필드1^필드2^..." 형식의 문자열이고, 구독 응답과 PINGPONG은 JSON입니다.
+체결통보는 구독 응답으로 받은 key/iv로 AES-256-CBC 암호화되어 오며, 복호화에는 cryptography 패키지가 필요합니다.
+(선택 의존성: genie[realtime])
+"""
+
+import base64
+import importlib.util
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.common.metrics import MetricsSink
+from src.common.order_direction import OrderDirection
+from src.common.price_table import DEFAULT_MAX_PRICE_AGE, LastPriceTable, PriceTick
+from src.common.websocket_stream import INITIAL_RECONNECT_DELAY, MAX_RECONNECT_DELAY, WebSocketStream
+from src.constants import KST
+from src.hantu.base_api import HantuBaseAPI
+from src.hantu.model.domestic.account_type import AccountType
+from src.hantu.model.overseas.market_code import OverseasMarketCode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WEBSOCKET_URLS = {
+    AccountType.REAL: "ws://ops.koreainvestment.com:21000",
+    AccountType.VIRTUAL: "ws://ops.koreainvestment.com:31000",
+}
+
+DOMESTIC_TRADE_TR_ID = "H0STCNT0"  # 국내주식 실시간체결가
+OVERSEAS_TRADE_TR_ID = "HDFSCNT0"  # 해외주식 실시간지연체결가
+DOMESTIC_EXECUTION_TR_IDS = {AccountType.REAL: "H0STCNI0", AccountType.VIRTUAL: "H0STCNI9"}  # 국내주식 실시간체결통보
+OVERSEAS_EXECUTION_TR_IDS = {AccountType.REAL: "H0GSCNI0", AccountType.VIRTUAL: "H0GSCNI9"}  # 해외주식 실시간체결통보
+PINGPONG_TR_ID = "PINGPONG"
+
+ENCRYPTED_FLAG = "1"  # 실시간 데이터 첫 필드: 0 평문, 1 암호화
+FILLED_FLAG = "2"  # 체결통보 CNTG_YN: 1 접수/정정/취소/거부, 2 체결
+SELL_FLAG = "01"  # 체결통보 SELN_BYOV_CLS: 01 매도, 02 매수
+MAX_TRACKED_ORDERS = 1000  # 체결 내역을 보관할 최대 주문 수
+
+# 실시간체결가 필드 위치
+DOMESTIC_TRADE_TICKER, DOMESTIC_TRADE_TIME, DOMESTIC_TRADE_PRICE = 0, 1, 2  # MKSC_SHRN_ISCD, STCK_CNTG_HOUR, STCK_PRPR
+OVERSEAS_TRADE_SYMBOL, OVERSEAS_TRADE_DATE, OVERSEAS_TRADE_TIME, OVERSEAS_TRADE_PRICE = 1, 6, 7, 11  # SYMB, KYMD, KHMS, LAST
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionFields:
+    """체결통보 필드 위치 (국내/해외가 다름)"""
+
+    order_no: int  # ODER_NO
+    side: int  # SELN_BYOV_CLS
+    ticker: int  # STCK_SHRN_ISCD
+    quantity: int  # CNTG_QTY
+    price: int  # CNTG_UNPR
+    time: int  # STCK_CNTG_HOUR
+    filled: int  # CNTG_YN
+
+
+DOMESTIC_EXECUTION_FIELDS = ExecutionFields(order_no=2, side=4, ticker=8, quantity=9, price=10, time=11, filled=13)
+OVERSEAS_EXECUTION_FIELDS = ExecutionFields(order_no=2, side=4, ticker=7, quantity=8, price=9, time=10, filled=12)
+
+
+@dataclass(frozen=True, slots=True)
+class Fill:
+    """
+    체결 한 건
+
+    Attributes:
+        order_no: 주문번호
+        ticker: 종목코드
+        direction: 매수/매도
+        quantity: 체결 수량
+        price: 체결 단가
+        filled_time: 체결 시각 (HHMMSS)
+        received_at: 수신 시각 (time.monotonic)
+    """
+
+    order_no: str
+    ticker: str
+    direction: OrderDirection
+    quantity: int
+    price: float
+    filled_time: str
+    received_at: float
+
+
+class FillTable:
+    """
+    주문번호별 체결 내역 테이블
+
+    LastPriceTable과 같이 쓰기는 피드 스레드 하나에서만 일어나고 항목은 튜플로 통째로 교체하므로
+    읽는 쪽은 잠금 없이 조회합니다. 주문 응답의 주문번호(ODNO)와 체결통보의 주문번호는
+    앞자리 0 개수가 다를 수 있어 0을 뗀 값으로 찾습니다.
+    """
+
+    def __init__(self, max_orders: int = MAX_TRACKED_ORDERS) -> None:
+        """
+        Args:
+            max_orders: 보관할 최대 주문 수 (넘으면 오래된 주문부터 버림)
+        """
+        self._max_orders = max_orders
+        self._fills: OrderedDict[str, tuple[Fill, ...]] = OrderedDict()
+
+    def add(self, fill: Fill) -> None:
+        """체결을 추가합니다."""
+        key = _order_key(fill.order_no)
+        self._fills[key] = (*self._fills.get(key, ()), fill)
+        if len(self._fills) > self._max_orders:
+            self._fills.popitem(last=False)
+
+    def fills(self, order_no: str) -> tuple[Fill, ...]:
+        """주문의 체결 내역 (체결 순서), 없으면 빈 튜플"""
+        return self._fills.get(_order_key(order_no), ())
+
+    def filled_quantity(self, order_no: str) -> int:
+        """주문의 누적 체결 수량"""
+        return sum(fill.quantity for fill in self.fills(order_no))
+
+    def average_price(self, order_no: str) -> float | None:
+        """주문의 평균 체결 단가, 체결 전이면 None"""
+        fills = self.fills(order_no)
+        quantity = sum(fill.quantity for fill in fills)
+        return sum(fill.price * fill.quantity for fill in fills) / quantity if quantity else None
+
+
+class HantuRealtimeFeed(WebSocketStream):
+    """
+    한투 실시간 체결가/체결통보 구독 클라이언트
+
+    Examples:
+        >>> feed = HantuRealtimeFeed(HantuOverseasAPI(config), domestic_tickers=["005930"], overseas_symbols=[(OverseasMarketCode.NAS, "AAPL")], hts_id="myhtsid")
+        >>> feed.start()
+        >>> feed.price("AAPL")  # 오래되었거나 아직 수신 전이면 None
+        >>> feed.fill_table.filled_quantity(order.odno)
+        >>> feed.stop()
+    """
+
+    _thread_prefix = "hantu"
+
+    def __init__(
+        self,
+        api: HantuBaseAPI,
+        domestic_tickers: Iterable[str] = (),
+        overseas_symbols: Iterable[tuple[OverseasMarketCode, str]] = (),
+        hts_id: str | None = None,
+        url: str | None = None,
+        price_table: LastPriceTable | None = None,
+        fill_table: FillTable | None = None,
+        max_price_age: float = DEFAULT_MAX_PRICE_AGE,
+        metrics_sink: MetricsSink | None = None,
+        initial_reconnect_delay: float = INITIAL_RECONNECT_DELAY,
+        max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+    ) -> None:
+        """
+        Args:
+            api: 접속키를 발급받을 한투 API 클라이언트 (계좌 타입에 따라 접속 URL과 체결통보 TR이 정해짐)
+            domestic_tickers: 실시간체결가를 구독할 국내 종목코드 목록
+            overseas_symbols: 실시간체결가를 구독할 (거래소코드, 종목코드) 목록
+            hts_id: 체결통보를 구독할 HTS ID (None이면 체결통보를 구독하지 않음)
+            url: WebSocket URL (None이면 계좌 타입별 기본 URL)
+            price_table: 체결가를 기록할 테이블 (None이면 새로 생성)
+            fill_table: 체결 내역을 기록할 테이블 (None이면 새로 생성)
+            max_price_age: price()가 허용하는 최대 경과 시간(초)
+            metrics_sink: 재연결 횟수 등을 기록할 메트릭 싱크
+            initial_reconnect_delay: 첫 재연결 대기 시간(초)
+            max_reconnect_delay: 최대 재연결 대기 시간(초)
+
+        Raises:
+            ImportError: hts_id를 지정했는데 cryptography 패키지가 설치되지 않은 경우
+        """
+        # 체결통보 복호화 실패를 첫 메시지를 받은 뒤가 아니라 생성 시점에 알린다
+        if hts_id is not None and importlib.util.find_spec("cryptography") is None:
+            raise ImportError("체결통보 구독(hts_id)에는 cryptography 패키지가 필요합니다 (genie[realtime] 설치)")
+
+        super().__init__(url or DEFAULT_WEBSOCKET_URLS[api.account_type], metrics_sink, initial_reconnect_delay, max_reconnect_delay)
+        self._api = api
+        self._price_table = price_table or LastPriceTable()
+        self._fill_table = fill_table or FillTable()
+        self._max_price_age = max_price_age
+
+        # (TR_ID, TR_KEY) 구독 목록
+        self._subscriptions = [(DOMESTIC_TRADE_TR_ID, ticker) for ticker in dict.fromkeys(domestic_tickers)]
+        self._subscriptions += [(OVERSEAS_TRADE_TR_ID, f"D{exchange_code.value}{symbol}") for exchange_code, symbol in dict.fromkeys(overseas_symbols)]
+        if hts_id is not None:
+            self._subscriptions += [(DOMESTIC_EXECUTION_TR_IDS[api.account_type], hts_id), (OVERSEAS_EXECUTION_TR_IDS[api.account_type], hts_id)]
+
+        self._handlers: dict[str, Callable[[list[str]], None]] = {
+            DOMESTIC_TRADE_TR_ID: self._handle_domestic_trade,
+            OVERSEAS_TRADE_TR_ID: self._handle_overseas_trade,
+            DOMESTIC_EXECUTION_TR_IDS[api.account_type]: lambda record: self._handle_execution(record, DOMESTIC_EXECUTION_FIELDS),
+            OVERSEAS_EXECUTION_TR_IDS[api.account_type]: lambda record: self._handle_execution(record, OVERSEAS_EXECUTION_FIELDS),
+        }
+        self._cipher_keys: dict[str, tuple[str, str]] = {}  # TR_ID → (key, iv)
+
+    @property
+    def _stream_name(self) -> str:
+        return "realtime"
+
+    @property
+    def price_table(self) -> LastPriceTable:
+        return self._price_table
+
+    @property
+    def fill_table(self) -> FillTable:
+        return self._fill_table
+
+    def price(self, ticker: str) -> float | None:
+        """
+        현재가 조회
+
+        Args:
+            ticker: 국내 종목코드(예: 005930) 또는 해외 종목코드(예: AAPL)
+
+        Returns:
+            현재가, 수신 전이거나 max_price_age보다 오래되었으면 None
+        """
+        return self._price_table.get(ticker, self._max_price_age)
+
+    def _subscribe_messages(self) -> list[str]:
+        # 접속키와 암호화 키는 연결마다 새로 받는다
+        approval_key = self._api.get_approval_key()
+        self._cipher_keys.clear()
+
+        return [
+            json.dumps(
+                {
+                    "header": {"approval_key": approval_key, "custtype": "P", "tr_type": "1", "content-type": "utf-8"},
+                    "body": {"input": {"tr_id": tr_id, "tr_key": tr_key}},
+                }
+            )
+            for tr_id, tr_key in self._subscriptions
+        ]
+
+    def _handle_message(self, message: str | bytes) -> str | None:
+        if isinstance(message, bytes):
+            message = message.decode()
+        self._last_message_at = time.monotonic()
+
+        if message[:1] in ("0", ENCRYPTED_FLAG):
+            self._handle_realtime(message)
+            return None
+
+        data = json.loads(message)
+        header = data.get("header", {})
+        tr_id = header.get("tr_id")
+
+        if tr_id == PINGPONG_TR_ID:
+            # 서버가 보낸 PINGPONG을 그대로 돌려보내야 연결이 유지된다
+            return message
+
+        body = data.get("body", {})
+        if body.get("rt_cd", "0") != "0":
+            logger.error(f"{self._stream_name} 스트림 구독 실패: {tr_id} {header.get('tr_key')} {body.get('msg1')}")
+            return None
+
+        output = body.get("output") or {}
+        if output.get("key") and output.get("iv"):
+            self._cipher_keys[tr_id] = (output["key"], output["iv"])
+        logger.debug(f"{self._stream_name} 스트림 구독 응답: {tr_id} {header.get('tr_key')} {body.get('msg1')}")
+        return None
+
+    def _handle_realtime(self, message: str) -> None:
+        encrypted, tr_id, count, payload = message.split("|", 3)
+        handler = self._handlers.get(tr_id)
+        if handler is None:
+            return
+
+        if encrypted == ENCRYPTED_FLAG:
+            cipher_key = self._cipher_keys.get(tr_id)
+            if cipher_key is None:
+                logger.warning(f"{self._stream_name} 스트림 복호화 키 없음: {tr_id}")
+                return
+            try:
+                payload = decrypt_payload(payload, *cipher_key)
+            except (ImportError, ValueError) as e:
+                # 복호화 실패로 연결을 끊으면 재연결해도 같은 실패가 반복되므로 해당 메시지만 버린다
+                logger.error(f"{self._stream_name} 스트림 복호화 실패: {tr_id} ({e})")
+                return
+
+        # 여러 건이 한 메시지로 오면 필드가 건수만큼 이어 붙어 있다
+        fields = payload.split("^")
+        record_count = int(count)
+        if record_count <= 0 or len(fields) < record_count:
+            logger.warning(f"{self._stream_name} 스트림 데이터 건수 오류: {tr_id} ({count}건, 필드 {len(fields)}개)")
+            return
+
+        size = len(fields) // record_count
+        for start in range(0, size * record_count, size):
+            handler(fields[start : start + size])
+
+    def _handle_domestic_trade(self, record: list[str]) -> None:
+        # 국내 체결가에는 일자가 없으므로 오늘(KST) 일자를 붙인다
+        trade_timestamp = kst_timestamp(datetime.now(KST).strftime("%Y%m%d"), record[DOMESTIC_TRADE_TIME])
+        self._price_table.update(PriceTick(record[DOMESTIC_TRADE_TICKER], float(record[DOMESTIC_TRADE_PRICE]), trade_timestamp, time.monotonic()))
+
+    def _handle_overseas_trade(self, record: list[str]) -> None:
+        trade_timestamp = kst_timestamp(record[OVERSEAS_TRADE_DATE], record[OVERSEAS_TRADE_TIME])
+        self._price_table.update(PriceTick(record[OVERSEAS_TRADE_SYMBOL], float(record[OVERSEAS_TRADE_PRICE]), trade_timestamp, time.monotonic()))
+
+    def _handle_execution(self, record: list[str], fields: ExecutionFields) -> None:
+        # 접수/정정/취소/거부 통보는 체결 수량이 없으므로 기록하지 않는다
+        if record[fields.filled] != FILLED_FLAG:
+            return
+
+        self._fill_table.add(
+            Fill(
+                order_no=record[fields.order_no],
+                ticker=record[fields.ticker],
+                direction=OrderDirection.SELL if record[fields.side] == SELL_FLAG else OrderDirection.BUY,
+                quantity=int(record[fields.quantity]),
+                price=float(record[fields.price]),
+                filled_time=record[fields.time],
+                received_at=time.monotonic(),
+            )
+        )
+
+
+def kst_timestamp(ymd: str, hms: str) -> int:
+    """한국 시각 일자(YYYYMMDD)와 시각(HHMMSS) → ms 타임스탬프"""
+    return int(datetime.strptime(ymd + hms, "%Y%m%d%H%M%S").replace(tzinfo=KST).timestamp() * 1000)
+
+
+def decrypt_payload(payload: str, key: str, iv: str) -> str:
+    """
+    체결통보 본문 복호화 (AES-256-CBC, base64)
+
+    Args:
+        payload: 암호화된 본문
+        key: 구독 응답의 output.key
+        iv: 구독 응답의 output.iv
+
+    Returns:
+        "^"로 구분된 평문 본문
+
+    Raises:
+        ImportError: cryptography 패키지가 설치되지 않은 경우
+    """
+    # 체결통보를 구독할 때만 필요하므로 시세만 구독하는 환경에서는 설치하지 않아도 된다
+    try:
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.primitives.padding import PKCS7
+    except ImportError as e:
+        raise ImportError("체결통보 복호화에는 cryptography 패키지가 필요합니다") from e
+
+    decryptor = Cipher(algorithms.AES(key.encode()), modes.CBC(iv.encode())).decryptor()
+    padded = decryptor.update(base64.b64decode(payload)) + decryptor.finalize()
+    unpadder = PKCS7(algorithms.AES.block_size).unpadder()
+    return (unpadder.update(padded) + unpadder.finalize()).decode()
+
+
+def _order_key(order_no: str) -> str:
+    return order_no.lstrip("0")
@@ -1,9 +1,12 @@
 """한국투자증권 API 데이터 모델"""
 
-from src.hantu.model import access_token, domestic, overseas
+from src.hantu.model import access_token, approval_key, domestic, overseas, quote_batch, result_code
 
 __all__ = [
     "access_token",
+    "approval_key",
     "domestic",
     "overseas",
+    "quote_batch",
+    "result_code",
 ]
@@ -27,8 +27,19 @@ class ResponseBody(BaseModel):
         Returns:
             만료되었으면 True, 아니면 False
         """
+        return self.seconds_until_expired(buffer_seconds) <= 0
+
+    def seconds_until_expired(self, buffer_seconds: int = 300) -> float:
+        """is_expired()가 True가 되기까지 남은 시간 (KST 기준)
+
+        Args:
+            buffer_seconds: 만료 여유 시간 (초). 기본값 300초(5분)
+
+        Returns:
+            남은 시간(초). 이미 지났으면 0 이하
+        """
         # 현재 시간을 KST로 가져옴
         now_kst = datetime.now(KST)
         # API 응답 시간을 KST로 간주
         expired_kst = self.access_token_token_expired.replace(tzinfo=KST)
-        return now_kst >= expired_kst - timedelta(seconds=buffer_seconds)
+        return (expired_kst - timedelta(seconds=buffer_seconds) - now_kst).total_seconds()
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class RequestBody(BaseModel):
+    grant_type: str = "client_credentials"  # 권한부여 Type
+    appkey: str  # 앱키
+    secretkey: str  # 앱시크릿키
+
+
+class ResponseBody(BaseModel):
+    approval_key: str  # 웹소켓 접속키
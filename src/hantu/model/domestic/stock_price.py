@@ -3,6 +3,7 @@
 from pydantic import BaseModel, Field
 
 from src.hantu.model.domestic.market_code import MarketCode
+from src.hantu.model.result_code import ResultCodeBody
 
 
 class RequestHeader(BaseModel):
@@ -147,3 +148,28 @@ class ResponseBody(BaseModel):
     msg_cd: str = Field(description="응답코드")
     msg1: str = Field(description="응답메시지")
     output: StockPriceOutput = Field(description="응답 상세")
+
+
+class StockPriceQuote(BaseModel):
+    """주식 현재가 시세 응답 output 중 주요 시세 필드
+
+    나머지 필드는 검증하지 않고 버립니다.
+    """
+
+    stck_prpr: str = Field(description="주식 현재가")
+    stck_oprc: str = Field(description="시가")
+    stck_hgpr: str = Field(description="고가")
+    stck_lwpr: str = Field(description="저가")
+    prdy_vrss: str = Field(description="전일 대비")
+    prdy_vrss_sign: str = Field(description="전일 대비 부호")
+    prdy_ctrt: str = Field(description="전일 대비율")
+    acml_vol: str = Field(description="누적 거래량")
+    acml_tr_pbmn: str = Field(description="누적 거래대금")
+
+
+class QuoteResponseBody(ResultCodeBody):
+    """주요 시세 필드만 담은 API 응답 바디"""
+
+    msg_cd: str = Field(description="응답코드")
+    msg1: str = Field(description="응답메시지")
+    output: StockPriceQuote = Field(description="응답 상세")
@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from src.hantu.model.result_code import ResultCodeBody
+
 
 class OverseasCurrentPriceData(BaseModel):
     """해외주식 현재체결가 데이터"""
@@ -25,6 +27,18 @@ class OverseasCurrentPriceResponse(BaseModel):
     output: OverseasCurrentPriceData = Field(..., description="응답 데이터")
 
 
+class OverseasLastPriceData(BaseModel):
+    """해외주식 현재체결가 데이터 중 현재가 (나머지 필드는 검증하지 않고 버린다)"""
+
+    last: str = Field(..., description="현재가")
+
+
+class OverseasLastPriceResponse(ResultCodeBody):
+    """해외주식 현재체결가 응답 (현재가만)"""
+
+    output: OverseasLastPriceData = Field(..., description="응답 데이터")
+
+
 class OverseasDailyCandleData(BaseModel):
     """해외주식 일/주/월/년 캔들 데이터"""
 
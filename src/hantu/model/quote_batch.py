@@ -0,0 +1,38 @@
+"""여러 종목 현재가 일괄 조회 결과"""
+
+from dataclasses import dataclass, field
+from typing import Protocol
+
+import pandas as pd
+from pydantic import BaseModel
+
+
+class QuoteResponse(Protocol):
+    """응답 상세(output)를 가진 종목별 현재가 응답"""
+
+    @property
+    def output(self) -> BaseModel: ...
+
+
+@dataclass
+class QuoteBatch[Q: QuoteResponse]:
+    """
+    종목별 현재가 조회 결과
+
+    일부 종목이 실패해도 나머지 결과는 quotes에 담기고, 실패한 종목은 errors에 예외와 함께 담깁니다.
+
+    Attributes:
+        quotes: 종목코드 → 현재가 응답
+        errors: 종목코드 → 조회 중 발생한 예외
+    """
+
+    quotes: dict[str, Q] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        성공한 종목의 응답 상세(output)를 종목코드 인덱스의 DataFrame으로 변환합니다.
+
+        값은 API 응답 그대로 문자열입니다.
+        """
+        return pd.DataFrame.from_dict({symbol: quote.output.model_dump() for symbol, quote in self.quotes.items()}, orient="index")
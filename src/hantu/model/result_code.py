@@ -0,0 +1,12 @@
+"""한투 API 응답 공통 모델"""
+
+from pydantic import BaseModel, Field
+
+
+class ResultCodeBody(BaseModel):
+    """성공 실패 여부(rt_cd)를 가진 응답 바디
+
+    HantuBaseAPI._validate_json으로 바로 검증하는 응답 모델은 이 모델을 상속합니다.
+    """
+
+    rt_cd: str = Field(description="성공 실패 여부 (0:성공, 0 이외:실패)")
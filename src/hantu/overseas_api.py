@@ -1,10 +1,13 @@
 import logging
-import time
+from collections.abc import Iterable, Iterator, Mapping
 
-import requests
+import pandas as pd
+from requests import Response
 
 from src.common.order_direction import OrderDirection
-from src.hantu.base_api import HantuBaseAPI
+from src.hantu import frames
+from src.hantu.base_api import DEFAULT_QUOTE_WORKERS, HantuBaseAPI
+from src.hantu.hantu_websocket import HantuRealtimeFeed
 from src.hantu.model.domestic.account_type import AccountType
 from src.hantu.model.domestic.trading_currency_code import TradingCurrencyCode
 from src.hantu.model.overseas import balance as overseas_balance
@@ -17,9 +20,11 @@ from src.hantu.model.overseas.minute_interval import OverseasMinuteInterval
 from src.hantu.model.overseas.price import (
     OverseasCurrentPriceResponse,
     OverseasDailyCandleResponse,
+    OverseasLastPriceResponse,
     OverseasMinuteCandleData,
     OverseasMinuteCandleResponse,
 )
+from src.hantu.model.quote_batch import QuoteBatch
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,9 @@ class HantuOverseasAPI(HantuBaseAPI):
         account_type: 계좌 타입 (REAL: 실제 계좌, VIRTUAL: 가상 계좌)
     """
 
+    # 실시간 시세 피드. 설정되어 있으면 시장가 주문의 주문 단가를 피드에서 먼저 읽고, 없거나 오래된 값이면 REST로 조회합니다.
+    price_feed: HantuRealtimeFeed | None = None
+
     def get_balance(
         self,
         exchange_code: OverseasExchangeCode = OverseasExchangeCode.NASD,
@@ -49,34 +57,62 @@ class HantuOverseasAPI(HantuBaseAPI):
 
         Returns:
             overseas_balance.OverseasBalanceResponse: output1(개별 종목), output2(계좌 전체)
+
+        Raises:
+            Exception: 조회된 페이지가 없는 경우
         """
-        output1, output2 = self._get_balance_recursive(exchange_code=exchange_code, trading_currency_code=trading_currency_code)
+        output1: list[overseas_balance.ResponseBodyoutput1] = []
+        output2: overseas_balance.ResponseBodyoutput2 | None = None
+
+        for page in self.iter_balance_pages(exchange_code=exchange_code, trading_currency_code=trading_currency_code):
+            output1.extend(page.output1)
+            # output2는 마지막 페이지의 값을 사용 (계좌 전체 정보)
+            output2 = page.output2
+
+        if output2 is None:
+            raise Exception("해외 잔고 조회 결과가 없습니다")
+
         return overseas_balance.OverseasBalanceResponse(output1=output1, output2=output2)
 
-    def _get_balance_recursive(
+    def iter_balance_pages(
         self,
-        exchange_code: OverseasExchangeCode,
-        trading_currency_code: TradingCurrencyCode,
-        ctx_area_fk200: str = "",
-        ctx_area_nk200: str = "",
-        continuation_flag: str = "",
-        accumulated_output1: list[overseas_balance.ResponseBodyoutput1] | None = None,
-    ) -> tuple[list[overseas_balance.ResponseBodyoutput1], overseas_balance.ResponseBodyoutput2]:
-        """해외 주식 잔고 조회 (연속 조회 지원) - 내부 메서드
+        exchange_code: OverseasExchangeCode = OverseasExchangeCode.NASD,
+        trading_currency_code: TradingCurrencyCode = TradingCurrencyCode.USD,
+    ) -> Iterator[overseas_balance.ResponseBody]:
+        """해외 주식 잔고 페이지 단위 조회
+
+        CTX_AREA_FK200/NK200 커서를 따라 페이지를 하나씩 요청해서 반환합니다.
+        output2(계좌 전체 정보)는 마지막 페이지의 값이 최신입니다.
 
         Args:
             exchange_code: 해외거래소코드 (OverseasExchangeCode enum 사용)
             trading_currency_code: 거래통화코드 (TradingCurrencyCode enum 사용)
-            ctx_area_fk200: 연속조회검색조건200 (내부적으로 사용)
-            ctx_area_nk200: 연속조회키200 (내부적으로 사용)
-            continuation_flag: 연속거래여부 (내부적으로 사용)
-            accumulated_output1: 누적된 output1 (내부적으로 사용)
 
         Returns:
-            Tuple: (종목 리스트, 계좌 정보)
+            Iterator[overseas_balance.ResponseBody]: 페이지별 잔고 응답
         """
-        if accumulated_output1 is None:
-            accumulated_output1 = []
+        return self._paginate(
+            fetch=lambda continuation_flag, cursor: self._fetch_balance_page(exchange_code, trading_currency_code, continuation_flag, cursor),
+            parse=lambda res: overseas_balance.ResponseBody.model_validate(res.json()),
+            next_cursor=lambda page: (page.ctx_area_fk200, page.ctx_area_nk200),
+        )
+
+    def _fetch_balance_page(
+        self,
+        exchange_code: OverseasExchangeCode,
+        trading_currency_code: TradingCurrencyCode,
+        continuation_flag: str,
+        cursor: tuple[str, str] | None,
+    ) -> Response:
+        """해외 주식 잔고 한 페이지 요청
+
+        Args:
+            exchange_code: 해외거래소코드 (OverseasExchangeCode enum 사용)
+            trading_currency_code: 거래통화코드 (TradingCurrencyCode enum 사용)
+            continuation_flag: 연속거래여부 (첫 페이지: "", 다음 페이지: "N")
+            cursor: (연속조회검색조건200, 연속조회키200). 첫 페이지는 None
+        """
+        ctx_area_fk200, ctx_area_nk200 = cursor or ("", "")
 
         url = f"{self.url_base}/uapi/overseas-stock/v1/trading/inquire-balance"
 
@@ -88,7 +124,7 @@ class HantuOverseasAPI(HantuBaseAPI):
             appkey=self.app_key,
             appsecret=self.app_secret,
             tr_id=tr_id,
-            tr_cont=continuation_flag if continuation_flag else "",
+            tr_cont=continuation_flag,
         )
 
         param = overseas_balance.RequestQueryParam(
@@ -101,33 +137,7 @@ class HantuOverseasAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
-
-        self._validate_response(res)
-
-        response_body = overseas_balance.ResponseBody.model_validate(res.json())
-
-        # 현재 페이지 데이터 누적
-        accumulated_output1.extend(response_body.output1)
-        # output2는 마지막 페이지의 값을 사용 (계좌 전체 정보)
-        # 연속 조회 필요 여부 확인
-        response_tr_cont = res.headers.get("tr_cont", "")
-
-        if response_tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            # API 호출 간격 (과부하 방지)
-            time.sleep(0.1)
-            # 재귀 호출로 다음 페이지 가져오기
-            return self._get_balance_recursive(
-                exchange_code=exchange_code,
-                trading_currency_code=trading_currency_code,
-                ctx_area_fk200=response_body.ctx_area_fk200,
-                ctx_area_nk200=response_body.ctx_area_nk200,
-                continuation_flag="N",
-                accumulated_output1=accumulated_output1,
-            )
-        else:
-            # 모든 페이지 수집 완료
-            return accumulated_output1, response_body.output2
+        return self._get(url, headers=header.model_dump(by_alias=True), params=param.model_dump())
 
     def get_current_price(self, exchange_code: OverseasMarketCode = OverseasMarketCode.NYS, symbol: str = "") -> OverseasCurrentPriceResponse:
         """해외 주식 현재체결가 조회
@@ -143,6 +153,32 @@ class HantuOverseasAPI(HantuBaseAPI):
             ValueError: 필수 파라미터가 누락된 경우
             Exception: API 호출 실패 시
         """
+        res = self._request_current_price(exchange_code, symbol)
+
+        self._validate_response(res)
+
+        return OverseasCurrentPriceResponse.model_validate(res.json())
+
+    def get_last_price(self, exchange_code: OverseasMarketCode = OverseasMarketCode.NYS, symbol: str = "") -> str:
+        """해외 주식 현재가만 조회
+
+        전체 응답 모델 대신 현재가(last) 필드만 응답 바이트에서 바로 검증합니다.
+        시장가 주문처럼 현재가만 필요한 곳에서 사용합니다.
+
+        Args:
+            exchange_code: 거래소코드 (OverseasMarketCode enum, 기본값: NYS)
+            symbol: 종목코드 (예: AAPL, TSLA 등)
+
+        Returns:
+            str: 현재가
+
+        Raises:
+            ValueError: 필수 파라미터가 누락된 경우
+            Exception: API 호출 실패 시
+        """
+        return self._validate_json(self._request_current_price(exchange_code, symbol), OverseasLastPriceResponse).output.last
+
+    def _request_current_price(self, exchange_code: OverseasMarketCode, symbol: str) -> Response:
         if not symbol:
             raise ValueError("종목코드(symbol)는 필수입니다")
 
@@ -160,11 +196,39 @@ class HantuOverseasAPI(HantuBaseAPI):
             "SYMB": symbol,
         }
 
-        res = requests.get(url, headers=headers, params=params)
+        return self._get(url, headers=headers, params=params)
 
-        self._validate_response(res)
+    def get_current_prices(
+        self,
+        symbols: Iterable[str],
+        exchange_code: OverseasMarketCode | Mapping[str, OverseasMarketCode] = OverseasMarketCode.NYS,
+        max_workers: int = DEFAULT_QUOTE_WORKERS,
+    ) -> QuoteBatch[OverseasCurrentPriceResponse]:
+        """여러 해외 종목 현재체결가 동시 조회
 
-        return OverseasCurrentPriceResponse.model_validate(res.json())
+        종목별 조회를 동시에 실행하며, 요청 간격은 계좌 타입별 요청 수 제한기가 맞춥니다.
+
+        Args:
+            symbols: 종목코드 목록 (예: ["AAPL", "TSLA"])
+            exchange_code: 모든 종목에 쓸 거래소코드, 또는 종목코드 → 거래소코드 (기본값: NYS)
+            max_workers: 동시에 조회할 최대 종목 수
+
+        Returns:
+            QuoteBatch[OverseasCurrentPriceResponse]: 종목별 현재체결가와 실패한 종목의 예외
+                (거래소코드가 지정되지 않은 종목은 KeyError로 errors에 담긴다)
+        """
+        exchange_codes: Mapping[str, OverseasMarketCode] | None = None
+        default_code = OverseasMarketCode.NYS
+        if isinstance(exchange_code, Mapping):
+            exchange_codes = exchange_code
+        else:
+            default_code = exchange_code
+
+        def fetch(symbol: str) -> OverseasCurrentPriceResponse:
+            code = exchange_codes[symbol] if exchange_codes is not None else default_code
+            return self.get_current_price(exchange_code=code, symbol=symbol)
+
+        return self._fetch_quotes(fetch, symbols, max_workers)
 
     def get_daily_candles(
         self,
@@ -190,6 +254,37 @@ class HantuOverseasAPI(HantuBaseAPI):
             ValueError: 필수 파라미터가 누락된 경우
             Exception: API 호출 실패 시
         """
+        return OverseasDailyCandleResponse.model_validate(self._request_daily_candles(symbol, start_date, end_date, asset_type, period))
+
+    def get_daily_candle_frame(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        asset_type: OverseasAssetType = OverseasAssetType.INDEX,
+        period: OverseasCandlePeriod = OverseasCandlePeriod.DAILY,
+    ) -> pd.DataFrame:
+        """해외 주식 일/주/월/년 캔들을 OHLCV DataFrame으로 조회
+
+        행마다 모델을 만들지 않고 응답 JSON을 바로 숫자 DataFrame으로 변환합니다.
+
+        Args:
+            symbol: 종목코드
+            start_date: 시작일자 (YYYYMMDD)
+            end_date: 종료일자 (YYYYMMDD)
+            asset_type: 자산 유형 코드 (OverseasAssetType enum)
+            period: 기간구분 (OverseasCandlePeriod enum, 기본값: DAILY)
+
+        Returns:
+            pd.DataFrame: OhlcvSchema 형태의 일자 오름차순 DataFrame
+
+        Raises:
+            ValueError: 필수 파라미터가 누락된 경우
+            Exception: API 호출 실패 시
+        """
+        return frames.overseas_daily_candle_frame(self._request_daily_candles(symbol, start_date, end_date, asset_type, period).get("output1") or [])
+
+    def _request_daily_candles(self, symbol: str, start_date: str, end_date: str, asset_type: OverseasAssetType, period: OverseasCandlePeriod) -> dict:
         if not symbol:
             raise ValueError("종목코드(symbol)는 필수입니다")
         if not start_date:
@@ -215,11 +310,11 @@ class HantuOverseasAPI(HantuBaseAPI):
             "FID_PERIOD_DIV_CODE": period.value,
         }
 
-        res = requests.get(url, headers=headers, params=params)
+        res = self._get(url, headers=headers, params=params)
 
         self._validate_response(res)
 
-        return OverseasDailyCandleResponse.model_validate(res.json())
+        return res.json()
 
     def get_minute_candles(
         self,
@@ -247,34 +342,116 @@ class HantuOverseasAPI(HantuBaseAPI):
             ValueError: 필수 파라미터가 누락된 경우
             Exception: API 호출 실패 시
         """
-        if not symbol:
-            raise ValueError("종목코드(symbol)는 필수입니다")
-        if limit > 120:
-            raise ValueError("요청 개수(limit)는 최대 120입니다")
+        output1 = None
+        output2: list[OverseasMinuteCandleData] = []
 
-        result = self._get_minute_candles_recursive(
+        for page in self.iter_minute_candle_pages(
             symbol=symbol,
             exchange_code=exchange_code,
             minute_interval=minute_interval,
             include_previous=include_previous,
             limit=limit,
+        ):
+            # output1 메타데이터는 첫 페이지의 값을 사용
+            output1 = output1 or page.output1
+            output2.extend(page.output2)
+
+        return OverseasMinuteCandleResponse(output1=output1, output2=output2)
+
+    def get_minute_candle_frame(
+        self,
+        symbol: str,
+        exchange_code: OverseasMarketCode = OverseasMarketCode.NAS,
+        minute_interval: OverseasMinuteInterval = OverseasMinuteInterval.MIN_1,
+        include_previous: bool = False,
+        limit: int = 120,
+    ) -> pd.DataFrame:
+        """해외 주식 분봉을 OHLCV DataFrame으로 조회
+
+        연속 조회로 모든 페이지를 받은 뒤, 행마다 모델을 만들지 않고 응답 JSON을 한 번에 숫자 DataFrame으로 변환합니다.
+
+        Args:
+            symbol: 종목코드 (예: TSLA, AAPL)
+            exchange_code: 거래소코드 (기본값: NAS, OverseasMarketCode 사용)
+            minute_interval: 분 간격 (기본값: MIN_1, OverseasMinuteInterval 사용)
+            include_previous: 전일 포함 여부 (기본값: False)
+            limit: 페이지당 요청 개수 (최대 120, 기본값: 120)
+
+        Returns:
+            pd.DataFrame: OhlcvSchema 형태의 한국 시각 오름차순 DataFrame
+
+        Raises:
+            ValueError: 필수 파라미터가 누락된 경우
+            Exception: API 호출 실패 시
+        """
+        pages = self._iter_raw_minute_candle_pages(symbol, exchange_code, minute_interval, include_previous, limit)
+        return frames.overseas_minute_candle_frame([record for page in pages for record in page.get("output2") or []])
+
+    def iter_minute_candle_pages(
+        self,
+        symbol: str,
+        exchange_code: OverseasMarketCode = OverseasMarketCode.NAS,
+        minute_interval: OverseasMinuteInterval = OverseasMinuteInterval.MIN_1,
+        include_previous: bool = False,
+        limit: int = 120,
+    ) -> Iterator[OverseasMinuteCandleResponse]:
+        """해외 주식 분봉 페이지 단위 조회
+
+        연속 조회 페이지를 하나씩 요청해서 반환합니다. output1(메타데이터)이 없는 페이지는 앞 페이지의 값을 사용합니다.
+
+        Args:
+            symbol: 종목코드 (예: TSLA, AAPL)
+            exchange_code: 거래소코드 (기본값: NAS, OverseasMarketCode 사용)
+            minute_interval: 분 간격 (기본값: MIN_1, OverseasMinuteInterval 사용)
+            include_previous: 전일 포함 여부 (기본값: False)
+            limit: 페이지당 요청 개수 (최대 120, 기본값: 120)
+
+        Returns:
+            Iterator[OverseasMinuteCandleResponse]: 페이지별 분봉 응답
+
+        Raises:
+            ValueError: 필수 파라미터가 누락된 경우 (첫 페이지를 요청하기 전에 발생)
+        """
+        return self._with_minute_candle_metadata(self._iter_raw_minute_candle_pages(symbol, exchange_code, minute_interval, include_previous, limit))
+
+    def _iter_raw_minute_candle_pages(
+        self,
+        symbol: str,
+        exchange_code: OverseasMarketCode,
+        minute_interval: OverseasMinuteInterval,
+        include_previous: bool,
+        limit: int,
+    ) -> Iterator[dict]:
+        """분봉 연속 조회 페이지를 응답 JSON 그대로 반환합니다. 파라미터 검증은 첫 페이지 요청 전에 합니다."""
+        if not symbol:
+            raise ValueError("종목코드(symbol)는 필수입니다")
+        if limit > 120:
+            raise ValueError("요청 개수(limit)는 최대 120입니다")
+
+        return self._paginate(
+            fetch=lambda continuation_flag, next_key: self._fetch_minute_candle_page(symbol, exchange_code, minute_interval, include_previous, limit, continuation_flag, next_key),
+            parse=lambda res: res.json(),
+            next_cursor=lambda page: "1",
         )
-        return result
 
-    def _get_minute_candles_recursive(
+    @staticmethod
+    def _with_minute_candle_metadata(pages: Iterator[dict]) -> Iterator[OverseasMinuteCandleResponse]:
+        metadata = None
+        for page in pages:
+            metadata = page.get("output1") or metadata
+            yield OverseasMinuteCandleResponse.model_validate({"output1": metadata, "output2": page.get("output2") or []})
+
+    def _fetch_minute_candle_page(
         self,
         symbol: str,
         exchange_code: OverseasMarketCode,
         minute_interval: OverseasMinuteInterval,
         include_previous: bool,
         limit: int,
-        next_key: str = "",
-        key_buffer: str = "",
-        continuation_flag: str = "",
-        accumulated_output2: list[OverseasMinuteCandleData] | None = None,
-        output1_metadata: dict[str, str] | None = None,
-    ) -> OverseasMinuteCandleResponse:
-        """해외 주식 분봉 조회 (연속 조회 지원) - 내부 메서드
+        continuation_flag: str,
+        next_key: str | None,
+    ) -> Response:
+        """해외 주식 분봉 한 페이지 요청
 
         Args:
             symbol: 종목코드
@@ -282,18 +459,9 @@ class HantuOverseasAPI(HantuBaseAPI):
             minute_interval: 분 간격 (OverseasMinuteInterval enum)
             include_previous: 전일 포함 여부
             limit: 요청 개수 (int, 최대 120)
-            next_key: 다음 조회 키
-            key_buffer: 키 버퍼
-            continuation_flag: 연속 거래 여부
-            accumulated_output2: 누적된 output2 (분봉 데이터)
-            output1_metadata: output1 메타데이터
-
-        Returns:
-            OverseasMinuteCandleResponse: 분봉 응답 객체
+            continuation_flag: 연속 거래 여부 (첫 페이지: "", 다음 페이지: "N")
+            next_key: 다음 조회 키. 첫 페이지는 None
         """
-        if accumulated_output2 is None:
-            accumulated_output2 = []
-
         url = f"{self.url_base}/uapi/overseas-price/v1/quotations/inquire-time-itemchartprice"
         tr_id = "HHDFS76950200"
 
@@ -302,7 +470,7 @@ class HantuOverseasAPI(HantuBaseAPI):
             "appkey": self.app_key,
             "appsecret": self.app_secret,
             "tr_id": tr_id,
-            "tr_cont": continuation_flag if continuation_flag else "",
+            "tr_cont": continuation_flag,
         }
 
         params = {
@@ -311,54 +479,19 @@ class HantuOverseasAPI(HantuBaseAPI):
             "SYMB": symbol,
             "NMIN": minute_interval.value,
             "PINC": "1" if include_previous else "0",
-            "NEXT": next_key,
+            "NEXT": next_key or "",
             "NREC": str(limit),
             "FILL": "",
-            "KEYB": key_buffer,
+            "KEYB": "",
         }
 
-        res = requests.get(url, headers=headers, params=params)
-
-        self._validate_response(res)
-
-        response_body = res.json()
-
-        # 첫 번째 호출에서만 output1 메타데이터 저장
-        if output1_metadata is None and "output1" in response_body:
-            output1_metadata = response_body["output1"]
-
-        # 현재 페이지의 분봉 데이터 누적
-        if "output2" in response_body and response_body["output2"]:
-            accumulated_output2.extend(response_body["output2"])
-
-        # 연속 조회 필요 여부 확인
-        response_tr_cont = res.headers.get("tr_cont", "")
-
-        if response_tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            # API 호출 간격 (과부하 방지)
-            time.sleep(0.1)
-            # 재귀 호출로 다음 페이지 가져오기
-            return self._get_minute_candles_recursive(
-                symbol=symbol,
-                exchange_code=exchange_code,
-                minute_interval=minute_interval,
-                include_previous=include_previous,
-                limit=limit,
-                next_key="1",
-                key_buffer=key_buffer,
-                continuation_flag="N",
-                accumulated_output2=accumulated_output2,
-                output1_metadata=output1_metadata,
-            )
-        else:
-            # 모든 페이지 수집 완료
-            return OverseasMinuteCandleResponse(output1=output1_metadata, output2=accumulated_output2)
+        return self._get(url, headers=headers, params=params)
 
     def buy_market_order(self, ticker: str, quantity: int, exchange_code: OverseasExchangeCode = OverseasExchangeCode.NASD) -> overseas_order.ResponseBody:
         """시장가 매수 주문
 
         주의: 미국 시장은 시장가 매수를 지원하지 않으므로 지정가로 주문합니다.
-        현재가를 조회하여 해당 가격으로 지정가 주문을 실행합니다.
+        현재가(실시간 피드 우선)로 지정가 주문을 실행합니다.
 
         Args:
             ticker: 종목코드 (예: AAPL, TSLA)
@@ -368,9 +501,7 @@ class HantuOverseasAPI(HantuBaseAPI):
         Returns:
             overseas_order.ResponseBody: 주문 응답
         """
-        # 현재가 조회
-        price_info = self.get_current_price(exchange_code=OverseasMarketCode(exchange_code.value), symbol=ticker)
-        current_price = price_info.output.last
+        current_price = self._market_order_price(exchange_code, ticker)
 
         return self._order(
             order_direction=OrderDirection.BUY,
@@ -381,6 +512,13 @@ class HantuOverseasAPI(HantuBaseAPI):
             price=current_price,
         )
 
+    def _market_order_price(self, exchange_code: OverseasExchangeCode, ticker: str) -> str:
+        """시장가 주문 단가: 실시간 피드의 최근 체결가, 없거나 오래되었으면 REST로 조회한 현재가"""
+        if HantuOverseasAPI.price_feed is not None and (price := HantuOverseasAPI.price_feed.price(ticker)) is not None:
+            return str(price)
+
+        return self.get_last_price(exchange_code=OverseasMarketCode(exchange_code.value), symbol=ticker)
+
     def buy_limit_order(
         self,
         ticker: str,
@@ -412,7 +550,7 @@ class HantuOverseasAPI(HantuBaseAPI):
         """시장가 매도 주문
 
         주의: 미국 시장은 시장가 매도를 지원하지 않으므로 지정가로 주문합니다.
-        현재가를 조회하여 해당 가격으로 지정가 주문을 실행합니다.
+        현재가(실시간 피드 우선)로 지정가 주문을 실행합니다.
 
         Args:
             ticker: 종목코드 (예: AAPL, TSLA)
@@ -422,9 +560,7 @@ class HantuOverseasAPI(HantuBaseAPI):
         Returns:
             overseas_order.ResponseBody: 주문 응답
         """
-        # 현재가 조회
-        price_info = self.get_current_price(exchange_code=OverseasMarketCode(exchange_code.value), symbol=ticker)
-        current_price = price_info.output.last
+        current_price = self._market_order_price(exchange_code, ticker)
 
         return self._order(
             order_direction=OrderDirection.SELL,
@@ -511,7 +647,7 @@ class HantuOverseasAPI(HantuBaseAPI):
         )
 
         # 호출
-        res = requests.post(url, headers=header.model_dump(by_alias=True), data=body.model_dump_json())
+        res = self._post(url, headers=header.model_dump(by_alias=True), data=body.model_dump_json())
 
         self._validate_response(res)
 
@@ -0,0 +1,106 @@
+"""
+한국투자증권(KIS) REST 요청 수 제한
+
+KIS는 앱 키마다 초당 요청 수를 제한하며, 모의투자 서버는 실전보다 훨씬 엄격합니다.
+제한을 넘으면 HTTP 500과 함께 msg_cd "EGW00201"(초당 거래건수 초과)을 반환합니다.
+
+HantuRateLimiter는 계좌 타입별 토큰 버킷으로 요청 간격을 맞추고, 초과 응답을 받으면 버킷을 비운 뒤
+지수적으로 늘어나는 시간만큼 물러납니다. 버킷 용량을 1로 두어 몰아서 보내지 않고 일정한 간격으로 보냅니다.
+"""
+
+import functools
+import logging
+import time
+
+from requests import Response
+
+from src.common.metrics import MetricsSink, NullMetricsSink
+from src.common.token_bucket import TokenBucket
+from src.hantu.model.domestic.account_type import AccountType
+
+logger = logging.getLogger(__name__)
+
+# 계좌 타입별 초당 요청 수 (실전: 초당 20건, 모의: 초당 2건)
+DEFAULT_ACCOUNT_RATES: dict[AccountType, float] = {
+    AccountType.REAL: 20,
+    AccountType.VIRTUAL: 2,
+}
+RATE_LIMIT_ERROR_CODES = frozenset({"EGW00201"})  # 초당 거래건수 초과
+DEFAULT_BACKOFF = 0.5  # 초. 첫 초과 응답 뒤 대기 시간 (재시도마다 두 배)
+MAX_BACKOFF = 4.0  # 초
+
+
+class HantuRateLimiter:
+    """
+    계좌 타입 하나의 요청 수 제한기
+
+    Examples:
+        >>> limiter = HantuRateLimiter(rate=2)
+        >>> limiter.acquire()
+        >>> res = session.get(url, ...)
+        >>> if is_rate_limited(res):
+        ...     limiter.backoff(attempt)
+    """
+
+    def __init__(self, rate: float, metrics_sink: MetricsSink | None = None, label: str = "") -> None:
+        """
+        Args:
+            rate: 초당 요청 수
+            metrics_sink: 대기 시간 등을 기록할 메트릭 싱크
+            label: 메트릭에 붙일 이름 (예: 'real', 'virtual')
+        """
+        self.rate = rate
+        self.label = label
+        self.metrics_sink: MetricsSink = metrics_sink or NullMetricsSink()
+        self._bucket = TokenBucket(rate, capacity=1)
+
+    def acquire(self) -> float:
+        """
+        요청을 보낼 수 있을 때까지 현재 스레드를 대기시킵니다.
+
+        Returns:
+            대기한 시간(초)
+        """
+        delay = self._bucket.reserve()
+
+        self.metrics_sink.observe("hantu.ratelimit.wait.seconds", delay, account=self.label)
+        if delay > 0:
+            self.metrics_sink.increment("hantu.ratelimit.throttled", account=self.label)
+            time.sleep(delay)
+
+        return delay
+
+    def backoff(self, attempt: int) -> float:
+        """
+        초과 응답을 받은 뒤 버킷을 비우고 물러납니다.
+
+        Args:
+            attempt: 같은 요청의 재시도 횟수 (0부터)
+
+        Returns:
+            대기한 시간(초)
+        """
+        self.metrics_sink.increment("hantu.ratelimit.rejected", account=self.label)
+        self._bucket.drain()
+
+        delay = min(DEFAULT_BACKOFF * 2**attempt, MAX_BACKOFF)
+        logger.warning(f"한투 초당 요청 수 초과, {delay}초 후 재시도 ({self.label})")
+        time.sleep(delay)
+        return delay
+
+
+def is_rate_limited(res: Response) -> bool:
+    """응답이 KIS 초당 요청 수 초과 에러인지 확인합니다."""
+    if res.status_code == 200:
+        return False
+
+    try:
+        return res.json().get("msg_cd") in RATE_LIMIT_ERROR_CODES
+    except ValueError:
+        return False
+
+
+@functools.cache
+def default_rate_limiter(account_type: AccountType) -> HantuRateLimiter:
+    """계좌 타입별로 프로세스 전체에서 공유하는 기본 제한기"""
+    return HantuRateLimiter(DEFAULT_ACCOUNT_RATES[account_type], label=account_type.name.lower())
@@ -0,0 +1,219 @@
+"""
+한국투자증권 접근 토큰 관리
+
+토큰은 만료 시각과 함께 메모리에 두고, is_expired()가 True가 되기 전에 백그라운드 타이머로 미리 갱신합니다.
+요청마다 토큰 파일을 읽고 검증하지 않으므로 토큰 조회는 속성 읽기와 시간 비교 한 번으로 끝납니다.
+토큰 파일(token_path)은 프로세스를 다시 시작해도 토큰을 새로 발급받지 않도록 토큰이 바뀔 때만 씁니다.
+
+토큰 발급 API는 호출 빈도 제한이 있으므로, 여러 프로세스(스케줄러, 백테스트 등)가 동시에 만료를 보더라도
+한 번만 발급합니다. 발급 전에 토큰 파일의 배타 잠금을 잡고 파일을 다시 읽어서, 먼저 잠금을 잡은 프로세스가
+발급한 토큰이 있으면 그대로 사용합니다. 파일은 임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 반쯤 쓴 파일을 보지 않습니다.
+
+같은 token_path를 쓰는 국내/해외 API는 HantuTokenManager.shared()로 하나의 인스턴스를 공유합니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+from src.common.file_lock import FileLock
+from src.common.http_session import DEFAULT_TIMEOUT, create_session
+from src.hantu.model.access_token import RequestBody, ResponseBody
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPIRY_BUFFER = 300  # 초. ResponseBody.is_expired()의 기본 여유 시간
+DEFAULT_REFRESH_MARGIN = 600  # 초. is_expired()가 True가 되기 이만큼 전에 백그라운드에서 갱신한다
+REFRESH_RETRY_INTERVAL = 60.0  # 초. 백그라운드 갱신이 실패했을 때 다시 시도하기까지의 간격
+TOKEN_LOCK_TIMEOUT = 30.0  # 초. 다른 프로세스의 토큰 발급을 기다리는 최대 시간
+
+
+class HantuTokenManager:
+    """
+    메모리 캐시 + 선제 갱신 접근 토큰
+
+    Examples:
+        >>> manager = HantuTokenManager.shared(url_base, app_key, app_secret, token_path)
+        >>> manager.access_token()  # 첫 호출에서 토큰 파일을 읽거나 새로 발급
+        >>> manager.access_token()  # 이후에는 메모리에서 응답
+    """
+
+    _shared: dict[tuple[str, str], "HantuTokenManager"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        url_base: str,
+        app_key: str,
+        app_secret: str,
+        token_path: str,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        session: requests.Session | None = None,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            url_base: 한투 API 기본 URL
+            app_key: 앱 키
+            app_secret: 앱 시크릿
+            token_path: 토큰 저장 경로
+            refresh_margin: is_expired()가 True가 되기 몇 초 전에 갱신할지
+            session: 토큰 발급에 쓸 HTTP 세션. None이면 새로 생성
+            timeout: 토큰 발급 요청 타임아웃 (connect, read) 초
+        """
+        self.url_base = url_base
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.token_path = token_path
+        self.refresh_margin = refresh_margin
+        self.session = session or create_session()
+        # 발급 요청은 프로세스 간 잠금을 잡은 채로 보내므로, 응답이 없으면 다른 프로세스가 TOKEN_LOCK_TIMEOUT까지 기다린다
+        self.timeout = timeout
+
+        # (토큰, 유효 기한(monotonic)). 한 번의 속성 읽기로 둘을 함께 보도록 튜플로 둔다
+        self._current: tuple[ResponseBody, float] | None = None
+        self._lock = threading.Lock()
+        # 프로세스 간 잠금. 토큰 파일 옆에 "<파일명>.lock"을 만든다
+        self._file_lock = FileLock(Path(token_path).parent, timeout=TOKEN_LOCK_TIMEOUT)
+        self._timer: threading.Timer | None = None
+
+    @classmethod
+    def shared(
+        cls,
+        url_base: str,
+        app_key: str,
+        app_secret: str,
+        token_path: str,
+        session: requests.Session | None = None,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+    ) -> "HantuTokenManager":
+        """
+        token_path × app_key마다 하나의 인스턴스를 반환합니다.
+
+        session, timeout은 인스턴스를 처음 만들 때만 사용합니다.
+        """
+        key = (token_path, app_key)
+        with cls._shared_lock:
+            manager = cls._shared.get(key)
+            if manager is None:
+                manager = cls._shared[key] = cls(url_base, app_key, app_secret, token_path, session=session, timeout=timeout)
+            return manager
+
+    def access_token(self) -> str:
+        """
+        유효한 접근 토큰
+
+        메모리의 토큰이 유효하면 그대로 반환하고, 없거나 만료되었으면 토큰 파일을 읽거나 새로 발급합니다.
+
+        Raises:
+            Exception: 토큰 발급에 실패한 경우
+            CacheLockTimeoutError: 다른 프로세스의 토큰 발급이 끝나기를 기다리다 시간을 초과한 경우
+        """
+        current = self._current
+        if current is not None and time.monotonic() < current[1]:
+            return current[0].access_token
+
+        with self._lock:
+            current = self._current
+            if current is None or time.monotonic() >= current[1]:
+                loaded = self._load() if current is None else None
+                if loaded is not None:
+                    self._set(loaded)
+                else:
+                    self._renew(min_remaining=0.0)
+
+            current = self._current
+            assert current is not None
+            return current[0].access_token
+
+    def stop(self) -> None:
+        """백그라운드 갱신 타이머를 멈춥니다."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _load(self) -> ResponseBody | None:
+        """토큰 파일에서 만료되지 않은 토큰을 읽습니다. 없거나 읽을 수 없으면 None"""
+        token_file = Path(self.token_path)
+        if not token_file.exists():
+            return None
+
+        try:
+            token = ResponseBody.model_validate_json(token_file.read_text())
+        except Exception:
+            return None
+
+        return None if token.is_expired(DEFAULT_EXPIRY_BUFFER) else token
+
+    def _renew(self, min_remaining: float) -> None:
+        """
+        프로세스 간 배타 잠금 안에서 토큰을 갱신합니다.
+
+        잠금을 기다리는 동안 다른 프로세스가 발급해서 파일에 쓴 토큰이 min_remaining초보다 오래 유효하면
+        그 토큰을 사용하고, 아니면 새로 발급합니다.
+        """
+        with self._file_lock.acquire(Path(self.token_path).name):
+            loaded = self._load()
+            if loaded is not None and loaded.seconds_until_expired(DEFAULT_EXPIRY_BUFFER) > min_remaining:
+                self._set(loaded)
+                return
+
+            self._replace(self._issue())
+
+    def _issue(self) -> ResponseBody:
+        """OAuth2 액세스 토큰 발급"""
+        request_body = RequestBody(appkey=self.app_key, appsecret=self.app_secret)
+
+        try:
+            res = self.session.post(f"{self.url_base}/oauth2/tokenP", data=request_body.model_dump_json(), timeout=self.timeout)
+        except requests.RequestException as e:
+            # 예외로 빠져나가야 _renew()의 with 블록이 프로세스 간 잠금을 바로 놓는다
+            logger.error(f"토큰 발급 요청 실패: {e}")
+            raise Exception(f"토큰 발급 실패: {e}") from e
+
+        if res.status_code != 200:
+            logger.error("Get Authentification token fail!")
+            raise Exception(f"토큰 발급 실패: {res.status_code}")
+
+        return ResponseBody.model_validate(res.json())
+
+    def _replace(self, token: ResponseBody) -> None:
+        """새로 발급한 토큰으로 바꾸고, 토큰이 바뀌었으면 파일에도 씁니다."""
+        if self._current is None or self._current[0].access_token != token.access_token:
+            token_file = Path(self.token_path)
+            token_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체한다
+            tmp_path = token_file.with_name(f"{token_file.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(token.model_dump_json())
+            os.replace(tmp_path, token_file)
+
+        self._set(token)
+
+    def _set(self, token: ResponseBody) -> None:
+        remaining = token.seconds_until_expired(DEFAULT_EXPIRY_BUFFER)
+        self._current = (token, time.monotonic() + remaining)
+        self._schedule(max(remaining - self.refresh_margin, 0.0))
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+        self._timer = threading.Timer(delay, self._refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh(self) -> None:
+        """백그라운드 선제 갱신. 실패하면 REFRESH_RETRY_INTERVAL 뒤에 다시 시도합니다."""
+        with self._lock:
+            try:
+                self._renew(min_remaining=self.refresh_margin)
+                logger.info("한투 접근 토큰을 미리 갱신했습니다.")
+            except Exception:
+                logger.exception(f"한투 접근 토큰 갱신 실패, {REFRESH_RETRY_INTERVAL}초 뒤 재시도")
+                self._schedule(REFRESH_RETRY_INTERVAL)
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
 from typing import Any, get_args, get_origin
 
 from src.common.clock import Clock
 from src.strategy.cache.cache_manager import CacheManager
 from src.strategy.cache.cache_models import StrategyCacheData
+from src.strategy.cache.shared_state import SharedStateTable
 from src.strategy.config import BaseStrategyConfig
 from src.strategy.data.collector import DataCollector
 from src.strategy.order.order_executor import OrderExecutor
+from src.upbit.upbit_api import UpbitAPI
 
 
 class BaseStrategy[T: StrategyCacheData](ABC):
@@ -30,12 +34,21 @@ class BaseStrategy[T: StrategyCacheData](ABC):
             clock: Clock,
             collector: DataCollector,
             cache_manager: CacheManager,
+            shared_state: SharedStateTable | None = None,
     ) -> None:
+        """
+        Args:
+            shared_state: 여러 프로세스가 공유하는 전략 상태 테이블. 설정하면 캐시 저장/삭제를 테이블에도 반영합니다.
+        """
         self._order_executor = order_executor
         self._config = config
         self._clock = clock
         self._collector = collector
         self._cache_manager = cache_manager
+        self._shared_state = shared_state
+        self._preloaded_cache: T | None = None
+        self._has_preloaded_cache = False
+        self._preloaded_price: float | None = None
 
     @property
     @abstractmethod
@@ -48,6 +61,52 @@ class BaseStrategy[T: StrategyCacheData](ABC):
         """전략을 실행합니다."""
         pass
 
+    def preload_cache(self, states: Mapping[tuple[str, str], StrategyCacheData]) -> None:
+        """tick 시작 시 일괄 로드한 캐시 스냅샷을 주입합니다.
+
+        스냅샷은 잠금 밖에서 읽은 값이므로 결과가 바뀌지 않는 경우
+        (이미 매수했거나, 매도할 포지션이 없는 경우)에 파일 접근을 건너뛰는 용도로만 사용합니다.
+        실제 주문 전에는 항상 잠금을 잡고 파일에서 다시 로드합니다.
+
+        Args:
+            states: `CacheManager.load_all_strategy_states`의 결과
+        """
+        self._preloaded_cache = states.get((self._config.ticker, self._strategy_name))  # type: ignore
+        self._has_preloaded_cache = True
+
+    def preload_prices(self, prices: Mapping[str, float]) -> None:
+        """tick 시작 시 일괄 조회한 현재가 스냅샷을 주입합니다.
+
+        Args:
+            prices: `UpbitAPI.get_current_prices`의 결과
+        """
+        self._preloaded_price = prices.get(self._config.ticker)
+
+    def _current_price(self) -> float:
+        """현재가 (스냅샷에 없으면 직접 조회)"""
+        if self._preloaded_price is not None:
+            return self._preloaded_price
+
+        return UpbitAPI.get_current_price(self._config.ticker)
+
+    def _preloaded_has_position(self) -> bool | None:
+        """스냅샷 기준 오늘 포지션 보유 여부
+
+        Returns:
+            보유 여부, 스냅샷이 없으면 None
+        """
+        if not self._has_preloaded_cache:
+            return None
+
+        return bool(self._preloaded_cache and self._preloaded_cache.has_position(self._clock.today()))
+
+    def _has_pending_order(self) -> bool:
+        """체결을 기다리는 주문이 있는지 확인합니다.
+
+        체결이 캐시에 반영되기 전까지는 같은 주문을 다시 넣지 않도록 캐시 잠금 안에서 확인합니다.
+        """
+        return self._order_executor.has_pending_order(self._config.ticker, self._strategy_name)
+
     def _load_cache(self) -> T | None:
         """캐시를 로드합니다.
 
@@ -58,5 +117,18 @@ class BaseStrategy[T: StrategyCacheData](ABC):
             self._config.ticker, self._strategy_name, self._cache_model_class
         )  # type: ignore
 
+    def _cache_transaction(self) -> AbstractContextManager[None]:
+        """캐시 로드 → 주문 → 저장 구간을 ticker × strategy 배타 잠금으로 감쌉니다."""
+        return self._cache_manager.lock(self._config.ticker, self._strategy_name)
+
+    def _save_strategy_cache(self, cache: T) -> None:
+        """캐시를 저장하고, 공유 상태 테이블이 있으면 테이블에도 씁니다."""
+        self._cache_manager.save_strategy_cache(self._config.ticker, self._strategy_name, cache)
+        if self._shared_state is not None:
+            self._shared_state.put(self._config.ticker, self._strategy_name, cache)
+
     def _delete_strategy_cache(self) -> None:
+        """캐시를 삭제하고, 공유 상태 테이블이 있으면 테이블에서도 삭제합니다."""
         self._cache_manager.delete_strategy_cache(self._config.ticker, self._strategy_name)
+        if self._shared_state is not None:
+            self._shared_state.delete(self._config.ticker, self._strategy_name)
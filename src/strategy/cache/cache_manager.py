@@ -1,11 +1,23 @@
+import json
 import logging
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TypeVar
 
 from pydantic import BaseModel
 
 from src import constants
+from src.common.file_lock import DEFAULT_LOCK_TIMEOUT, FileLock, LockMetrics
+from src.common.metrics import MetricsSink, NullMetricsSink, timed
 from src.strategy.cache.cache_models import DataCache, StrategyCacheData
+from src.strategy.cache.migration import (
+    LEGACY_SCHEMA_VERSION,
+    SCHEMA_VERSION_KEY,
+    CacheMigrationRegistry,
+    cache_migrations,
+    schema_version_of,
+)
 
 T = TypeVar("T", bound=StrategyCacheData)
 
@@ -13,23 +25,80 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CACHE_DIR = ".cache"
 DEFAULT_CACHE_FILE_NAME = "cache.json"
+DEFAULT_LOCK_DIR_NAME = ".lock"
+
+# 메트릭 네임스페이스
+NAMESPACE_DATA = "data"
+NAMESPACE_STRATEGY = "strategy"
 
 
 class CacheManager:
     """캐시를 파일로 저장하고 로드하는 범용 클래스
 
     DataCache와 StrategyCacheData를 구분하여 저장할 수 있습니다.
+    읽기는 공유 잠금, 쓰기는 배타 잠금으로 보호되어 여러 프로세스가 같은 캐시를 다뤄도 안전합니다.
+    저장 시 모델의 스키마 버전을 함께 기록하고, 로드 시 등록된 마이그레이션을 적용합니다.
     """
 
-    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, file_suffix: str = "") -> None:
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        file_suffix: str = "",
+        lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+        metrics_sink: MetricsSink | None = None,
+        migrations: CacheMigrationRegistry = cache_migrations,
+    ) -> None:
         """
         Args:
             cache_dir: 캐시 파일을 저장할 디렉토리 경로 (기본값: .cache)
             file_suffix: DataCache용 파일명 접미사 (예: "data")
                         StrategyCacheData는 strategy_name을 사용
+            lock_timeout: 캐시 잠금 대기 시간(초) (기본값: 10초)
+            metrics_sink: 히트/미스 카운터와 I/O 지연 시간을 기록할 싱크 (None이면 기록하지 않음)
+            migrations: 캐시 스키마 마이그레이션 저장소 (기본값: 전역 저장소)
         """
         self._cache_dir = Path(cache_dir)
         self._file_suffix = file_suffix
+        self._file_lock = FileLock(self._cache_dir / DEFAULT_LOCK_DIR_NAME, timeout=lock_timeout)
+        self._metrics_sink = metrics_sink or NullMetricsSink()
+        self._migrations = migrations
+
+    @property
+    def metrics_sink(self) -> MetricsSink:
+        """캐시 메트릭 싱크"""
+        return self._metrics_sink
+
+    @property
+    def lock_metrics(self) -> dict[str, LockMetrics]:
+        """캐시 키별 잠금 경합 지표"""
+        return self._file_lock.metrics
+
+    @contextmanager
+    def lock(self, ticker: str, strategy_name: str | None = None, exclusive: bool = True, timeout: float | None = None) -> Iterator[None]:
+        """
+        ticker × strategy 단위로 캐시 잠금을 획득
+
+        load → 주문 → save 같은 읽기-수정-쓰기 트랜잭션 전체를 감쌀 때 사용합니다.
+        잠금 안에서 호출하는 load/save/delete는 같은 잠금을 재사용합니다.
+
+        Args:
+            ticker: 종목 코드
+            strategy_name: 전략 이름 (None이면 DataCache 잠금)
+            exclusive: True면 배타 잠금, False면 공유 잠금
+            timeout: 잠금 대기 시간(초). None이면 기본값 사용
+
+        Raises:
+            CacheLockTimeoutError: 시간 안에 잠금을 획득하지 못한 경우
+        """
+        with self._file_lock.acquire(self._lock_key(ticker, strategy_name), exclusive=exclusive, timeout=timeout):
+            yield
+
+    def _lock_key(self, ticker: str, strategy_name: str | None = None) -> str:
+        return self.get_cache_path(ticker, strategy_name).stem
+
+    @staticmethod
+    def _namespace(strategy_name: str | None = None) -> str:
+        return NAMESPACE_STRATEGY if strategy_name else NAMESPACE_DATA
 
     def get_cache_path(self, ticker: str, strategy_name: str | None = None) -> Path:
         """
@@ -67,8 +136,10 @@ class CacheManager:
         cache_path = self.get_cache_path(ticker, strategy_name)
 
         # JSON으로 직렬화하여 저장
-        json_data = cache.model_dump_json(indent=2)
-        cache_path.write_text(json_data, encoding=constants.UTF_8)
+        with timed(self._metrics_sink, "cache.save.seconds", namespace=self._namespace(strategy_name), ticker=ticker):
+            json_data = self._serialize(cache)
+            with self.lock(ticker, strategy_name):
+                cache_path.write_text(json_data, encoding=constants.UTF_8)
 
         logger.debug(f"캐시 저장 완료: {cache_path}")
 
@@ -84,19 +155,33 @@ class CacheManager:
         Returns:
             캐시 객체, 파일이 없으면 None
         """
+        namespace = self._namespace(strategy_name)
+
+        with timed(self._metrics_sink, "cache.load.seconds", namespace=namespace, ticker=ticker):
+            cache = self._read_cache(ticker, model_class, strategy_name)
+
+        self._metrics_sink.increment("cache.load", namespace=namespace, ticker=ticker, result="hit" if cache else "miss")
+        return cache
+
+    def _read_cache(self, ticker: str, model_class: type[BaseModel], strategy_name: str | None = None) -> BaseModel | None:
         cache_path = self.get_cache_path(ticker, strategy_name)
 
-        # 파일이 없으면 None 반환
-        if not cache_path.exists():
-            logger.debug(f"캐시 파일 없음: {cache_path}")
-            return None
+        with self.lock(ticker, strategy_name, exclusive=False):
+            # 파일이 없으면 None 반환
+            if not cache_path.exists():
+                logger.debug(f"캐시 파일 없음: {cache_path}")
+                return None
 
-        try:
-            # JSON 파일 읽기
-            json_data = cache_path.read_text(encoding=constants.UTF_8)
+            try:
+                # JSON 파일 읽기
+                json_data = cache_path.read_text(encoding=constants.UTF_8)
+            except OSError as e:
+                logger.warning(f"캐시 로드 실패: {cache_path}, 에러: {e}")
+                return None
 
-            # Pydantic 모델로 역직렬화
-            cache = model_class.model_validate_json(json_data)
+        try:
+            # 스키마 마이그레이션 후 Pydantic 모델로 역직렬화
+            cache = self._deserialize(json_data, model_class)
 
             logger.debug(f"캐시 로드 완료: {cache_path}")
             return cache
@@ -105,6 +190,21 @@ class CacheManager:
             logger.warning(f"캐시 로드 실패: {cache_path}, 에러: {e}")
             return None
 
+    @staticmethod
+    def _serialize(cache: BaseModel) -> str:
+        data = {SCHEMA_VERSION_KEY: schema_version_of(type(cache)), **cache.model_dump(mode="json")}
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def _deserialize(self, json_data: str, model_class: type[BaseModel]) -> BaseModel:
+        data = json.loads(json_data)
+        version = data.pop(SCHEMA_VERSION_KEY, LEGACY_SCHEMA_VERSION)
+
+        if version < schema_version_of(model_class):
+            logger.debug(f"캐시 마이그레이션: {model_class.__name__} v{version} → v{schema_version_of(model_class)}")
+            data = self._migrations.migrate(model_class, data, version)
+
+        return model_class.model_validate(data)
+
     def save_data_cache(self, ticker: str, cache: DataCache) -> None:
         """
         DataCache를 JSON 파일로 저장
@@ -154,6 +254,44 @@ class CacheManager:
         """
         return self._load_cache(ticker, model_class, strategy_name)
 
+    def load_all_strategy_states(self, model_classes: Mapping[str, type[StrategyCacheData]]) -> dict[tuple[str, str], StrategyCacheData]:
+        """
+        캐시 디렉토리를 한 번 스캔해서 모든 ticker × strategy 캐시를 로드
+
+        tick 시작 시 전략마다 따로 캐시를 여는 대신 한 번에 스냅샷을 만들 때 사용합니다.
+        파일이 없는 조합은 결과에 포함되지 않습니다.
+
+        Args:
+            model_classes: 전략 이름 → 캐시 모델 클래스 매핑
+                           (예: {"volatility": VolatilityStrategyCacheData})
+                           매핑에 없는 전략의 파일과 DataCache 파일은 무시합니다.
+
+        Returns:
+            (ticker, strategy_name) → 캐시 객체 딕셔너리
+        """
+        states: dict[tuple[str, str], StrategyCacheData] = {}
+
+        if not self._cache_dir.is_dir():
+            return states
+
+        file_suffix = f"_{DEFAULT_CACHE_FILE_NAME}"
+
+        with timed(self._metrics_sink, "cache.load_all.seconds", namespace=NAMESPACE_STRATEGY):
+            for cache_path in self._cache_dir.glob(f"*{file_suffix}"):
+                # 파일명: {ticker}_{strategy_name}_cache.json (ticker에는 "_"가 없다)
+                ticker, _, strategy_name = cache_path.name.removesuffix(file_suffix).partition("_")
+                model_class = model_classes.get(strategy_name)
+
+                if model_class is None:
+                    continue
+
+                cache = self._read_cache(ticker, model_class, strategy_name)
+                if isinstance(cache, StrategyCacheData):
+                    states[ticker, strategy_name] = cache
+
+        logger.debug(f"전략 캐시 일괄 로드 완료: {len(states)}건")
+        return states
+
     def delete_strategy_cache(self, ticker: str, strategy_name: str) -> None:
         """
         전략 캐시 파일을 삭제
@@ -164,8 +302,9 @@ class CacheManager:
         """
         cache_path = self.get_cache_path(ticker, strategy_name)
 
-        if cache_path.exists():
-            cache_path.unlink()
-            logger.debug(f"캐시 삭제 완료: {cache_path}")
-        else:
-            logger.debug(f"삭제할 캐시 파일 없음: {cache_path}")
+        with self.lock(ticker, strategy_name):
+            if cache_path.exists():
+                cache_path.unlink()
+                logger.debug(f"캐시 삭제 완료: {cache_path}")
+            else:
+                logger.debug(f"삭제할 캐시 파일 없음: {cache_path}")
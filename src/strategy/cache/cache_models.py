@@ -1,9 +1,11 @@
 """캐시 모델
 
 전략에서 사용하는 캐시 데이터 모델을 정의합니다.
+필드를 바꾸면 SCHEMA_VERSION을 올리고 migration.py에 마이그레이션을 등록합니다.
 """
 
 import datetime as dt
+from typing import ClassVar
 
 from pydantic import BaseModel, Field
 
@@ -21,6 +23,8 @@ class DataCache(BaseModel):
         history: 최근 20일의 반일봉 데이터
     """
 
+    SCHEMA_VERSION: ClassVar[int] = 1
+
     ticker: str = Field(..., description="종목 코드")
     last_update_date: dt.date = Field(..., description="마지막 업데이트 날짜")
     history: Recent20DaysHalfDayCandles = Field(..., description="최근 20일의 반일봉 데이터")
@@ -36,6 +40,8 @@ class StrategyCacheData(BaseModel):
         last_run_date: 마지막 실행 날짜
     """
 
+    SCHEMA_VERSION: ClassVar[int] = 1
+
     execution_volume: float = Field(default=0.0, description="체결 수량")
     last_run_date: dt.date = Field(..., description="마지막 실행 날짜")
 
@@ -61,5 +67,7 @@ class VolatilityStrategyCacheData(StrategyCacheData):
         threshold: 돌파 가격
     """
 
+    SCHEMA_VERSION: ClassVar[int] = 1
+
     position_size: float = Field(..., description="매수 비중 (0~1)")
     threshold: float = Field(..., description="돌파 가격")
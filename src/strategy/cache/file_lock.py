@@ -0,0 +1,19 @@
+"""파일 잠금 (src.common.file_lock으로 옮겨졌으며, 기존 import 경로 호환을 위해 다시 내보냅니다)"""
+
+from src.common.file_lock import (
+    DEFAULT_LOCK_TIMEOUT,
+    DEFAULT_POLL_INTERVAL,
+    LOCK_FILE_SUFFIX,
+    CacheLockTimeoutError,
+    FileLock,
+    LockMetrics,
+)
+
+__all__ = [
+    "DEFAULT_LOCK_TIMEOUT",
+    "DEFAULT_POLL_INTERVAL",
+    "LOCK_FILE_SUFFIX",
+    "CacheLockTimeoutError",
+    "FileLock",
+    "LockMetrics",
+]
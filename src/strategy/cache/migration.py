@@ -0,0 +1,93 @@
+"""캐시 스키마 마이그레이션
+
+캐시 모델의 스키마가 바뀌어도 기존 캐시 파일을 버리지 않도록
+로드 시점에 버전별 마이그레이션을 순서대로 적용합니다.
+
+Examples:
+    VolatilityStrategyCacheData에 필드를 추가하면서 SCHEMA_VERSION을 2로 올린 경우
+
+    >>> @register_migration(VolatilityStrategyCacheData, from_version=1)
+    ... def _add_stop_loss(data: dict[str, Any]) -> dict[str, Any]:
+    ...     return {**data, "stop_loss": 0.0}
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+SCHEMA_VERSION_KEY = "schema_version"
+LEGACY_SCHEMA_VERSION = 1  # 버전이 기록되기 전에 저장된 캐시
+
+CacheMigration = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class CacheMigrationError(Exception):
+    """
+    캐시 마이그레이션 에러
+
+    저장된 버전에서 현재 버전까지 이어지는 마이그레이션이 없는 경우 발생하는 에러입니다.
+    """
+
+    def __init__(self, model_class: type[BaseModel], from_version: int) -> None:
+        self.model_class = model_class
+        self.from_version = from_version
+        super().__init__(f"캐시 마이그레이션 없음: {model_class.__name__} v{from_version} → v{from_version + 1}")
+
+
+def schema_version_of(model_class: type[BaseModel]) -> int:
+    """모델 클래스의 현재 스키마 버전 (SCHEMA_VERSION이 없으면 LEGACY_SCHEMA_VERSION)"""
+    return getattr(model_class, "SCHEMA_VERSION", LEGACY_SCHEMA_VERSION)
+
+
+class CacheMigrationRegistry:
+    """모델 클래스별 버전 마이그레이션 저장소"""
+
+    def __init__(self) -> None:
+        self._migrations: dict[tuple[type[BaseModel], int], CacheMigration] = {}
+
+    def register(self, model_class: type[BaseModel], from_version: int) -> Callable[[CacheMigration], CacheMigration]:
+        """
+        from_version → from_version + 1 마이그레이션을 등록하는 데코레이터
+
+        Args:
+            model_class: 마이그레이션 대상 캐시 모델 클래스
+            from_version: 마이그레이션 전 버전
+        """
+
+        def decorator(migration: CacheMigration) -> CacheMigration:
+            self._migrations[model_class, from_version] = migration
+            return migration
+
+        return decorator
+
+    def migrate(self, model_class: type[BaseModel], data: dict[str, Any], from_version: int) -> dict[str, Any]:
+        """
+        저장된 데이터를 현재 스키마 버전까지 마이그레이션
+
+        Args:
+            model_class: 캐시 모델 클래스
+            data: 저장된 캐시 데이터 (버전 키 제외)
+            from_version: 저장된 스키마 버전
+
+        Returns:
+            현재 버전으로 변환된 데이터. 이미 현재 버전 이상이면 그대로 반환
+
+        Raises:
+            CacheMigrationError: 중간 버전의 마이그레이션이 등록되지 않은 경우
+        """
+        version = from_version
+
+        while version < schema_version_of(model_class):
+            migration = self._migrations.get((model_class, version))
+            if migration is None:
+                raise CacheMigrationError(model_class, version)
+
+            data = migration(data)
+            version += 1
+
+        return data
+
+
+cache_migrations = CacheMigrationRegistry()
+register_migration = cache_migrations.register
@@ -0,0 +1,379 @@
+"""공유 메모리 전략 상태 테이블
+
+여러 프로세스에서 전략을 실행할 때 `.cache` 파일 대신 공유 메모리로 포지션 상태를 주고받습니다.
+
+레코드는 ticker × strategy 당 고정 길이이며, 각 레코드는 seqlock으로 보호됩니다.
+- 쓰기: 테이블 잠금(파일 잠금)을 잡고 seq를 홀수로 올린 뒤 값을 쓰고 다시 짝수로 올립니다.
+- 읽기: 잠금 없이 seq를 읽고 값을 읽은 뒤 seq가 짝수이고 변하지 않았으면 성공, 아니면 재시도합니다.
+
+삭제는 슬롯을 비우지 않고 키를 남긴 채 삭제 표시(last_run_date ordinal 0)만 합니다.
+슬롯을 비우면 같은 탐사 경로에 있는 뒤쪽 키를 찾지 못하기 때문입니다.
+
+테이블은 휘발성이므로 `SharedStatePersister`로 주기적으로 CacheManager에 저장합니다.
+마지막 저장 이후 seq가 바뀐 레코드만 저장(삭제 표시된 레코드는 파일 삭제)하므로,
+테이블을 거치지 않고 파일에 직접 쓴 값을 덮어쓰거나 삭제한 포지션을 되살리지 않습니다.
+"""
+
+import datetime as dt
+import logging
+import math
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections.abc import Iterator, Mapping
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+from src.common.file_lock import FileLock
+from src.strategy.cache.cache_manager import DEFAULT_CACHE_DIR, DEFAULT_LOCK_DIR_NAME, CacheManager
+from src.strategy.cache.cache_models import StrategyCacheData, VolatilityStrategyCacheData
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TABLE_NAME = "genie_strategy_state"
+DEFAULT_CAPACITY = 256
+DEFAULT_PERSIST_INTERVAL = 10.0
+DEFAULT_READ_TIMEOUT = 0.5  # 쓰기가 끝나기를 기다리는 최대 시간(초)
+
+# 헤더: magic, capacity
+_HEADER = struct.Struct("<4sI")
+_MAGIC = b"GSST"
+# 레코드: seq, ticker, strategy, execution_volume, last_run_date(ordinal), position_size, threshold
+# ticker가 비어 있으면 빈 슬롯, last_run_date가 0이면 삭제된 레코드, position_size가 NaN이면 StrategyCacheData
+_SEQ = struct.Struct("<Q")
+_RECORD = struct.Struct("<Q16s32sdqdd")
+_EMPTY_TICKER = bytes(16)
+_DELETED_ORDINAL = 0  # date.toordinal()은 1 이상이므로 삭제 표시로 사용
+
+
+class SharedStateReadError(Exception):
+    """
+    공유 상태 읽기 에러
+
+    읽기 제한 시간 동안 쓰기가 계속 진행 중이어서 일관된 레코드를 읽지 못한 경우 발생하는 에러입니다.
+    """
+
+    def __init__(self, ticker: str, strategy_name: str) -> None:
+        super().__init__(f"공유 상태를 일관되게 읽지 못했습니다: {ticker} {strategy_name}")
+
+
+class SharedStateTable:
+    """
+    ticker × strategy 단위 고정 길이 공유 메모리 상태 테이블
+
+    Examples:
+        >>> table = SharedStateTable.create()  # 스케줄러(소유자) 프로세스
+        >>> table = SharedStateTable.attach()  # 워커 프로세스
+        >>> table.put("KRW-BTC", "volatility", cache)
+        >>> table.get("KRW-BTC", "volatility")
+        >>> table.delete("KRW-BTC", "volatility")  # 매도로 포지션 청산
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, lock_dir: Path, owner: bool, read_timeout: float = DEFAULT_READ_TIMEOUT) -> None:
+        self._shm = shm
+        self._buf = _buffer(shm)
+        self._capacity = capacity
+        self._owner = owner
+        self._file_lock = FileLock(lock_dir)
+        self._name = shm.name
+        self._read_timeout = read_timeout
+        self._persisted_seqs: dict[int, int] = {}  # 슬롯 → 마지막으로 저장한 seq
+
+    @classmethod
+    def create(
+        cls,
+        name: str = DEFAULT_TABLE_NAME,
+        capacity: int = DEFAULT_CAPACITY,
+        lock_dir: Path = Path(DEFAULT_CACHE_DIR) / DEFAULT_LOCK_DIR_NAME,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ) -> "SharedStateTable":
+        """
+        공유 메모리 테이블을 생성합니다.
+
+        Args:
+            name: 공유 메모리 이름
+            capacity: 최대 레코드 수 (ticker × strategy 조합 수)
+            lock_dir: 쓰기 잠금 파일 디렉토리
+            read_timeout: 쓰기가 끝나기를 기다리는 최대 시간(초)
+        """
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER.size + capacity * _RECORD.size)
+        buf = _buffer(shm)
+        buf[: shm.size] = bytes(shm.size)
+        _HEADER.pack_into(buf, 0, _MAGIC, capacity)
+        return cls(shm, capacity, lock_dir, owner=True, read_timeout=read_timeout)
+
+    @classmethod
+    def attach(
+        cls,
+        name: str = DEFAULT_TABLE_NAME,
+        lock_dir: Path = Path(DEFAULT_CACHE_DIR) / DEFAULT_LOCK_DIR_NAME,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ) -> "SharedStateTable":
+        """
+        다른 프로세스가 만든 공유 메모리 테이블에 연결합니다.
+
+        Raises:
+            FileNotFoundError: 테이블이 없는 경우
+            ValueError: 테이블 형식이 올바르지 않은 경우
+        """
+        shm = _attach_untracked(name)
+        magic, capacity = _HEADER.unpack_from(_buffer(shm), 0)
+
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError(f"전략 상태 테이블이 아닙니다: {name}")
+
+        return cls(shm, capacity, lock_dir, owner=False, read_timeout=read_timeout)
+
+    @property
+    def name(self) -> str:
+        """공유 메모리 이름"""
+        return self._name
+
+    def close(self) -> None:
+        """연결을 닫고, 소유자면 공유 메모리를 해제합니다."""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def get(self, ticker: str, strategy_name: str) -> StrategyCacheData | None:
+        """
+        레코드를 읽습니다.
+
+        position_size와 threshold가 기록된 레코드는 VolatilityStrategyCacheData로 반환합니다.
+
+        Returns:
+            캐시 객체, 레코드가 없거나 삭제되었으면 None
+
+        Raises:
+            SharedStateReadError: 읽기 제한 시간 안에 일관된 값을 읽지 못한 경우
+        """
+        key = _encode_key(ticker, strategy_name)
+
+        for slot in self._probe(key):
+            record = self._read_slot(slot, ticker, strategy_name)
+
+            if record[1:3] == key:
+                return None if _is_deleted(record) else _to_cache(record)
+            if record[1] == _EMPTY_TICKER:
+                return None
+
+        return None
+
+    def put(self, ticker: str, strategy_name: str, cache: StrategyCacheData) -> None:
+        """
+        레코드를 씁니다.
+
+        Raises:
+            RuntimeError: 테이블이 가득 찬 경우
+        """
+        key = _encode_key(ticker, strategy_name)
+
+        with self._file_lock.acquire(self._name):
+            self._write_slot(self._find_slot_for_write(key), key, _from_cache(cache))
+
+    def delete(self, ticker: str, strategy_name: str) -> None:
+        """
+        레코드를 삭제합니다.
+
+        전략이 매도로 포지션을 청산할 때 호출합니다. 다음 persist()에서 캐시 파일도 삭제됩니다.
+        """
+        key = _encode_key(ticker, strategy_name)
+
+        with self._file_lock.acquire(self._name):
+            slot = self._find_slot(key)
+            if slot is not None:
+                self._write_slot(slot, key, (0.0, _DELETED_ORDINAL, math.nan, math.nan))
+
+    def items(self) -> Iterator[tuple[tuple[str, str], StrategyCacheData]]:
+        """기록된 모든 ((ticker, strategy_name), 캐시) 쌍을 반환합니다. 삭제된 레코드는 제외합니다."""
+        for slot in range(self._capacity):
+            record = self._read_slot(slot)
+            if record[1] != _EMPTY_TICKER and not _is_deleted(record):
+                yield (_decode(record[1]), _decode(record[2])), _to_cache(record)
+
+    def load_from(self, states: Mapping[tuple[str, str], StrategyCacheData]) -> None:
+        """`CacheManager.load_all_strategy_states` 결과로 테이블을 채웁니다."""
+        for (ticker, strategy_name), cache in states.items():
+            self.put(ticker, strategy_name, cache)
+
+    def persist(self, cache_manager: CacheManager) -> int:
+        """
+        마지막 저장 이후 바뀐 레코드만 CacheManager에 반영합니다.
+
+        삭제된 레코드는 캐시 파일을 삭제합니다. 바뀌지 않은 레코드는 건드리지 않으므로
+        전략이 테이블을 거치지 않고 파일에 직접 쓴 값을 덮어쓰지 않습니다.
+
+        Returns:
+            저장하거나 삭제한 레코드 수
+        """
+        count = 0
+        for slot in range(self._capacity):
+            record = self._read_slot(slot)
+            seq = record[0]
+            if record[1] == _EMPTY_TICKER or self._persisted_seqs.get(slot) == seq:
+                continue
+
+            ticker, strategy_name = _decode(record[1]), _decode(record[2])
+            if _is_deleted(record):
+                cache_manager.delete_strategy_cache(ticker, strategy_name)
+            else:
+                cache_manager.save_strategy_cache(ticker, strategy_name, _to_cache(record))
+
+            self._persisted_seqs[slot] = seq
+            count += 1
+
+        logger.debug(f"공유 상태 저장 완료: {count}건")
+        return count
+
+    def _read_slot(self, slot: int, ticker: str = "", strategy_name: str = "") -> tuple:
+        offset = self._offset(slot)
+        deadline = time.monotonic() + self._read_timeout
+
+        while True:
+            (seq_before,) = _SEQ.unpack_from(self._buf, offset)
+            if seq_before % 2 == 0:
+                record = _RECORD.unpack_from(self._buf, offset)
+                (seq_after,) = _SEQ.unpack_from(self._buf, offset)
+
+                if seq_before == seq_after:
+                    return record
+
+            if time.monotonic() > deadline:
+                raise SharedStateReadError(ticker, strategy_name)
+
+            # 쓰는 프로세스가 쓰기 도중 스케줄에서 밀려났으면 바로 재시도해도 소용없으므로 CPU를 양보한다
+            time.sleep(0)
+
+    def _write_slot(self, slot: int, key: tuple[bytes, bytes], values: tuple[float, int, float, float]) -> None:
+        """seqlock으로 레코드를 씁니다. 테이블 잠금 안에서 호출해야 합니다."""
+        offset = self._offset(slot)
+        (seq,) = _SEQ.unpack_from(self._buf, offset)
+
+        _SEQ.pack_into(self._buf, offset, seq + 1)
+        _RECORD.pack_into(self._buf, offset, seq + 1, *key, *values)
+        _SEQ.pack_into(self._buf, offset, seq + 2)
+
+    def _find_slot(self, key: tuple[bytes, bytes]) -> int | None:
+        for slot in self._probe(key):
+            record = _RECORD.unpack_from(self._buf, self._offset(slot))
+            if record[1:3] == key:
+                return slot
+            if record[1] == _EMPTY_TICKER:
+                return None
+
+        return None
+
+    def _find_slot_for_write(self, key: tuple[bytes, bytes]) -> int:
+        for slot in self._probe(key):
+            record = _RECORD.unpack_from(self._buf, self._offset(slot))
+            if record[1:3] == key or record[1] == _EMPTY_TICKER:
+                return slot
+
+        raise RuntimeError(f"전략 상태 테이블이 가득 찼습니다 (capacity={self._capacity})")
+
+    def _probe(self, key: tuple[bytes, bytes]) -> Iterator[int]:
+        # 프로세스마다 값이 같아야 하므로 hash() 대신 crc32 사용
+        start = zlib.crc32(b"\0".join(key)) % self._capacity
+        for i in range(self._capacity):
+            yield (start + i) % self._capacity
+
+    @staticmethod
+    def _offset(slot: int) -> int:
+        return _HEADER.size + slot * _RECORD.size
+
+
+class SharedStatePersister:
+    """공유 상태 테이블을 주기적으로 CacheManager에 저장하는 백그라운드 스레드"""
+
+    def __init__(self, table: SharedStateTable, cache_manager: CacheManager, interval: float = DEFAULT_PERSIST_INTERVAL) -> None:
+        """
+        Args:
+            table: 공유 상태 테이블
+            cache_manager: 저장할 CacheManager
+            interval: 저장 주기(초)
+        """
+        self._table = table
+        self._cache_manager = cache_manager
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="shared-state-persister", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스레드를 멈추고 마지막으로 한 번 더 저장합니다."""
+        self._stop_event.set()
+        self._thread.join()
+        self._table.persist(self._cache_manager)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                self._table.persist(self._cache_manager)
+            except Exception:
+                logger.exception("공유 상태 저장 실패")
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    resource tracker에 등록하지 않고 기존 공유 메모리에 연결합니다.
+
+    등록되면 연결한 프로세스가 종료될 때 tracker가 만든 프로세스의 세그먼트까지 지워 버린다.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # 3.12에는 track 인자가 없으므로 연결 시 자동으로 등록된 것을 직접 해제한다
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    # SharedMemory.buf는 close() 뒤에만 None이다
+    assert shm.buf is not None
+    return shm.buf
+
+
+def _encode_key(ticker: str, strategy_name: str) -> tuple[bytes, bytes]:
+    ticker_bytes = ticker.encode()
+    strategy_bytes = strategy_name.encode()
+
+    if len(ticker_bytes) > 16 or len(strategy_bytes) > 32:
+        raise ValueError(f"키가 너무 깁니다 (ticker 16바이트, strategy 32바이트 이하): {ticker} {strategy_name}")
+
+    # struct는 "s" 필드를 NUL로 채워서 저장하므로 비교를 위해 같은 길이로 맞춘다
+    return ticker_bytes.ljust(16, b"\0"), strategy_bytes.ljust(32, b"\0")
+
+
+def _decode(value: bytes) -> str:
+    return value.rstrip(b"\0").decode()
+
+
+def _from_cache(cache: StrategyCacheData) -> tuple[float, int, float, float]:
+    if isinstance(cache, VolatilityStrategyCacheData):
+        return cache.execution_volume, cache.last_run_date.toordinal(), cache.position_size, cache.threshold
+    return cache.execution_volume, cache.last_run_date.toordinal(), math.nan, math.nan
+
+
+def _is_deleted(record: tuple) -> bool:
+    return record[4] == _DELETED_ORDINAL
+
+
+def _to_cache(record: tuple) -> StrategyCacheData:
+    _, _, _, execution_volume, ordinal, position_size, threshold = record
+    last_run_date = dt.date.fromordinal(ordinal)
+
+    if math.isnan(position_size):
+        return StrategyCacheData(execution_volume=execution_volume, last_run_date=last_run_date)
+
+    return VolatilityStrategyCacheData(
+        execution_volume=execution_volume,
+        last_run_date=last_run_date,
+        position_size=position_size,
+        threshold=threshold,
+    )
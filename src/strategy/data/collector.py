@@ -11,6 +11,7 @@ from pandera.typing import DataFrame, Series
 
 from src import constants
 from src.common.clock import Clock
+from src.common.metrics import timed
 from src.strategy.cache.cache_manager import CacheManager
 from src.strategy.cache.cache_models import DataCache
 from src.strategy.data.models import HalfDayCandle, Period, Recent20DaysHalfDayCandles
@@ -69,12 +70,16 @@ class DataCollector:
         file_cache = self._cache_manager.load_data_cache(ticker)
         if file_cache and file_cache.last_update_date == today:
             logger.debug(f"파일 캐시 히트: {ticker}, {today}")
+            self._cache_manager.metrics_sink.increment("collector.cache", ticker=ticker, result="hit")
             return file_cache.history
 
         logger.debug(f"파일 캐시 미스: {ticker}, {today}")
+        # 파일이 없으면 cold, 날짜가 지난 캐시면 stale (날짜 변경 직후 몰리는 미스 파악용)
+        self._cache_manager.metrics_sink.increment("collector.cache", ticker=ticker, result="stale" if file_cache else "cold")
 
         # API 호출
-        df = UpbitAPI.get_candles(ticker=ticker, interval=upbit_api.CandleInterval.MINUTE_60, count=(days + 1) * 24)
+        with timed(self._cache_manager.metrics_sink, "collector.fetch.seconds", ticker=ticker):
+            df = UpbitAPI.get_candles(ticker=ticker, interval=upbit_api.CandleInterval.MINUTE_60, count=(days + 1) * 24)
 
         candles = self._aggregate_all(df, days)
         result = Recent20DaysHalfDayCandles(candles=candles)
@@ -24,20 +24,36 @@ class MorningAfternoonStrategy(BaseStrategy[StrategyCacheData]):
             self._sell()
 
     def _buy(self) -> None:
-        if self._should_buy():
-            history = self._collector.collect_data(self._config.ticker)
-            position_size = self._config.target_vol / max(history.yesterday_morning.volatility, 0.01)
-            amount = min(self._config.total_balance * position_size, self._config.allocated_balance)
+        if self._preloaded_has_position():
+            return
 
-            result = self._order_executor.buy(self._config.ticker, amount, strategy_name=self._strategy_name)
-            self._save_cache(execution_volume=result.executed_volume)
+        with self._cache_transaction():
+            if self._has_pending_order():
+                return
+
+            if self._should_buy():
+                history = self._collector.collect_data(self._config.ticker)
+                position_size = self._config.target_vol / max(history.yesterday_morning.volatility, 0.01)
+                amount = min(self._config.total_balance * position_size, self._config.allocated_balance)
+
+                result = self._order_executor.buy(self._config.ticker, amount, strategy_name=self._strategy_name)
+                if result is not None:  # None이면 체결 후 OrderTracker가 캐시에 반영한다
+                    self._save_cache(execution_volume=result.executed_volume)
 
     def _sell(self) -> None:
         # TODO: 공통 메서드로 리팩터링?
-        cache = self._load_cache()
-        if cache and cache.has_position(self._clock.today()):
-            self._order_executor.sell(self._config.ticker, cache.execution_volume, strategy_name=self._strategy_name)
-            self._delete_strategy_cache()
+        if self._preloaded_has_position() is False:
+            return
+
+        with self._cache_transaction():
+            if self._has_pending_order():
+                return
+
+            cache = self._load_cache()
+            if cache and cache.has_position(self._clock.today()):
+                result = self._order_executor.sell(self._config.ticker, cache.execution_volume, strategy_name=self._strategy_name)
+                if result is not None:  # None이면 체결 후 OrderTracker가 캐시에서 수량을 뺀다
+                    self._delete_strategy_cache()
 
     def _save_cache(self, execution_volume: float) -> None:
         """기본 캐시를 저장합니다.
@@ -46,7 +62,7 @@ class MorningAfternoonStrategy(BaseStrategy[StrategyCacheData]):
             execution_volume: 체결 수량
         """
         cache = StrategyCacheData(execution_volume=execution_volume, last_run_date=self._clock.today())
-        self._cache_manager.save_strategy_cache(self._config.ticker, self._strategy_name, cache)
+        self._save_strategy_cache(cache)
 
     def _should_buy(self) -> bool:
         """오전/오후 전략의 매수 시그널을 확인합니다.
@@ -1,27 +1,85 @@
+from collections.abc import Mapping
+from functools import cache
 from zoneinfo import ZoneInfo
 
-from src.common.clock import SystemClock
+from src.common.clock import Clock, SystemClock
 from src.common.google_sheet.client import GoogleSheetClient
 from src.common.slack.client import SlackClient
 from src.config import GoogleSheetConfig, SlackConfig, UpbitConfig
 from src.constants import KST
 from src.strategy.cache.cache_manager import CacheManager
+from src.strategy.cache.cache_models import StrategyCacheData, VolatilityStrategyCacheData
 from src.strategy.config import BaseStrategyConfig
 from src.strategy.data.collector import DataCollector
 from src.strategy.morning_afternoon_strategy import MorningAfternoonStrategy
 from src.strategy.order.order_executor import OrderExecutor
+from src.strategy.order.order_tracker import OrderTracker
 from src.strategy.volatility_strategy import VolatilityStrategy
 from src.upbit.upbit_api import UpbitAPI
 
+# 전략 이름 → 캐시 모델 (캐시 일괄 로드용)
+STRATEGY_CACHE_MODELS: dict[str, type[StrategyCacheData]] = {
+    "volatility": VolatilityStrategyCacheData,
+    "morning_afternoon": StrategyCacheData,
+}
 
-def run(ticker: str, total_balance: float, allocated_balance: float, target_vol: float = 0.01, timezone: ZoneInfo = KST) -> None:
+
+@cache
+def shared_upbit_api() -> UpbitAPI:
+    """프로세스에서 함께 쓰는 UpbitAPI (티커가 많아도 잔고 스냅샷을 공유한다)"""
+    return UpbitAPI(UpbitConfig())  # type: ignore
+
+
+def load_cache_states() -> dict[tuple[str, str], StrategyCacheData]:
+    """모든 티커의 전략 캐시를 한 번에 로드합니다."""
+    return CacheManager().load_all_strategy_states(STRATEGY_CACHE_MODELS)
+
+
+def load_prices(tickers: list[str]) -> dict[str, float]:
+    """이번 tick에 사용할 티커들의 현재가를 한 번의 요청으로 조회합니다."""
+    return UpbitAPI.get_current_prices(tickers)
+
+
+def create_order_tracker() -> OrderTracker:
+    """체결을 백그라운드에서 전략 캐시에 반영하는 OrderTracker를 만듭니다.
+
+    체결이 반영되면 동기 주문과 같은 방식으로 슬랙 알림과 구글 시트 기록을 남깁니다.
+    """
+    upbit_api = shared_upbit_api()
+    notifier = OrderExecutor(upbit_api, google_sheet_client=GoogleSheetClient(GoogleSheetConfig()), slack_client=SlackClient(SlackConfig()))
+    return OrderTracker(upbit_api, CacheManager(), STRATEGY_CACHE_MODELS, on_fill=notifier.handle_fill)
+
+
+def has_pending_work(ticker: str, cache_states: Mapping[tuple[str, str], StrategyCacheData], clock: Clock) -> bool:
+    """이번 실행에서 티커에 할 일이 있는지 확인합니다.
+
+    오전에는 매수 시그널을 확인해야 하므로 항상 True,
+    오후에는 오늘 매수한 포지션이 있는 경우에만 매도할 일이 있습니다.
+    """
+    if clock.is_morning():
+        return True
+
+    today = clock.today()
+    return any(cache.has_position(today) for (cache_ticker, _), cache in cache_states.items() if cache_ticker == ticker)
+
+
+def run(
+    ticker: str,
+    total_balance: float,
+    allocated_balance: float,
+    target_vol: float = 0.01,
+    timezone: ZoneInfo = KST,
+    cache_states: Mapping[tuple[str, str], StrategyCacheData] | None = None,
+    prices: Mapping[str, float] | None = None,
+    order_tracker: OrderTracker | None = None,
+) -> None:
     # 공유 컴포넌트
     clock = SystemClock(timezone)
     data_collector = DataCollector(clock)
     google_sheet_client = GoogleSheetClient(GoogleSheetConfig())
     slack_client = SlackClient(SlackConfig())
-    upbit_api = UpbitAPI(UpbitConfig())  # type: ignore
-    order_executor = OrderExecutor(upbit_api, google_sheet_client=google_sheet_client, slack_client=slack_client)
+    upbit_api = shared_upbit_api()
+    order_executor = OrderExecutor(upbit_api, google_sheet_client=google_sheet_client, slack_client=slack_client, order_tracker=order_tracker)
     cache_manager = CacheManager()
 
     allocated_balance_per_strategy = (allocated_balance - 100) / 2  # 티커에 할당된 금액을 전략별로 5:5로 나눈다.
@@ -30,6 +88,14 @@ def run(ticker: str, total_balance: float, allocated_balance: float, target_vol:
     volatility_strategy = VolatilityStrategy(order_executor, strategy_config, clock, data_collector, cache_manager)
     morning_afternoon_strategy = MorningAfternoonStrategy(order_executor, strategy_config, clock, data_collector, cache_manager)
 
+    if cache_states is not None:
+        volatility_strategy.preload_cache(cache_states)
+        morning_afternoon_strategy.preload_cache(cache_states)
+
+    if prices is not None:
+        volatility_strategy.preload_prices(prices)
+        morning_afternoon_strategy.preload_prices(prices)
+
     try:
         volatility_strategy.execute()
     except Exception as e:
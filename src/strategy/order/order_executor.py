@@ -4,8 +4,10 @@ import logging
 from typing import Protocol
 
 from src.common.google_sheet.client import GoogleSheetClient
+from src.common.order_direction import OrderDirection
 from src.common.slack.client import SlackClient
 from src.strategy.order.execution_result import ExecutionResult
+from src.strategy.order.order_tracker import OrderTracker, TrackedOrder
 from src.upbit.model.order import OrderResult
 from src.upbit.upbit_api import UpbitAPI
 
@@ -15,11 +17,11 @@ logger = logging.getLogger(__name__)
 class OrderExecutorProtocol(Protocol):
     """OrderExecutor 인터페이스 (테스트용 모킹 가능)"""
 
-    def buy(self, ticker: str, amount: float) -> ExecutionResult:
+    def buy(self, ticker: str, amount: float) -> ExecutionResult | None:
         """시장가 매수 주문 실행"""
         ...
 
-    def sell(self, ticker: str, volume: float) -> ExecutionResult:
+    def sell(self, ticker: str, volume: float) -> ExecutionResult | None:
         """시장가 매도 주문 실행"""
         ...
 
@@ -32,6 +34,7 @@ class OrderExecutor:
         upbit_api: UpbitAPI,
         google_sheet_client: GoogleSheetClient | None = None,
         slack_client: SlackClient | None = None,
+        order_tracker: OrderTracker | None = None,
     ) -> None:
         """
         OrderExecutor 초기화
@@ -40,12 +43,14 @@ class OrderExecutor:
             upbit_api: UpbitAPI 인스턴스
             google_sheet_client: GoogleSheetClient 인스턴스 (optional)
             slack_client: SlackClient 인스턴스 (optional)
+            order_tracker: OrderTracker 인스턴스 (optional). 있으면 체결을 기다리지 않고 주문만 넣는다.
         """
         self._upbit_api = upbit_api
         self._google_sheet_client = google_sheet_client
         self._slack_client = slack_client
+        self._order_tracker = order_tracker
 
-    def buy(self, ticker: str, amount: float, strategy_name: str = "Unknown") -> ExecutionResult:
+    def buy(self, ticker: str, amount: float, strategy_name: str = "Unknown") -> ExecutionResult | None:
         """
         시장가 매수 주문 실행
 
@@ -55,8 +60,14 @@ class OrderExecutor:
             strategy_name: 전략 이름 (기본값: "Unknown")
 
         Returns:
-            ExecutionResult: 체결 결과
+            ExecutionResult: 체결 결과. order_tracker가 있으면 None (체결은 OrderTracker가 캐시에 반영)
         """
+        if self._order_tracker is not None:
+            # 주문 날짜는 업비트 주문 생성 시각(KST) 기준
+            order_result = self._upbit_api.buy_market_order(ticker, amount)
+            self._order_tracker.track(order_result, strategy_name, OrderDirection.BUY, order_result.created_at.date())
+            return None
+
         order_result = self._upbit_api.buy_market_order_and_wait(ticker, amount)
 
         result = ExecutionResult.buy(strategy_name=strategy_name, order_result=order_result)
@@ -65,7 +76,7 @@ class OrderExecutor:
 
         return result
 
-    def sell(self, ticker: str, volume: float, strategy_name: str = "Unknown") -> ExecutionResult:
+    def sell(self, ticker: str, volume: float, strategy_name: str = "Unknown") -> ExecutionResult | None:
         """
         시장가 매도 주문 실행
 
@@ -75,9 +86,15 @@ class OrderExecutor:
             strategy_name: 전략 이름 (기본값: "Unknown")
 
         Returns:
-            ExecutionResult: 체결 결과
+            ExecutionResult: 체결 결과. order_tracker가 있으면 None (체결은 OrderTracker가 캐시에 반영)
         """
-        order_result: OrderResult = self._upbit_api.sell_market_order_and_wait(ticker, volume)
+        if self._order_tracker is not None:
+            # 주문 날짜는 업비트 주문 생성 시각(KST) 기준
+            order_result = self._upbit_api.sell_market_order(ticker, volume)
+            self._order_tracker.track(order_result, strategy_name, OrderDirection.SELL, order_result.created_at.date())
+            return None
+
+        order_result = self._upbit_api.sell_market_order_and_wait(ticker, volume)
 
         result = ExecutionResult.sell(strategy_name=strategy_name, order_result=order_result)
 
@@ -85,6 +102,21 @@ class OrderExecutor:
 
         return result
 
+    def has_pending_order(self, ticker: str, strategy_name: str) -> bool:
+        """체결을 기다리는 주문이 있는지 확인합니다. (order_tracker가 없으면 항상 False)"""
+        return self._order_tracker is not None and self._order_tracker.has_pending(ticker, strategy_name)
+
+    def handle_fill(self, order: TrackedOrder, order_result: OrderResult) -> None:
+        """
+        OrderTracker가 체결을 반영한 뒤 알림과 기록을 처리합니다.
+
+        Args:
+            order: 완료된 주문
+            order_result: 체결 내역이 포함된 주문 결과
+        """
+        result = ExecutionResult.of(strategy_name=order.strategy_name, order_direction=order.direction, order_result=order_result)
+        self._handle_result(result)
+
     def _handle_result(self, result: ExecutionResult) -> None:
         # TODO: 비동기?
         if self._slack_client:
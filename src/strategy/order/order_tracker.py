@@ -0,0 +1,275 @@
+"""주문 추적
+
+주문을 넣은 뒤 체결을 기다리지 않고 uuid만 파일에 기록해 두었다가,
+백그라운드에서 한꺼번에 조회해서 체결된 주문을 전략 캐시에 반영합니다.
+
+- 기록: 주문 직후 `track()`이 미체결 주문 파일에 추가합니다. 프로세스가 재시작되어도 이어서 처리합니다.
+- 조회: `reconcile()`이 `/v1/orders/uuids`로 미체결 주문 상태를 한 번에 조회하고,
+  완료/취소된 주문만 개별 조회해서 체결 내역을 가져옵니다.
+- 반영: 매수는 캐시의 체결 수량에 더하고, 매도는 체결 수량만큼 빼서 남은 수량이 없으면 캐시를 삭제합니다.
+
+잠금 순서는 항상 전략 캐시 잠금 → 주문 파일 잠금입니다.
+"""
+
+import datetime as dt
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from src.common.file_lock import FileLock
+from src.common.order_direction import OrderDirection
+from src.strategy.cache.cache_manager import DEFAULT_CACHE_DIR, DEFAULT_LOCK_DIR_NAME, CacheManager
+from src.strategy.cache.cache_models import StrategyCacheData
+from src.strategy.cache.shared_state import SharedStateTable
+from src.upbit.model.order import OrderResult, OrderState
+from src.upbit.upbit_api import UpbitAPI
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORDER_FILE_NAME = "pending_orders.json"
+DEFAULT_RECONCILE_INTERVAL = 2.0
+MAX_BULK_ORDER_COUNT = 100  # /v1/orders/uuids 1회 최대 조회 수
+
+FillHandler = Callable[["TrackedOrder", OrderResult], None]
+
+
+class TrackedOrder(BaseModel):
+    """체결을 기다리는 주문
+
+    Attributes:
+        uuid: 주문 고유 ID
+        ticker: 종목 코드
+        strategy_name: 주문한 전략 이름
+        direction: 매수/매도
+        submitted_date: 주문 날짜 (체결 시 캐시의 last_run_date)
+    """
+
+    uuid: str = Field(..., description="주문 고유 ID")
+    ticker: str = Field(..., description="종목 코드")
+    strategy_name: str = Field(..., description="전략 이름")
+    direction: OrderDirection = Field(..., description="매수/매도")
+    submitted_date: dt.date = Field(..., description="주문 날짜")
+
+
+_tracked_orders = TypeAdapter(list[TrackedOrder])
+
+
+class OrderTracker:
+    """미체결 주문 기록 및 체결 반영"""
+
+    def __init__(
+        self,
+        upbit_api: UpbitAPI,
+        cache_manager: CacheManager,
+        cache_models: Mapping[str, type[StrategyCacheData]],
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        on_fill: FillHandler | None = None,
+        shared_state: SharedStateTable | None = None,
+    ) -> None:
+        """
+        Args:
+            upbit_api: 주문 조회에 사용할 UpbitAPI
+            cache_manager: 체결을 반영할 전략 캐시 관리자
+            cache_models: 전략 이름 → 캐시 모델 클래스
+            cache_dir: 미체결 주문 파일을 저장할 디렉토리
+            on_fill: 체결 반영 후 호출할 콜백 (알림, 기록 등)
+            shared_state: 여러 프로세스가 공유하는 전략 상태 테이블. 설정하면 체결 반영을 테이블에도 씁니다.
+        """
+        self._upbit_api = upbit_api
+        self._cache_manager = cache_manager
+        self._cache_models = cache_models
+        self._path = Path(cache_dir) / DEFAULT_ORDER_FILE_NAME
+        self._file_lock = FileLock(Path(cache_dir) / DEFAULT_LOCK_DIR_NAME)
+        self._on_fill = on_fill
+        self._shared_state = shared_state
+
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self, order_result: OrderResult, strategy_name: str, direction: OrderDirection, submitted_date: dt.date) -> TrackedOrder:
+        """
+        주문을 미체결 주문으로 기록합니다.
+
+        체결 스트림이 연결되어 있으면 완료 이벤트가 오는 즉시 백그라운드 조회를 깨웁니다.
+        """
+        order = TrackedOrder(
+            uuid=order_result.uuid,
+            ticker=order_result.market,
+            strategy_name=strategy_name,
+            direction=direction,
+            submitted_date=submitted_date,
+        )
+
+        with self._file_lock.acquire(self._path.stem):
+            self._write([*self._read(), order])
+
+        if UpbitAPI.order_stream is not None:
+            UpbitAPI.order_stream.watch(order.uuid).add_done_callback(lambda _: self.wake())
+
+        logger.info(f"주문 추적 시작: {order.ticker} {order.strategy_name} {order.direction} {order.uuid}")
+        return order
+
+    def pending(self) -> list[TrackedOrder]:
+        """미체결 주문 목록"""
+        with self._file_lock.acquire(self._path.stem, exclusive=False):
+            return self._read()
+
+    def has_pending(self, ticker: str, strategy_name: str) -> bool:
+        """ticker × strategy에 체결을 기다리는 주문이 있는지 확인합니다."""
+        return any(order.ticker == ticker and order.strategy_name == strategy_name for order in self.pending())
+
+    def reconcile(self) -> list[OrderResult]:
+        """
+        미체결 주문 상태를 일괄 조회해서 완료/취소된 주문을 캐시에 반영합니다.
+
+        Returns:
+            이번에 반영한 주문의 결과 목록
+        """
+        pending = self.pending()
+        completed: list[OrderResult] = []
+
+        for start in range(0, len(pending), MAX_BULK_ORDER_COUNT):
+            chunk = pending[start : start + MAX_BULK_ORDER_COUNT]
+            states = self._upbit_api.get_order_states([order.uuid for order in chunk])
+
+            for order in chunk:
+                if states.get(order.uuid) not in (OrderState.DONE, OrderState.CANCEL):
+                    continue
+
+                result = self._upbit_api.get_order(order.uuid)
+                if self._complete(order, result):
+                    completed.append(result)
+
+                # 체결 스트림으로 완료 이벤트를 받지 못한 주문도 대기 목록에서 정리한다
+                if UpbitAPI.order_stream is not None:
+                    UpbitAPI.order_stream.discard(order.uuid)
+
+        return completed
+
+    def start(self, interval: float = DEFAULT_RECONCILE_INTERVAL) -> None:
+        """백그라운드 조회 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="order-tracker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 조회 스레드를 멈춥니다."""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._wake_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def wake(self) -> None:
+        """다음 주기를 기다리지 않고 바로 조회하게 합니다."""
+        self._wake_event.set()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop_event.is_set():
+            self._wake_event.wait(interval)
+            self._wake_event.clear()
+
+            if self._stop_event.is_set():
+                break
+
+            try:
+                self.reconcile()
+            except Exception:
+                logger.exception("주문 체결 조회 실패")
+
+    def _complete(self, order: TrackedOrder, result: OrderResult) -> bool:
+        """
+        체결을 캐시에 반영하고 미체결 목록에서 제거합니다.
+
+        다른 프로세스가 먼저 반영했으면 아무것도 하지 않습니다.
+
+        Returns:
+            반영했으면 True
+        """
+        with self._cache_manager.lock(order.ticker, order.strategy_name), self._file_lock.acquire(self._path.stem):
+            orders = self._read()
+            remaining = [tracked for tracked in orders if tracked.uuid != order.uuid]
+            if len(remaining) == len(orders):
+                return False
+
+            self._apply_fill(order, result.executed_volume)
+            self._write(remaining)
+
+        logger.info(f"주문 체결 반영: {order.ticker} {order.strategy_name} {order.direction} {result.state} {result.executed_volume}")
+
+        # 체결 없이 취소된 주문은 알릴 내용이 없다
+        if self._on_fill and result.trades:
+            self._on_fill(order, result)
+
+        return True
+
+    def _apply_fill(self, order: TrackedOrder, executed_volume: float) -> None:
+        """
+        체결 수량을 전략 캐시에 반영합니다. 캐시 잠금 안에서 호출해야 합니다.
+
+        Args:
+            order: 완료된 주문
+            executed_volume: 체결 수량 (취소된 주문은 부분 체결 수량)
+        """
+        if executed_volume <= 0:
+            return
+
+        model_class = self._cache_models.get(order.strategy_name, StrategyCacheData)
+        cache = self._cache_manager.load_strategy_cache(order.ticker, order.strategy_name, model_class)
+
+        if order.direction == OrderDirection.BUY:
+            if cache is None:
+                if model_class is not StrategyCacheData:
+                    # 전략 파라미터가 필요한 캐시는 주문 전에 전략이 만들어 둔다
+                    logger.error(f"매수 체결을 반영할 캐시가 없습니다: {order.ticker} {order.strategy_name} {order.uuid}")
+                    return
+                cache = StrategyCacheData(last_run_date=order.submitted_date)
+
+            previous_volume = cache.execution_volume if cache.last_run_date == order.submitted_date else 0.0
+            cache = cache.model_copy(update={"execution_volume": previous_volume + executed_volume, "last_run_date": order.submitted_date})
+            self._save_cache(order, cache)
+            return
+
+        if cache is None:
+            return
+
+        remaining_volume = cache.execution_volume - executed_volume
+        if remaining_volume <= 0:
+            self._delete_cache(order)
+        else:
+            self._save_cache(order, cache.model_copy(update={"execution_volume": remaining_volume}))
+
+    def _save_cache(self, order: TrackedOrder, cache: StrategyCacheData) -> None:
+        self._cache_manager.save_strategy_cache(order.ticker, order.strategy_name, cache)
+        if self._shared_state is not None:
+            self._shared_state.put(order.ticker, order.strategy_name, cache)
+
+    def _delete_cache(self, order: TrackedOrder) -> None:
+        # 테이블에서도 지워야 persist가 청산한 포지션을 되살리지 않는다
+        self._cache_manager.delete_strategy_cache(order.ticker, order.strategy_name)
+        if self._shared_state is not None:
+            self._shared_state.delete(order.ticker, order.strategy_name)
+
+    def _read(self) -> list[TrackedOrder]:
+        if not self._path.exists():
+            return []
+        return _tracked_orders.validate_json(self._path.read_bytes())
+
+    def _write(self, orders: list[TrackedOrder]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 중간에 프로세스가 죽어도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체한다
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(_tracked_orders.dump_python(orders, mode="json"), indent=2, ensure_ascii=False))
+        os.replace(tmp_path, self._path)
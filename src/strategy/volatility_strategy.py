@@ -2,7 +2,6 @@ import logging
 
 from src.strategy.base_strategy import BaseStrategy
 from src.strategy.cache.cache_models import VolatilityStrategyCacheData
-from src.upbit.upbit_api import UpbitAPI
 
 logger = logging.getLogger(__name__)
 
@@ -26,26 +25,43 @@ class VolatilityStrategy(BaseStrategy[VolatilityStrategyCacheData]):
             self._sell()
 
     def _buy(self) -> None:
-        position_size, threshold, has_position = self._get_strategy_params()
+        if self._preloaded_has_position():
+            return
 
-        if self._should_buy(position_size, threshold, has_position):
-            amount = min(
-                self._config.total_balance * position_size,
-                self._config.allocated_balance,
-            )
+        with self._cache_transaction():
+            if self._has_pending_order():
+                return
 
-            result = self._order_executor.buy(self._config.ticker, amount, strategy_name=self._strategy_name)
+            position_size, threshold, has_position = self._get_strategy_params()
 
-            self._save_cache(
-                execution_volume=result.executed_volume, position_size=position_size, threshold=threshold
-            )
+            if self._should_buy(position_size, threshold, has_position):
+                amount = min(
+                    self._config.total_balance * position_size,
+                    self._config.allocated_balance,
+                )
+
+                result = self._order_executor.buy(self._config.ticker, amount, strategy_name=self._strategy_name)
+                if result is None:
+                    return  # 체결되면 OrderTracker가 캐시에 반영한다
+
+                self._save_cache(
+                    execution_volume=result.executed_volume, position_size=position_size, threshold=threshold
+                )
 
     def _sell(self) -> None:
         # TODO: 공통 메서드로 리팩터링?
-        cache = self._load_cache()
-        if cache and cache.has_position(self._clock.today()):
-            self._order_executor.sell(self._config.ticker, cache.execution_volume, strategy_name=self._strategy_name)
-            self._delete_strategy_cache()
+        if self._preloaded_has_position() is False:
+            return
+
+        with self._cache_transaction():
+            if self._has_pending_order():
+                return
+
+            cache = self._load_cache()
+            if cache and cache.has_position(self._clock.today()):
+                result = self._order_executor.sell(self._config.ticker, cache.execution_volume, strategy_name=self._strategy_name)
+                if result is not None:  # None이면 체결 후 OrderTracker가 캐시에서 수량을 뺀다
+                    self._delete_strategy_cache()
 
     def _get_strategy_params(self) -> tuple[float, float, bool]:
         """전략 파라미터를 캐시에서 가져오거나 새로 계산합니다.
@@ -97,7 +113,7 @@ class VolatilityStrategy(BaseStrategy[VolatilityStrategyCacheData]):
             return False
 
         # 4. 현재가 > 돌파 가격
-        current_price = UpbitAPI.get_current_price(self._config.ticker)
+        current_price = self._current_price()
         price_breakout = current_price > threshold
 
         logger.debug(f"조건 3: 현재가: {current_price} > 돌파 가격: {threshold} = {price_breakout}")
@@ -118,7 +134,7 @@ class VolatilityStrategy(BaseStrategy[VolatilityStrategyCacheData]):
             position_size=position_size,
             threshold=threshold,
         )
-        self._cache_manager.save_strategy_cache(self._config.ticker, self._strategy_name, cache)
+        self._save_strategy_cache(cache)
 
     @staticmethod
     def _calculate_threshold(yesterday_afternoon_close: float, yesterday_morning_range: float, k: float) -> float:
@@ -0,0 +1,82 @@
+"""
+계좌 잔고 스냅샷
+
+잔고 조회(`/v1/accounts`)는 한 번에 모든 통화를 반환하므로, 짧은 시간 동안 결과를 메모리에 두고
+통화별 조회는 스냅샷에서 답합니다. 여러 티커를 실행하는 tick에서 잔고 API 호출이 티커 수만큼 늘지 않습니다.
+
+내 주문으로 잔고가 바뀌면(주문 접수, 체결 완료) UpbitAPI가 스냅샷을 무효화하므로
+TTL 안이라도 주문 뒤에는 새 잔고를 조회합니다.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from src.upbit.model.balance import BalanceInfo
+
+DEFAULT_BALANCE_TTL = 3.0  # 초
+
+
+class AccountSnapshot:
+    """
+    TTL 기반 잔고 스냅샷
+
+    Examples:
+        >>> snapshot = AccountSnapshot(load_balances, ttl=3.0)
+        >>> snapshot.available("KRW-BTC")  # 첫 호출에서 전체 잔고 조회
+        >>> snapshot.available("KRW")  # TTL 안에서는 메모리에서 응답
+        >>> snapshot.invalidate()  # 주문 후
+    """
+
+    def __init__(self, loader: Callable[[], list[BalanceInfo]], ttl: float = DEFAULT_BALANCE_TTL) -> None:
+        """
+        Args:
+            loader: 전체 잔고를 조회하는 함수
+            ttl: 스냅샷 유지 시간(초). 0이면 매번 조회
+        """
+        self._loader = loader
+        self._ttl = ttl
+        self._balances: dict[tuple[str, str], BalanceInfo] | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def balances(self) -> list[BalanceInfo]:
+        """
+        전체 잔고 (만료되었으면 다시 조회)
+
+        Raises:
+            UpbitAPIError: 잔고 조회 중 에러가 발생한 경우
+        """
+        return list(self._snapshot().values())
+
+    def available(self, ticker: str) -> float:
+        """
+        특정 통화의 주문 가능 수량
+
+        Args:
+            ticker: 통화 코드 ('KRW', 'BTC') 또는 마켓 ID ('KRW-BTC')
+
+        Returns:
+            주문 가능 수량 (보유하지 않았으면 0)
+
+        Raises:
+            UpbitAPIError: 잔고 조회 중 에러가 발생한 경우
+        """
+        fiat, currency = ticker.split("-") if "-" in ticker else ("KRW", ticker)
+        balance = self._snapshot().get((currency, fiat))
+        return balance.balance if balance else 0.0
+
+    def invalidate(self) -> None:
+        """스냅샷을 버립니다. 다음 조회는 거래소에서 다시 가져옵니다."""
+        with self._lock:
+            self._balances = None
+
+    def _snapshot(self) -> dict[tuple[str, str], BalanceInfo]:
+        # 동시에 만료를 본 스레드들이 한 번만 조회하도록 잠금 안에서 조회한다.
+        # 조회 중 invalidate()는 조회가 끝난 뒤 스냅샷을 버린다.
+        with self._lock:
+            if self._balances is None or time.monotonic() - self._loaded_at >= self._ttl:
+                self._balances = {(balance.currency, balance.unit_currency): balance for balance in self._loader()}
+                self._loaded_at = time.monotonic()
+
+            return self._balances
@@ -0,0 +1,170 @@
+"""
+캔들 히스토리 병렬 조회
+
+캔들 API는 한 번에 200개까지만 반환하므로 긴 기간은 여러 페이지로 나눠 조회해야 합니다.
+이전 페이지의 마지막 캔들 시각을 다음 `to`로 넘기는 순차 방식 대신,
+간격이 고정된 캔들은 모든 페이지의 `to` 커서를 미리 계산해서 동시에 조회합니다.
+거래가 없어 캔들이 빠진 구간이 있으면 페이지가 겹쳐 개수가 모자라므로, 모자란 만큼은 가장 오래된 캔들부터 순차로 이어서 조회합니다.
+동시 요청 수는 UpbitClient의 요청 수 제한기(candle 그룹)가 조절합니다.
+"""
+
+import datetime
+import logging
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+
+import pandas as pd
+from pandera.typing import DataFrame
+
+from src.upbit.model.candle import CandleSchema
+from src.upbit.upbit_client import CANDLE_PATHS, MAX_CANDLE_COUNT, UpbitClient, candles_to_frame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+KST_UTC_OFFSET = datetime.timedelta(hours=9)  # 캔들 인덱스(KST) → to 커서(UTC)
+
+# 간격이 고정된 캔들만 커서를 미리 계산할 수 있다 (월봉 제외)
+INTERVAL_STEPS = {
+    "day": datetime.timedelta(days=1),
+    "minute1": datetime.timedelta(minutes=1),
+    "minute3": datetime.timedelta(minutes=3),
+    "minute5": datetime.timedelta(minutes=5),
+    "minute10": datetime.timedelta(minutes=10),
+    "minute15": datetime.timedelta(minutes=15),
+    "minute30": datetime.timedelta(minutes=30),
+    "minute60": datetime.timedelta(minutes=60),
+    "minute240": datetime.timedelta(minutes=240),
+    "week": datetime.timedelta(weeks=1),
+}
+
+PageSink = Callable[[DataFrame[CandleSchema]], None]
+
+
+class CandleHistoryFetcher:
+    """
+    여러 페이지의 캔들을 동시에 조회하는 조회기
+
+    Examples:
+        >>> fetcher = CandleHistoryFetcher(UpbitAPI.quotation_client)
+        >>> df = fetcher.fetch("KRW-BTC", "minute60", count=24 * 365)
+        >>> fetcher.fetch_to_sink("KRW-BTC", "minute60", count=24 * 365, sink=store.append)
+    """
+
+    def __init__(self, client: UpbitClient, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Args:
+            client: 업비트 REST 클라이언트
+            max_workers: 동시에 조회할 최대 페이지 수
+        """
+        self._client = client
+        self._max_workers = max_workers
+
+    @staticmethod
+    def supports(interval: str) -> bool:
+        """커서를 미리 계산할 수 있는 간격인지 여부"""
+        return interval in INTERVAL_STEPS
+
+    @staticmethod
+    def page_cursors(interval: str, count: int, to: datetime.datetime) -> list[tuple[datetime.datetime, int]]:
+        """
+        페이지별 (to 커서, 캔들 개수) 목록 (최신 페이지부터)
+
+        Args:
+            interval: 캔들 간격
+            count: 조회할 캔들 개수
+            to: 마지막 캔들 시각 (UTC, exclusive)
+        """
+        step = INTERVAL_STEPS[interval]
+        return [(to - step * offset, min(MAX_CANDLE_COUNT, count - offset)) for offset in range(0, count, MAX_CANDLE_COUNT)]
+
+    def iter_pages(self, ticker: str, interval: str, count: int, to: datetime.datetime | None = None) -> Iterator[DataFrame[CandleSchema]]:
+        """
+        페이지를 최신순으로 하나씩 반환합니다.
+
+        최대 max_workers개의 페이지를 미리 요청해 두고, 앞 페이지를 반환하는 동안 다음 페이지를 조회합니다.
+        동시에 메모리에 올라가는 페이지는 max_workers개를 넘지 않습니다.
+
+        Args:
+            ticker: 마켓 ID
+            interval: 캔들 간격 (INTERVAL_STEPS의 키)
+            count: 조회할 캔들 개수
+            to: 마지막 캔들 시각 (UTC, exclusive). None이면 현재
+
+        Raises:
+            ValueError: 커서를 미리 계산할 수 없는 간격인 경우
+        """
+        if not self.supports(interval):
+            raise ValueError(f"병렬 조회를 지원하지 않는 캔들 간격입니다: {interval}")
+
+        cursors = iter(self.page_cursors(interval, count, to or datetime.datetime.now(datetime.UTC).replace(tzinfo=None)))
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="candle-history") as executor:
+            pending: deque[Future[DataFrame[CandleSchema]]] = deque(
+                executor.submit(self._fetch_page, ticker, interval, cursor, page_count) for cursor, page_count in islice(cursors, self._max_workers)
+            )
+
+            while pending:
+                page = pending.popleft().result()
+
+                for cursor, page_count in islice(cursors, 1):
+                    pending.append(executor.submit(self._fetch_page, ticker, interval, cursor, page_count))
+
+                if not page.empty:
+                    yield page
+
+    def fetch(self, ticker: str, interval: str, count: int, to: datetime.datetime | None = None) -> DataFrame[CandleSchema]:
+        """
+        모든 페이지를 조회해서 하나의 DataFrame으로 합칩니다.
+
+        거래가 없어 캔들이 빠진 구간에서는 페이지가 겹칠 수 있으므로 중복 시각은 하나만 남기고,
+        그래서 count개보다 모자라면 가장 오래된 캔들 이전을 한 페이지씩 이어서 조회합니다.
+        상장 이전까지 거슬러 올라가 더 조회할 캔들이 없으면 모자란 채로 반환합니다.
+
+        Returns:
+            시각 오름차순 최신 count개 DataFrame
+        """
+        pages = list(self.iter_pages(ticker, interval, count, to))
+        if not pages:
+            return pd.DataFrame()
+
+        df = pd.concat(pages)
+        df = df[~df.index.duplicated(keep="first")].sort_index()
+
+        while len(df) < count:
+            cursor = df.index[0].to_pydatetime() - KST_UTC_OFFSET
+            page = self._fetch_page(ticker, interval, cursor, min(MAX_CANDLE_COUNT, count - len(df)))
+            older = page[page.index < df.index[0]] if not page.empty else page
+            if older.empty:
+                break
+            df = pd.concat([older, df])
+
+        if len(df) < count:
+            logger.debug(f"캔들 히스토리 부족: {ticker} {interval} {len(df)}/{count}")
+
+        return CandleSchema.validate(df.iloc[-count:])
+
+    def fetch_to_sink(self, ticker: str, interval: str, count: int, sink: PageSink, to: datetime.datetime | None = None) -> int:
+        """
+        페이지를 모두 메모리에 모으지 않고 조회하는 대로 sink에 넘깁니다.
+
+        페이지는 최신순으로 전달되며, 각 페이지는 시각 오름차순으로 정렬되어 있습니다.
+        페이지 사이 중복 제거는 sink의 책임입니다.
+
+        Returns:
+            sink에 넘긴 캔들 수
+        """
+        total = 0
+        for page in self.iter_pages(ticker, interval, count, to):
+            sink(page)
+            total += len(page)
+        return total
+
+    def _fetch_page(self, ticker: str, interval: str, cursor: datetime.datetime, count: int) -> DataFrame[CandleSchema]:
+        candles = self._client.get_candle_page(CANDLE_PATHS[interval], ticker, count, cursor)
+        if not candles:
+            return pd.DataFrame()
+
+        return CandleSchema.validate(candles_to_frame(candles))
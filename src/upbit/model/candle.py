@@ -1,12 +1,11 @@
-import pandera.pandas as pa
-from pandera.typing import Series
+from src.common.ohlcv import OhlcvSchema
 
 
-class CandleSchema(pa.DataFrameModel):
+class CandleSchema(OhlcvSchema):
     """
     업비트 캔들 DataFrame 스키마
 
-    pyupbit.get_ohlcv()가 반환하는 DataFrame의 스키마 정의
+    UpbitClient.get_ohlcv()가 반환하는 DataFrame의 스키마 정의 (컬럼은 공통 OhlcvSchema와 같다)
 
     Columns:
         open: 시가
@@ -19,14 +18,3 @@ class CandleSchema(pa.DataFrameModel):
     Index:
         DatetimeIndex: 캔들 일시
     """
-
-    open: Series[float]
-    high: Series[float]
-    low: Series[float]
-    close: Series[float]
-    volume: Series[float]
-    value: Series[float]
-
-    class Config:
-        strict = True  # 정의되지 않은 컬럼 허용 안함
-        coerce = True  # 자동 타입 변환
@@ -15,6 +15,11 @@ class UpbitAPIError(Exception):
         """API 응답이 비어있는 경우의 에러를 생성합니다."""
         return cls({"name": "empty_response", "message": "API 응답이 비어있습니다"})
 
+    @classmethod
+    def unexpected_response(cls, result: object) -> "UpbitAPIError":
+        """목록 응답을 기대했는데 다른 형식의 응답을 받은 경우의 에러를 생성합니다."""
+        return cls({"name": "unexpected_response", "message": f"목록 응답이 아닙니다: {result}"})
+
 
 class OrderTimeoutError(Exception):
     """
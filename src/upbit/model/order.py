@@ -23,7 +23,11 @@ class OrderState(Enum):
     CANCEL = "cancel"
 
 
-@dataclass
+# Enum 호출(OrderState("done"))보다 빠른 값 → 멤버 조회표
+_ORDER_STATES = {state.value: state for state in OrderState}
+
+
+@dataclass(slots=True)
 class Trade:
     """
     개별 체결 내역
@@ -71,12 +75,13 @@ class Trade:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """
     업비트 주문 결과
 
     주문 생성/조회 결과를 나타냅니다. API 응답의 숫자 문자열은 적절한 타입(float/int)으로 변환됩니다.
+    체결을 기다리며 폴링할 때는 parse_state()로 상태만 읽고, 완료된 뒤에 from_dict()로 한 번만 전체를 만듭니다.
 
     Attributes:
         uuid: 주문 고유 ID
@@ -143,3 +148,26 @@ class OrderResult:
             trades_count=int(data["trades_count"]),
             trades=[Trade.from_dict(trade) for trade in data.get("trades", [])],
         )
+
+    @staticmethod
+    def parse_state(data: dict[str, Any]) -> OrderState:
+        """
+        응답 딕셔너리에서 주문 상태만 읽습니다.
+
+        from_dict()와 달리 시간 파싱, 숫자 변환, 체결 내역 생성을 하지 않으므로
+        완료 여부만 확인하는 폴링에서 사용합니다.
+
+        Args:
+            data: 업비트 API 응답 딕셔너리
+
+        Returns:
+            주문 상태
+
+        Raises:
+            ValueError: 알 수 없는 주문 상태인 경우
+        """
+        state = data["state"]
+        try:
+            return _ORDER_STATES[state]
+        except KeyError:
+            raise ValueError(f"{state!r} is not a valid OrderState") from None
@@ -0,0 +1,158 @@
+"""
+업비트 REST 요청 수 제한
+
+업비트는 API를 그룹(시세: market/candle/ticker/trade/orderbook, 거래: default, 주문: order)으로 나누고
+그룹별 초당 요청 수를 제한하며, 응답의 `Remaining-Req` 헤더로 이번 초에 남은 요청 수를 알려줍니다.
+
+UpbitRateLimiter는 그룹별 토큰 버킷으로 요청 전에 대기하고, 응답 헤더로 버킷을 서버 값에 맞춥니다.
+대기 시간은 예약 방식으로 계산하므로 같은 버킷을 스레드와 asyncio에서 함께 사용할 수 있습니다.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+
+from src.common.metrics import MetricsSink, NullMetricsSink
+from src.common.token_bucket import TokenBucket
+
+REMAINING_REQ_HEADER = "Remaining-Req"
+
+# 그룹별 초당 요청 수 (https://docs.upbit.com/kr/reference/rate-limits)
+DEFAULT_GROUP_RATES: dict[str, float] = {
+    "market": 10,
+    "candle": 10,
+    "ticker": 10,
+    "trade": 10,
+    "orderbook": 10,
+    "default": 30,
+    "order": 8,
+}
+DEFAULT_RATE = 10.0  # 알 수 없는 그룹
+
+# 시세 API 경로 접두사 → 그룹
+QUOTATION_GROUPS = {
+    "/v1/market": "market",
+    "/v1/candles": "candle",
+    "/v1/ticker": "ticker",
+    "/v1/trades": "trade",
+    "/v1/orderbook": "orderbook",
+}
+
+
+class UpbitRateLimiter:
+    """
+    그룹별 토큰 버킷 모음
+
+    Examples:
+        >>> group = limiter.group_for("GET", "/v1/ticker")
+        >>> limiter.acquire(group)  # 스레드에서
+        >>> await limiter.acquire_async(group)  # asyncio에서
+        >>> limiter.update(response.headers, status_code=response.status_code)
+    """
+
+    def __init__(self, rates: Mapping[str, float] = DEFAULT_GROUP_RATES, metrics_sink: MetricsSink | None = None) -> None:
+        """
+        Args:
+            rates: 그룹별 초당 요청 수
+            metrics_sink: 대기 시간 등을 기록할 메트릭 싱크
+        """
+        self._rates = dict(rates)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.metrics_sink: MetricsSink = metrics_sink or NullMetricsSink()
+
+    @staticmethod
+    def group_for(method: str, path: str) -> str:
+        """
+        요청이 속한 그룹
+
+        Args:
+            method: HTTP 메서드
+            path: API 경로 (예: '/v1/orders')
+        """
+        for prefix, group in QUOTATION_GROUPS.items():
+            if path.startswith(prefix):
+                return group
+
+        if method != "GET" and path.startswith("/v1/order"):
+            return "order"
+
+        return "default"
+
+    def bucket(self, group: str) -> TokenBucket:
+        with self._lock:
+            if group not in self._buckets:
+                self._buckets[group] = TokenBucket(self._rates.get(group, DEFAULT_RATE))
+            return self._buckets[group]
+
+    def acquire(self, group: str) -> float:
+        """
+        요청을 보낼 수 있을 때까지 현재 스레드를 대기시킵니다.
+
+        Returns:
+            대기한 시간(초)
+        """
+        delay = self._reserve(group)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, group: str) -> float:
+        """
+        요청을 보낼 수 있을 때까지 이벤트 루프를 막지 않고 대기합니다.
+
+        Returns:
+            대기한 시간(초)
+        """
+        delay = self._reserve(group)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def update(self, headers: Mapping[str, str], status_code: int = 200, group: str | None = None) -> None:
+        """
+        응답 헤더로 버킷을 갱신합니다.
+
+        Args:
+            headers: 응답 헤더
+            status_code: 응답 상태 코드 (429면 해당 그룹 버킷을 비움)
+            group: 헤더가 없을 때 사용할 요청 그룹
+        """
+        remaining_req = parse_remaining_req(headers.get(REMAINING_REQ_HEADER))
+        group = remaining_req.get("group", group)
+        if group is None:
+            return
+
+        if status_code == 429:
+            self.metrics_sink.increment("ratelimit.rejected", group=group)
+            self.bucket(group).drain()
+        elif "sec" in remaining_req:
+            self.bucket(group).sync(float(remaining_req["sec"]))
+
+    def _reserve(self, group: str) -> float:
+        delay = self.bucket(group).reserve()
+
+        self.metrics_sink.observe("ratelimit.wait.seconds", delay, group=group)
+        if delay > 0:
+            self.metrics_sink.increment("ratelimit.throttled", group=group)
+
+        return delay
+
+
+def parse_remaining_req(value: str | None) -> dict[str, str]:
+    """
+    `Remaining-Req` 헤더 파싱
+
+    Examples:
+        >>> parse_remaining_req("group=default; min=1800; sec=29")
+        {'group': 'default', 'min': '1800', 'sec': '29'}
+    """
+    if not value:
+        return {}
+
+    return dict(part.strip().split("=", 1) for part in value.split(";") if "=" in part)
+
+
+# 프로세스 전체에서 공유하는 기본 제한기
+default_rate_limiter = UpbitRateLimiter()
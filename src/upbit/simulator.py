@@ -0,0 +1,748 @@
+"""
+업비트 로컬 시뮬레이터
+
+부하/지연 테스트용으로 우리가 사용하는 업비트 REST/WebSocket 엔드포인트를 로컬에서 흉내 내는 서버입니다.
+
+- REST: 현재가(`/v1/ticker`), 캔들(`/v1/candles/...`), 잔고(`/v1/accounts`),
+  주문(`POST /v1/orders`), 주문 조회(`/v1/order`, `/v1/orders/uuids`)
+- WebSocket: 공개 ticker/trade 스트림(`/websocket/v1`), 개인 myOrder 스트림(`/websocket/v1/private`)
+
+가격은 마켓별 기하 랜덤 워크로 움직이고, 응답 지연, 체결 지연, 429 응답 비율을 설정할 수 있습니다.
+그룹별 초당 요청 수를 넘으면 실제 서버처럼 429를 반환하고, 모든 응답에 `Remaining-Req` 헤더를 붙입니다.
+
+Examples:
+    >>> with UpbitSimulator(SimulatorConfig(latency=0.02, fill_delay=0.1)) as simulator:
+    ...     UpbitAPI.redirect(simulator.base_url)
+    ...     api = UpbitAPI(simulator.config_for_api())
+
+    명령줄에서 실행하면 UPBIT_BASE_URL/UPBIT_WEBSOCKET_URL로 쓸 주소를 출력합니다.
+
+    $ python -m src.upbit.simulator --port 8080 --ws-port 8081 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import base64
+import datetime
+import hashlib
+import hmac
+import json
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+from src.config import UpbitConfig
+from src.upbit.rate_limiter import DEFAULT_GROUP_RATES, DEFAULT_RATE, REMAINING_REQ_HEADER, UpbitRateLimiter
+from src.upbit.upbit_client import CANDLE_PATHS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_INITIAL_PRICE = 10_000.0
+DEFAULT_INITIAL_KRW = 1_000_000_000.0
+DEFAULT_ACCESS_KEY = "simulator-access-key"
+DEFAULT_SECRET_KEY = "simulator-secret-key-" + "0" * 43  # HS512 권장 길이(64바이트)
+FEE_RATE = 0.0005
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+# 캔들 경로 → 간격(초). 월봉은 고정 간격이 아니므로 지원하지 않는다.
+CANDLE_STEPS = {
+    CANDLE_PATHS["day"]: 86_400,
+    CANDLE_PATHS["minute1"]: 60,
+    CANDLE_PATHS["minute3"]: 180,
+    CANDLE_PATHS["minute5"]: 300,
+    CANDLE_PATHS["minute10"]: 600,
+    CANDLE_PATHS["minute15"]: 900,
+    CANDLE_PATHS["minute30"]: 1_800,
+    CANDLE_PATHS["minute60"]: 3_600,
+    CANDLE_PATHS["minute240"]: 14_400,
+    CANDLE_PATHS["week"]: 604_800,
+}
+
+
+@dataclass
+class SimulatorConfig:
+    """
+    시뮬레이터 설정
+
+    Attributes:
+        latency: REST 응답 지연(초)
+        fill_delay: 주문 접수 후 체결까지 지연(초)
+        reject_rate: 요청 수와 관계없이 429를 반환할 비율 (0~1)
+        enforce_rate_limit: 그룹별 초당 요청 수를 넘으면 429를 반환할지 여부
+        tick_interval: 가격이 한 번 움직이는 간격이자 WebSocket 시세 전송 간격(초)
+        volatility: 한 tick당 로그 수익률 표준편차
+        initial_prices: 마켓별 시작 가격 (없는 마켓은 initial_price)
+        initial_price: 기본 시작 가격
+        initial_krw: 시작 KRW 잔고
+        seed: 난수 시드 (같은 시드면 같은 가격 경로)
+    """
+
+    latency: float = 0.0
+    fill_delay: float = 0.0
+    reject_rate: float = 0.0
+    enforce_rate_limit: bool = True
+    tick_interval: float = 0.1
+    volatility: float = 0.001
+    initial_prices: dict[str, float] = field(default_factory=dict)
+    initial_price: float = DEFAULT_INITIAL_PRICE
+    initial_krw: float = DEFAULT_INITIAL_KRW
+    seed: int = 0
+
+
+class SimulatorError(Exception):
+    """업비트 에러 응답으로 변환되는 시뮬레이터 예외"""
+
+    def __init__(self, status: HTTPStatus, name: str, message: str, remaining_req: str | None = None) -> None:
+        self.status = status
+        self.name = name
+        self.message = message
+        self.remaining_req = remaining_req
+        super().__init__(f"[{name}] {message}")
+
+    def body(self) -> dict[str, Any]:
+        return {"error": {"name": self.name, "message": self.message}}
+
+
+class PricePath:
+    """
+    기하 랜덤 워크 가격 경로
+
+    가격은 조회할 때 지난 tick 수만큼 한 번에 움직입니다. n tick 동안의 로그 수익률은
+    표준편차 volatility * sqrt(n)인 정규분포이므로 tick마다 계산하지 않아도 분포는 같습니다.
+    """
+
+    def __init__(self, initial_price: float, volatility: float, tick_interval: float, rng: random.Random) -> None:
+        self.initial_price = initial_price
+        self._price = initial_price
+        self._volatility = volatility
+        self._tick_interval = tick_interval
+        self._rng = rng
+        self._updated_at = time.monotonic()
+
+    def price(self) -> float:
+        now = time.monotonic()
+        ticks = int((now - self._updated_at) / self._tick_interval)
+
+        if ticks > 0:
+            self._price *= math.exp(self._rng.gauss(0.0, self._volatility * math.sqrt(ticks)))
+            self._updated_at += ticks * self._tick_interval
+
+        return self._price
+
+
+class SimulatedExchange:
+    """
+    시뮬레이터의 거래소 상태 (가격, 잔고, 주문, 요청 수)
+
+    네트워크와 분리되어 있어 단독으로 사용할 수 있습니다. 모든 메서드는 스레드 안전합니다.
+    """
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        self.config = config
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self._paths: dict[str, PricePath] = {}
+        self._balances: dict[str, dict[str, float]] = {"KRW": {"balance": config.initial_krw, "locked": 0.0, "avg_buy_price": 0.0}}
+        self._orders: dict[str, dict[str, Any]] = {}
+        self._request_counts: dict[tuple[str, int], int] = {}
+        self.stats: dict[str, int] = {"requests": 0, "throttled": 0, "injected": 0, "orders": 0, "fills": 0}
+
+    # ------------------------------------------------------------------
+    # 요청 수 제한
+    # ------------------------------------------------------------------
+
+    def admit(self, method: str, path: str) -> str:
+        """
+        요청을 집계하고 `Remaining-Req` 헤더 값을 반환합니다.
+
+        Raises:
+            SimulatorError: 초당 요청 수를 넘었거나 429 주입에 걸린 경우
+        """
+        group = UpbitRateLimiter.group_for(method, path)
+        rate = int(DEFAULT_GROUP_RATES.get(group, DEFAULT_RATE))
+        second = int(time.time())
+
+        with self._lock:
+            self.stats["requests"] += 1
+            count = self._request_counts.get((group, second), 0) + 1
+            self._request_counts[(group, second)] = count
+            # 지난 초의 집계는 버린다
+            for key in [key for key in self._request_counts if key[1] < second]:
+                del self._request_counts[key]
+
+            remaining_req = f"group={group}; min={rate * 60}; sec={max(rate - count, 0)}"
+
+            if self.config.enforce_rate_limit and count > rate:
+                self.stats["throttled"] += 1
+                raise _too_many_requests(remaining_req)
+
+            if self.config.reject_rate and self._rng.random() < self.config.reject_rate:
+                self.stats["injected"] += 1
+                raise _too_many_requests(remaining_req)
+
+        return remaining_req
+
+    # ------------------------------------------------------------------
+    # 시세
+    # ------------------------------------------------------------------
+
+    def price(self, market: str) -> float:
+        with self._lock:
+            return self._path(market).price()
+
+    def tickers(self, markets: list[str]) -> list[dict[str, Any]]:
+        now_ms = int(time.time() * 1000)
+        return [{"market": market, "trade_price": self.price(market), "trade_timestamp": now_ms, "timestamp": now_ms} for market in markets]
+
+    def candles(self, path: str, market: str, count: int, to: datetime.datetime | None = None) -> list[dict[str, Any]]:
+        """
+        합성 캔들 (최신순)
+
+        캔들은 (마켓, 간격, 시작 시각)으로 시드를 정해 만들기 때문에 페이지를 나눠 조회해도 같은 값이 나옵니다.
+
+        Args:
+            path: 캔들 엔드포인트 경로
+            market: 마켓 ID
+            count: 캔들 개수 (최대 200)
+            to: 마지막 캔들 시각 (UTC, exclusive). None이면 현재
+        """
+        if path not in CANDLE_STEPS:
+            raise SimulatorError(HTTPStatus.NOT_FOUND, "not_found", f"지원하지 않는 캔들 경로입니다: {path}")
+
+        step = CANDLE_STEPS[path]
+        end = (to or datetime.datetime.now(datetime.UTC).replace(tzinfo=None)).replace(tzinfo=datetime.UTC).timestamp()
+        last_start = math.ceil(end / step) * step - step
+        with self._lock:
+            base = self._path(market).initial_price
+
+        return [self._candle(market, step, base, last_start - offset * step) for offset in range(min(count, 200))]
+
+    def _candle(self, market: str, step: int, base: float, start: float) -> dict[str, Any]:
+        rng = random.Random(f"{self.config.seed}:{market}:{step}:{int(start)}")
+        opening_price = base * math.exp(rng.gauss(0.0, 0.02))
+        trade_price = opening_price * math.exp(rng.gauss(0.0, 0.01))
+        high_price = max(opening_price, trade_price) * (1 + abs(rng.gauss(0.0, 0.005)))
+        low_price = min(opening_price, trade_price) * (1 - abs(rng.gauss(0.0, 0.005)))
+        volume = rng.uniform(1.0, 100.0)
+        started_at = datetime.datetime.fromtimestamp(start, datetime.UTC)
+
+        return {
+            "market": market,
+            "candle_date_time_utc": started_at.strftime("%Y-%m-%dT%H:%M:%S"),
+            "candle_date_time_kst": started_at.astimezone(KST).strftime("%Y-%m-%dT%H:%M:%S"),
+            "opening_price": opening_price,
+            "high_price": high_price,
+            "low_price": low_price,
+            "trade_price": trade_price,
+            "timestamp": int(start * 1000),
+            "candle_acc_trade_price": volume * trade_price,
+            "candle_acc_trade_volume": volume,
+        }
+
+    # ------------------------------------------------------------------
+    # 거래
+    # ------------------------------------------------------------------
+
+    def accounts(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "currency": currency,
+                    "balance": str(balance["balance"]),
+                    "locked": str(balance["locked"]),
+                    "avg_buy_price": str(balance["avg_buy_price"]),
+                    "avg_buy_price_modified": False,
+                    "unit_currency": "KRW",
+                }
+                for currency, balance in self._balances.items()
+                if balance["balance"] > 0 or balance["locked"] > 0 or currency == "KRW"
+            ]
+
+    def create_order(self, body: dict[str, Any]) -> dict[str, Any]:
+        """
+        시장가 주문 접수 (매수: ord_type=price, 매도: ord_type=market)
+
+        주문 금액/수량은 체결될 때까지 잠금(locked) 상태가 됩니다.
+
+        Raises:
+            SimulatorError: 지원하지 않는 주문이거나 잔고가 부족한 경우
+        """
+        market, side, ord_type = body.get("market", ""), body.get("side"), body.get("ord_type")
+        fiat, _, currency = market.partition("-")
+        if fiat != "KRW" or not currency:
+            raise SimulatorError(HTTPStatus.BAD_REQUEST, "invalid_market", f"지원하지 않는 마켓입니다: {market}")
+
+        with self._lock:
+            if side == "bid" and ord_type == "price":
+                funds = float(body["price"])
+                locked = funds * (1 + FEE_RATE)
+                self._lock_balance("KRW", locked, "insufficient_funds_bid", "주문가능한 금액(KRW)이 부족합니다.")
+                order = self._new_order(market, side, ord_type, price=funds, volume=None, locked=locked, reserved_fee=funds * FEE_RATE)
+            elif side == "ask" and ord_type == "market":
+                volume = float(body["volume"])
+                self._lock_balance(currency, volume, "insufficient_funds_ask", f"주문가능한 금액({currency})이 부족합니다.")
+                order = self._new_order(market, side, ord_type, price=None, volume=volume, locked=volume, reserved_fee=0.0)
+            else:
+                raise SimulatorError(HTTPStatus.BAD_REQUEST, "invalid_parameter", f"지원하지 않는 주문입니다: side={side}, ord_type={ord_type}")
+
+            self._orders[order["uuid"]] = order
+            self.stats["orders"] += 1
+            return _public_order(order)
+
+    def fill(self, order_uuid: str) -> dict[str, Any] | None:
+        """
+        대기 중인 주문을 현재가로 전량 체결합니다.
+
+        Returns:
+            체결된 주문, 이미 완료되었거나 없는 주문이면 None
+        """
+        with self._lock:
+            order = self._orders.get(order_uuid)
+            if order is None or order["state"] != "wait":
+                return None
+
+            market = order["market"]
+            currency = market.split("-")[1]
+            price = self._path(market).price()
+
+            if order["side"] == "bid":
+                funds = order["price"]
+                volume = funds / price
+                fee = funds * FEE_RATE
+                self._release("KRW", order["locked"], spent=funds + fee)
+                self._credit(currency, volume, price)
+            else:
+                volume = order["volume"]
+                funds = volume * price
+                fee = funds * FEE_RATE
+                self._release(currency, volume, spent=volume)
+                self._credit("KRW", funds - fee, 0.0)
+
+            created_at = datetime.datetime.now(KST).isoformat(timespec="seconds")
+            order.update(
+                state="done",
+                executed_volume=volume,
+                remaining_volume=0.0 if order["volume"] is not None else None,
+                paid_fee=fee,
+                remaining_fee=0.0,
+                locked=0.0,
+                trades_count=1,
+                trades=[
+                    {
+                        "market": market,
+                        "uuid": str(uuid.uuid4()),
+                        "price": str(price),
+                        "volume": str(volume),
+                        "funds": str(funds),
+                        "trend": "up" if order["side"] == "bid" else "down",
+                        "created_at": created_at,
+                        "side": order["side"],
+                    }
+                ],
+            )
+            self.stats["fills"] += 1
+            return _public_order(order)
+
+    def order(self, order_uuid: str) -> dict[str, Any]:
+        """
+        주문 조회 (체결 내역 포함)
+
+        Raises:
+            SimulatorError: 주문이 없는 경우
+        """
+        with self._lock:
+            if order_uuid not in self._orders:
+                raise SimulatorError(HTTPStatus.NOT_FOUND, "order_not_found", "주문을 찾지 못했습니다.")
+            return _public_order(self._orders[order_uuid], with_trades=True)
+
+    def orders(self, order_uuids: list[str]) -> list[dict[str, Any]]:
+        """주문 일괄 조회 (체결 내역 제외, 없는 주문은 건너뜀)"""
+        with self._lock:
+            return [_public_order(self._orders[order_uuid]) for order_uuid in order_uuids if order_uuid in self._orders]
+
+    def _path(self, market: str) -> PricePath:
+        if market not in self._paths:
+            initial_price = self.config.initial_prices.get(market, self.config.initial_price)
+            rng = random.Random(f"{self.config.seed}:{market}")
+            self._paths[market] = PricePath(initial_price, self.config.volatility, self.config.tick_interval, rng)
+        return self._paths[market]
+
+    def _lock_balance(self, currency: str, amount: float, error_name: str, message: str) -> None:
+        balance = self._balances.get(currency)
+        if balance is None or balance["balance"] < amount:
+            raise SimulatorError(HTTPStatus.BAD_REQUEST, error_name, message)
+        balance["balance"] -= amount
+        balance["locked"] += amount
+
+    def _release(self, currency: str, locked: float, spent: float) -> None:
+        balance = self._balances[currency]
+        balance["locked"] -= locked
+        balance["balance"] += locked - spent
+
+    def _credit(self, currency: str, amount: float, price: float) -> None:
+        balance = self._balances.setdefault(currency, {"balance": 0.0, "locked": 0.0, "avg_buy_price": 0.0})
+        total = balance["balance"] + balance["locked"]
+        if price:
+            balance["avg_buy_price"] = (balance["avg_buy_price"] * total + price * amount) / (total + amount)
+        balance["balance"] += amount
+
+    @staticmethod
+    def _new_order(market: str, side: str, ord_type: str, price: float | None, volume: float | None, locked: float, reserved_fee: float) -> dict[str, Any]:
+        return {
+            "uuid": str(uuid.uuid4()),
+            "side": side,
+            "ord_type": ord_type,
+            "price": price,
+            "state": "wait",
+            "market": market,
+            "created_at": datetime.datetime.now(KST).isoformat(timespec="seconds"),
+            "volume": volume,
+            "remaining_volume": volume,
+            "reserved_fee": reserved_fee,
+            "remaining_fee": reserved_fee,
+            "paid_fee": 0.0,
+            "locked": locked,
+            "executed_volume": 0.0,
+            "trades_count": 0,
+            "trades": [],
+        }
+
+
+class UpbitSimulator:
+    """
+    SimulatedExchange를 REST(HTTP)와 WebSocket으로 제공하는 로컬 서버
+
+    REST와 WebSocket은 서로 다른 포트에서 동작합니다. 포트가 0이면 빈 포트를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        config: SimulatorConfig | None = None,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        ws_port: int = 0,
+        access_key: str = DEFAULT_ACCESS_KEY,
+        secret_key: str = DEFAULT_SECRET_KEY,
+    ) -> None:
+        """
+        Args:
+            config: 시뮬레이터 설정
+            host: 바인딩할 주소
+            port: REST 포트
+            ws_port: WebSocket 포트
+            access_key: 거래 API에 허용할 액세스 키
+            secret_key: JWT 서명 검증에 사용할 시크릿 키
+        """
+        self.exchange = SimulatedExchange(config or SimulatorConfig())
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self._host = host
+        self._http_server = ThreadingHTTPServer((host, port), _RequestHandler)
+        self._http_server.daemon_threads = True
+        self._http_server.simulator = self  # type: ignore[attr-defined]
+        self._ws_port = ws_port
+        self._http_thread: threading.Thread | None = None
+        self._ws_thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ws_server: Server | None = None
+        self._ticker_subscribers: dict[ServerConnection, set[str]] = {}
+        self._order_subscribers: set[ServerConnection] = set()
+
+    @property
+    def config(self) -> SimulatorConfig:
+        return self.exchange.config
+
+    @property
+    def base_url(self) -> str:
+        """UpbitClient/UpbitAPI.redirect에 넘길 REST 기본 URL"""
+        return f"http://{self._host}:{self._http_server.server_address[1]}"
+
+    @property
+    def websocket_url(self) -> str:
+        """공개 WebSocket URL (개인 스트림은 뒤에 /private)"""
+        return f"ws://{self._host}:{self._ws_port}/websocket/v1"
+
+    @property
+    def private_websocket_url(self) -> str:
+        return f"{self.websocket_url}/private"
+
+    def config_for_api(self) -> UpbitConfig:
+        """시뮬레이터의 키와 주소를 담은 UpbitConfig"""
+        return UpbitConfig(
+            UPBIT_ACCESS_KEY=self.access_key,
+            UPBIT_SECRET_KEY=self.secret_key,
+            UPBIT_BASE_URL=self.base_url,
+            UPBIT_WEBSOCKET_URL=self.websocket_url,
+            _env_file=None,
+        )  # type: ignore[call-arg]
+
+    def start(self) -> "UpbitSimulator":
+        """REST/WebSocket 서버를 백그라운드 스레드에서 시작합니다."""
+        ready = threading.Event()
+        self._ws_thread = threading.Thread(target=self._run_loop, args=(ready,), name="upbit-simulator-ws", daemon=True)
+        self._ws_thread.start()
+        ready.wait()
+
+        self._http_thread = threading.Thread(target=self._http_server.serve_forever, name="upbit-simulator-http", daemon=True)
+        self._http_thread.start()
+
+        logger.info(f"업비트 시뮬레이터 시작: {self.base_url}, {self.websocket_url}")
+        return self
+
+    def stop(self) -> None:
+        """서버를 종료합니다."""
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stop_ws.set)
+        if self._ws_thread is not None:
+            self._ws_thread.join(5)
+
+    def __enter__(self) -> "UpbitSimulator":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def submit_order(self, body: dict[str, Any]) -> dict[str, Any]:
+        """주문을 접수하고 fill_delay 뒤에 체결을 예약합니다."""
+        order = self.exchange.create_order(body)
+        self._publish_order(order)
+
+        assert self._loop is not None
+        self._loop.call_soon_threadsafe(self._loop.call_later, self.config.fill_delay, self._fill, order["uuid"])
+        return order
+
+    def verify_token(self, authorization: str | None) -> None:
+        """
+        거래 API 인증 헤더(HS512 JWT) 검증
+
+        Raises:
+            SimulatorError: 토큰이 없거나 서명/액세스 키가 맞지 않는 경우
+        """
+        if not authorization or not authorization.startswith("Bearer "):
+            raise SimulatorError(HTTPStatus.UNAUTHORIZED, "jwt_verification", "인증 헤더가 없습니다.")
+
+        try:
+            header, payload, signature = authorization.removeprefix("Bearer ").split(".")
+            expected = hmac.new(self.secret_key.encode(), f"{header}.{payload}".encode(), hashlib.sha512).digest()
+            valid = hmac.compare_digest(_b64url_decode(signature), expected)
+            access_key = json.loads(_b64url_decode(payload)).get("access_key")
+        except ValueError:
+            valid, access_key = False, None
+
+        if not valid or access_key != self.access_key:
+            raise SimulatorError(HTTPStatus.UNAUTHORIZED, "invalid_access_key", "잘못된 엑세스 키입니다.")
+
+    # ------------------------------------------------------------------
+    # WebSocket
+    # ------------------------------------------------------------------
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._serve_ws(ready))
+        self._loop.close()
+
+    async def _serve_ws(self, ready: threading.Event) -> None:
+        self._stop_ws = asyncio.Event()
+        async with serve(self._handle_ws, self._host, self._ws_port) as server:
+            self._ws_server = server
+            self._ws_port = server.sockets[0].getsockname()[1]
+            ready.set()
+
+            broadcaster = asyncio.create_task(self._broadcast_tickers())
+            await self._stop_ws.wait()
+            broadcaster.cancel()
+
+    async def _handle_ws(self, connection: ServerConnection) -> None:
+        assert connection.request is not None
+        private = connection.request.path.rstrip("/").endswith("/private")
+
+        if private:
+            try:
+                self.verify_token(connection.request.headers.get("Authorization"))
+            except SimulatorError as e:
+                await connection.send(json.dumps(e.body()).encode())
+                return
+
+        try:
+            subscription = json.loads(await connection.recv())
+            if private:
+                self._order_subscribers.add(connection)
+            else:
+                self._ticker_subscribers[connection] = {code for item in subscription if item.get("type") in ("ticker", "trade") for code in item.get("codes", [])}
+
+            await connection.wait_closed()
+        finally:
+            self._order_subscribers.discard(connection)
+            self._ticker_subscribers.pop(connection, None)
+
+    async def _broadcast_tickers(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.tick_interval)
+
+            for connection, codes in list(self._ticker_subscribers.items()):
+                for ticker in self.exchange.tickers(sorted(codes)):
+                    message = {
+                        "type": "ticker",
+                        "code": ticker["market"],
+                        "trade_price": ticker["trade_price"],
+                        "trade_timestamp": ticker["trade_timestamp"],
+                        "stream_type": "REALTIME",
+                    }
+                    try:
+                        await connection.send(json.dumps(message).encode())
+                    except Exception:
+                        break
+
+    def _fill(self, order_uuid: str) -> None:
+        order = self.exchange.fill(order_uuid)
+        if order is not None:
+            self._publish_order(order)
+
+    def _publish_order(self, order: dict[str, Any]) -> None:
+        """myOrder 구독자에게 주문 상태를 보냅니다. 어느 스레드에서나 호출할 수 있습니다."""
+        if self._loop is None:
+            return
+
+        message = json.dumps({"type": "myOrder", "code": order["market"], "uuid": order["uuid"], "state": order["state"], "side": order["side"]}).encode()
+        self._loop.call_soon_threadsafe(self._send_to_order_subscribers, message)
+
+    def _send_to_order_subscribers(self, message: bytes) -> None:
+        for connection in list(self._order_subscribers):
+            asyncio.ensure_future(connection.send(message))
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """업비트 REST 엔드포인트 핸들러"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive (커넥션 풀 재사용)
+    server: ThreadingHTTPServer
+
+    @property
+    def simulator(self) -> UpbitSimulator:
+        return self.server.simulator  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        remaining_req = None
+
+        try:
+            if self.simulator.config.latency:
+                time.sleep(self.simulator.config.latency)
+
+            remaining_req = self.simulator.exchange.admit(method, url.path)
+            status, body = HTTPStatus.OK, self._route(method, url.path, query)
+            if method == "POST":
+                status = HTTPStatus.CREATED
+        except SimulatorError as e:
+            status, body = e.status, e.body()
+            remaining_req = e.remaining_req or remaining_req
+
+        self._send_json(status, body, remaining_req)
+
+    def _route(self, method: str, path: str, query: dict[str, list[str]]) -> Any:  # noqa: ANN401
+        exchange = self.simulator.exchange
+
+        if method == "GET" and path == "/v1/ticker":
+            return exchange.tickers(query.get("markets", [""])[0].split(","))
+
+        if method == "GET" and path.startswith("/v1/candles/"):
+            to = datetime.datetime.strptime(query["to"][0], "%Y-%m-%d %H:%M:%S") if "to" in query else None
+            return exchange.candles(path, query["market"][0], int(query.get("count", ["1"])[0]), to)
+
+        self.simulator.verify_token(self.headers.get("Authorization"))
+
+        if method == "GET" and path == "/v1/accounts":
+            return exchange.accounts()
+        if method == "POST" and path == "/v1/orders":
+            return self.simulator.submit_order(self._read_json())
+        if method == "GET" and path == "/v1/order":
+            return exchange.order(query["uuid"][0])
+        if method == "GET" and path == "/v1/orders/uuids":
+            return exchange.orders(query.get("uuids[]", []))
+
+        raise SimulatorError(HTTPStatus.NOT_FOUND, "not_found", f"지원하지 않는 API입니다: {method} {path}")
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _send_json(self, status: HTTPStatus, body: Any, remaining_req: str | None) -> None:  # noqa: ANN401
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if remaining_req:
+            self.send_header(REMAINING_REQ_HEADER, remaining_req)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _too_many_requests(remaining_req: str) -> SimulatorError:
+    return SimulatorError(HTTPStatus.TOO_MANY_REQUESTS, "too_many_requests", "요청 수 제한을 초과했습니다.", remaining_req)
+
+
+def _public_order(order: dict[str, Any], with_trades: bool = False) -> dict[str, Any]:
+    """업비트 응답 형식(숫자는 문자열)으로 변환"""
+    public = {key: (str(value) if isinstance(value, float) else value) for key, value in order.items() if key != "trades"}
+    if with_trades:
+        public["trades"] = order["trades"]
+    return public
+
+
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="업비트 로컬 시뮬레이터")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=8080, help="REST 포트")
+    parser.add_argument("--ws-port", type=int, default=8081, help="WebSocket 포트")
+    parser.add_argument("--latency", type=float, default=0.0, help="REST 응답 지연(초)")
+    parser.add_argument("--fill-delay", type=float, default=0.0, help="주문 체결 지연(초)")
+    parser.add_argument("--reject-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--no-rate-limit", action="store_true", help="그룹별 초당 요청 수 제한을 끈다")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    config = SimulatorConfig(latency=args.latency, fill_delay=args.fill_delay, reject_rate=args.reject_rate, enforce_rate_limit=not args.no_rate_limit, seed=args.seed)
+
+    with UpbitSimulator(config, host=args.host, port=args.port, ws_port=args.ws_port) as simulator:
+        print(f"UPBIT_BASE_URL={simulator.base_url}")
+        print(f"UPBIT_WEBSOCKET_URL={simulator.websocket_url}")
+        print(f"UPBIT_ACCESS_KEY={simulator.access_key}")
+        print(f"UPBIT_SECRET_KEY={simulator.secret_key}")
+
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
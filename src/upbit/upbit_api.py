@@ -6,21 +6,31 @@
 
 import logging
 import time
+from collections.abc import Iterable
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from enum import Enum
+from typing import Any
 
 import pandas as pd
-import pyupbit  # type: ignore
 from pandera.typing import DataFrame
 
 from src import constants
 from src.config import UpbitConfig
+from src.upbit.account_snapshot import DEFAULT_BALANCE_TTL, AccountSnapshot
+from src.upbit.candle_history import CandleHistoryFetcher
 from src.upbit.model.balance import BalanceInfo
 from src.upbit.model.candle import CandleSchema
 from src.upbit.model.error import OrderTimeoutError, UpbitAPIError
 from src.upbit.model.order import OrderResult, OrderState
+from src.upbit.upbit_client import DEFAULT_BASE_URL, MAX_CANDLE_COUNT, UpbitClient
+from src.upbit.upbit_websocket import UpbitOrderStream, UpbitTickerFeed
 
 logger = logging.getLogger(__name__)
 
+ORDER_STREAM_CHECK_INTERVAL = 1.0  # 체결 스트림 대기 중 연결 상태를 확인하는 주기(초)
+ORDER_STREAM_POLL_INTERVAL = 5.0  # 체결 스트림 대기 중에도 REST로 주문 상태를 확인하는 주기(초)
+MAX_ORDER_POLL_INTERVAL = 4.0  # REST 폴링 최대 간격(초)
+
 
 class CandleInterval(Enum):
     """캔들 간격"""
@@ -39,6 +49,32 @@ class CandleInterval(Enum):
 
 
 class UpbitAPI:
+    # REST 기본 URL. redirect()로 로컬 시뮬레이터 등 다른 서버로 바꿀 수 있습니다.
+    base_url = DEFAULT_BASE_URL
+    # 시세 조회용 클라이언트. 프로세스 전체에서 하나의 커넥션 풀을 재사용합니다.
+    quotation_client = UpbitClient()
+    # 200개를 넘는 캔들 조회용 병렬 조회기
+    candle_history = CandleHistoryFetcher(quotation_client)
+    # 실시간 시세 피드. 설정되어 있으면 현재가를 피드에서 먼저 읽고, 없거나 오래된 값이면 REST로 조회합니다.
+    price_feed: UpbitTickerFeed | None = None
+    # 주문 체결 스트림. 연결되어 있으면 주문 완료를 REST 폴링 대신 이벤트로 기다립니다.
+    order_stream: UpbitOrderStream | None = None
+
+    @classmethod
+    def redirect(cls, base_url: str) -> None:
+        """
+        REST 요청을 다른 서버로 보냅니다. (예: 부하 테스트용 로컬 시뮬레이터)
+
+        시세 조회는 바로 적용되고, 거래 API는 이후에 생성한 인스턴스부터 적용됩니다.
+        커넥션 풀은 그대로 재사용합니다.
+
+        Args:
+            base_url: REST 기본 URL (예: 'http://127.0.0.1:8080')
+        """
+        cls.base_url = base_url
+        cls.quotation_client = UpbitClient(base_url=base_url, session=cls.quotation_client.session)
+        cls.candle_history = CandleHistoryFetcher(cls.quotation_client)
+
     @staticmethod
     def get_current_price(ticker: str = constants.KRW_BTC) -> float:
         """
@@ -48,9 +84,36 @@ class UpbitAPI:
             ticker: 티커 코드 (기본값: 'KRW-BTC')
 
         Returns:
-            현재가, 실패 시 0.0
+            현재가 (실시간 피드 우선), 실패 시 0.0
+        """
+        if UpbitAPI.price_feed is not None and (price := UpbitAPI.price_feed.price(ticker)) is not None:
+            return price
+
+        return UpbitAPI.quotation_client.get_current_price(ticker) or 0.0
+
+    @staticmethod
+    def get_current_prices(tickers: Iterable[str]) -> dict[str, float]:
+        """
+        여러 티커의 현재가를 한 번의 요청으로 조회
+
+        Args:
+            tickers: 티커 코드 목록
+
+        Returns:
+            티커 → 현재가 (실시간 피드 우선, 나머지만 REST로 조회). 조회되지 않은 티커는 포함하지 않으며, 실패 시 빈 딕셔너리
         """
-        return pyupbit.get_current_price(ticker) or 0.0
+        # 제너레이터도 받을 수 있도록 한 번만 순회해서 중복을 제거한다
+        tickers = list(dict.fromkeys(tickers))
+
+        prices: dict[str, float] = {}
+        if UpbitAPI.price_feed is not None:
+            prices = {ticker: price for ticker in tickers if (price := UpbitAPI.price_feed.price(ticker)) is not None}
+
+        missing = [ticker for ticker in tickers if ticker not in prices]
+        if missing:
+            prices.update(UpbitAPI.quotation_client.get_current_prices(missing) or {})
+
+        return prices
 
     @staticmethod
     def get_candles(ticker: str = constants.KRW_BTC, interval: CandleInterval = CandleInterval.MINUTE_60, count: int = 24) -> DataFrame[CandleSchema]:
@@ -60,13 +123,16 @@ class UpbitAPI:
         Args:
             ticker: 티커 코드 (기본값: 'KRW-BTC')
             interval: 캔들 간격 (기본값: CandleInterval.HOUR)
-            count: 조회할 캔들 개수 (기본값: 24)
+            count: 조회할 캔들 개수 (기본값: 24). 200개를 넘으면 페이지를 동시에 조회합니다.
 
         Returns:
             CandleSchema를 따르는 DataFrame, 실패 시 빈 DataFrame
         """
         try:
-            df = pyupbit.get_ohlcv(ticker, interval=interval.value, count=count)
+            if count > MAX_CANDLE_COUNT and CandleHistoryFetcher.supports(interval.value):
+                return UpbitAPI.candle_history.fetch(ticker, interval.value, count)
+
+            df = UpbitAPI.quotation_client.get_ohlcv(ticker, interval=interval.value, count=count)
 
             if df is None or df.empty:
                 return pd.DataFrame()
@@ -76,37 +142,55 @@ class UpbitAPI:
             logger.exception(f"캔들 데이터 조회 실패: ticker={ticker}, interval={interval.value}, count={count}")
             return pd.DataFrame()
 
-    def __init__(self, config: UpbitConfig | None = None) -> None:
+    def __init__(self, config: UpbitConfig | None = None, balance_ttl: float = DEFAULT_BALANCE_TTL) -> None:
+        """
+        Args:
+            config: 업비트 API 키 설정 (None이면 환경 변수에서 로드)
+            balance_ttl: 잔고 스냅샷 유지 시간(초). 0이면 매번 조회
+        """
         if config is None:
             config = UpbitConfig()
-        self.upbit = pyupbit.Upbit(config.upbit_access_key, config.upbit_secret_key)
+        base_url = config.upbit_base_url or UpbitAPI.base_url
+        self.upbit = UpbitClient(config.upbit_access_key, config.upbit_secret_key, base_url=base_url, session=UpbitAPI.quotation_client.session)
+        # 잔고 스냅샷. 내 주문이 접수되거나 완료되면 무효화합니다.
+        self.account = AccountSnapshot(self._fetch_balances, ttl=balance_ttl)
 
     def get_available_amount(self, ticker: str = constants.CURRENCY_KRW) -> float:
         """
         특정 통화의 사용 가능 수량 조회
 
+        TTL 안에서는 잔고 스냅샷에서 응답합니다.
+
         Args:
             ticker: 티커 ('KRW-BTC') 또는 통화 코드 ('KRW', 'BTC')
 
         Returns:
             사용 가능 수량, 실패 시 0.0
         """
-        return self.upbit.get_balance(ticker) or 0.0
+        try:
+            return self.account.available(ticker)
+        except UpbitAPIError:
+            logger.exception(f"잔고 조회 실패: {ticker}")
+            return 0.0
 
     def get_balances(self) -> list[BalanceInfo]:
         """
         전체 계좌 잔고 조회
 
+        TTL 안에서는 잔고 스냅샷에서 응답합니다.
+
         Returns:
             모든 보유 자산의 잔고 정보 리스트
 
         Raises:
             UpbitAPIError: API 호출 중 에러가 발생한 경우
         """
-        balances = self.upbit.get_balances()
-        self._check_api_error(balances)
+        return self.account.balances()
+
+    def _fetch_balances(self) -> list[BalanceInfo]:
+        balances = self._check_list_response(self.upbit.get_balances())
 
-        return [BalanceInfo.from_dict(balance) for balance in balances] if balances else []
+        return [BalanceInfo.from_dict(balance) for balance in balances]
 
     def buy_market_order(self, ticker: str, amount: float) -> OrderResult:
         """
@@ -127,6 +211,7 @@ class UpbitAPI:
             raise ValueError("amount는 0보다 커야 합니다")
 
         result = self.upbit.buy_market_order(ticker, amount)
+        self.account.invalidate()
         self._check_api_error(result)
         return OrderResult.from_dict(result)
 
@@ -149,6 +234,7 @@ class UpbitAPI:
             raise ValueError("volume은 0보다 커야 합니다")
 
         result = self.upbit.sell_market_order(ticker, volume)
+        self.account.invalidate()
         self._check_api_error(result)
         return OrderResult.from_dict(result)
 
@@ -200,16 +286,64 @@ class UpbitAPI:
 
         return self.sell_market_order(ticker, volume)
 
+    def get_order(self, uuid: str) -> OrderResult:
+        """
+        개별 주문 조회 (체결 내역 포함)
+
+        Raises:
+            UpbitAPIError: API 호출 중 에러가 발생한 경우
+        """
+        return self._on_order_result(OrderResult.from_dict(self._fetch_order(uuid)))
+
+    def get_orders(self, uuids: list[str]) -> list[OrderResult]:
+        """
+        여러 주문을 한 번의 요청으로 조회
+
+        체결 내역(trades)은 포함되지 않으므로 상태 확인 용도로 사용합니다.
+
+        Args:
+            uuids: 주문 고유 ID 목록 (최대 100개)
+
+        Raises:
+            UpbitAPIError: API 호출 중 에러가 발생한 경우
+        """
+        if not uuids:
+            return []
+
+        return [OrderResult.from_dict(order) for order in self._fetch_orders(uuids)]
+
+    def get_order_states(self, uuids: list[str]) -> dict[str, OrderState]:
+        """
+        여러 주문의 상태만 한 번의 요청으로 조회
+
+        응답에서 상태만 읽고 OrderResult를 만들지 않으므로, 완료 여부만 확인하는 폴링에 사용합니다.
+
+        Args:
+            uuids: 주문 고유 ID 목록 (최대 100개)
+
+        Returns:
+            주문 고유 ID → 주문 상태
+
+        Raises:
+            UpbitAPIError: API 호출 중 에러가 발생한 경우
+        """
+        if not uuids:
+            return {}
+
+        return {order["uuid"]: OrderResult.parse_state(order) for order in self._fetch_orders(uuids)}
+
     def wait_for_order_completion(self, uuid: str, timeout: float = 30.0, poll_interval: float = 0.5) -> OrderResult:
         """
         주문 완료를 대기하고 체결 내역을 반환
 
-        주문이 완료(done) 상태가 될 때까지 폴링하며 대기합니다.
+        체결 스트림(order_stream)이 연결되어 있으면 완료 이벤트를 기다린 뒤 체결 내역을 한 번만 조회합니다.
+        스트림이 재연결된 직후와 ORDER_STREAM_POLL_INTERVAL마다 REST로도 확인해 놓친 이벤트에 대비합니다.
+        스트림이 없거나 끊긴 동안에는 REST로 폴링하며, 폴링 간격은 poll_interval부터 두 배씩 늘어납니다.
 
         Args:
             uuid: 주문 고유 ID
             timeout: 최대 대기 시간(초). 기본값: 30초
-            poll_interval: 폴링 간격(초). 기본값: 0.5초
+            poll_interval: 첫 폴링 간격(초). 기본값: 0.5초
 
         Returns:
             완료된 주문의 OrderResult
@@ -220,27 +354,92 @@ class UpbitAPI:
             UpbitAPIError: API 호출 중 에러가 발생한 경우
         """
         start_time = time.time()
+        order_stream = UpbitAPI.order_stream
+        future = order_stream.watch(uuid) if order_stream is not None else None
+        connections = order_stream.connections if order_stream is not None else 0
+        next_stream_poll_at = start_time + ORDER_STREAM_POLL_INTERVAL
+
+        try:
+            while True:
+                waiting_stream = False
+
+                if future is not None and order_stream is not None and order_stream.connected and not future.done():
+                    waiting_stream = True
+                    now = time.time()
+                    if order_stream.connections == connections and now < next_stream_poll_at:
+                        # 체결 이벤트를 기다리되, 스트림이 끊기면 폴링으로 넘어가도록 주기적으로 깨어난다
+                        try:
+                            future.result(timeout=min(ORDER_STREAM_CHECK_INTERVAL, next_stream_poll_at - now, start_time + timeout - now))
+                        except FutureTimeoutError:
+                            self._check_order_timeout(uuid, start_time, timeout)
+                        continue
+
+                    # 재연결 직후에는 끊긴 동안 놓친 이벤트가 있을 수 있으므로 REST로 한 번 확인한다
+                    connections = order_stream.connections
+                    next_stream_poll_at = now + ORDER_STREAM_POLL_INTERVAL
+
+                # 주문 상태 조회 (완료되기 전에는 상태만 확인한다)
+                result = self._fetch_order(uuid)
+
+                # 주문 완료 확인
+                if OrderResult.parse_state(result) in (OrderState.DONE, OrderState.CANCEL):
+                    logger.debug(f"주문 체결 완료: {uuid}")
+                    return self._on_order_result(OrderResult.from_dict(result))
+
+                remaining = self._check_order_timeout(uuid, start_time, timeout)
+
+                if waiting_stream:
+                    continue
+
+                # 다음 폴링까지 대기 (남은 시간보다 오래 자지 않는다)
+                time.sleep(min(poll_interval, remaining))
+                poll_interval = min(poll_interval * 2, MAX_ORDER_POLL_INTERVAL)
+        finally:
+            if order_stream is not None:
+                order_stream.discard(uuid)
+
+    def _fetch_order(self, uuid: str) -> dict[str, Any]:
+        """
+        개별 주문 조회 응답 (파싱 전)
+
+        Raises:
+            UpbitAPIError: API 호출 중 에러가 발생한 경우
+        """
+        result = self.upbit.get_order(uuid)
+        self._check_api_error(result)
+        return result
+
+    def _fetch_orders(self, uuids: list[str]) -> list[dict[str, Any]]:
+        """
+        여러 주문 조회 응답 (파싱 전)
 
-        while True:
-            # 주문 상태 조회
-            result = self.upbit.get_order(uuid)
-            self._check_api_error(result)
+        Raises:
+            UpbitAPIError: API 호출 중 에러가 발생한 경우
+        """
+        return self._check_list_response(self.upbit.get_orders(uuids))
 
-            order_result = OrderResult.from_dict(result)
+    def _on_order_result(self, order_result: OrderResult) -> OrderResult:
+        """완료된 주문이면 잔고가 바뀌었으므로 잔고 스냅샷을 무효화합니다."""
+        if order_result.state in (OrderState.DONE, OrderState.CANCEL):
+            self.account.invalidate()
+        return order_result
 
-            # 주문 완료 확인
-            if order_result.state == OrderState.DONE or order_result.state == OrderState.CANCEL:
-                logger.debug(f"주문 체결 완료: {uuid}")
-                return order_result
+    @staticmethod
+    def _check_order_timeout(uuid: str, start_time: float, timeout: float) -> float:
+        """
+        주문 완료 대기 시간 초과 확인
 
-            # 타임아웃 확인
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                logger.error(f"주문 완료 대기 타임아웃: {uuid} ({elapsed:.2f}초)")
-                raise OrderTimeoutError(uuid, timeout)
+        Returns:
+            남은 대기 시간(초)
 
-            # 다음 폴링까지 대기
-            time.sleep(poll_interval)
+        Raises:
+            OrderTimeoutError: 타임아웃 시간을 초과한 경우
+        """
+        elapsed = time.time() - start_time
+        if elapsed >= timeout:
+            logger.error(f"주문 완료 대기 타임아웃: {uuid} ({elapsed:.2f}초)")
+            raise OrderTimeoutError(uuid, timeout)
+        return timeout - elapsed
 
     def buy_market_order_and_wait(self, ticker: str, amount: float, timeout: float = 30.0) -> OrderResult:
         """
@@ -305,6 +504,19 @@ class UpbitAPI:
         order_result = self.sell_market_order_by_price(ticker, price)
         return self.wait_for_order_completion(order_result.uuid, timeout)
 
+    @staticmethod
+    def _check_list_response(result: list[dict[str, Any]] | dict[str, Any] | None) -> list[dict[str, Any]]:
+        """
+        목록 응답의 에러를 확인하고 목록을 반환
+
+        Raises:
+            UpbitAPIError: 응답에 에러가 포함되었거나 목록이 아닌 경우
+        """
+        UpbitAPI._check_api_error(result)
+        if not isinstance(result, list):
+            raise UpbitAPIError.unexpected_response(result)
+        return result
+
     @staticmethod
     def _check_api_error(result: dict | list | None) -> None:
         """
@@ -0,0 +1,308 @@
+"""
+업비트 REST 클라이언트
+
+pyupbit는 호출마다 모듈 수준의 requests.get/post를 사용해서 매번 TCP/TLS 연결을 새로 맺습니다.
+이 클라이언트는 keep-alive 커넥션 풀을 가진 requests.Session 하나를 재사용하고,
+pyupbit와 같은 이름/형태의 원시 응답을 반환하므로 UpbitAPI에서 그대로 교체해서 사용할 수 있습니다.
+"""
+
+import base64
+import datetime
+import hashlib
+import hmac
+import json
+import logging
+import uuid
+from typing import Any
+from urllib.parse import urlencode
+
+import pandas as pd
+import requests
+
+from src.common.http_session import DEFAULT_TIMEOUT, create_session
+from src.upbit.rate_limiter import UpbitRateLimiter, default_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.upbit.com"
+MAX_CANDLE_COUNT = 200  # 캔들 조회 1회 최대 개수
+MAX_RATE_LIMIT_RETRIES = 3  # 429 응답 시 제한기로 물러난 뒤 다시 보내는 최대 횟수
+TOO_MANY_REQUESTS = 429
+
+# 캔들 간격 → 엔드포인트 경로
+CANDLE_PATHS = {
+    "day": "/v1/candles/days",
+    "minute1": "/v1/candles/minutes/1",
+    "minute3": "/v1/candles/minutes/3",
+    "minute5": "/v1/candles/minutes/5",
+    "minute10": "/v1/candles/minutes/10",
+    "minute15": "/v1/candles/minutes/15",
+    "minute30": "/v1/candles/minutes/30",
+    "minute60": "/v1/candles/minutes/60",
+    "minute240": "/v1/candles/minutes/240",
+    "week": "/v1/candles/weeks",
+    "month": "/v1/candles/months",
+}
+
+# 업비트 캔들 응답 필드 → CandleSchema 컬럼
+CANDLE_COLUMNS = {
+    "opening_price": "open",
+    "high_price": "high",
+    "low_price": "low",
+    "trade_price": "close",
+    "candle_acc_trade_volume": "volume",
+    "candle_acc_trade_price": "value",
+}
+
+
+class UpbitClient:
+    """
+    업비트 REST API 클라이언트
+
+    시세 조회는 키 없이, 거래(잔고/주문)는 액세스 키와 시크릿 키로 서명한 JWT로 호출합니다.
+
+    Args:
+        access_key: 업비트 액세스 키 (시세 조회만 할 경우 None)
+        secret_key: 업비트 시크릿 키 (시세 조회만 할 경우 None)
+        base_url: API 기본 URL
+        timeout: 요청 타임아웃 (connect, read) 초
+        session: 공유할 세션 (None이면 새로 생성)
+        rate_limiter: 요청 수 제한기 (None이면 프로세스 공용 제한기)
+    """
+
+    def __init__(
+        self,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        session: requests.Session | None = None,
+        rate_limiter: UpbitRateLimiter | None = None,
+    ) -> None:
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self.session = session or create_session()
+        self.rate_limiter = rate_limiter or default_rate_limiter
+
+    # ------------------------------------------------------------------
+    # 시세 (Quotation)
+    # ------------------------------------------------------------------
+
+    def get_current_price(self, ticker: str) -> float | None:
+        """
+        현재가 조회
+
+        Returns:
+            현재가, 실패 시 None
+        """
+        try:
+            tickers = self._get("/v1/ticker", params={"markets": ticker})
+            return float(tickers[0]["trade_price"])
+        except Exception:
+            logger.exception(f"현재가 조회 실패: {ticker}")
+            return None
+
+    def get_current_prices(self, tickers: list[str]) -> dict[str, float] | None:
+        """
+        여러 마켓의 현재가를 한 번의 요청으로 조회
+
+        Returns:
+            마켓 ID → 현재가, 실패 시 None
+        """
+        try:
+            tickers_info = self._get("/v1/ticker", params={"markets": ",".join(tickers)})
+            return {info["market"]: float(info["trade_price"]) for info in tickers_info}
+        except Exception:
+            logger.exception(f"현재가 일괄 조회 실패: {tickers}")
+            return None
+
+    def get_ohlcv(self, ticker: str, interval: str = "day", count: int = MAX_CANDLE_COUNT, to: datetime.datetime | None = None) -> pd.DataFrame | None:
+        """
+        캔들 조회
+
+        200개를 넘는 요청은 가장 오래된 캔들 시각을 다음 요청의 `to`로 넘기며 이어서 조회합니다.
+
+        Args:
+            ticker: 마켓 ID
+            interval: 캔들 간격 (CANDLE_PATHS의 키)
+            count: 조회할 캔들 개수
+            to: 마지막 캔들 시각 (UTC, exclusive). None이면 현재
+
+        Returns:
+            open/high/low/close/volume/value 컬럼과 KST 시각 인덱스를 가진 DataFrame, 실패 시 None
+        """
+        try:
+            path = CANDLE_PATHS[interval]
+            cursor = to or datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+            pages = []
+
+            for remaining in range(max(count, 1), 0, -MAX_CANDLE_COUNT):
+                candles = self.get_candle_page(path, ticker, min(MAX_CANDLE_COUNT, remaining), cursor)
+                if not candles:
+                    break
+
+                pages.append(candles)
+                cursor = datetime.datetime.fromisoformat(candles[-1]["candle_date_time_utc"])
+
+            return candles_to_frame([candle for page in pages for candle in page])
+        except Exception:
+            logger.exception(f"캔들 조회 실패: ticker={ticker}, interval={interval}, count={count}")
+            return None
+
+    def get_candle_page(self, path: str, ticker: str, count: int, to: datetime.datetime) -> list[dict[str, Any]]:
+        """
+        캔들 한 페이지(최대 200개) 원시 응답 조회
+
+        Args:
+            path: 캔들 엔드포인트 경로
+            ticker: 마켓 ID
+            count: 조회할 캔들 개수
+            to: 마지막 캔들 시각 (UTC, exclusive)
+
+        Returns:
+            최신순 캔들 리스트
+        """
+        return self._get(path, params={"market": ticker, "count": count, "to": to.strftime("%Y-%m-%d %H:%M:%S")})
+
+    # ------------------------------------------------------------------
+    # 거래 (Exchange)
+    # ------------------------------------------------------------------
+
+    def get_balances(self) -> list[dict[str, Any]] | dict[str, Any]:
+        """전체 계좌 조회 (에러 시 error 필드를 가진 딕셔너리)"""
+        return self._request("GET", "/v1/accounts")
+
+    def get_balance(self, ticker: str = "KRW") -> float | None:
+        """
+        특정 통화의 주문 가능 수량 조회
+
+        Args:
+            ticker: 통화 코드 ('KRW', 'BTC') 또는 마켓 ID ('KRW-BTC')
+
+        Returns:
+            주문 가능 수량 (보유하지 않았으면 0), 실패 시 None
+        """
+        fiat, currency = ticker.split("-") if "-" in ticker else ("KRW", ticker)
+
+        balances = self.get_balances()
+        if not isinstance(balances, list):
+            logger.error(f"잔고 조회 실패: {balances}")
+            return None
+
+        for balance in balances:
+            if balance["currency"] == currency and balance["unit_currency"] == fiat:
+                return float(balance["balance"])
+
+        return 0.0
+
+    def buy_market_order(self, ticker: str, price: float) -> dict[str, Any]:
+        """시장가 매수 (price: 주문 금액)"""
+        return self._request("POST", "/v1/orders", body={"market": ticker, "side": "bid", "price": str(price), "ord_type": "price"})
+
+    def sell_market_order(self, ticker: str, volume: float) -> dict[str, Any]:
+        """시장가 매도 (volume: 주문 수량)"""
+        return self._request("POST", "/v1/orders", body={"market": ticker, "side": "ask", "volume": str(volume), "ord_type": "market"})
+
+    def get_order(self, uuid_: str) -> dict[str, Any]:
+        """개별 주문 조회"""
+        return self._request("GET", "/v1/order", params={"uuid": uuid_})
+
+    def get_orders(self, uuids: list[str]) -> list[dict[str, Any]] | dict[str, Any]:
+        """uuid 목록으로 주문 일괄 조회 (체결 내역 제외, 최대 100개)"""
+        return self._request("GET", "/v1/orders/uuids", params={"uuids[]": uuids})
+
+    # ------------------------------------------------------------------
+    # 내부 메서드
+    # ------------------------------------------------------------------
+
+    def _get(self, path: str, params: dict[str, Any]) -> Any:  # noqa: ANN401
+        res = self._send("GET", path, params=params)
+        res.raise_for_status()
+        return res.json()
+
+    def _request(self, method: str, path: str, params: dict[str, Any] | None = None, body: dict[str, Any] | None = None) -> Any:  # noqa: ANN401
+        """
+        인증이 필요한 API 호출
+
+        4xx 응답도 업비트 에러 형식({"error": {...}})의 본문을 그대로 반환하여
+        호출부에서 UpbitAPIError로 변환할 수 있게 합니다.
+        """
+        res = self._send(method, path, params=params, body=body, signed=True)
+
+        if res.status_code >= 500:
+            res.raise_for_status()
+
+        return res.json()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+        signed: bool = False,
+    ) -> requests.Response:
+        """
+        요청 그룹의 제한에 맞춰 대기한 뒤 요청을 보내고, 응답의 Remaining-Req 헤더로 제한기를 갱신합니다.
+
+        429 응답은 요청이 처리되지 않은 것이므로(주문 포함) 제한기가 버킷을 비운 뒤 다시 대기해서 보냅니다.
+        인증 헤더의 nonce는 재사용할 수 없으므로 signed면 요청할 때마다 새로 서명합니다.
+        """
+        group = self.rate_limiter.group_for(method, path)
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire(group)
+
+            headers = self._auth_headers(body if body is not None else params) if signed else None
+            res = self.session.request(method, f"{self._base_url}{path}", params=params, json=body, headers=headers, timeout=self._timeout)
+            self.rate_limiter.update(res.headers, res.status_code, group)
+
+            if attempt == MAX_RATE_LIMIT_RETRIES or res.status_code != TOO_MANY_REQUESTS:
+                return res
+
+            logger.warning(f"업비트 요청 수 초과, 다시 요청합니다: {method} {path} ({attempt + 1}/{MAX_RATE_LIMIT_RETRIES})")
+
+        return res
+
+    def _auth_headers(self, query: dict[str, Any] | None = None) -> dict[str, str]:
+        """
+        업비트 인증 헤더 생성
+
+        쿼리(또는 본문)가 있으면 urlencode한 문자열의 SHA512 해시를 query_hash로 JWT에 포함합니다.
+        """
+        if not self._access_key or not self._secret_key:
+            raise ValueError("거래 API는 액세스 키와 시크릿 키가 필요합니다")
+
+        payload: dict[str, Any] = {"access_key": self._access_key, "nonce": str(uuid.uuid4())}
+
+        if query:
+            payload["query_hash"] = hashlib.sha512(urlencode(query, doseq=True).replace("%5B%5D=", "[]=").encode()).hexdigest()
+            payload["query_hash_alg"] = "SHA512"
+
+        return {"Authorization": f"Bearer {encode_jwt(payload, self._secret_key)}"}
+
+
+def encode_jwt(payload: dict[str, Any], secret_key: str) -> str:
+    """HS512 JWT 서명"""
+    header = _b64url(json.dumps({"alg": "HS512", "typ": "JWT"}, separators=(",", ":")).encode())
+    body = _b64url(json.dumps(payload, separators=(",", ":")).encode())
+    signature = hmac.new(secret_key.encode(), f"{header}.{body}".encode(), hashlib.sha512).digest()
+    return f"{header}.{body}.{_b64url(signature)}"
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def candles_to_frame(candles: list[dict[str, Any]]) -> pd.DataFrame:
+    """
+    업비트 캔들 원시 응답을 pyupbit.get_ohlcv와 같은 형태의 DataFrame으로 변환
+
+    Returns:
+        KST 시각(tz-naive) 인덱스 오름차순 DataFrame. 중복 시각은 하나만 남깁니다.
+    """
+    index = pd.to_datetime([candle["candle_date_time_kst"] for candle in candles])
+    df = pd.DataFrame(candles, columns=list(CANDLE_COLUMNS), index=index).rename(columns=CANDLE_COLUMNS)
+    return df[~df.index.duplicated(keep="last")].sort_index()
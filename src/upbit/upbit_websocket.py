@@ -0,0 +1,227 @@
+"""
+업비트 실시간 WebSocket 스트림
+
+- UpbitTickerFeed: 공개 ticker/trade 스트림을 구독해서 마켓별 마지막 체결가를 메모리 테이블에 유지합니다.
+  전략은 REST 호출 없이 테이블에서 현재가를 읽고, 값이 오래되었으면 REST로 대체합니다.
+- UpbitOrderStream: 개인 myOrder 스트림을 구독해서 주문이 완료/취소되면 uuid별 Future를 완료합니다.
+
+연결 관리(재연결, 스레드)는 공통 WebSocketStream, 체결가 테이블은 공통 LastPriceTable을 사용합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future
+from typing import Any
+
+from src.common.metrics import MetricsSink
+from src.common.price_table import DEFAULT_MAX_PRICE_AGE, LastPriceTable, PriceTick
+from src.common.websocket_stream import INITIAL_RECONNECT_DELAY, MAX_RECONNECT_DELAY, WebSocketStream
+from src.upbit.model.order import OrderState
+from src.upbit.upbit_client import encode_jwt
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WEBSOCKET_URL = "wss://api.upbit.com/websocket/v1"
+DEFAULT_PRIVATE_WEBSOCKET_URL = "wss://api.upbit.com/websocket/v1/private"
+DEFAULT_STREAM_TYPES = ("ticker", "trade")
+MAX_COMPLETED_ORDERS = 1000  # watch 전에 도착한 완료 이벤트를 보관할 최대 주문 수
+
+
+class UpbitWebSocketStream(WebSocketStream):
+    """
+    업비트 WebSocket 스트림
+
+    업비트는 JSON 구독 메시지 하나로 구독하고, 모든 수신 메시지가 JSON입니다.
+    서브클래스는 구독 메시지와 수신 데이터 처리만 구현합니다.
+    """
+
+    _thread_prefix = "upbit"
+
+    @abstractmethod
+    def _subscribe_message(self) -> str:
+        """연결 직후 보낼 구독 메시지"""
+        pass
+
+    @abstractmethod
+    def _handle_data(self, data: dict[str, Any]) -> None:
+        """수신한 메시지 처리"""
+        pass
+
+    def _subscribe_messages(self) -> list[str]:
+        return [self._subscribe_message()]
+
+    def _handle_message(self, message: str | bytes) -> None:
+        data = json.loads(message)
+        self._last_message_at = time.monotonic()
+
+        if "error" in data:
+            logger.error(f"{self._stream_name} 스트림 에러: {data['error']}")
+            return
+
+        self._handle_data(data)
+
+
+class UpbitTickerFeed(UpbitWebSocketStream):
+    """
+    업비트 공개 ticker/trade 스트림 구독 클라이언트
+
+    Examples:
+        >>> feed = UpbitTickerFeed(["KRW-BTC", "KRW-ETH"])
+        >>> feed.start()
+        >>> feed.price("KRW-BTC")  # 오래되었거나 아직 수신 전이면 None
+        >>> feed.stop()
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        url: str = DEFAULT_WEBSOCKET_URL,
+        stream_types: tuple[str, ...] = DEFAULT_STREAM_TYPES,
+        table: LastPriceTable | None = None,
+        max_price_age: float = DEFAULT_MAX_PRICE_AGE,
+        metrics_sink: MetricsSink | None = None,
+        initial_reconnect_delay: float = INITIAL_RECONNECT_DELAY,
+        max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+    ) -> None:
+        """
+        Args:
+            tickers: 구독할 마켓 ID 목록
+            url: WebSocket URL
+            stream_types: 구독할 스트림 종류
+            table: 체결가를 기록할 테이블 (None이면 새로 생성)
+            max_price_age: price()가 허용하는 최대 경과 시간(초)
+            metrics_sink: 재연결 횟수 등을 기록할 메트릭 싱크
+            initial_reconnect_delay: 첫 재연결 대기 시간(초)
+            max_reconnect_delay: 최대 재연결 대기 시간(초)
+        """
+        super().__init__(url, metrics_sink, initial_reconnect_delay, max_reconnect_delay)
+        self._tickers = list(dict.fromkeys(tickers))
+        self._stream_types = stream_types
+        self._table = table or LastPriceTable()
+        self._max_price_age = max_price_age
+
+    @property
+    def _stream_name(self) -> str:
+        return "ticker"
+
+    @property
+    def table(self) -> LastPriceTable:
+        return self._table
+
+    def price(self, ticker: str) -> float | None:
+        """
+        현재가 조회
+
+        Returns:
+            현재가, 수신 전이거나 max_price_age보다 오래되었으면 None
+        """
+        return self._table.get(ticker, self._max_price_age)
+
+    def _subscribe_message(self) -> str:
+        streams = [{"type": stream_type, "codes": self._tickers, "isOnlyRealtime": True} for stream_type in self._stream_types]
+        return json.dumps([{"ticket": str(uuid.uuid4())}, *streams, {"format": "DEFAULT"}])
+
+    def _handle_data(self, data: dict[str, Any]) -> None:
+        if data.get("type") not in self._stream_types:
+            return
+
+        self._table.update(PriceTick(data["code"], float(data["trade_price"]), int(data["trade_timestamp"]), time.monotonic()))
+
+
+class UpbitOrderStream(UpbitWebSocketStream):
+    """
+    업비트 개인 myOrder 스트림 구독 클라이언트
+
+    주문이 완료(done) 또는 취소(cancel)되면 watch()가 반환한 Future를 최종 상태로 완료합니다.
+    시장가 주문은 주문 응답보다 체결 이벤트가 먼저 도착할 수 있으므로,
+    최근 완료된 주문 상태를 보관해 두었다가 뒤늦게 watch()해도 바로 완료합니다.
+
+    Examples:
+        >>> stream = UpbitOrderStream(access_key, secret_key)
+        >>> stream.start()
+        >>> future = stream.watch(order.uuid)
+        >>> future.result(timeout=30)
+        <OrderState.DONE: 'done'>
+    """
+
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        url: str = DEFAULT_PRIVATE_WEBSOCKET_URL,
+        metrics_sink: MetricsSink | None = None,
+        initial_reconnect_delay: float = INITIAL_RECONNECT_DELAY,
+        max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+    ) -> None:
+        """
+        Args:
+            access_key: 업비트 액세스 키
+            secret_key: 업비트 시크릿 키
+            url: 개인 WebSocket URL
+            metrics_sink: 재연결 횟수 등을 기록할 메트릭 싱크
+            initial_reconnect_delay: 첫 재연결 대기 시간(초)
+            max_reconnect_delay: 최대 재연결 대기 시간(초)
+        """
+        super().__init__(url, metrics_sink, initial_reconnect_delay, max_reconnect_delay)
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._waiters: dict[str, Future[OrderState]] = {}
+        self._completed: OrderedDict[str, OrderState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def _stream_name(self) -> str:
+        return "my_order"
+
+    def watch(self, order_uuid: str) -> Future[OrderState]:
+        """
+        주문 완료를 기다리는 Future를 반환합니다.
+
+        Args:
+            order_uuid: 주문 고유 ID
+
+        Returns:
+            주문이 done/cancel 상태가 되면 해당 OrderState로 완료되는 Future
+        """
+        with self._lock:
+            future = self._waiters.get(order_uuid)
+            if future is None:
+                future = self._waiters[order_uuid] = Future()
+
+            if order_uuid in self._completed:
+                self._complete(order_uuid, self._completed[order_uuid])
+
+        return future
+
+    def discard(self, order_uuid: str) -> None:
+        """더 이상 기다리지 않는 주문을 정리합니다."""
+        with self._lock:
+            self._waiters.pop(order_uuid, None)
+
+    def _connect_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {encode_jwt({'access_key': self._access_key, 'nonce': str(uuid.uuid4())}, self._secret_key)}"}
+
+    def _subscribe_message(self) -> str:
+        return json.dumps([{"ticket": str(uuid.uuid4())}, {"type": "myOrder"}, {"format": "DEFAULT"}])
+
+    def _handle_data(self, data: dict[str, Any]) -> None:
+        if data.get("type") != "myOrder" or data.get("state") not in (OrderState.DONE.value, OrderState.CANCEL.value):
+            return
+
+        with self._lock:
+            self._completed[data["uuid"]] = OrderState(data["state"])
+            if len(self._completed) > MAX_COMPLETED_ORDERS:
+                self._completed.popitem(last=False)
+
+            self._complete(data["uuid"], OrderState(data["state"]))
+
+    def _complete(self, order_uuid: str, state: OrderState) -> None:
+        future = self._waiters.pop(order_uuid, None)
+        if future is not None and not future.done():
+            future.set_result(state)
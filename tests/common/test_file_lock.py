@@ -0,0 +1,112 @@
+import datetime as dt
+import threading
+
+import pytest
+
+from src.common.file_lock import CacheLockTimeoutError, FileLock
+from src.strategy.cache.cache_manager import CacheManager
+from src.strategy.cache.cache_models import StrategyCacheData
+
+
+def _hold_lock(file_lock: FileLock, key: str, exclusive: bool, acquired: threading.Event, release: threading.Event) -> None:
+    with file_lock.acquire(key, exclusive=exclusive):
+        acquired.set()
+        release.wait(timeout=5)
+
+
+@pytest.fixture
+def sample_strategy_cache():
+    return StrategyCacheData(execution_volume=0.1, last_run_date=dt.date(2024, 1, 2))
+
+
+@pytest.fixture
+def holder():
+    """다른 스레드에서 잠금을 잡고 있는 상태를 만든다"""
+    threads = []
+    release = threading.Event()
+
+    def start(file_lock: FileLock, key: str, exclusive: bool = True) -> None:
+        acquired = threading.Event()
+        thread = threading.Thread(target=_hold_lock, args=(file_lock, key, exclusive, acquired, release))
+        thread.start()
+        threads.append(thread)
+        assert acquired.wait(timeout=5)
+
+    yield start
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+
+class TestFileLock:
+    def test_같은_스레드에서_재진입_가능(self, tmp_path):
+        file_lock = FileLock(tmp_path)
+
+        with file_lock.acquire("KRW-BTC_volatility"):
+            with file_lock.acquire("KRW-BTC_volatility", exclusive=False):
+                pass
+
+        assert file_lock.metrics["KRW-BTC_volatility"].acquired == 1
+
+    def test_공유_잠금_보유_중_배타_잠금_요청시_에러(self, tmp_path):
+        file_lock = FileLock(tmp_path)
+
+        with file_lock.acquire("KRW-BTC_volatility", exclusive=False):
+            with pytest.raises(RuntimeError):
+                with file_lock.acquire("KRW-BTC_volatility"):
+                    pass
+
+    def test_배타_잠금_경합시_타임아웃(self, tmp_path, holder):
+        file_lock = FileLock(tmp_path)
+        holder(file_lock, "KRW-BTC_volatility")
+
+        with pytest.raises(CacheLockTimeoutError):
+            with file_lock.acquire("KRW-BTC_volatility", timeout=0.05):
+                pass
+
+        metrics = file_lock.metrics["KRW-BTC_volatility"]
+        assert metrics.timeouts == 1
+        assert metrics.contended == 1
+        assert metrics.max_wait_seconds >= 0.05
+
+    def test_공유_잠금끼리는_경합하지_않음(self, tmp_path, holder):
+        file_lock = FileLock(tmp_path)
+        holder(file_lock, "KRW-BTC_volatility", exclusive=False)
+
+        with file_lock.acquire("KRW-BTC_volatility", exclusive=False, timeout=0.05):
+            pass
+
+        assert file_lock.metrics["KRW-BTC_volatility"].contended == 0
+
+    def test_다른_키는_서로_독립적(self, tmp_path, holder):
+        file_lock = FileLock(tmp_path)
+        holder(file_lock, "KRW-BTC_volatility")
+
+        with file_lock.acquire("KRW-ETH_volatility", timeout=0.05):
+            pass
+
+    def test_기존_경로에서도_import할_수_있음(self):
+        from src.strategy.cache import file_lock
+
+        assert file_lock.FileLock is FileLock
+        assert file_lock.CacheLockTimeoutError is CacheLockTimeoutError
+
+
+class TestCacheManagerLock:
+    def test_트랜잭션_잠금_안에서_load_save_가능(self, tmp_path, sample_strategy_cache):
+        manager = CacheManager(cache_dir=str(tmp_path))
+
+        with manager.lock("KRW-BTC", "volatility"):
+            assert manager.load_strategy_cache("KRW-BTC", "volatility") is None
+            manager.save_strategy_cache("KRW-BTC", "volatility", sample_strategy_cache)
+
+        assert manager.load_strategy_cache("KRW-BTC", "volatility") == sample_strategy_cache
+
+    def test_다른_프로세스가_쓰기_중이면_로드_타임아웃(self, tmp_path, holder, sample_strategy_cache):
+        manager = CacheManager(cache_dir=str(tmp_path), lock_timeout=0.05)
+        manager.save_strategy_cache("KRW-BTC", "volatility", sample_strategy_cache)
+        holder(manager._file_lock, manager._lock_key("KRW-BTC", "volatility"))
+
+        with pytest.raises(CacheLockTimeoutError):
+            manager.load_strategy_cache("KRW-BTC", "volatility")
@@ -0,0 +1,40 @@
+from src.common.metrics import Histogram, InMemoryMetricsSink, timed
+
+
+class TestHistogram:
+    def test_observe_buckets(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(3.0)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.mean == (0.05 + 0.1 + 0.5 + 3.0) / 4
+
+
+class TestInMemoryMetricsSink:
+    def test_counter_sums_partial_labels(self):
+        sink = InMemoryMetricsSink()
+
+        sink.increment("cache.load", namespace="data", result="hit")
+        sink.increment("cache.load", namespace="strategy", result="hit", value=2)
+        sink.increment("cache.load", namespace="strategy", result="miss")
+
+        assert sink.counter("cache.load", result="hit") == 3
+        assert sink.counter("cache.load", namespace="strategy") == 3
+        assert sink.counter("cache.load") == 4
+        assert sink.counter("unknown") == 0
+
+    def test_timed_records_elapsed(self):
+        sink = InMemoryMetricsSink()
+
+        with timed(sink, "io.seconds", ticker="KRW-BTC"):
+            pass
+
+        histogram = sink.histogram("io.seconds", ticker="KRW-BTC")
+        assert histogram is not None
+        assert histogram.count == 1
+        assert sink.histogram("io.seconds") is None
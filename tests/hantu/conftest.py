@@ -0,0 +1,13 @@
+"""한투 API 테스트 공통 fixture"""
+
+import pytest
+
+from src.hantu.rate_limiter import HantuRateLimiter
+
+
+@pytest.fixture(autouse=True)
+def unthrottled_rate_limiter(mocker):
+    """응답 파싱 테스트가 모의투자 요청 간격(초당 2건)만큼 기다리지 않도록 기본 제한기를 바꾼다"""
+    limiter = HantuRateLimiter(rate=1_000_000)
+    mocker.patch("src.hantu.base_api.default_rate_limiter", return_value=limiter)
+    return limiter
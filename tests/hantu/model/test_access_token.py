@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from src.hantu.model.access_token import ResponseBody
 
 # KST = UTC+9
@@ -58,3 +60,14 @@ class TestResponseBody:
 
         assert response.is_expired(buffer_seconds=300) is False  # 5분 버퍼: 유효
         assert response.is_expired(buffer_seconds=900) is True  # 15분 버퍼: 만료
+
+    def test_seconds_until_expired_여유_시간을_뺀_남은_시간(self):
+        """만료 시각에서 여유 시간을 뺀 시각까지 남은 초"""
+        response = ResponseBody(
+            access_token="test_token",
+            token_type="Bearer",
+            expires_in=86400.0,
+            access_token_token_expired=datetime.now(KST) + timedelta(hours=1),
+        )
+
+        assert response.seconds_until_expired(buffer_seconds=600) == pytest.approx(3000, abs=5)
@@ -0,0 +1,170 @@
+"""국내주식 차트 구간 조회 테스트"""
+
+from datetime import date, datetime, time, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.common.clock import FixedClock
+from src.common.ohlcv import OhlcvSchema
+from src.hantu.chart_history import (
+    MAX_DAILY_BARS,
+    MAX_MINUTE_BARS,
+    HantuChartHistory,
+    daily_windows,
+    minute_cursors,
+    subtract_spans,
+)
+from src.hantu.chart_store import ChartStore
+from src.hantu.frames import domestic_daily_chart_frame, domestic_minute_chart_frame
+from src.hantu.model.domestic.chart import ChartInterval
+
+NOW = datetime(2024, 12, 31, 18, 0)
+
+
+def fake_daily_chart_frame(ticker, start_date, end_date, interval, price_type, market_code):
+    """구간 안 평일마다 일봉 하나"""
+    days = [end_date - timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    rows = [
+        {
+            "stck_bsop_date": day.strftime("%Y%m%d"),
+            "stck_clpr": "71000",
+            "stck_oprc": "70500",
+            "stck_hgpr": "71500",
+            "stck_lwpr": "70000",
+            "acml_vol": "15000000",
+            "acml_tr_pbmn": "1065000000000",
+        }
+        for day in days
+        if day.weekday() < 5
+    ]
+    assert len(rows) <= MAX_DAILY_BARS
+    return domestic_daily_chart_frame(rows)
+
+
+def fake_minute_chart_frame(ticker, target_date, target_time, market_code):
+    """조회 시각 직전 MAX_MINUTE_BARS분의 장중 분봉"""
+    cursor = datetime.combine(target_date, target_time)
+    minutes = [cursor - timedelta(minutes=i) for i in range(MAX_MINUTE_BARS)]
+    rows = [
+        {
+            "stck_bsop_date": minute.strftime("%Y%m%d"),
+            "stck_cntg_hour": minute.strftime("%H%M%S"),
+            "stck_prpr": "71000",
+            "stck_oprc": "70900",
+            "stck_hgpr": "71100",
+            "stck_lwpr": "70800",
+            "cntg_vol": "1200",
+            "acml_tr_pbmn": "85200000",
+        }
+        for minute in minutes
+        if minute.time() >= time(9, 0)
+    ]
+    return domestic_minute_chart_frame(rows)
+
+
+@pytest.fixture
+def api():
+    api = MagicMock()
+    api.get_daily_chart_frame.side_effect = fake_daily_chart_frame
+    api.get_minute_chart_frame.side_effect = fake_minute_chart_frame
+    return api
+
+
+class TestWindows:
+    def test_일봉_구간은_100일씩_최신_구간부터_나눈다(self):
+        windows = daily_windows(date(2024, 1, 1), date(2024, 12, 31), ChartInterval.DAY)
+
+        assert windows[0] == (date(2024, 9, 23), date(2024, 12, 31))
+        assert windows[-1][0] == date(2024, 1, 1)
+        assert all((end - start).days + 1 <= MAX_DAILY_BARS for start, end in windows)
+        assert all(prev_start - timedelta(days=1) == end for (prev_start, _), (_, end) in zip(windows, windows[1:], strict=False))
+
+    def test_주봉은_한_구간이_100주를_넘지_않는다(self):
+        windows = daily_windows(date(2000, 1, 1), date(2024, 12, 31), ChartInterval.WEEK)
+
+        assert all((end - start).days // 7 + 2 <= MAX_DAILY_BARS for start, end in windows)
+
+    def test_분봉_조회_시각은_정규장_안에서_120분_간격이다(self):
+        cursors = minute_cursors(datetime(2024, 12, 6, 9, 0), datetime(2024, 12, 9, 15, 30))
+
+        # 12/9(월) 4번, 12/7~8(주말) 없음, 12/6(금) 4번
+        assert cursors == [
+            datetime(2024, 12, 9, 15, 30),
+            datetime(2024, 12, 9, 13, 30),
+            datetime(2024, 12, 9, 11, 30),
+            datetime(2024, 12, 9, 9, 30),
+            datetime(2024, 12, 6, 15, 30),
+            datetime(2024, 12, 6, 13, 30),
+            datetime(2024, 12, 6, 11, 30),
+            datetime(2024, 12, 6, 9, 30),
+        ]
+
+    def test_덮인_구간을_뺀_빈_구간만_남긴다(self):
+        day = timedelta(days=1)
+        spans = [(datetime(2024, 1, 10), datetime(2024, 1, 20)), (datetime(2024, 1, 21), datetime(2024, 1, 25))]
+
+        gaps = subtract_spans(datetime(2024, 1, 1), datetime(2024, 1, 31), spans, day)
+
+        assert gaps == [(datetime(2024, 1, 1), datetime(2024, 1, 9)), (datetime(2024, 1, 26), datetime(2024, 1, 31))]
+
+
+class TestHantuChartHistory:
+    def test_일봉을_합쳐_중복_없이_오름차순_숫자로_반환한다(self, api):
+        history = HantuChartHistory(api, clock=FixedClock(NOW))
+
+        df = history.daily("005930", date(2024, 1, 1), date(2024, 12, 31))
+
+        OhlcvSchema.validate(df)
+        assert df.index.is_monotonic_increasing
+        assert df.index.is_unique
+        assert df.index[0] == datetime(2024, 1, 1)
+        assert df.index[-1] == datetime(2024, 12, 31)
+        assert df["close"].iloc[0] == 71000.0
+        assert api.get_daily_chart_frame.call_count == 4
+
+    def test_분봉은_요청한_구간만_반환한다(self, api):
+        history = HantuChartHistory(api, clock=FixedClock(NOW))
+
+        df = history.minute("005930", datetime(2024, 12, 6, 10, 0), datetime(2024, 12, 6, 14, 0))
+
+        assert df.index[0] == datetime(2024, 12, 6, 10, 0)
+        assert df.index[-1] == datetime(2024, 12, 6, 14, 0)
+        assert len(df) == 4 * 60 + 1
+        assert df.index.is_unique
+
+    def test_시작이_종료보다_늦으면_에러(self, api):
+        with pytest.raises(ValueError):
+            HantuChartHistory(api).daily("005930", date(2024, 2, 1), date(2024, 1, 1))
+
+    def test_저장소에_있는_구간은_다시_조회하지_않는다(self, api, tmp_path):
+        history = HantuChartHistory(api, store=ChartStore(str(tmp_path)), clock=FixedClock(NOW))
+        first = history.daily("005930", date(2024, 1, 1), date(2024, 6, 30))
+        calls = api.get_daily_chart_frame.call_count
+
+        second = history.daily("005930", date(2024, 2, 1), date(2024, 3, 31))
+
+        assert api.get_daily_chart_frame.call_count == calls
+        assert second.equals(first.loc[datetime(2024, 2, 1) : datetime(2024, 3, 31)])
+
+    def test_빠진_구간만_이어서_조회한다(self, api, tmp_path):
+        history = HantuChartHistory(api, store=ChartStore(str(tmp_path)), clock=FixedClock(NOW))
+        history.daily("005930", date(2024, 1, 1), date(2024, 3, 31))
+        api.get_daily_chart_frame.reset_mock()
+
+        df = history.daily("005930", date(2024, 1, 1), date(2024, 4, 30))
+
+        api.get_daily_chart_frame.assert_called_once()
+        assert api.get_daily_chart_frame.call_args.args[1:3] == (date(2024, 4, 1), date(2024, 4, 30))
+        assert df.index[0] == datetime(2024, 1, 1)
+        assert df.index[-1] == datetime(2024, 4, 30)
+
+    def test_확정되지_않은_오늘_봉은_매번_다시_조회한다(self, api, tmp_path):
+        history = HantuChartHistory(api, store=ChartStore(str(tmp_path)), clock=FixedClock(NOW))
+        history.daily("005930", date(2024, 12, 1), date(2024, 12, 31))
+        api.get_daily_chart_frame.reset_mock()
+
+        history.daily("005930", date(2024, 12, 1), date(2024, 12, 31))
+
+        api.get_daily_chart_frame.assert_called_once()
+        assert api.get_daily_chart_frame.call_args.args[1:3] == (date(2024, 12, 31), date(2024, 12, 31))
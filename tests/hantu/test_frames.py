@@ -0,0 +1,98 @@
+"""한투 응답 → 숫자 DataFrame 변환 테스트"""
+
+import math
+
+import pandas as pd
+
+from src.common.ohlcv import OHLCV_COLUMNS, OhlcvSchema
+from src.hantu.frames import (
+    domestic_daily_chart_frame,
+    domestic_minute_chart_frame,
+    numeric_frame,
+    overseas_daily_candle_frame,
+    overseas_minute_candle_frame,
+)
+from src.upbit.model.candle import CandleSchema
+
+
+def daily_row(day: str, close: str) -> dict[str, str]:
+    return {
+        "stck_bsop_date": day,
+        "stck_clpr": close,
+        "stck_oprc": "70500",
+        "stck_hgpr": "71500",
+        "stck_lwpr": "70000",
+        "acml_vol": "15000000",
+        "acml_tr_pbmn": "1065000000000",
+        "mod_yn": "N",
+    }
+
+
+class TestOhlcvFrame:
+    def test_국내_일봉을_오름차순_숫자_OHLCV로_변환한다(self):
+        df = domestic_daily_chart_frame([daily_row("20240103", "71000"), daily_row("20240102", "70000")])
+
+        assert list(df.columns) == list(OHLCV_COLUMNS)
+        assert list(df.index) == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")]
+        assert df["close"].tolist() == [70000.0, 71000.0]
+        assert df["value"].iloc[0] == 1065000000000.0
+
+    def test_업비트_캔들과_같은_스키마를_통과한다(self):
+        df = domestic_daily_chart_frame([daily_row("20240102", "70000")])
+
+        OhlcvSchema.validate(df)
+        CandleSchema.validate(df)
+
+    def test_빈_행과_중복_일자는_버린다(self):
+        df = domestic_daily_chart_frame([daily_row("20240102", "70000"), {}, daily_row("20240102", "70100")])
+
+        assert len(df) == 1
+        assert df["close"].iloc[0] == 70100.0
+
+    def test_빈_응답은_빈_OHLCV_DataFrame(self):
+        df = domestic_minute_chart_frame([])
+
+        assert df.empty
+        assert list(df.columns) == list(OHLCV_COLUMNS)
+        assert isinstance(df.index, pd.DatetimeIndex)
+
+    def test_국내_분봉은_일자와_체결시간을_합쳐_인덱스로_쓴다(self):
+        df = domestic_minute_chart_frame(
+            [
+                {
+                    "stck_bsop_date": "20241023",
+                    "stck_cntg_hour": "130000",
+                    "stck_prpr": "65100",
+                    "stck_oprc": "65000",
+                    "stck_hgpr": "65200",
+                    "stck_lwpr": "64900",
+                    "cntg_vol": "100000",
+                    "acml_tr_pbmn": "650000000000",
+                }
+            ]
+        )
+
+        assert df.index[0] == pd.Timestamp("2024-10-23 13:00:00")
+        assert df.loc["2024-10-23 13:00:00", "close"] == 65100.0
+        assert df.loc["2024-10-23 13:00:00", "volume"] == 100000.0
+
+    def test_해외_캔들도_같은_컬럼으로_변환한다(self):
+        daily = overseas_daily_candle_frame([{"xymd": "20240102", "clos": "150.25", "open": "149.5", "high": "151", "low": "149", "tvol": "1000", "tamt": "150250", "sign": "2"}])
+        minute = overseas_minute_candle_frame(
+            [{"kymd": "20240103", "khms": "003000", "open": "150.5", "high": "151", "low": "150", "last": "150.75", "evol": "10", "eamt": "1507.5"}]
+        )
+
+        assert daily.loc["2024-01-02", "close"] == 150.25
+        assert minute.index[0] == pd.Timestamp("2024-01-03 00:30:00")
+        assert minute["close"].iloc[0] == 150.75
+        OhlcvSchema.validate(daily)
+        OhlcvSchema.validate(minute)
+
+
+class TestNumericFrame:
+    def test_지정한_필드만_숫자로_변환하고_빈_값은_NaN(self):
+        df = numeric_frame([{"stck_prpr": "71000", "per": "", "hts_kor_isnm": "삼성전자"}, {"stck_prpr": "-5", "per": "12.5"}], ["stck_prpr", "per"])
+
+        assert df["stck_prpr"].tolist() == [71000.0, -5.0]
+        assert math.isnan(df["per"].iloc[0])
+        assert df["per"].iloc[1] == 12.5
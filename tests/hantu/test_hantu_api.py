@@ -139,7 +139,7 @@ class TestGetBalance:
             ],
         }
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         result = api.get_balance()
@@ -277,7 +277,7 @@ class TestGetBalance:
             ],
         }
 
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch("requests.Session.get")
         mock_get.side_effect = [first_response, second_response]
 
         # When
@@ -314,10 +314,64 @@ class TestGetBalance:
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When & Then
         import pytest
 
         with pytest.raises(Exception):
             api.get_balance()
+
+
+def balance_page_response(mocker, index: int, tr_cont: str):
+    response = mocker.Mock()
+    response.status_code = 200
+    response.headers = {"tr_cont": tr_cont}
+    response.json.return_value = {
+        "rt_cd": "0",
+        "msg_cd": "MCA00000",
+        "msg1": "정상처리 되었습니다.",
+        "ctx_area_fk100": f"CTX_FK_{index}",
+        "ctx_area_nk100": f"CTX_NK_{index}",
+        "output1": [],
+        "output2": [],
+    }
+    return response
+
+
+class TestIterBalancePages:
+    """iter_balance_pages 메서드 테스트"""
+
+    def test_페이지를_읽는_만큼만_요청한다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        mock_get = mocker.patch("requests.Session.get", side_effect=[balance_page_response(mocker, index, "M") for index in range(3)])
+
+        # When
+        pages = api.iter_balance_pages()
+        first = next(pages)
+
+        # Then
+        assert first.ctx_area_fk100 == "CTX_FK_0"
+        assert mock_get.call_count == 1
+
+        second = next(pages)
+        assert second.ctx_area_fk100 == "CTX_FK_1"
+        assert mock_get.call_args.kwargs["headers"]["tr_cont"] == "N"
+        assert mock_get.call_args.kwargs["params"]["CTX_AREA_NK100"] == "CTX_NK_0"
+
+    def test_페이지가_많아도_재귀_한도에_걸리지_않는다(self, mocker):
+        # Given
+        page_count = 1500
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        responses = [balance_page_response(mocker, index, "M") for index in range(page_count - 1)] + [balance_page_response(mocker, page_count - 1, "D")]
+        mocker.patch("requests.Session.get", side_effect=responses)
+
+        # When
+        pages = list(api.iter_balance_pages())
+
+        # Then
+        assert len(pages) == page_count
+        assert pages[-1].ctx_area_fk100 == f"CTX_FK_{page_count - 1}"
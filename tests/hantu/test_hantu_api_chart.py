@@ -6,6 +6,7 @@ import pytest
 
 from src.config import HantuConfig
 from src.hantu.domestic_api import HantuDomesticAPI
+from src.hantu.model.domestic import chart
 from src.hantu.model.domestic.account_type import AccountType
 from src.hantu.model.domestic.chart import ChartInterval, PriceType
 from src.hantu.model.domestic.market_code import MarketCode
@@ -95,7 +96,7 @@ class TestGetDailyChart:
             ],
         }
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         response = api.get_daily_chart(ticker="005930", start_date=date(2022, 1, 1), end_date=date(2022, 8, 9))
@@ -174,7 +175,7 @@ class TestGetDailyChart:
             ],
         }
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         response = api.get_daily_chart(ticker="005930", start_date=date(2022, 1, 1), end_date=date(2022, 8, 9), interval=ChartInterval.WEEK)
@@ -252,7 +253,7 @@ class TestGetDailyChart:
             ],
         }
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         response = api.get_daily_chart(ticker="005930", start_date=date(2022, 1, 1), end_date=date(2022, 8, 9), price_type=PriceType.ORIGINAL)
@@ -277,7 +278,7 @@ class TestGetDailyChart:
         mock_response.text = "Bad Request"
         mock_response.json.return_value = {"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "종목코드 오류"}
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When & Then
         with pytest.raises(Exception, match="Error:"):
@@ -335,7 +336,7 @@ class TestGetMinuteChart:
             ],
         }
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         response = api.get_minute_chart(ticker="005930", target_date=date(2024, 10, 23), target_time=time(13, 0, 0))
@@ -388,7 +389,7 @@ class TestGetMinuteChart:
             ],
         }
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         response = api.get_minute_chart(ticker="005930", target_date=date(2024, 10, 23), target_time=time(13, 0, 0), market_code=MarketCode.KRX)
@@ -413,8 +414,70 @@ class TestGetMinuteChart:
         mock_response.text = "Bad Request"
         mock_response.json.return_value = {"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "종목코드 오류"}
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When & Then
         with pytest.raises(Exception, match="Error:"):
             api.get_minute_chart(ticker="000000", target_date=date(2024, 10, 23), target_time=time(13, 0, 0))
+
+
+class TestGetChartFrame:
+    """차트 OHLCV DataFrame 조회 테스트"""
+
+    def test_분봉_응답을_모델_없이_DataFrame으로_변환한다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "rt_cd": "0",
+            "msg_cd": "MCA00000",
+            "msg1": "정상처리 되었습니다.",
+            "output1": {},
+            "output2": [
+                {
+                    "stck_bsop_date": "20241023",
+                    "stck_cntg_hour": "130000",
+                    "stck_prpr": "65100",
+                    "stck_oprc": "65000",
+                    "stck_hgpr": "65200",
+                    "stck_lwpr": "64900",
+                    "cntg_vol": "100000",
+                    "acml_tr_pbmn": "650000000000",
+                },
+                {
+                    "stck_bsop_date": "20241023",
+                    "stck_cntg_hour": "125900",
+                    "stck_prpr": "65000",
+                    "stck_oprc": "64950",
+                    "stck_hgpr": "65050",
+                    "stck_lwpr": "64900",
+                    "cntg_vol": "95000",
+                    "acml_tr_pbmn": "617500000000",
+                },
+            ],
+        }
+        mocker.patch("requests.Session.get", return_value=mock_response)
+        model_validate = mocker.spy(chart.MinuteChartResponseBody, "model_validate")
+
+        # When
+        df = api.get_minute_chart_frame("005930", date(2024, 10, 23), time(13, 0))
+
+        # Then
+        model_validate.assert_not_called()
+        assert df["close"].tolist() == [65000.0, 65100.0]
+        assert df.index.is_monotonic_increasing
+
+    def test_일봉_에러_응답은_예외(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        mock_response = mocker.Mock()
+        mock_response.status_code = 400
+        mock_response.text = "Bad Request"
+        mocker.patch("requests.Session.get", return_value=mock_response)
+
+        # When & Then
+        with pytest.raises(Exception, match="Error: Bad Request"):
+            api.get_daily_chart_frame("005930", date(2024, 1, 1), date(2024, 1, 31))
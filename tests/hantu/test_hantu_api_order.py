@@ -35,7 +35,7 @@ class TestSellMarketOrder:
             "output": {"KRX_FWDG_ORD_ORGNO": "91252", "ODNO": "0000117057", "ORD_TMD": "121052"},
         }
 
-        mock_post = mocker.patch("requests.post", return_value=mock_response)
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         # When
         result = api.sell_market_order(ticker="005930", quantity=10)
@@ -75,7 +75,7 @@ class TestSellMarketOrder:
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
 
-        mocker.patch("requests.post", return_value=mock_response)
+        mocker.patch("requests.Session.post", return_value=mock_response)
 
         # When & Then
         with pytest.raises(Exception) as exc_info:
@@ -102,7 +102,7 @@ class TestSellMarketOrder:
             "output": {"KRX_FWDG_ORD_ORGNO": "", "ODNO": "", "ORD_TMD": ""},
         }
 
-        mocker.patch("requests.post", return_value=mock_response)
+        mocker.patch("requests.Session.post", return_value=mock_response)
 
         # When & Then
         with pytest.raises(Exception) as exc_info:
@@ -138,7 +138,7 @@ class TestSellLimitOrder:
             "output": {"KRX_FWDG_ORD_ORGNO": "91252", "ODNO": "0000117058", "ORD_TMD": "121053"},
         }
 
-        mock_post = mocker.patch("requests.post", return_value=mock_response)
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         # When
         result = api.sell_limit_order(ticker="005930", quantity=10, price=70000)
@@ -188,7 +188,7 @@ class TestBuyMarketOrder:
             "output": {"KRX_FWDG_ORD_ORGNO": "91252", "ODNO": "0000117059", "ORD_TMD": "121054"},
         }
 
-        mock_post = mocker.patch("requests.post", return_value=mock_response)
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         # When
         result = api.buy_market_order(ticker="005930", quantity=10)
@@ -238,7 +238,7 @@ class TestBuyLimitOrder:
             "output": {"KRX_FWDG_ORD_ORGNO": "91252", "ODNO": "0000117060", "ORD_TMD": "121055"},
         }
 
-        mock_post = mocker.patch("requests.post", return_value=mock_response)
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         # When
         result = api.buy_limit_order(ticker="005930", quantity=10, price=70000)
@@ -2,10 +2,15 @@
 한투 API 주식 시세 조회 테스트
 """
 
+import json
+from unittest.mock import Mock
+
 import pytest
 
+from src.common.http_session import DEFAULT_TIMEOUT
 from src.config import HantuConfig
 from src.hantu.domestic_api import HantuDomesticAPI
+from src.hantu.hantu_api import HantuAPI
 from src.hantu.model.domestic.account_type import AccountType
 from src.hantu.model.domestic.market_code import MarketCode
 
@@ -44,7 +49,7 @@ class TestGetStockPrice:
             },
         }
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         response = api.get_stock_price("005930")
@@ -89,7 +94,7 @@ class TestGetStockPrice:
             },
         }
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         response = api.get_stock_price("005930", MarketCode.KRX)
@@ -116,8 +121,201 @@ class TestGetStockPrice:
         mock_response.text = "Bad Request"
         mock_response.json.return_value = {"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "종목코드 오류"}
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When & Then
         with pytest.raises(Exception, match="Error: Bad Request"):
             api.get_stock_price("000000")
+
+
+class TestGetStockQuote:
+    """주요 시세 필드만 조회하는 테스트"""
+
+    def test_응답_바이트에서_주요_필드만_검증한다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            {
+                "rt_cd": "0",
+                "msg_cd": "MCA00000",
+                "msg1": "정상처리 되었습니다.",
+                "output": {
+                    "stck_prpr": "71000",
+                    "stck_oprc": "70500",
+                    "stck_hgpr": "71500",
+                    "stck_lwpr": "70000",
+                    "prdy_vrss": "1000",
+                    "prdy_vrss_sign": "2",
+                    "prdy_ctrt": "1.43",
+                    "acml_vol": "15000000",
+                    "acml_tr_pbmn": "1065000000000",
+                    "per": "12.5",
+                    "hts_avls": "4238000",
+                },
+            }
+        ).encode()
+        mocker.patch("requests.Session.get", return_value=mock_response)
+
+        # When
+        quote = api.get_stock_quote("005930")
+
+        # Then
+        mock_response.json.assert_not_called()
+        assert quote.output.stck_prpr == "71000"
+        assert quote.output.acml_vol == "15000000"
+        assert not hasattr(quote.output, "per")
+
+    def test_에러_응답은_기존과_같은_예외(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        body = {"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "종목코드 오류"}
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(body).encode()
+        mock_response.json.return_value = body
+        mock_response.text = json.dumps(body)
+        mocker.patch("requests.Session.get", return_value=mock_response)
+
+        # When & Then
+        with pytest.raises(Exception, match="EGW00123"):
+            api.get_stock_quote("000000")
+
+
+def stock_price_response(mocker, price: str) -> Mock:
+    """현재가 시세 모의 응답"""
+    response = mocker.Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "rt_cd": "0",
+        "msg_cd": "MCA00000",
+        "msg1": "정상처리 되었습니다.",
+        "output": {
+            "stck_prpr": price,
+            "stck_oprc": "0",
+            "stck_hgpr": "0",
+            "stck_lwpr": "0",
+            "stck_mxpr": "0",
+            "stck_llam": "0",
+            "stck_sdpr": "0",
+            "acml_vol": "0",
+            "acml_tr_pbmn": "0",
+            "prdy_vrss": "0",
+            "prdy_vrss_sign": "0",
+            "prdy_ctrt": "0",
+        },
+    }
+    return response
+
+
+class TestGetStockPrices:
+    """여러 종목 현재가 동시 조회 테스트"""
+
+    def test_종목별_시세를_종목코드로_묶어_반환한다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        prices = {"005930": "71000", "000660": "180000", "035420": "210000"}
+        mocker.patch(
+            "requests.Session.get",
+            side_effect=lambda url, **kwargs: stock_price_response(mocker, prices[kwargs["params"]["FID_INPUT_ISCD"]]),
+        )
+
+        # When
+        batch = api.get_stock_prices(list(prices))
+
+        # Then
+        assert batch.errors == {}
+        assert {ticker: quote.output.stck_prpr for ticker, quote in batch.quotes.items()} == prices
+
+    def test_실패한_종목만_errors에_담고_나머지는_계속_조회한다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        error_response = mocker.Mock()
+        error_response.status_code = 400
+        error_response.text = "Bad Request"
+
+        def fake_get(url: str, **kwargs: object) -> Mock:
+            ticker = kwargs["params"]["FID_INPUT_ISCD"]
+            return error_response if ticker == "000000" else stock_price_response(mocker, "71000")
+
+        mocker.patch("requests.Session.get", side_effect=fake_get)
+
+        # When
+        batch = api.get_stock_prices(["005930", "000000", "000660"])
+
+        # Then
+        assert set(batch.quotes) == {"005930", "000660"}
+        assert set(batch.errors) == {"000000"}
+        assert "Bad Request" in str(batch.errors["000000"])
+
+    def test_중복_종목은_한_번만_조회한다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        mock_get = mocker.patch("requests.Session.get", return_value=stock_price_response(mocker, "71000"))
+
+        # When
+        batch = api.get_stock_prices(["005930", "005930"])
+
+        # Then
+        assert list(batch.quotes) == ["005930"]
+        assert mock_get.call_count == 1
+
+    def test_빈_목록이면_요청하지_않는다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mock_get = mocker.patch("requests.Session.get")
+
+        # When
+        batch = api.get_stock_prices([])
+
+        # Then
+        assert batch.quotes == {}
+        assert batch.errors == {}
+        mock_get.assert_not_called()
+
+    def test_to_frame은_종목코드를_인덱스로_쓴다(self, mocker):
+        # Given
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        mocker.patch("requests.Session.get", return_value=stock_price_response(mocker, "71000"))
+
+        # When
+        frame = api.get_stock_prices(["005930", "000660"]).to_frame()
+
+        # Then
+        assert list(frame.index) == ["005930", "000660"]
+        assert frame.loc["000660", "stck_prpr"] == "71000"
+
+
+class TestHantuSession:
+    """HTTP 세션 공유 테스트"""
+
+    def test_국내_해외_클라이언트가_하나의_세션을_공유한다(self):
+        # Given
+        config = HantuConfig()
+
+        # When
+        api = HantuAPI(config, AccountType.VIRTUAL)
+
+        # Then
+        assert api.domestic.session is api.session
+        assert api.overseas.session is api.session
+
+    def test_요청은_세션으로_기본_타임아웃과_함께_보낸다(self, mocker):
+        # Given
+        session = mocker.Mock()
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL, session=session)
+
+        # When
+        api._get("https://example.com/quote", headers={"tr_id": "FHKST01010100"}, params={"FID_INPUT_ISCD": "005930"})
+        api._post("https://example.com/order", headers={"tr_id": "VTTC0011U"}, data="{}")
+
+        # Then
+        session.get.assert_called_once_with("https://example.com/quote", headers={"tr_id": "FHKST01010100"}, params={"FID_INPUT_ISCD": "005930"}, timeout=DEFAULT_TIMEOUT)
+        session.post.assert_called_once_with("https://example.com/order", headers={"tr_id": "VTTC0011U"}, data="{}", timeout=DEFAULT_TIMEOUT)
@@ -0,0 +1,301 @@
+"""한투 실시간 WebSocket 스트림 테스트"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from websockets.asyncio.server import serve
+
+from src.common.metrics import InMemoryMetricsSink
+from src.common.order_direction import OrderDirection
+from src.config import HantuConfig
+from src.hantu.hantu_websocket import (
+    DEFAULT_WEBSOCKET_URLS,
+    Fill,
+    FillTable,
+    HantuRealtimeFeed,
+)
+from src.hantu.model.domestic.account_type import AccountType
+from src.hantu.model.overseas.exchange_code import OverseasExchangeCode
+from src.hantu.model.overseas.market_code import OverseasMarketCode
+from src.hantu.overseas_api import HantuOverseasAPI
+
+AES_KEY = "k" * 32
+AES_IV = "i" * 16
+
+
+def make_api(account_type: AccountType = AccountType.REAL) -> MagicMock:
+    api = MagicMock()
+    api.account_type = account_type
+    api.get_approval_key.return_value = "approval-key"
+    return api
+
+
+def domestic_trade(ticker: str, hhmmss: str, price: str) -> list[str]:
+    return [ticker, hhmmss, price, "2", "100", "0.14"]
+
+
+def overseas_trade(symbol: str, kymd: str, khms: str, last: str) -> list[str]:
+    return [f"DNAS{symbol}", symbol, "4", "20241205", "20241205", "100000", kymd, khms, "180.0", "181.0", "179.0", last]
+
+
+def domestic_execution(order_no: str, side: str, quantity: str, price: str, filled: str = "2") -> list[str]:
+    return ["myhtsid", "1234567801", order_no, "", side, "0", "00", "0", "005930", quantity, price, "093001", "0", filled]
+
+
+def realtime_message(tr_id: str, records: list[list[str]], encrypted: bool = False) -> str:
+    payload = "^".join(field for record in records for field in record)
+    if encrypted:
+        payload = encrypt(payload)
+    return f"{1 if encrypted else 0}|{tr_id}|{len(records):03d}|{payload}"
+
+
+def encrypt(payload: str) -> str:
+    ciphers = pytest.importorskip("cryptography.hazmat.primitives.ciphers")
+    padding = pytest.importorskip("cryptography.hazmat.primitives.padding")
+
+    padder = padding.PKCS7(128).padder()
+    padded = padder.update(payload.encode()) + padder.finalize()
+    encryptor = ciphers.Cipher(ciphers.algorithms.AES(AES_KEY.encode()), ciphers.modes.CBC(AES_IV.encode())).encryptor()
+    return base64.b64encode(encryptor.update(padded) + encryptor.finalize()).decode()
+
+
+def subscribe_response(tr_id: str, tr_key: str, rt_cd: str = "0", output: dict | None = None) -> str:
+    body = {"rt_cd": rt_cd, "msg_cd": "OPSP0000", "msg1": "SUBSCRIBE SUCCESS"}
+    if output is not None:
+        body["output"] = output
+    return json.dumps({"header": {"tr_id": tr_id, "tr_key": tr_key, "encrypt": "N"}, "body": body})
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestFillTable:
+    def test_주문번호별로_체결을_모으고_평균_단가를_계산한다(self):
+        table = FillTable()
+        table.add(Fill("0000012345", "005930", OrderDirection.BUY, 3, 100.0, "093000", time.monotonic()))
+        table.add(Fill("0000012345", "005930", OrderDirection.BUY, 1, 104.0, "093001", time.monotonic()))
+
+        assert table.filled_quantity("12345") == 4
+        assert table.average_price("0000012345") == 101.0
+        assert len(table.fills("12345")) == 2
+
+    def test_보관_한도를_넘으면_오래된_주문부터_버린다(self):
+        table = FillTable(max_orders=2)
+        for order_no in ("1", "2", "3"):
+            table.add(Fill(order_no, "005930", OrderDirection.SELL, 1, 100.0, "093000", time.monotonic()))
+
+        assert table.fills("1") == ()
+        assert table.filled_quantity("3") == 1
+
+    def test_체결_전이면_평균_단가는_None(self):
+        assert FillTable().average_price("1") is None
+
+
+class TestHantuRealtimeFeed:
+    def test_종목과_체결통보를_TR별로_구독한다(self):
+        feed = HantuRealtimeFeed(
+            make_api(AccountType.VIRTUAL),
+            domestic_tickers=["005930", "005930"],
+            overseas_symbols=[(OverseasMarketCode.NAS, "AAPL")],
+            hts_id="myhtsid",
+        )
+
+        messages = [json.loads(message) for message in feed._subscribe_messages()]
+
+        assert feed._url == DEFAULT_WEBSOCKET_URLS[AccountType.VIRTUAL]
+        assert {message["header"]["approval_key"] for message in messages} == {"approval-key"}
+        assert [(message["body"]["input"]["tr_id"], message["body"]["input"]["tr_key"]) for message in messages] == [
+            ("H0STCNT0", "005930"),
+            ("HDFSCNT0", "DNASAAPL"),
+            ("H0STCNI9", "myhtsid"),
+            ("H0GSCNI9", "myhtsid"),
+        ]
+
+    def test_여러_건이_한_메시지로_오면_마지막_체결가를_기록한다(self):
+        feed = HantuRealtimeFeed(make_api(), domestic_tickers=["005930"])
+
+        feed._handle_message(realtime_message("H0STCNT0", [domestic_trade("005930", "093000", "71000"), domestic_trade("005930", "093001", "71100")]))
+
+        assert feed.price("005930") == 71100.0
+        assert feed.last_message_age() is not None
+
+    def test_해외_체결가는_종목코드로_기록한다(self):
+        feed = HantuRealtimeFeed(make_api(), overseas_symbols=[(OverseasMarketCode.NAS, "AAPL")])
+
+        feed._handle_message(realtime_message("HDFSCNT0", [overseas_trade("AAPL", "20241206", "000001", "180.25")]))
+        feed._handle_message(realtime_message("HDFSCNT0", [overseas_trade("AAPL", "20241206", "000000", "179.00")]))
+
+        # 더 오래된 체결로는 덮어쓰지 않는다
+        assert feed.price("AAPL") == 180.25
+
+    def test_PINGPONG은_그대로_돌려보낸다(self):
+        feed = HantuRealtimeFeed(make_api())
+        pingpong = json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20241206093000"}})
+
+        assert feed._handle_message(pingpong) == pingpong
+        assert feed._handle_message(subscribe_response("H0STCNT0", "005930")) is None
+
+    def test_암호화된_체결통보를_복호화해서_체결만_기록한다(self):
+        feed = HantuRealtimeFeed(make_api(), hts_id="myhtsid")
+        feed._handle_message(subscribe_response("H0STCNI0", "myhtsid", output={"key": AES_KEY, "iv": AES_IV}))
+
+        feed._handle_message(
+            realtime_message(
+                "H0STCNI0",
+                [domestic_execution("0000012345", "02", "0", "0", filled="1"), domestic_execution("0000012345", "02", "3", "71000")],
+                encrypted=True,
+            )
+        )
+
+        fills = feed.fill_table.fills("12345")
+        assert len(fills) == 1
+        assert fills[0].direction == OrderDirection.BUY
+        assert fills[0].ticker == "005930"
+        assert (fills[0].quantity, fills[0].price) == (3, 71000.0)
+
+    def test_복호화_키가_없으면_메시지를_버린다(self):
+        feed = HantuRealtimeFeed(make_api(), hts_id="myhtsid")
+
+        feed._handle_message(realtime_message("H0STCNI0", [domestic_execution("1", "01", "1", "71000")], encrypted=True))
+
+        assert feed.fill_table.fills("1") == ()
+
+    def test_데이터_건수가_0이면_메시지를_버린다(self):
+        feed = HantuRealtimeFeed(make_api(), domestic_tickers=["005930"])
+
+        assert feed._handle_message("0|H0STCNT0|000|") is None
+        assert feed.price("005930") is None
+
+    def test_cryptography가_없으면_체결통보를_구독할_수_없다(self, mocker):
+        mocker.patch("src.hantu.hantu_websocket.importlib.util.find_spec", return_value=None)
+
+        with pytest.raises(ImportError, match="cryptography"):
+            HantuRealtimeFeed(make_api(), hts_id="myhtsid")
+
+        # 시세만 구독하면 필요 없다
+        HantuRealtimeFeed(make_api(), domestic_tickers=["005930"])
+
+    def test_로컬_서버에_구독하고_PINGPONG에_응답한다(self):
+        pingpong = json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20241206093000"}})
+        received: list[str] = []
+        stop = threading.Event()
+        started = threading.Event()
+        port: list[int] = []
+
+        async def handler(connection) -> None:
+            received.extend([await connection.recv(), await connection.recv()])
+            await connection.send(realtime_message("H0STCNT0", [domestic_trade("005930", "093000", "71000")]))
+            await connection.send(pingpong)
+            received.append(await connection.recv())
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+
+        async def run_server() -> None:
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port.append(server.sockets[0].getsockname()[1])
+                started.set()
+                while not stop.is_set():
+                    await asyncio.sleep(0.01)
+
+        server_thread = threading.Thread(target=asyncio.run, args=(run_server(),), daemon=True)
+        server_thread.start()
+        started.wait(5)
+
+        feed = HantuRealtimeFeed(make_api(), domestic_tickers=["005930", "000660"], url=f"ws://127.0.0.1:{port[0]}")
+        feed.start()
+        try:
+            assert wait_until(lambda: len(received) == 3)
+            assert feed.price("005930") == 71000.0
+            assert received[2] == pingpong
+            assert feed.connected
+        finally:
+            feed.stop()
+            stop.set()
+            server_thread.join(5)
+
+    def test_잘못된_메시지는_버리고_연결을_유지한다(self):
+        metrics = InMemoryMetricsSink()
+        stop = threading.Event()
+        started = threading.Event()
+        port: list[int] = []
+        bad_messages = [
+            "0|H0STCNT0",  # 필드 구분자 누락
+            "0|H0STCNT0|00x|005930",  # 건수가 숫자가 아님
+            realtime_message("H0STCNT0", [domestic_trade("005930", "093000", "")]),  # 빈 체결가
+        ]
+
+        async def handler(connection) -> None:
+            await connection.recv()
+            for message in bad_messages:
+                await connection.send(message)
+            await connection.send(realtime_message("H0STCNT0", [domestic_trade("005930", "093001", "71000")]))
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+
+        async def run_server() -> None:
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port.append(server.sockets[0].getsockname()[1])
+                started.set()
+                while not stop.is_set():
+                    await asyncio.sleep(0.01)
+
+        server_thread = threading.Thread(target=asyncio.run, args=(run_server(),), daemon=True)
+        server_thread.start()
+        started.wait(5)
+
+        api = make_api()
+        feed = HantuRealtimeFeed(api, domestic_tickers=["005930"], url=f"ws://127.0.0.1:{port[0]}", metrics_sink=metrics)
+        feed.start()
+        try:
+            assert wait_until(lambda: feed.price("005930") == 71000.0)
+            assert feed.connections == 1
+            assert metrics.counter("ws.message_error") == len(bad_messages)
+            api.get_approval_key.assert_called_once()
+        finally:
+            feed.stop()
+            stop.set()
+            server_thread.join(5)
+
+
+class TestMarketOrderPrice:
+    @pytest.fixture
+    def api(self, mocker):
+        api = HantuOverseasAPI(HantuConfig())
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        return api
+
+    def test_실시간_피드에_체결가가_있으면_REST를_호출하지_않는다(self, api, mocker):
+        feed = HantuRealtimeFeed(make_api(), overseas_symbols=[(OverseasMarketCode.NAS, "AAPL")])
+        feed._handle_message(realtime_message("HDFSCNT0", [overseas_trade("AAPL", "20241206", "000001", "180.25")]))
+        mocker.patch.object(HantuOverseasAPI, "price_feed", feed)
+        get = mocker.patch("requests.Session.get")
+        order = mocker.patch.object(api, "_order")
+
+        api.buy_market_order("AAPL", 3, exchange_code=OverseasExchangeCode.NAS)
+
+        get.assert_not_called()
+        assert order.call_args.kwargs["price"] == "180.25"
+
+
+class TestGetApprovalKey:
+    def test_웹소켓_접속키를_발급받는다(self, mocker):
+        api = HantuOverseasAPI(HantuConfig())
+        response = mocker.Mock()
+        response.status_code = 200
+        response.json.return_value = {"approval_key": "abc"}
+        post = mocker.patch("requests.Session.post", return_value=response)
+
+        assert api.get_approval_key() == "abc"
+        assert post.call_args.args[0].endswith("/oauth2/Approval")
+        assert json.loads(post.call_args.kwargs["data"])["secretkey"] == api.app_secret
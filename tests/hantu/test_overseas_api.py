@@ -103,7 +103,7 @@ class TestGetBalance:
             },
         }
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         result = api.get_balance(exchange_code=OverseasExchangeCode.NASD, trading_currency_code=TradingCurrencyCode.USD)
@@ -217,7 +217,7 @@ class TestGetBalance:
             },
         }
 
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch("requests.Session.get")
         mock_get.side_effect = [first_response, second_response]
 
         # When
@@ -240,6 +240,14 @@ class TestGetBalance:
         assert second_call_params["CTX_AREA_FK200"] == "CTX_FK_001"
         assert second_call_params["CTX_AREA_NK200"] == "CTX_NK_001"
 
+    def test_get_balance_no_pages(self, mocker):
+        """조회된 페이지가 없으면 예외"""
+        api = HantuOverseasAPI(HantuConfig(), AccountType.VIRTUAL)
+        mocker.patch.object(api, "iter_balance_pages", return_value=iter([]))
+
+        with pytest.raises(Exception, match="해외 잔고 조회 결과가 없습니다"):
+            api.get_balance()
+
     def test_get_balance_error(self, mocker):
         """API 에러 응답"""
         # Given
@@ -253,7 +261,7 @@ class TestGetBalance:
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When & Then
         with pytest.raises(Exception, match="Error: Bad Request"):
@@ -68,7 +68,7 @@ class TestGetMinuteCandles:
             ],
         }
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         result = api.get_minute_candles(symbol="TSLA", minute_interval=OverseasMinuteInterval.MIN_1)
@@ -165,7 +165,7 @@ class TestGetMinuteCandles:
             ],
         }
 
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch("requests.Session.get")
         mock_get.side_effect = [first_response, second_response]
 
         # When
@@ -214,7 +214,7 @@ class TestGetMinuteCandles:
             "output2": [],
         }
 
-        mock_get = mocker.patch("requests.get", return_value=mock_response)
+        mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When
         api.get_minute_candles(
@@ -246,7 +246,7 @@ class TestGetMinuteCandles:
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
 
-        mocker.patch("requests.get", return_value=mock_response)
+        mocker.patch("requests.Session.get", return_value=mock_response)
 
         # When & Then
         with pytest.raises(Exception, match="Error: Bad Request"):
@@ -1,12 +1,14 @@
 """해외주식 시세 조회 API 테스트"""
 
-from unittest.mock import patch
+import json
+from unittest.mock import Mock, patch
 
 import pytest
 
 from src.config import HantuConfig
 from src.hantu.model.overseas.asset_type import OverseasAssetType
 from src.hantu.model.overseas.candle_period import OverseasCandlePeriod
+from src.hantu.model.overseas.exchange_code import OverseasExchangeCode
 from src.hantu.model.overseas.market_code import OverseasMarketCode
 from src.hantu.model.overseas.price import (
     OverseasCurrentPriceResponse,
@@ -48,7 +50,7 @@ class TestGetCurrentPrice:
 
     def test_get_current_price_returns_valid_response(self, api, mock_response):
         """현재가 조회가 유효한 응답을 반환하는지 테스트"""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
 
@@ -65,6 +67,119 @@ class TestGetCurrentPrice:
             api.get_current_price(symbol="")
 
 
+class TestGetLastPrice:
+    """get_last_price() 메서드 테스트"""
+
+    @pytest.fixture
+    def api(self, mocker):
+        """토큰 발급을 막은 HantuOverseasAPI 인스턴스"""
+        api = HantuOverseasAPI(HantuConfig())
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        return api
+
+    @pytest.fixture
+    def mock_get(self, mocker):
+        """현재체결가 응답 바이트를 반환하는 Session.get"""
+        response = mocker.Mock()
+        response.status_code = 200
+        response.content = json.dumps({"rt_cd": "0", "msg_cd": "SUCCESS", "msg1": "성공", "output": {"rsym": "DNASAAPL", "last": "150.25", "tvol": "50000000"}}).encode()
+        return mocker.patch("requests.Session.get", return_value=response)
+
+    def test_현재가만_읽는다(self, api, mock_get):
+        assert api.get_last_price(exchange_code=OverseasMarketCode.NAS, symbol="AAPL") == "150.25"
+        assert mock_get.call_args.kwargs["params"]["SYMB"] == "AAPL"
+
+    def test_시장가_매수는_현재가로_지정가_주문한다(self, api, mock_get, mocker):
+        order = mocker.patch.object(api, "_order")
+
+        api.buy_market_order("AAPL", 3, exchange_code=OverseasExchangeCode.NAS)
+
+        assert mock_get.call_args.kwargs["params"]["EXCD"] == "NAS"
+        assert order.call_args.kwargs["price"] == "150.25"
+
+
+class TestGetCurrentPrices:
+    """get_current_prices() 메서드 테스트"""
+
+    @pytest.fixture
+    def api(self, mocker):
+        """토큰 발급을 막은 HantuOverseasAPI 인스턴스"""
+        api = HantuOverseasAPI(HantuConfig())
+        mocker.patch.object(api, "_get_token", return_value="mock_token")
+        return api
+
+    @staticmethod
+    def current_price_response(mocker, symbol: str, exchange_code: str) -> Mock:
+        """종목별 현재가 모의 응답"""
+        response = mocker.Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "rt_cd": "0",
+            "msg_cd": "SUCCESS",
+            "msg1": "성공",
+            "output": {
+                "rsym": f"D{exchange_code}{symbol}",
+                "zdiv": "2",
+                "base": "99.00",
+                "pvol": "1000",
+                "last": "100.00",
+                "sign": "2",
+                "diff": "1.00",
+                "rate": "1.01",
+                "tvol": "1000",
+                "tamt": "100000",
+                "ordy": "Y",
+            },
+        }
+        return response
+
+    def test_종목마다_지정한_거래소로_조회한다(self, api, mocker):
+        # Given
+        mocker.patch(
+            "requests.Session.get",
+            side_effect=lambda url, **kwargs: self.current_price_response(mocker, kwargs["params"]["SYMB"], kwargs["params"]["EXCD"]),
+        )
+
+        # When
+        batch = api.get_current_prices(
+            ["AAPL", "IBM"],
+            exchange_code={"AAPL": OverseasMarketCode.NAS, "IBM": OverseasMarketCode.NYS},
+        )
+
+        # Then
+        assert batch.errors == {}
+        assert batch.quotes["AAPL"].output.rsym == "DNASAAPL"
+        assert batch.quotes["IBM"].output.rsym == "DNYSIBM"
+
+    def test_거래소가_하나면_모든_종목에_적용한다(self, api, mocker):
+        # Given
+        mock_get = mocker.patch(
+            "requests.Session.get",
+            side_effect=lambda url, **kwargs: self.current_price_response(mocker, kwargs["params"]["SYMB"], kwargs["params"]["EXCD"]),
+        )
+
+        # When
+        batch = api.get_current_prices(["AAPL", "TSLA"], exchange_code=OverseasMarketCode.NAS)
+
+        # Then
+        assert set(batch.quotes) == {"AAPL", "TSLA"}
+        assert {call.kwargs["params"]["EXCD"] for call in mock_get.call_args_list} == {"NAS"}
+
+    def test_거래소가_없는_종목은_errors에_담긴다(self, api, mocker):
+        # Given
+        mocker.patch(
+            "requests.Session.get",
+            side_effect=lambda url, **kwargs: self.current_price_response(mocker, kwargs["params"]["SYMB"], kwargs["params"]["EXCD"]),
+        )
+
+        # When
+        batch = api.get_current_prices(["AAPL", "TSLA"], exchange_code={"AAPL": OverseasMarketCode.NAS})
+
+        # Then
+        assert set(batch.quotes) == {"AAPL"}
+        assert isinstance(batch.errors["TSLA"], KeyError)
+
+
 class TestGetDailyCandles:
     """get_daily_candles() 메서드 테스트"""
 
@@ -100,7 +215,7 @@ class TestGetDailyCandles:
 
     def test_get_daily_candles_returns_valid_response(self, api, mock_response):
         """일봉 조회가 유효한 응답을 반환하는지 테스트"""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
             mock_get.return_value.headers = {"tr_cont": ""}
@@ -114,7 +229,7 @@ class TestGetDailyCandles:
 
     def test_get_daily_candles_with_period_parameter(self, api, mock_response):
         """기간 구분 파라미터 테스트"""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
             mock_get.return_value.headers = {"tr_cont": ""}
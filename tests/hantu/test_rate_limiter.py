@@ -0,0 +1,82 @@
+"""한투 요청 수 제한기 테스트"""
+
+import time
+
+import pytest
+
+from src.common.metrics import InMemoryMetricsSink
+from src.config import HantuConfig
+from src.hantu.domestic_api import HantuDomesticAPI
+from src.hantu.model.domestic.account_type import AccountType
+from src.hantu.rate_limiter import DEFAULT_ACCOUNT_RATES, HantuRateLimiter, default_rate_limiter, is_rate_limited
+
+
+def make_response(mocker, status_code: int, body: dict):
+    response = mocker.Mock()
+    response.status_code = status_code
+    response.json.return_value = body
+    return response
+
+
+RATE_LIMITED = {"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}
+
+
+class TestHantuRateLimiter:
+    def test_초당_요청_수를_넘지_않도록_일정한_간격으로_보낸다(self):
+        limiter = HantuRateLimiter(rate=20)
+
+        started = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        elapsed = time.monotonic() - started
+
+        assert elapsed == pytest.approx(5 / 20, abs=0.04)
+
+    def test_계좌_타입별_기본_제한기는_공유되고_모의투자가_더_엄격하다(self):
+        real = default_rate_limiter(AccountType.REAL)
+        virtual = default_rate_limiter(AccountType.VIRTUAL)
+
+        assert default_rate_limiter(AccountType.REAL) is real
+        assert virtual.rate == DEFAULT_ACCOUNT_RATES[AccountType.VIRTUAL] < real.rate
+
+    def test_초과_응답이면_버킷을_비우고_물러난다(self, mocker):
+        mock_sleep = mocker.patch("src.hantu.rate_limiter.time.sleep")
+        metrics_sink = InMemoryMetricsSink()
+        limiter = HantuRateLimiter(rate=2, metrics_sink=metrics_sink, label="virtual")
+
+        assert limiter.backoff(0) == 0.5
+        assert limiter.backoff(1) == 1.0
+        assert limiter.backoff(10) == 4.0
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0, 4.0]
+        assert metrics_sink.counter("hantu.ratelimit.rejected", account="virtual") == 3
+
+    def test_초과_에러_코드만_초과_응답으로_본다(self, mocker):
+        assert is_rate_limited(make_response(mocker, 500, RATE_LIMITED))
+        assert not is_rate_limited(make_response(mocker, 500, {"rt_cd": "1", "msg_cd": "EGW00123"}))
+        assert not is_rate_limited(make_response(mocker, 200, {"rt_cd": "0"}))
+
+
+class TestHantuBaseAPIRateLimit:
+    def test_초과_응답을_받으면_물러난_뒤_다시_요청한다(self, mocker, unthrottled_rate_limiter):
+        mock_backoff = mocker.patch.object(unthrottled_rate_limiter, "backoff")
+        session = mocker.Mock()
+        session.get.side_effect = [make_response(mocker, 500, RATE_LIMITED), make_response(mocker, 200, {"rt_cd": "0"})]
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL, session=session)
+
+        res = api._get("https://example.com/quote", headers={}, params={})
+
+        assert res.status_code == 200
+        assert session.get.call_count == 2
+        mock_backoff.assert_called_once_with(0)
+
+    def test_재시도_횟수를_넘으면_마지막_응답을_반환한다(self, mocker, unthrottled_rate_limiter):
+        mocker.patch.object(unthrottled_rate_limiter, "backoff")
+        session = mocker.Mock()
+        session.post.return_value = make_response(mocker, 500, RATE_LIMITED)
+        api = HantuDomesticAPI(HantuConfig(), AccountType.VIRTUAL, session=session)
+
+        res = api._post("https://example.com/order", headers={}, data="{}")
+
+        assert is_rate_limited(res)
+        assert session.post.call_count == 4
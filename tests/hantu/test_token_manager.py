@@ -0,0 +1,158 @@
+"""한국투자증권 접근 토큰 관리 테스트"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+from src.hantu.model.access_token import KST, ResponseBody
+from src.hantu.token_manager import HantuTokenManager
+
+
+def make_token(access_token: str, expires_after: timedelta = timedelta(hours=24)) -> ResponseBody:
+    return ResponseBody(
+        access_token=access_token,
+        token_type="Bearer",
+        expires_in=expires_after.total_seconds(),
+        access_token_token_expired=(datetime.now(KST) + expires_after).replace(tzinfo=None),
+    )
+
+
+def token_response(mocker, token: ResponseBody):
+    response = mocker.Mock()
+    response.status_code = 200
+    response.json.return_value = token.model_dump(mode="json")
+    return response
+
+
+@pytest.fixture
+def token_path(tmp_path):
+    return str(tmp_path / "token" / "token.json")
+
+
+@pytest.fixture
+def manager(token_path):
+    manager = HantuTokenManager("https://example.com", "app_key", "app_secret", token_path)
+    yield manager
+    manager.stop()
+
+
+class TestHantuTokenManager:
+    def test_토큰_파일이_유효하면_발급하지_않고_이후에는_파일을_읽지_않는다(self, mocker, manager, token_path):
+        manager._replace(make_token("file_token"))
+        reloaded = HantuTokenManager("https://example.com", "app_key", "app_secret", token_path)
+        mock_post = mocker.patch.object(requests.Session, "post")
+        mock_load = mocker.patch.object(reloaded, "_load", wraps=reloaded._load)
+
+        try:
+            assert [reloaded.access_token() for _ in range(3)] == ["file_token"] * 3
+        finally:
+            reloaded.stop()
+
+        mock_post.assert_not_called()
+        mock_load.assert_called_once()
+
+    def test_토큰_파일이_없으면_발급하고_저장한다(self, mocker, manager, token_path):
+        mock_post = mocker.patch.object(requests.Session, "post", return_value=token_response(mocker, make_token("new_token")))
+
+        assert manager.access_token() == "new_token"
+        assert manager.access_token() == "new_token"
+
+        mock_post.assert_called_once()
+        with open(token_path) as token_file:
+            assert ResponseBody.model_validate_json(token_file.read()).access_token == "new_token"
+
+    def test_만료되기_전에_백그라운드에서_갱신한다(self, mocker, token_path):
+        manager = HantuTokenManager("https://example.com", "app_key", "app_secret", token_path, refresh_margin=86400)
+        mock_post = mocker.patch.object(requests.Session, "post", return_value=token_response(mocker, make_token("old_token")))
+        try:
+            assert manager.access_token() == "old_token"
+
+            mock_post.return_value = token_response(mocker, make_token("refreshed_token"))
+            deadline = time.monotonic() + 5
+            while manager.access_token() != "refreshed_token" and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            manager.stop()
+
+        assert manager.access_token() == "refreshed_token"
+        with open(token_path) as token_file:
+            assert ResponseBody.model_validate_json(token_file.read()).access_token == "refreshed_token"
+
+    def test_같은_토큰이_다시_발급되면_파일을_쓰지_않는다(self, mocker, manager):
+        token = make_token("same_token")
+        manager._replace(token)
+        mock_write = mocker.patch("src.hantu.token_manager.Path.write_text")
+
+        manager._replace(token)
+
+        mock_write.assert_not_called()
+
+    def test_같은_토큰_파일은_인스턴스를_공유한다(self, token_path):
+        first = HantuTokenManager.shared("https://example.com", "app_key", "app_secret", token_path)
+        second = HantuTokenManager.shared("https://example.com", "app_key", "app_secret", token_path)
+        other = HantuTokenManager.shared("https://example.com", "app_key", "app_secret", token_path + ".virtual")
+
+        assert first is second
+        assert first is not other
+
+
+class TestHantuTokenManagerAcrossProcesses:
+    def test_동시에_시작한_여러_인스턴스는_토큰을_한_번만_발급한다(self, mocker, token_path):
+        def slow_issue(*args: object, **kwargs: object) -> object:
+            time.sleep(0.1)
+            return token_response(mocker, make_token("only_token"))
+
+        mock_post = mocker.patch.object(requests.Session, "post", side_effect=slow_issue)
+        # 인스턴스마다 잠금 파일을 따로 열므로 프로세스가 여러 개인 것과 같다
+        managers = [HantuTokenManager("https://example.com", "app_key", "app_secret", token_path) for _ in range(8)]
+        results: list[str] = []
+        barrier = threading.Barrier(len(managers))
+
+        def run(manager: HantuTokenManager) -> None:
+            barrier.wait()
+            results.append(manager.access_token())
+
+        threads = [threading.Thread(target=run, args=(manager,)) for manager in managers]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            for manager in managers:
+                manager.stop()
+
+        assert results == ["only_token"] * len(managers)
+        mock_post.assert_called_once()
+
+    def test_선제_갱신_시_다른_프로세스가_갱신한_토큰이_있으면_발급하지_않는다(self, mocker, manager, token_path):
+        manager._replace(make_token("old_token", expires_after=timedelta(minutes=20)))
+        other = HantuTokenManager("https://example.com", "app_key", "app_secret", token_path)
+        other._replace(make_token("other_token"))
+        other.stop()
+        mock_post = mocker.patch.object(requests.Session, "post")
+
+        manager._refresh()
+
+        mock_post.assert_not_called()
+        assert manager.access_token() == "other_token"
+
+    def test_발급_요청이_시간을_초과하면_실패하고_잠금을_놓는다(self, mocker, manager, token_path):
+        mock_post = mocker.patch.object(requests.Session, "post", side_effect=requests.Timeout("read timed out"))
+
+        with pytest.raises(Exception, match="토큰 발급 실패"):
+            manager.access_token()
+
+        assert mock_post.call_args.kwargs["timeout"] == manager.timeout
+        # 다른 프로세스가 기다리지 않고 바로 발급할 수 있다
+        other = HantuTokenManager("https://example.com", "app_key", "app_secret", token_path)
+        mock_post.side_effect = None
+        mock_post.return_value = token_response(mocker, make_token("other_token"))
+        other._file_lock._timeout = 0.1
+        try:
+            assert other.access_token() == "other_token"
+        finally:
+            other.stop()
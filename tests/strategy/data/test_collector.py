@@ -284,3 +284,30 @@ class TestDataCollector:
 
         # 날짜가 바뀌어서 파일 캐시가 무시되고 다시 API 호출
         assert mock_get_candles.call_count == 2
+
+    @patch("src.strategy.data.collector.UpbitAPI.get_candles")
+    def test_캐시_히트_미스_메트릭_기록(self, mock_get_candles, tmp_path):
+        """cold / hit / stale 캐시 조회를 메트릭 싱크에 기록한다"""
+        from src.common.metrics import InMemoryMetricsSink
+        from src.strategy.cache.cache_manager import CacheManager
+
+        base_date = datetime.datetime(2025, 10, 15)
+        index = [base_date - timedelta(days=day + 1, hours=-hour) for day in range(21) for hour in range(24)]
+        data = [{"open": 50000.0, "high": 51000.0, "low": 49000.0, "close": 50500.0, "volume": 100.0}] * len(index)
+        mock_get_candles.return_value = pd.DataFrame(data, index=index)
+
+        sink = InMemoryMetricsSink()
+        clock = FixedClock(datetime.datetime(2025, 10, 15, 10, 0, 0))
+        cache_manager = CacheManager(cache_dir=str(tmp_path), file_suffix="data", metrics_sink=sink)
+        collector = DataCollector(clock=clock, cache_manager=cache_manager)
+
+        collector.collect_data("KRW-BTC", days=20)
+        collector.collect_data("KRW-BTC", days=20)
+        clock.set_time(datetime.datetime(2025, 10, 16, 10, 0, 0))
+        collector.collect_data("KRW-BTC", days=20)
+
+        assert sink.counter("collector.cache", ticker="KRW-BTC", result="cold") == 1
+        assert sink.counter("collector.cache", ticker="KRW-BTC", result="hit") == 1
+        assert sink.counter("collector.cache", ticker="KRW-BTC", result="stale") == 1
+        assert sink.histogram("collector.fetch.seconds", ticker="KRW-BTC").count == 2
+        assert sink.histogram("cache.save.seconds", namespace="data", ticker="KRW-BTC").count == 2
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from src.common.metrics import InMemoryMetricsSink
 from src.strategy.cache.cache_manager import CacheManager
 from src.strategy.cache.cache_models import DataCache, StrategyCacheData, VolatilityStrategyCacheData
 from src.strategy.data.models import HalfDayCandle, Recent20DaysHalfDayCandles
@@ -246,6 +247,49 @@ class TestCacheManager:
         # 존재하지 않는 캐시 삭제 - 에러 없이 처리되어야 함
         manager.delete_strategy_cache(ticker, strategy_name)
 
+    def test_load_and_save_record_metrics(self, temp_cache_dir, sample_strategy_cache):
+        """로드 히트/미스와 I/O 지연 시간을 네임스페이스, 티커별로 기록"""
+        sink = InMemoryMetricsSink()
+        manager = CacheManager(cache_dir=temp_cache_dir, metrics_sink=sink)
+
+        manager.load_strategy_cache("KRW-BTC", "volatility")
+        manager.save_strategy_cache("KRW-BTC", "volatility", sample_strategy_cache)
+        manager.load_strategy_cache("KRW-BTC", "volatility")
+        manager.load_data_cache("KRW-BTC")
+
+        assert sink.counter("cache.load", namespace="strategy", ticker="KRW-BTC", result="miss") == 1
+        assert sink.counter("cache.load", namespace="strategy", ticker="KRW-BTC", result="hit") == 1
+        assert sink.counter("cache.load", namespace="data", result="miss") == 1
+        assert sink.counter("cache.load", ticker="KRW-BTC") == 3
+        assert sink.histogram("cache.load.seconds", namespace="strategy", ticker="KRW-BTC").count == 2
+        assert sink.histogram("cache.save.seconds", namespace="strategy", ticker="KRW-BTC").count == 1
+
+    def test_load_all_strategy_states(self, temp_cache_dir, sample_data_cache):
+        """디렉토리를 한 번 스캔해서 (ticker, strategy) 별 캐시를 로드"""
+        manager = CacheManager(cache_dir=temp_cache_dir)
+        data_manager = CacheManager(cache_dir=temp_cache_dir, file_suffix="data")
+        volatility_cache = VolatilityStrategyCacheData(execution_volume=0.1, last_run_date=dt.date(2024, 1, 2), position_size=0.5, threshold=100.0)
+        morning_cache = StrategyCacheData(execution_volume=0.2, last_run_date=dt.date(2024, 1, 2))
+
+        manager.save_strategy_cache("KRW-BTC", "volatility", volatility_cache)
+        manager.save_strategy_cache("KRW-ETH", "morning_afternoon", morning_cache)
+        manager.save_strategy_cache("KRW-ETH", "unknown", morning_cache)
+        data_manager.save_data_cache("KRW-BTC", sample_data_cache)
+
+        states = manager.load_all_strategy_states({"volatility": VolatilityStrategyCacheData, "morning_afternoon": StrategyCacheData})
+
+        assert states == {
+            ("KRW-BTC", "volatility"): volatility_cache,
+            ("KRW-ETH", "morning_afternoon"): morning_cache,
+        }
+        assert isinstance(states["KRW-BTC", "volatility"], VolatilityStrategyCacheData)
+
+    def test_load_all_strategy_states_without_cache_dir(self, temp_cache_dir):
+        """캐시 디렉토리가 없으면 빈 딕셔너리 반환"""
+        manager = CacheManager(cache_dir=str(Path(temp_cache_dir) / "missing"))
+
+        assert manager.load_all_strategy_states({"volatility": VolatilityStrategyCacheData}) == {}
+
 
 class TestStrategyCacheData:
     """StrategyCacheData 모델 테스트"""
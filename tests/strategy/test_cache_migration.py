@@ -0,0 +1,85 @@
+import datetime as dt
+import json
+from typing import ClassVar
+
+import pytest
+from pydantic import Field
+
+from src.strategy.cache.cache_manager import CacheManager
+from src.strategy.cache.cache_models import StrategyCacheData, VolatilityStrategyCacheData
+from src.strategy.cache.migration import CacheMigrationError, CacheMigrationRegistry
+
+
+class StopLossCacheData(VolatilityStrategyCacheData):
+    """필드가 추가된 v3 캐시 (v1 → v2: threshold 이름 변경, v2 → v3: stop_loss 추가)"""
+
+    SCHEMA_VERSION: ClassVar[int] = 3
+
+    stop_loss: float = Field(..., description="손절 가격")
+
+
+@pytest.fixture
+def registry():
+    registry = CacheMigrationRegistry()
+
+    @registry.register(StopLossCacheData, from_version=1)
+    def _rename_threshold(data):
+        return {**data, "threshold": data.pop("breakout_price")}
+
+    @registry.register(StopLossCacheData, from_version=2)
+    def _add_stop_loss(data):
+        return {**data, "stop_loss": data["threshold"] * 0.9}
+
+    return registry
+
+
+class TestCacheMigration:
+    def test_save_stamps_schema_version(self, tmp_path):
+        manager = CacheManager(cache_dir=str(tmp_path))
+        cache = StrategyCacheData(execution_volume=0.1, last_run_date=dt.date(2024, 1, 2))
+
+        manager.save_strategy_cache("KRW-BTC", "morning_afternoon", cache)
+
+        data = json.loads(manager.get_cache_path("KRW-BTC", "morning_afternoon").read_text())
+        assert data["schema_version"] == 1
+        assert manager.load_strategy_cache("KRW-BTC", "morning_afternoon") == cache
+
+    def test_legacy_cache_without_version_loads(self, tmp_path):
+        """버전 기록 이전의 캐시 파일도 그대로 로드된다"""
+        manager = CacheManager(cache_dir=str(tmp_path))
+        tmp_path.joinpath("KRW-BTC_volatility_cache.json").write_text(
+            json.dumps({"execution_volume": 0.1, "last_run_date": "2024-01-02", "position_size": 0.5, "threshold": 100.0})
+        )
+
+        cache = manager.load_strategy_cache("KRW-BTC", "volatility", VolatilityStrategyCacheData)
+
+        assert cache == VolatilityStrategyCacheData(execution_volume=0.1, last_run_date=dt.date(2024, 1, 2), position_size=0.5, threshold=100.0)
+
+    def test_migrations_applied_in_order_on_load(self, tmp_path, registry):
+        """저장된 버전부터 현재 버전까지 마이그레이션을 순서대로 적용해 포지션을 유지한다"""
+        manager = CacheManager(cache_dir=str(tmp_path), migrations=registry)
+        tmp_path.joinpath("KRW-BTC_volatility_cache.json").write_text(
+            json.dumps({"execution_volume": 0.1, "last_run_date": "2024-01-02", "position_size": 0.5, "breakout_price": 100.0})
+        )
+
+        cache = manager.load_strategy_cache("KRW-BTC", "volatility", StopLossCacheData)
+
+        assert cache is not None
+        assert cache.execution_volume == 0.1
+        assert cache.threshold == 100.0
+        assert cache.stop_loss == pytest.approx(90.0)
+
+    def test_missing_migration_raises(self, registry):
+        with pytest.raises(CacheMigrationError):
+            registry.migrate(StopLossCacheData, {}, from_version=0)
+
+    def test_newer_version_is_loaded_as_is(self, tmp_path):
+        """롤백 등으로 현재보다 높은 버전이 저장되어 있으면 마이그레이션 없이 로드한다"""
+        manager = CacheManager(cache_dir=str(tmp_path))
+        tmp_path.joinpath("KRW-BTC_morning_afternoon_cache.json").write_text(
+            json.dumps({"schema_version": 5, "execution_volume": 0.1, "last_run_date": "2024-01-02", "new_field": 1})
+        )
+
+        cache = manager.load_strategy_cache("KRW-BTC", "morning_afternoon")
+
+        assert cache == StrategyCacheData(execution_volume=0.1, last_run_date=dt.date(2024, 1, 2))
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -13,7 +13,9 @@ from src.strategy.order.order_executor import OrderExecutor
 
 @pytest.fixture
 def mock_order_executor():
-    return Mock(spec=OrderExecutor)
+    order_executor = Mock(spec=OrderExecutor)
+    order_executor.has_pending_order.return_value = False
+    return order_executor
 
 
 @pytest.fixture
@@ -38,7 +40,7 @@ def mock_collector():
 
 @pytest.fixture
 def mock_cache_manager():
-    return Mock(spec=CacheManager)
+    return MagicMock(spec=CacheManager)
 
 
 @pytest.fixture
@@ -137,3 +139,34 @@ class TestMorningAfternoonStrategyExecute:
         # Then: 매수 주문이 실행되지 않음
         mock_order_executor.buy.assert_not_called()
         mock_order_executor.sell.assert_not_called()
+
+    def test_execute_no_cache_save_when_buy_is_tracked(self, morning_afternoon_strategy, mock_order_executor, mock_clock, mock_collector, mock_cache_manager):
+        """주문만 넣고 반환되면(None) 캐시는 OrderTracker가 체결 후 저장한다"""
+        import datetime as dt
+
+        mock_clock.is_morning.return_value = True
+        mock_clock.today.return_value = dt.date(2024, 1, 1)
+        mock_cache_manager.load_strategy_cache.return_value = None
+
+        mock_history = Mock()
+        mock_history.yesterday_morning.volatility = 0.05
+        mock_history.yesterday_morning.volume = 100
+        mock_history.yesterday_afternoon.return_rate = 0.01
+        mock_history.yesterday_afternoon.volume = 200
+        mock_collector.collect_data.return_value = mock_history
+        mock_order_executor.buy.return_value = None
+
+        morning_afternoon_strategy.execute()
+
+        mock_order_executor.buy.assert_called_once()
+        mock_cache_manager.save_strategy_cache.assert_not_called()
+
+    def test_execute_skip_sell_when_order_pending(self, morning_afternoon_strategy, mock_order_executor, mock_clock, mock_cache_manager):
+        """체결을 기다리는 매도 주문이 있으면 다시 매도하지 않는다"""
+        mock_clock.is_morning.return_value = False
+        mock_order_executor.has_pending_order.return_value = True
+
+        morning_afternoon_strategy.execute()
+
+        mock_cache_manager.load_strategy_cache.assert_not_called()
+        mock_order_executor.sell.assert_not_called()
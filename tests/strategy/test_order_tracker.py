@@ -0,0 +1,249 @@
+"""OrderTracker 테스트"""
+
+import datetime as dt
+import tempfile
+import time
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.common.order_direction import OrderDirection
+from src.strategy.cache.cache_manager import CacheManager
+from src.strategy.cache.cache_models import StrategyCacheData, VolatilityStrategyCacheData
+from src.strategy.cache.shared_state import SharedStateTable
+from src.strategy.order.order_executor import OrderExecutor
+from src.strategy.order.order_tracker import OrderTracker
+from src.upbit.model.order import OrderResult, OrderSide, OrderState, OrderType, Trade
+from src.upbit.upbit_api import UpbitAPI
+
+TODAY = dt.date(2024, 1, 1)
+CACHE_MODELS = {"volatility": VolatilityStrategyCacheData, "morning_afternoon": StrategyCacheData}
+
+
+def make_order(uuid: str, state: OrderState = OrderState.WAIT, executed_volume: float = 0.0, side: OrderSide = OrderSide.BID) -> OrderResult:
+    created_at = dt.datetime(2024, 1, 1, 9, 0, tzinfo=dt.timezone(dt.timedelta(hours=9)))
+    trades = (
+        [Trade(market="KRW-BTC", uuid=f"{uuid}-trade", price=100.0, volume=executed_volume, funds=100.0 * executed_volume, trend="up", created_at=created_at, side=side)]
+        if executed_volume
+        else []
+    )
+    return OrderResult(
+        uuid=uuid,
+        side=side,
+        ord_type=OrderType.PRICE if side == OrderSide.BID else OrderType.MARKET,
+        price=None,
+        state=state,
+        market="KRW-BTC",
+        created_at=created_at,
+        volume=None,
+        remaining_volume=None,
+        executed_volume=executed_volume,
+        reserved_fee=0.0,
+        remaining_fee=0.0,
+        paid_fee=0.0,
+        locked=0.0,
+        trades_count=len(trades),
+        trades=trades,
+    )
+
+
+@pytest.fixture
+def temp_cache_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def cache_manager(temp_cache_dir):
+    return CacheManager(cache_dir=temp_cache_dir)
+
+
+@pytest.fixture
+def upbit_api():
+    return Mock(spec=UpbitAPI)
+
+
+@pytest.fixture
+def on_fill():
+    return Mock()
+
+
+@pytest.fixture
+def tracker(upbit_api, cache_manager, temp_cache_dir, on_fill):
+    return OrderTracker(upbit_api, cache_manager, CACHE_MODELS, cache_dir=temp_cache_dir, on_fill=on_fill)
+
+
+class TestOrderTrackerTrack:
+    def test_추적한_주문은_파일에_남아_새_인스턴스에서도_보인다(self, tracker, upbit_api, cache_manager, temp_cache_dir):
+        tracker.track(make_order("order-1"), "volatility", OrderDirection.BUY, TODAY)
+
+        restarted = OrderTracker(upbit_api, cache_manager, CACHE_MODELS, cache_dir=temp_cache_dir)
+
+        assert [order.uuid for order in restarted.pending()] == ["order-1"]
+        assert restarted.has_pending("KRW-BTC", "volatility")
+        assert not restarted.has_pending("KRW-BTC", "morning_afternoon")
+
+    def test_체결_스트림이_있으면_완료_이벤트로_조회를_깨운다(self, tracker):
+        future: Future[OrderState] = Future()
+        order_stream = Mock()
+        order_stream.watch.return_value = future
+
+        with patch.object(UpbitAPI, "order_stream", order_stream), patch.object(tracker, "wake") as mock_wake:
+            tracker.track(make_order("order-1"), "volatility", OrderDirection.BUY, TODAY)
+            mock_wake.assert_not_called()
+
+            future.set_result(OrderState.DONE)
+
+        order_stream.watch.assert_called_once_with("order-1")
+        mock_wake.assert_called_once()
+
+
+class TestOrderTrackerReconcile:
+    def test_미체결_주문은_한_번의_요청으로_조회하고_남겨둔다(self, tracker, upbit_api):
+        tracker.track(make_order("order-1"), "volatility", OrderDirection.BUY, TODAY)
+        tracker.track(make_order("order-2"), "morning_afternoon", OrderDirection.BUY, TODAY)
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.WAIT, "order-2": OrderState.WAIT}
+
+        assert tracker.reconcile() == []
+
+        upbit_api.get_order_states.assert_called_once_with(["order-1", "order-2"])
+        upbit_api.get_order.assert_not_called()
+        assert len(tracker.pending()) == 2
+
+    def test_매수_체결은_캐시의_체결_수량에_더한다(self, tracker, upbit_api, cache_manager, on_fill):
+        cache_manager.save_strategy_cache("KRW-BTC", "volatility", VolatilityStrategyCacheData(execution_volume=0, last_run_date=TODAY, position_size=0.5, threshold=100.0))
+        tracker.track(make_order("order-1"), "volatility", OrderDirection.BUY, TODAY)
+        filled = make_order("order-1", OrderState.DONE, executed_volume=0.001)
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.DONE}
+        upbit_api.get_order.return_value = filled
+
+        assert tracker.reconcile() == [filled]
+
+        cache = cache_manager.load_strategy_cache("KRW-BTC", "volatility", VolatilityStrategyCacheData)
+        assert cache.execution_volume == 0.001
+        assert cache.threshold == 100.0
+        assert tracker.pending() == []
+        on_fill.assert_called_once()
+
+    def test_캐시가_없는_기본_전략은_매수_체결로_캐시를_만든다(self, tracker, upbit_api, cache_manager):
+        tracker.track(make_order("order-1"), "morning_afternoon", OrderDirection.BUY, TODAY)
+        filled = make_order("order-1", OrderState.DONE, executed_volume=0.002)
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.DONE}
+        upbit_api.get_order.return_value = filled
+
+        tracker.reconcile()
+
+        cache = cache_manager.load_strategy_cache("KRW-BTC", "morning_afternoon", StrategyCacheData)
+        assert cache.has_position(TODAY)
+        assert cache.execution_volume == 0.002
+
+    def test_매도_체결로_수량이_남지_않으면_캐시를_삭제한다(self, tracker, upbit_api, cache_manager):
+        cache_manager.save_strategy_cache("KRW-BTC", "morning_afternoon", StrategyCacheData(execution_volume=0.002, last_run_date=TODAY))
+        tracker.track(make_order("order-1", side=OrderSide.ASK), "morning_afternoon", OrderDirection.SELL, TODAY)
+        filled = make_order("order-1", OrderState.DONE, executed_volume=0.002, side=OrderSide.ASK)
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.DONE}
+        upbit_api.get_order.return_value = filled
+
+        tracker.reconcile()
+
+        assert cache_manager.load_strategy_cache("KRW-BTC", "morning_afternoon", StrategyCacheData) is None
+
+    def test_조회로_완료를_확인하면_체결_스트림_대기를_정리한다(self, tracker, upbit_api):
+        order_stream = Mock()
+        order_stream.watch.return_value = Future()
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.DONE}
+        upbit_api.get_order.return_value = make_order("order-1", OrderState.DONE, executed_volume=0.001)
+
+        with patch.object(UpbitAPI, "order_stream", order_stream):
+            tracker.track(make_order("order-1"), "volatility", OrderDirection.BUY, TODAY)
+            tracker.reconcile()
+
+        order_stream.discard.assert_called_once_with("order-1")
+
+    def test_매도_체결로_청산하면_공유_상태_테이블에서도_삭제한다(self, upbit_api, cache_manager, temp_cache_dir):
+        table = SharedStateTable.create(name=f"genie_test_{uuid.uuid4().hex[:8]}", capacity=4, lock_dir=Path(temp_cache_dir))
+        try:
+            tracker = OrderTracker(upbit_api, cache_manager, CACHE_MODELS, cache_dir=temp_cache_dir, shared_state=table)
+            cache = StrategyCacheData(execution_volume=0.002, last_run_date=TODAY)
+            cache_manager.save_strategy_cache("KRW-BTC", "morning_afternoon", cache)
+            table.put("KRW-BTC", "morning_afternoon", cache)
+            tracker.track(make_order("order-1", side=OrderSide.ASK), "morning_afternoon", OrderDirection.SELL, TODAY)
+            upbit_api.get_order_states.return_value = {"order-1": OrderState.DONE}
+            upbit_api.get_order.return_value = make_order("order-1", OrderState.DONE, executed_volume=0.002, side=OrderSide.ASK)
+
+            tracker.reconcile()
+            table.persist(cache_manager)
+
+            assert table.get("KRW-BTC", "morning_afternoon") is None
+            assert cache_manager.load_strategy_cache("KRW-BTC", "morning_afternoon", StrategyCacheData) is None
+        finally:
+            table.close()
+
+    def test_체결_없이_취소된_매도는_포지션을_유지한다(self, tracker, upbit_api, cache_manager, on_fill):
+        cache_manager.save_strategy_cache("KRW-BTC", "morning_afternoon", StrategyCacheData(execution_volume=0.002, last_run_date=TODAY))
+        tracker.track(make_order("order-1", side=OrderSide.ASK), "morning_afternoon", OrderDirection.SELL, TODAY)
+        cancelled = make_order("order-1", OrderState.CANCEL, side=OrderSide.ASK)
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.CANCEL}
+        upbit_api.get_order.return_value = cancelled
+
+        tracker.reconcile()
+
+        assert cache_manager.load_strategy_cache("KRW-BTC", "morning_afternoon", StrategyCacheData).execution_volume == 0.002
+        assert tracker.pending() == []
+        on_fill.assert_not_called()
+
+    def test_다른_프로세스가_먼저_반영한_주문은_다시_반영하지_않는다(self, tracker, upbit_api, cache_manager, temp_cache_dir):
+        tracker.track(make_order("order-1"), "morning_afternoon", OrderDirection.BUY, TODAY)
+        filled = make_order("order-1", OrderState.DONE, executed_volume=0.002)
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.DONE}
+        upbit_api.get_order.return_value = filled
+
+        other = OrderTracker(upbit_api, cache_manager, CACHE_MODELS, cache_dir=temp_cache_dir)
+        with patch.object(tracker, "pending", return_value=tracker.pending()):
+            other.reconcile()
+            assert tracker.reconcile() == []
+
+        assert cache_manager.load_strategy_cache("KRW-BTC", "morning_afternoon", StrategyCacheData).execution_volume == 0.002
+
+
+class TestOrderTrackerBackground:
+    def test_wake를_호출하면_주기를_기다리지_않고_조회한다(self, tracker, upbit_api):
+        tracker.track(make_order("order-1"), "volatility", OrderDirection.BUY, TODAY)
+        upbit_api.get_order_states.return_value = {"order-1": OrderState.WAIT}
+
+        tracker.start(interval=60)
+        try:
+            tracker.wake()
+            deadline = time.monotonic() + 5
+            while not upbit_api.get_order_states.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            tracker.stop()
+
+        upbit_api.get_order_states.assert_called_with(["order-1"])
+
+
+class TestOrderExecutorWithTracker:
+    def test_주문만_넣고_체결을_기다리지_않는다(self, tracker, upbit_api):
+        upbit_api.buy_market_order.return_value = make_order("order-1")
+        executor = OrderExecutor(upbit_api, order_tracker=tracker)
+
+        assert executor.buy("KRW-BTC", 10000.0, strategy_name="volatility") is None
+
+        upbit_api.buy_market_order_and_wait.assert_not_called()
+        assert executor.has_pending_order("KRW-BTC", "volatility")
+        assert tracker.pending()[0].submitted_date == TODAY
+
+    def test_체결되면_알림을_보낸다(self, upbit_api):
+        slack_client = Mock()
+        executor = OrderExecutor(upbit_api, slack_client=slack_client)
+        order = Mock(strategy_name="volatility", direction=OrderDirection.BUY)
+
+        executor.handle_fill(order, make_order("order-1", OrderState.DONE, executed_volume=0.001))
+
+        result = slack_client.send_order_notification.call_args.args[0]
+        assert result.strategy_name == "volatility"
+        assert result.executed_volume == 0.001
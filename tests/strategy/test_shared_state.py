@@ -0,0 +1,132 @@
+import datetime as dt
+import uuid
+from multiprocessing import resource_tracker
+
+import pytest
+
+from src.strategy.cache.cache_manager import CacheManager
+from src.strategy.cache.cache_models import StrategyCacheData, VolatilityStrategyCacheData
+from src.strategy.cache.shared_state import SharedStatePersister, SharedStateReadError, SharedStateTable
+
+
+@pytest.fixture
+def table(tmp_path):
+    table = SharedStateTable.create(name=f"genie_test_{uuid.uuid4().hex[:8]}", capacity=4, lock_dir=tmp_path)
+    yield table
+    table.close()
+
+
+@pytest.fixture
+def volatility_cache():
+    return VolatilityStrategyCacheData(execution_volume=0.1, last_run_date=dt.date(2024, 1, 2), position_size=0.5, threshold=100.0)
+
+
+class TestSharedStateTable:
+    def test_put_and_get(self, table, volatility_cache):
+        morning_cache = StrategyCacheData(execution_volume=0.2, last_run_date=dt.date(2024, 1, 2))
+
+        table.put("KRW-BTC", "volatility", volatility_cache)
+        table.put("KRW-BTC", "morning_afternoon", morning_cache)
+
+        assert table.get("KRW-BTC", "volatility") == volatility_cache
+        assert isinstance(table.get("KRW-BTC", "volatility"), VolatilityStrategyCacheData)
+        assert table.get("KRW-BTC", "morning_afternoon") == morning_cache
+        assert table.get("KRW-ETH", "volatility") is None
+
+    def test_overwrite_same_key(self, table, volatility_cache):
+        table.put("KRW-BTC", "volatility", volatility_cache)
+        table.put("KRW-BTC", "volatility", volatility_cache.model_copy(update={"execution_volume": 0.3}))
+
+        assert table.get("KRW-BTC", "volatility").execution_volume == 0.3
+        assert len(list(table.items())) == 1
+
+    def test_attach_shares_memory(self, table, tmp_path, volatility_cache):
+        other = SharedStateTable.attach(name=table.name, lock_dir=tmp_path)
+        try:
+            other.put("KRW-BTC", "volatility", volatility_cache)
+            assert table.get("KRW-BTC", "volatility") == volatility_cache
+        finally:
+            other.close()
+
+    def test_attach_unregisters_from_resource_tracker_on_python_312(self, table, tmp_path, mocker):
+        # 3.12에는 SharedMemory(track=False)가 없다
+        mocker.patch("src.strategy.cache.shared_state.sys.version_info", (3, 12, 0))
+        unregister = mocker.spy(resource_tracker, "unregister")
+
+        other = SharedStateTable.attach(name=table.name, lock_dir=tmp_path)
+        other.close()
+
+        unregister.assert_called_once()
+        assert unregister.call_args.args[1] == "shared_memory"
+        # 같은 프로세스에서 만든 테이블의 등록까지 해제되었으므로 되돌린다
+        resource_tracker.register(*unregister.call_args.args)
+
+    def test_full_table_raises(self, table, volatility_cache):
+        for ticker in ["KRW-A", "KRW-B", "KRW-C", "KRW-D"]:
+            table.put(ticker, "volatility", volatility_cache)
+
+        with pytest.raises(RuntimeError):
+            table.put("KRW-E", "volatility", volatility_cache)
+
+    def test_key_too_long_raises(self, table, volatility_cache):
+        with pytest.raises(ValueError):
+            table.put("KRW-" + "X" * 20, "volatility", volatility_cache)
+
+    def test_load_from_and_persist(self, table, tmp_path, volatility_cache):
+        cache_manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+        table.load_from({("KRW-BTC", "volatility"): volatility_cache})
+
+        persister = SharedStatePersister(table, cache_manager, interval=60)
+        persister.start()
+        persister.stop()
+
+        assert cache_manager.load_strategy_cache("KRW-BTC", "volatility", VolatilityStrategyCacheData) == volatility_cache
+
+    def test_delete_hides_record_and_persist_removes_file(self, table, tmp_path, volatility_cache):
+        cache_manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+        table.put("KRW-BTC", "volatility", volatility_cache)
+        table.persist(cache_manager)
+
+        table.delete("KRW-BTC", "volatility")
+
+        assert table.get("KRW-BTC", "volatility") is None
+        assert list(table.items()) == []
+        assert table.persist(cache_manager) == 1
+        assert cache_manager.load_strategy_cache("KRW-BTC", "volatility", VolatilityStrategyCacheData) is None
+
+    def test_put_after_delete_reuses_slot(self, table, volatility_cache):
+        for ticker in ["KRW-A", "KRW-B", "KRW-C", "KRW-D"]:
+            table.put(ticker, "volatility", volatility_cache)
+        table.delete("KRW-B", "volatility")
+
+        table.put("KRW-B", "volatility", volatility_cache)
+
+        assert table.get("KRW-B", "volatility") == volatility_cache
+        assert table.get("KRW-D", "volatility") == volatility_cache
+
+    def test_persist_writes_only_changed_records(self, table, tmp_path, volatility_cache):
+        cache_manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+        table.put("KRW-BTC", "volatility", volatility_cache)
+        table.put("KRW-ETH", "volatility", volatility_cache)
+        assert table.persist(cache_manager) == 2
+
+        # 전략이 테이블을 거치지 않고 파일에 직접 쓴 값은 덮어쓰지 않는다
+        direct = volatility_cache.model_copy(update={"execution_volume": 0.7})
+        cache_manager.save_strategy_cache("KRW-BTC", "volatility", direct)
+        table.put("KRW-ETH", "volatility", volatility_cache.model_copy(update={"execution_volume": 0.3}))
+
+        assert table.persist(cache_manager) == 1
+        assert cache_manager.load_strategy_cache("KRW-BTC", "volatility", VolatilityStrategyCacheData) == direct
+        assert cache_manager.load_strategy_cache("KRW-ETH", "volatility", VolatilityStrategyCacheData).execution_volume == 0.3
+
+    def test_read_gives_up_after_timeout_while_write_in_progress(self, tmp_path, volatility_cache):
+        table = SharedStateTable.create(name=f"genie_test_{uuid.uuid4().hex[:8]}", capacity=1, lock_dir=tmp_path, read_timeout=0.05)
+        try:
+            table.put("KRW-BTC", "volatility", volatility_cache)
+            offset = table._offset(0)
+            table._buf[offset] = table._buf[offset] + 1  # 쓰는 도중 멈춘 것처럼 seq를 홀수로 만든다
+
+            with pytest.raises(SharedStateReadError):
+                table.get("KRW-BTC", "volatility")
+        finally:
+            table.close()
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -13,7 +13,9 @@ from src.strategy.volatility_strategy import VolatilityStrategy
 
 @pytest.fixture
 def mock_order_executor():
-    return Mock(spec=OrderExecutor)
+    order_executor = Mock(spec=OrderExecutor)
+    order_executor.has_pending_order.return_value = False
+    return order_executor
 
 
 @pytest.fixture
@@ -38,7 +40,7 @@ def mock_collector():
 
 @pytest.fixture
 def mock_cache_manager():
-    return Mock(spec=CacheManager)
+    return MagicMock(spec=CacheManager)
 
 
 @pytest.fixture
@@ -76,7 +78,7 @@ class TestVolatilityStrategyExecute:
         mock_collector.collect_data.return_value = mock_history
 
         # Mock UpbitAPI.get_current_price to return price > threshold
-        with patch("src.strategy.volatility_strategy.UpbitAPI.get_current_price") as mock_price:
+        with patch("src.strategy.base_strategy.UpbitAPI.get_current_price") as mock_price:
             mock_price.return_value = 51000000  # > threshold (50500000)
 
             # Mock ExecutionResult
@@ -148,7 +150,7 @@ class TestVolatilityStrategyExecute:
         mock_history.calculate_morning_noise_average.return_value = 0.5
         mock_collector.collect_data.return_value = mock_history
 
-        with patch("src.strategy.volatility_strategy.UpbitAPI.get_current_price") as mock_price:
+        with patch("src.strategy.base_strategy.UpbitAPI.get_current_price") as mock_price:
             mock_price.return_value = 51000000
 
             # When: execute 호출
@@ -180,7 +182,7 @@ class TestVolatilityStrategyExecute:
         mock_cache_manager.load_strategy_cache.return_value = mock_cache
 
         # Mock UpbitAPI.get_current_price to return price > cached_threshold
-        with patch("src.strategy.volatility_strategy.UpbitAPI.get_current_price") as mock_price:
+        with patch("src.strategy.base_strategy.UpbitAPI.get_current_price") as mock_price:
             mock_price.return_value = 51000000  # > cached_threshold
 
             # Mock ExecutionResult
@@ -224,7 +226,7 @@ class TestVolatilityStrategyExecute:
         mock_history.calculate_morning_noise_average.return_value = 0.5
         mock_collector.collect_data.return_value = mock_history
 
-        with patch("src.strategy.volatility_strategy.UpbitAPI.get_current_price") as mock_price:
+        with patch("src.strategy.base_strategy.UpbitAPI.get_current_price") as mock_price:
             mock_price.return_value = 51000000
 
             execution_result = Mock(spec=ExecutionResult)
@@ -248,3 +250,110 @@ class TestVolatilityStrategyExecute:
             assert saved_cache.last_run_date == dt.date(2024, 1, 1)
             assert saved_cache.position_size == 1.0  # target_vol / volatility * ma_score
             assert saved_cache.threshold == 50500000  # close + range * k
+
+
+class TestVolatilityStrategyPreloadedCache:
+    """일괄 로드한 캐시 스냅샷 사용 테스트"""
+
+    def test_skip_buy_when_preloaded_has_position(self, volatility_strategy, mock_order_executor, mock_clock, mock_cache_manager):
+        """스냅샷에 오늘 포지션이 있으면 파일 로드 없이 매수를 건너뛴다"""
+        import datetime as dt
+
+        from src.strategy.cache.cache_models import VolatilityStrategyCacheData
+
+        mock_clock.is_morning.return_value = True
+        mock_clock.today.return_value = dt.date(2024, 1, 1)
+        cache = VolatilityStrategyCacheData(execution_volume=0.001, last_run_date=dt.date(2024, 1, 1), position_size=1.0, threshold=100.0)
+        volatility_strategy.preload_cache({("KRW-BTC", "volatility"): cache})
+
+        volatility_strategy.execute()
+
+        mock_cache_manager.load_strategy_cache.assert_not_called()
+        mock_cache_manager.lock.assert_not_called()
+        mock_order_executor.buy.assert_not_called()
+
+    def test_skip_sell_when_preloaded_has_no_position(self, volatility_strategy, mock_order_executor, mock_clock, mock_cache_manager):
+        """스냅샷에 캐시가 없으면 파일 로드 없이 매도를 건너뛴다"""
+        import datetime as dt
+
+        mock_clock.is_morning.return_value = False
+        mock_clock.today.return_value = dt.date(2024, 1, 1)
+        volatility_strategy.preload_cache({})
+
+        volatility_strategy.execute()
+
+        mock_cache_manager.load_strategy_cache.assert_not_called()
+        mock_order_executor.sell.assert_not_called()
+
+    def test_sell_reloads_under_lock_when_preloaded_has_position(self, volatility_strategy, mock_order_executor, mock_clock, mock_cache_manager):
+        """스냅샷에 포지션이 있어도 매도 전에는 잠금 안에서 다시 로드한다"""
+        import datetime as dt
+
+        from src.strategy.cache.cache_models import VolatilityStrategyCacheData
+
+        mock_clock.is_morning.return_value = False
+        mock_clock.today.return_value = dt.date(2024, 1, 1)
+        cache = VolatilityStrategyCacheData(execution_volume=0.001, last_run_date=dt.date(2024, 1, 1), position_size=1.0, threshold=100.0)
+        volatility_strategy.preload_cache({("KRW-BTC", "volatility"): cache})
+        # 다른 프로세스가 이미 매도해서 캐시가 삭제된 상태
+        mock_cache_manager.load_strategy_cache.return_value = None
+
+        volatility_strategy.execute()
+
+        mock_cache_manager.lock.assert_called_once_with("KRW-BTC", "volatility")
+        mock_order_executor.sell.assert_not_called()
+
+
+class TestVolatilityStrategyPreloadedPrices:
+    """일괄 조회한 현재가 스냅샷 사용 테스트"""
+
+    def test_should_buy_uses_preloaded_price(self, volatility_strategy):
+        """스냅샷에 현재가가 있으면 API를 호출하지 않는다"""
+        volatility_strategy.preload_prices({"KRW-BTC": 200.0})
+
+        with patch("src.strategy.base_strategy.UpbitAPI.get_current_price") as mock_price:
+            assert volatility_strategy._should_buy(position_size=0.5, threshold=100.0, has_position=False)
+
+        mock_price.assert_not_called()
+
+    def test_should_buy_falls_back_when_price_missing(self, volatility_strategy):
+        """스냅샷에 티커가 없으면 직접 조회한다"""
+        volatility_strategy.preload_prices({"KRW-ETH": 200.0})
+
+        with patch("src.strategy.base_strategy.UpbitAPI.get_current_price", return_value=50.0) as mock_price:
+            assert not volatility_strategy._should_buy(position_size=0.5, threshold=100.0, has_position=False)
+
+        mock_price.assert_called_once_with("KRW-BTC")
+
+
+class TestVolatilityStrategyPendingOrder:
+    """체결 대기 주문이 있는 경우 테스트"""
+
+    def test_skip_buy_when_order_pending(self, volatility_strategy, mock_order_executor, mock_clock, mock_collector):
+        """체결을 기다리는 주문이 있으면 매수 시그널을 계산하지 않는다"""
+        mock_clock.is_morning.return_value = True
+        mock_order_executor.has_pending_order.return_value = True
+
+        volatility_strategy.execute()
+
+        mock_order_executor.has_pending_order.assert_called_once_with("KRW-BTC", "volatility")
+        mock_collector.collect_data.assert_not_called()
+        mock_order_executor.buy.assert_not_called()
+
+    def test_keep_cache_when_sell_is_tracked(self, volatility_strategy, mock_order_executor, mock_clock, mock_cache_manager):
+        """주문만 넣고 반환되면(None) 캐시는 OrderTracker가 체결 후 갱신한다"""
+        import datetime as dt
+
+        from src.strategy.cache.cache_models import VolatilityStrategyCacheData
+
+        mock_clock.is_morning.return_value = False
+        mock_clock.today.return_value = dt.date(2024, 1, 1)
+        mock_cache_manager.load_strategy_cache.return_value = VolatilityStrategyCacheData(
+            execution_volume=0.001, last_run_date=dt.date(2024, 1, 1), position_size=1.0, threshold=100.0
+        )
+        mock_order_executor.sell.return_value = None
+
+        volatility_strategy.execute()
+
+        mock_order_executor.sell.assert_called_once_with("KRW-BTC", 0.001, strategy_name="volatility")
+        mock_cache_manager.delete_strategy_cache.assert_not_called()
@@ -17,14 +17,14 @@ def mock_upbit_config():
 
 @pytest.fixture
 def mock_upbit_instance():
-    """pyupbit.Upbit 인스턴스 Mock fixture"""
+    """UpbitClient 인스턴스 Mock fixture"""
     mock_instance = MagicMock()
     return mock_instance
 
 
 @pytest.fixture
 def mock_upbit_class(mock_upbit_instance):
-    """pyupbit.Upbit 클래스 Mock fixture"""
-    with patch("src.upbit.upbit_api.pyupbit.Upbit") as mock_class:
+    """UpbitClient 클래스 Mock fixture"""
+    with patch("src.upbit.upbit_api.UpbitClient") as mock_class:
         mock_class.return_value = mock_upbit_instance
         yield mock_class
@@ -2,6 +2,8 @@
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from src.upbit.model.order import OrderResult, OrderSide, OrderState, OrderType
 
 
@@ -47,3 +49,45 @@ class TestOrderResult:
         # 숫자 타입 변환 검증 (문자열 → float)
         assert order.price == 60000000.0
         assert order.volume == 0.01
+
+    def test_parse_state는_상태만_읽는다(self):
+        assert OrderResult.parse_state({"uuid": "test-uuid", "state": "wait"}) == OrderState.WAIT
+        assert OrderResult.parse_state({"state": "done"}) == OrderState.DONE
+
+    def test_parse_state_알_수_없는_상태면_ValueError(self):
+        with pytest.raises(ValueError):
+            OrderResult.parse_state({"state": "unknown"})
+
+    def test_slots_모델이라_인스턴스_딕셔너리가_없다(self):
+        order = OrderResult.from_dict(
+            {
+                "uuid": "test-uuid",
+                "side": "bid",
+                "ord_type": "price",
+                "price": "5000",
+                "state": "done",
+                "market": "KRW-BTC",
+                "created_at": "2025-10-10T14:00:00+09:00",
+                "reserved_fee": "2.5",
+                "remaining_fee": "0",
+                "paid_fee": "2.5",
+                "locked": "0",
+                "executed_volume": "0.0001",
+                "trades_count": 1,
+                "trades": [
+                    {
+                        "market": "KRW-BTC",
+                        "uuid": "trade-uuid",
+                        "price": "50000000",
+                        "volume": "0.0001",
+                        "funds": "5000",
+                        "trend": "up",
+                        "created_at": "2025-10-10T14:00:00+09:00",
+                        "side": "bid",
+                    }
+                ],
+            }
+        )
+
+        assert not hasattr(order, "__dict__")
+        assert not hasattr(order.trades[0], "__dict__")
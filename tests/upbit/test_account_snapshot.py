@@ -0,0 +1,77 @@
+"""잔고 스냅샷 테스트"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.upbit.account_snapshot import AccountSnapshot
+from src.upbit.model.balance import BalanceInfo
+from src.upbit.model.error import UpbitAPIError
+from src.upbit.upbit_api import UpbitAPI
+
+
+def balance(currency: str, amount: float, unit_currency: str = "KRW") -> BalanceInfo:
+    return BalanceInfo(currency=currency, balance=amount, locked=0.0, avg_buy_price=0.0, avg_buy_price_modified=False, unit_currency=unit_currency)
+
+
+class TestAccountSnapshot:
+    def test_TTL_안에서는_한_번만_조회한다(self):
+        loader = Mock(return_value=[balance("KRW", 1000.0), balance("BTC", 0.5)])
+        snapshot = AccountSnapshot(loader, ttl=60)
+
+        assert snapshot.available("KRW") == 1000.0
+        assert snapshot.available("KRW-BTC") == 0.5
+        assert snapshot.available("KRW-ETH") == 0.0
+        assert len(snapshot.balances()) == 2
+        loader.assert_called_once()
+
+    def test_TTL이_지나면_다시_조회한다(self):
+        loader = Mock(return_value=[balance("KRW", 1000.0)])
+        snapshot = AccountSnapshot(loader, ttl=60)
+
+        with patch("src.upbit.account_snapshot.time.monotonic", side_effect=[0.0, 30.0, 61.0, 61.0]):
+            snapshot.available("KRW")
+            snapshot.available("KRW")
+            snapshot.available("KRW")
+
+        assert loader.call_count == 2
+
+    def test_invalidate_후에는_다시_조회한다(self):
+        loader = Mock(side_effect=[[balance("KRW", 1000.0)], [balance("KRW", 500.0)]])
+        snapshot = AccountSnapshot(loader, ttl=60)
+
+        assert snapshot.available("KRW") == 1000.0
+        snapshot.invalidate()
+        assert snapshot.available("KRW") == 500.0
+
+    def test_조회_실패는_저장하지_않고_전파한다(self):
+        loader = Mock(side_effect=[UpbitAPIError({"name": "server_error", "message": "실패"}), [balance("KRW", 1000.0)]])
+        snapshot = AccountSnapshot(loader, ttl=60)
+
+        with pytest.raises(UpbitAPIError):
+            snapshot.available("KRW")
+        assert snapshot.available("KRW") == 1000.0
+
+
+class TestUpbitAPIAccountSnapshot:
+    @pytest.fixture
+    def api(self, mock_upbit_config, mock_upbit_class, mock_upbit_instance):
+        mock_upbit_instance.get_balances.return_value = [
+            {"currency": "KRW", "balance": "1000", "locked": "0", "avg_buy_price": "0", "avg_buy_price_modified": False, "unit_currency": "KRW"},
+        ]
+        return UpbitAPI(mock_upbit_config, balance_ttl=60)
+
+    def test_여러_통화_조회에_잔고_API는_한_번만_호출한다(self, api, mock_upbit_instance):
+        api.get_available_amount("KRW")
+        api.get_available_amount("KRW-BTC")
+        api.get_balances()
+
+        mock_upbit_instance.get_balances.assert_called_once()
+
+    def test_주문을_넣으면_스냅샷을_무효화한다(self, api, mock_upbit_instance):
+        api.get_available_amount("KRW")
+        with patch("src.upbit.upbit_api.OrderResult.from_dict", return_value=MagicMock()):
+            api.buy_market_order("KRW-BTC", 5000)
+        api.get_available_amount("KRW")
+
+        assert mock_upbit_instance.get_balances.call_count == 2
@@ -0,0 +1,126 @@
+"""캔들 히스토리 병렬 조회 테스트"""
+
+import datetime
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.upbit.candle_history import CandleHistoryFetcher
+from src.upbit.upbit_api import CandleInterval, UpbitAPI
+
+TO = datetime.datetime(2025, 1, 10)
+KST_OFFSET = datetime.timedelta(hours=9)
+
+
+def fake_candle_page(path, ticker, count, to):
+    """to 직전 count개의 시간봉 (최신순)"""
+    starts = [to - datetime.timedelta(hours=i) for i in range(1, count + 1)]
+    return [
+        {
+            "candle_date_time_utc": start.isoformat(),
+            "candle_date_time_kst": (start + KST_OFFSET).isoformat(),
+            "opening_price": 100.0,
+            "high_price": 110.0,
+            "low_price": 90.0,
+            "trade_price": 105.0,
+            "candle_acc_trade_volume": 1.0,
+            "candle_acc_trade_price": 105.0,
+        }
+        for start in starts
+    ]
+
+
+def gapped_candle_page(path, ticker, count, to, listed_at=TO - datetime.timedelta(hours=1000)):
+    """거래가 없는 시각(5의 배수 시)의 캔들이 빠진 시간봉 (최신순). listed_at 이전에는 캔들이 없다"""
+    candles = []
+    start = to - datetime.timedelta(hours=1)
+    while len(candles) < count and start >= listed_at:
+        if start.hour % 5:
+            candles.extend(fake_candle_page(path, ticker, 1, start + datetime.timedelta(hours=1)))
+        start -= datetime.timedelta(hours=1)
+    return candles
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.get_candle_page.side_effect = fake_candle_page
+    return client
+
+
+class TestCandleHistoryFetcher:
+    def test_페이지별_to_커서를_미리_계산한다(self):
+        cursors = CandleHistoryFetcher.page_cursors("minute60", 450, TO)
+
+        assert cursors == [
+            (TO, 200),
+            (TO - datetime.timedelta(hours=200), 200),
+            (TO - datetime.timedelta(hours=400), 50),
+        ]
+
+    def test_페이지를_합쳐_중복_없이_오름차순으로_반환한다(self, client):
+        df = CandleHistoryFetcher(client).fetch("KRW-BTC", "minute60", 450, to=TO)
+
+        assert len(df) == 450
+        assert df.index.is_monotonic_increasing
+        assert df.index.is_unique
+        assert df.index[-1] == pd.Timestamp(TO - datetime.timedelta(hours=1) + KST_OFFSET)
+        assert client.get_candle_page.call_count == 3
+
+    def test_페이지를_동시에_조회한다(self, client):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_all_pages(*args: object):
+            barrier.wait()  # 3개 페이지가 동시에 요청되지 않으면 타임아웃
+            return fake_candle_page(*args)
+
+        client.get_candle_page.side_effect = wait_for_all_pages
+
+        df = CandleHistoryFetcher(client, max_workers=3).fetch("KRW-BTC", "minute60", 600, to=TO)
+
+        assert len(df) == 600
+
+    def test_sink에_페이지를_최신순으로_전달한다(self, client):
+        pages = []
+
+        total = CandleHistoryFetcher(client, max_workers=2).fetch_to_sink("KRW-BTC", "minute60", 450, sink=pages.append, to=TO)
+
+        assert total == 450
+        assert [len(page) for page in pages] == [200, 200, 50]
+        assert pages[0].index[0] > pages[1].index[-1]
+
+    def test_캔들이_빠진_구간이_있으면_모자란_만큼_이어서_조회한다(self, client):
+        client.get_candle_page.side_effect = gapped_candle_page
+
+        df = CandleHistoryFetcher(client).fetch("KRW-BTC", "minute60", 450, to=TO)
+
+        assert len(df) == 450
+        assert df.index.is_unique
+        assert df.index.is_monotonic_increasing
+        assert df.index[-1] == pd.Timestamp(TO - datetime.timedelta(hours=1) + KST_OFFSET)
+        assert client.get_candle_page.call_count > 3
+
+    def test_상장_이전까지_조회해도_모자라면_있는_만큼_반환한다(self, client):
+        client.get_candle_page.side_effect = gapped_candle_page
+
+        listed = len(gapped_candle_page(None, "KRW-BTC", 1000, TO))
+
+        df = CandleHistoryFetcher(client).fetch("KRW-BTC", "minute60", 900, to=TO)
+
+        assert listed < 900
+        assert len(df) == listed
+        assert df.index.is_unique
+
+    def test_월봉은_지원하지_않는다(self, client):
+        with pytest.raises(ValueError):
+            list(CandleHistoryFetcher(client).iter_pages("KRW-BTC", "month", 300))
+
+
+class TestGetCandlesHistory:
+    def test_200개_초과는_병렬_조회기를_사용한다(self):
+        with patch.object(UpbitAPI.candle_history, "fetch", return_value=pd.DataFrame()) as mock_fetch:
+            UpbitAPI.get_candles(interval=CandleInterval.MINUTE_60, count=504)
+
+        mock_fetch.assert_called_once_with("KRW-BTC", "minute60", 504)
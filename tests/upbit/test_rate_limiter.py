@@ -0,0 +1,89 @@
+"""업비트 요청 수 제한기 테스트"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.common.metrics import InMemoryMetricsSink
+from src.upbit.rate_limiter import TokenBucket, UpbitRateLimiter, parse_remaining_req
+
+
+class TestParseRemainingReq:
+    def test_헤더를_딕셔너리로_파싱한다(self):
+        assert parse_remaining_req("group=default; min=1800; sec=29") == {"group": "default", "min": "1800", "sec": "29"}
+
+    def test_헤더가_없으면_빈_딕셔너리(self):
+        assert parse_remaining_req(None) == {}
+
+
+class TestTokenBucket:
+    def test_토큰이_부족하면_충전될_때까지의_대기_시간을_반환한다(self):
+        bucket = TokenBucket(rate=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+        assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+    def test_서버가_알려준_남은_요청_수로_낮춘다(self):
+        bucket = TokenBucket(rate=10)
+
+        bucket.sync(3)
+
+        assert bucket.tokens == pytest.approx(3, abs=0.1)
+
+
+class TestUpbitRateLimiter:
+    @pytest.mark.parametrize(
+        ("method", "path", "group"),
+        [
+            ("GET", "/v1/ticker", "ticker"),
+            ("GET", "/v1/candles/minutes/60", "candle"),
+            ("GET", "/v1/accounts", "default"),
+            ("GET", "/v1/order", "default"),
+            ("POST", "/v1/orders", "order"),
+            ("DELETE", "/v1/order", "order"),
+        ],
+    )
+    def test_경로로_그룹을_결정한다(self, method, path, group):
+        assert UpbitRateLimiter.group_for(method, path) == group
+
+    def test_429_응답이면_버킷을_비우고_기록한다(self):
+        metrics = InMemoryMetricsSink()
+        limiter = UpbitRateLimiter(metrics_sink=metrics)
+
+        limiter.update({"Remaining-Req": "group=order; sec=5"}, status_code=429)
+
+        assert limiter.bucket("order").tokens < 1
+        assert metrics.counter("ratelimit.rejected", group="order") == 1
+
+    def test_대기_시간을_메트릭으로_기록한다(self):
+        metrics = InMemoryMetricsSink()
+        limiter = UpbitRateLimiter(rates={"ticker": 100}, metrics_sink=metrics)
+        limiter.bucket("ticker").drain()
+
+        limiter.acquire("ticker")
+
+        histogram = metrics.histogram("ratelimit.wait.seconds", group="ticker")
+        assert histogram is not None and histogram.total > 0
+        assert metrics.counter("ratelimit.throttled", group="ticker") == 1
+
+    def test_스레드와_asyncio가_같은_버킷을_공유한다(self):
+        limiter = UpbitRateLimiter(rates={"ticker": 50})
+        limiter.bucket("ticker").drain()
+
+        async def acquire_async():
+            await asyncio.gather(*(limiter.acquire_async("ticker") for _ in range(5)))
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire, args=("ticker",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        asyncio.run(acquire_async())
+        for thread in threads:
+            thread.join()
+
+        # 토큰이 없는 상태에서 10건은 초당 50건 속도로 0.2초가 걸린다
+        assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
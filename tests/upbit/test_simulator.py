@@ -0,0 +1,130 @@
+"""업비트 로컬 시뮬레이터 테스트"""
+
+import datetime
+import time
+from http import HTTPStatus
+
+import pytest
+import requests
+
+from src.upbit.model.order import OrderState
+from src.upbit.simulator import SimulatedExchange, SimulatorConfig, SimulatorError, UpbitSimulator
+from src.upbit.upbit_api import CandleInterval, UpbitAPI
+from src.upbit.upbit_client import CANDLE_PATHS
+from src.upbit.upbit_websocket import UpbitOrderStream, UpbitTickerFeed
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def simulator():
+    with UpbitSimulator(SimulatorConfig(fill_delay=0.05, tick_interval=0.02, initial_prices={"KRW-BTC": 100_000_000.0})) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def redirected(simulator):
+    """UpbitAPI 시세 요청을 시뮬레이터로 보내고, 테스트가 끝나면 되돌린다"""
+    base_url, quotation_client, candle_history = UpbitAPI.base_url, UpbitAPI.quotation_client, UpbitAPI.candle_history
+    UpbitAPI.redirect(simulator.base_url)
+    yield simulator
+    UpbitAPI.base_url, UpbitAPI.quotation_client, UpbitAPI.candle_history = base_url, quotation_client, candle_history
+
+
+class TestSimulatedExchange:
+    def test_그룹별_초당_요청_수를_넘으면_429(self):
+        exchange = SimulatedExchange(SimulatorConfig())
+
+        remaining = [exchange.admit("GET", "/v1/ticker") for _ in range(10)]
+        with pytest.raises(SimulatorError) as exc_info:
+            exchange.admit("GET", "/v1/ticker")
+
+        assert remaining[0] == "group=ticker; min=600; sec=9"
+        assert exc_info.value.status == HTTPStatus.TOO_MANY_REQUESTS
+        assert exc_info.value.remaining_req.endswith("sec=0")
+        exchange.admit("GET", "/v1/accounts")  # 다른 그룹은 영향 없음
+
+    def test_reject_rate로_429를_주입한다(self):
+        exchange = SimulatedExchange(SimulatorConfig(reject_rate=1.0, enforce_rate_limit=False))
+
+        with pytest.raises(SimulatorError):
+            exchange.admit("GET", "/v1/ticker")
+        assert exchange.stats["injected"] == 1
+
+    def test_캔들은_페이지를_나눠_조회해도_같다(self):
+        exchange = SimulatedExchange(SimulatorConfig())
+        to = datetime.datetime(2024, 1, 1, 12, 30)
+
+        first = exchange.candles(CANDLE_PATHS["minute60"], "KRW-BTC", 3, to)
+        second = exchange.candles(CANDLE_PATHS["minute60"], "KRW-BTC", 2, datetime.datetime(2024, 1, 1, 12, 0))
+
+        assert [candle["candle_date_time_utc"] for candle in first] == ["2024-01-01T12:00:00", "2024-01-01T11:00:00", "2024-01-01T10:00:00"]
+        assert first[1:] == second
+
+    def test_잔고가_부족하면_주문을_거절한다(self):
+        exchange = SimulatedExchange(SimulatorConfig(initial_krw=1000))
+
+        with pytest.raises(SimulatorError) as exc_info:
+            exchange.create_order({"market": "KRW-BTC", "side": "bid", "price": "5000", "ord_type": "price"})
+
+        assert exc_info.value.name == "insufficient_funds_bid"
+
+
+class TestUpbitSimulatorRest:
+    def test_시세와_캔들을_UpbitAPI로_조회한다(self, redirected):
+        prices = UpbitAPI.get_current_prices(["KRW-BTC", "KRW-ETH"])
+        candles = UpbitAPI.get_candles("KRW-ETH", CandleInterval.MINUTE_60, count=250)
+
+        assert set(prices) == {"KRW-BTC", "KRW-ETH"}
+        assert prices["KRW-BTC"] == pytest.approx(100_000_000.0, rel=0.1)
+        assert len(candles) == 250
+        assert candles.index.is_monotonic_increasing
+
+    def test_주문하고_체결까지_기다린다(self, redirected):
+        api = UpbitAPI(redirected.config_for_api(), balance_ttl=0)
+        krw_before = api.get_available_amount("KRW")
+
+        order = api.buy_market_order_and_wait("KRW-BTC", 1_000_000)
+
+        assert order.state == OrderState.DONE
+        assert order.trades[0].funds == pytest.approx(1_000_000)
+        assert api.get_available_amount("KRW-BTC") == pytest.approx(order.executed_volume)
+        assert api.get_available_amount("KRW") == pytest.approx(krw_before - 1_000_000 * 1.0005)
+        assert [result.state for result in api.get_orders([order.uuid])] == [OrderState.DONE]
+
+    def test_서명이_틀리면_401(self, simulator):
+        response = requests.get(f"{simulator.base_url}/v1/accounts", headers={"Authorization": "Bearer a.b.c"}, timeout=5)
+
+        assert response.status_code == 401
+        assert response.json()["error"]["name"] == "invalid_access_key"
+        assert "Remaining-Req" in response.headers
+
+
+class TestUpbitSimulatorWebSocket:
+    def test_ticker_스트림으로_가격을_보낸다(self, simulator):
+        feed = UpbitTickerFeed(["KRW-BTC"], url=simulator.websocket_url)
+        feed.start()
+        try:
+            assert feed.wait_connected(5)
+            assert wait_until(lambda: feed.price("KRW-BTC") is not None)
+            assert feed.price("KRW-BTC") == pytest.approx(100_000_000.0, rel=0.1)
+        finally:
+            feed.stop()
+
+    def test_체결되면_myOrder로_완료를_알린다(self, redirected):
+        stream = UpbitOrderStream(redirected.access_key, redirected.secret_key, url=redirected.private_websocket_url)
+        stream.start()
+        try:
+            assert stream.wait_connected(5)
+            order = UpbitAPI(redirected.config_for_api()).buy_market_order("KRW-BTC", 10_000)
+
+            assert stream.watch(order.uuid).result(timeout=5) == OrderState.DONE
+        finally:
+            stream.stop()
@@ -14,7 +14,7 @@ from src.upbit.upbit_api import UpbitAPI
 class TestGetCandles:
     """get_candles 함수 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.get_ohlcv")
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_ohlcv")
     def test_get_candles_여러_캔들_반환(self, mock_get_ohlcv):
         """get_candles는 여러 개의 캔들 데이터를 DataFrame으로 반환할 수 있다"""
 
@@ -41,7 +41,7 @@ class TestGetCandles:
         assert len(result) == 2
         assert list(result.columns) == ["open", "high", "low", "close", "volume", "value"]
 
-    @patch("src.upbit.upbit_api.pyupbit.get_ohlcv")
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_ohlcv")
     def test_get_candles_API_호출_실패시_빈_DataFrame_반환(self, mock_get_ohlcv):
         """API 호출 실패 시 빈 DataFrame을 반환한다"""
         mock_get_ohlcv.return_value = None
@@ -55,20 +55,20 @@ class TestGetCandles:
 class TestGetCurrentPrice:
     """get_current_price 함수 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.get_current_price")
-    def test_get_current_price_정상_반환(self, mock_pyupbit):
-        """pyupbit가 정상 가격을 반환하면 그대로 반환한다"""
-        mock_pyupbit.return_value = 95000000.0
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_price")
+    def test_get_current_price_정상_반환(self, mock_get_current_price):
+        """클라이언트가 정상 가격을 반환하면 그대로 반환한다"""
+        mock_get_current_price.return_value = 95000000.0
 
         result = UpbitAPI.get_current_price()
 
         assert result == 95000000.0
         assert isinstance(result, float)
 
-    @patch("src.upbit.upbit_api.pyupbit.get_current_price")
-    def test_get_current_price_실패시_0_반환(self, mock_pyupbit):
-        """pyupbit가 None을 반환하면 0을 반환한다"""
-        mock_pyupbit.return_value = None
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_price")
+    def test_get_current_price_실패시_0_반환(self, mock_get_current_price):
+        """클라이언트가 None을 반환하면 0을 반환한다"""
+        mock_get_current_price.return_value = None
 
         result = UpbitAPI.get_current_price()
 
@@ -76,15 +76,64 @@ class TestGetCurrentPrice:
         assert isinstance(result, float)
 
 
+class TestGetCurrentPrices:
+    """get_current_prices 함수 테스트"""
+
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_prices")
+    def test_get_current_prices_한_번의_요청으로_조회(self, mock_get_current_prices):
+        """중복을 제거한 티커 목록으로 한 번만 조회한다"""
+        mock_get_current_prices.return_value = {"KRW-BTC": 95000000.0, "KRW-ETH": 5000000.0}
+
+        result = UpbitAPI.get_current_prices(["KRW-BTC", "KRW-ETH", "KRW-BTC"])
+
+        assert result == {"KRW-BTC": 95000000.0, "KRW-ETH": 5000000.0}
+        mock_get_current_prices.assert_called_once_with(["KRW-BTC", "KRW-ETH"])
+
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_prices")
+    def test_get_current_prices_실패시_빈_딕셔너리_반환(self, mock_get_current_prices):
+        mock_get_current_prices.return_value = None
+
+        assert UpbitAPI.get_current_prices(["KRW-BTC"]) == {}
+
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_prices")
+    def test_get_current_prices_제너레이터도_피드에_없는_티커는_REST로_조회(self, mock_get_current_prices):
+        """티커를 한 번만 순회하므로 제너레이터를 넘겨도 피드에 없는 티커가 빠지지 않는다"""
+        price_feed = MagicMock()
+        price_feed.price.side_effect = lambda ticker: 95000000.0 if ticker == "KRW-BTC" else None
+        mock_get_current_prices.return_value = {"KRW-ETH": 5000000.0}
+
+        with patch.object(UpbitAPI, "price_feed", price_feed):
+            result = UpbitAPI.get_current_prices(ticker for ticker in ["KRW-BTC", "KRW-ETH"])
+
+        assert result == {"KRW-BTC": 95000000.0, "KRW-ETH": 5000000.0}
+        mock_get_current_prices.assert_called_once_with(["KRW-ETH"])
+
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_prices")
+    def test_get_current_prices_빈_목록은_요청하지_않음(self, mock_get_current_prices):
+        assert UpbitAPI.get_current_prices([]) == {}
+        mock_get_current_prices.assert_not_called()
+
+
+def balance_row(currency: str, balance: str, unit_currency: str = "KRW") -> dict:
+    return {
+        "currency": currency,
+        "balance": balance,
+        "locked": "0.0",
+        "avg_buy_price": "0",
+        "avg_buy_price_modified": False,
+        "unit_currency": unit_currency,
+    }
+
+
 class TestUpbitAPIGetBalance:
     """UpbitAPI.get_balance 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balance_정상_반환(self, mock_upbit_class):
-        """upbit.get_balance가 정상 잔고를 반환하면 그대로 반환한다"""
+        """전체 잔고에서 KRW 주문 가능 수량을 반환한다"""
         # Mock 설정
         mock_upbit_instance = MagicMock()
-        mock_upbit_instance.get_balance.return_value = 1000000.0
+        mock_upbit_instance.get_balances.return_value = [balance_row("KRW", "1000000.0"), balance_row("BTC", "0.5")]
         mock_upbit_class.return_value = mock_upbit_instance
 
         # Config mock
@@ -98,14 +147,14 @@ class TestUpbitAPIGetBalance:
 
             assert result == 1000000.0
             assert isinstance(result, float)
-            mock_upbit_instance.get_balance.assert_called_once_with("KRW")
+            mock_upbit_instance.get_balances.assert_called_once_with()
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balance_실패시_0_반환(self, mock_upbit_class):
-        """upbit.get_balance가 None을 반환하면 0.0을 반환한다"""
+        """잔고 조회가 실패하면 0.0을 반환한다"""
         # Mock 설정
         mock_upbit_instance = MagicMock()
-        mock_upbit_instance.get_balance.return_value = None
+        mock_upbit_instance.get_balances.return_value = None
         mock_upbit_class.return_value = mock_upbit_instance
 
         # Config mock
@@ -120,11 +169,11 @@ class TestUpbitAPIGetBalance:
             assert result == 0.0
             assert isinstance(result, float)
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balance_ticker_파라미터_전달(self, mock_upbit_class):
-        """ticker 파라미터가 올바르게 전달된다"""
+        """통화 코드로 조회한다"""
         mock_upbit_instance = MagicMock()
-        mock_upbit_instance.get_balance.return_value = 1.5
+        mock_upbit_instance.get_balances.return_value = [balance_row("KRW", "1000000.0"), balance_row("BTC", "1.5")]
         mock_upbit_class.return_value = mock_upbit_instance
 
         with patch("src.upbit.upbit_api.UpbitConfig") as mock_config_class:
@@ -136,13 +185,12 @@ class TestUpbitAPIGetBalance:
             result = api.get_available_amount(ticker="BTC")
 
             assert result == 1.5
-            mock_upbit_instance.get_balance.assert_called_once_with("BTC")
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balance_ticker_형식_전달(self, mock_upbit_class):
-        """ticker 형식('KRW-BTC')이 올바르게 전달된다"""
+        """ticker 형식('KRW-BTC')으로 조회한다"""
         mock_upbit_instance = MagicMock()
-        mock_upbit_instance.get_balance.return_value = 0.5
+        mock_upbit_instance.get_balances.return_value = [balance_row("KRW", "1000000.0"), balance_row("BTC", "0.5")]
         mock_upbit_class.return_value = mock_upbit_instance
 
         with patch("src.upbit.upbit_api.UpbitConfig") as mock_config_class:
@@ -154,13 +202,12 @@ class TestUpbitAPIGetBalance:
             result = api.get_available_amount(ticker="KRW-BTC")
 
             assert result == 0.5
-            mock_upbit_instance.get_balance.assert_called_once_with("KRW-BTC")
 
 
 class TestUpbitAPIGetBalances:
     """UpbitAPI.get_balances 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balances_정상_반환(self, mock_upbit_class):
         """정상 응답 시 BalanceInfo 리스트를 반환한다"""
         # Mock 설정
@@ -199,7 +246,7 @@ class TestUpbitAPIGetBalances:
             assert result[0].currency == "KRW"
             assert result[1].currency == "BTC"
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balances_에러_응답시_예외_발생(self, mock_upbit_class):
         """에러 응답 시 UpbitAPIError 예외를 발생시킨다"""
         # Mock 설정 - 에러 응답
@@ -220,7 +267,7 @@ class TestUpbitAPIGetBalances:
             assert exc_info.value.message == "This is not a verified IP."
             assert exc_info.value.name == "no_authorization_ip"
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balances_None_응답시_예외_발생(self, mock_upbit_class):
         """None 응답 시 UpbitAPIError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -240,7 +287,17 @@ class TestUpbitAPIGetBalances:
             assert exc_info.value.message == "API 응답이 비어있습니다"
             assert exc_info.value.name == "empty_response"
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
+    def test_get_balances_목록이_아닌_응답시_예외_발생(self, mock_upbit_class):
+        """error 필드 없는 딕셔너리 응답 시 UpbitAPIError 예외를 발생시킨다"""
+        mock_upbit_class.return_value.get_balances.return_value = {"currency": "KRW"}
+
+        with pytest.raises(UpbitAPIError) as exc_info:
+            UpbitAPI(MagicMock()).get_balances()
+
+        assert exc_info.value.name == "unexpected_response"
+
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_get_balances_빈_리스트_응답시_빈_리스트_반환(self, mock_upbit_class):
         """빈 리스트 응답 시 빈 리스트를 반환한다"""
         mock_upbit_instance = MagicMock()
@@ -261,7 +318,7 @@ class TestUpbitAPIGetBalances:
 class TestUpbitAPIBuyMarketOrder:
     """UpbitAPI.buy_market_order 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_buy_market_order_amount가_0일때_예외_발생(self, mock_upbit_class):
         """amount가 0일 때 ValueError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -280,7 +337,7 @@ class TestUpbitAPIBuyMarketOrder:
             assert "amount는 0보다 커야 합니다" in str(exc_info.value)
             mock_upbit_instance.buy_market_order.assert_not_called()
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_buy_market_order_amount가_음수일때_예외_발생(self, mock_upbit_class):
         """amount가 음수일 때 ValueError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -299,7 +356,7 @@ class TestUpbitAPIBuyMarketOrder:
             assert "amount는 0보다 커야 합니다" in str(exc_info.value)
             mock_upbit_instance.buy_market_order.assert_not_called()
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_buy_market_order_에러_응답시_예외_발생(self, mock_upbit_class):
         """에러 응답 시 UpbitAPIError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -319,7 +376,7 @@ class TestUpbitAPIBuyMarketOrder:
             assert exc_info.value.message == "Insufficient funds."
             assert exc_info.value.name == "insufficient_funds"
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_buy_market_order_정상_반환(self, mock_upbit_class):
         """정상 응답 시 OrderResult 객체를 반환한다"""
         mock_upbit_instance = MagicMock()
@@ -360,7 +417,7 @@ class TestUpbitAPIBuyMarketOrder:
 class TestUpbitAPISellMarketOrder:
     """UpbitAPI.sell_market_order 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_market_order_volume이_0일때_예외_발생(self, mock_upbit_class):
         """volume이 0일 때 ValueError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -379,7 +436,7 @@ class TestUpbitAPISellMarketOrder:
             assert "volume은 0보다 커야 합니다" in str(exc_info.value)
             mock_upbit_instance.sell_market_order.assert_not_called()
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_market_order_volume이_음수일때_예외_발생(self, mock_upbit_class):
         """volume이 음수일 때 ValueError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -398,7 +455,7 @@ class TestUpbitAPISellMarketOrder:
             assert "volume은 0보다 커야 합니다" in str(exc_info.value)
             mock_upbit_instance.sell_market_order.assert_not_called()
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_market_order_에러_응답시_예외_발생(self, mock_upbit_class):
         """에러 응답 시 UpbitAPIError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -418,7 +475,7 @@ class TestUpbitAPISellMarketOrder:
             assert exc_info.value.message == "Insufficient volume."
             assert exc_info.value.name == "insufficient_volume"
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_market_order_정상_반환(self, mock_upbit_class):
         """정상 응답 시 OrderResult 객체를 반환한다"""
         mock_upbit_instance = MagicMock()
@@ -459,7 +516,7 @@ class TestUpbitAPISellMarketOrder:
 class TestUpbitAPISellMarketOrderByPrice:
     """UpbitAPI.sell_market_order_by_price 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_market_order_by_price_price가_0일때_예외_발생(self, mock_upbit_class):
         """price가 0일 때 ValueError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -477,7 +534,7 @@ class TestUpbitAPISellMarketOrderByPrice:
 
             assert "price는 0보다 커야 합니다" in str(exc_info.value)
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_market_order_by_price_price가_음수일때_예외_발생(self, mock_upbit_class):
         """price가 음수일 때 ValueError 예외를 발생시킨다"""
         mock_upbit_instance = MagicMock()
@@ -495,7 +552,7 @@ class TestUpbitAPISellMarketOrderByPrice:
 
             assert "price는 0보다 커야 합니다" in str(exc_info.value)
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     @patch("src.upbit.upbit_api.UpbitAPI.get_current_price")
     def test_sell_market_order_by_price_정상_반환(self, mock_get_current_price, mock_upbit_class):
         """현재가로 수량 계산 후 매도 주문을 정상적으로 수행한다"""
@@ -542,7 +599,7 @@ class TestUpbitAPISellMarketOrderByPrice:
             # volume = 50000.0 / 100000000.0 = 0.0005
             mock_upbit_instance.sell_market_order.assert_called_once_with("KRW-BTC", 0.0005)
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     @patch("src.upbit.upbit_api.UpbitAPI.get_current_price")
     def test_sell_market_order_by_price_현재가_0일때_예외_발생(self, mock_get_current_price, mock_upbit_class):
         """현재가가 0일 때 ValueError 예외를 발생시킨다"""
@@ -571,12 +628,12 @@ class TestUpbitAPISellMarketOrderByPrice:
 class TestUpbitAPISellAll:
     """UpbitAPI.sell_all 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_all_보유_수량이_있을때_정상_매도(self, mock_upbit_class):
         """보유 수량이 있을 때 전량 매도하고 OrderResult를 반환한다"""
         # Mock 설정
         mock_upbit_instance = MagicMock()
-        mock_upbit_instance.get_balance.return_value = 0.5  # BTC 0.5개 보유
+        mock_upbit_instance.get_balances.return_value = [balance_row("BTC", "0.5")]  # BTC 0.5개 보유
         mock_upbit_instance.sell_market_order.return_value = {
             "uuid": "test-uuid-sell-all",
             "side": "ask",
@@ -609,18 +666,18 @@ class TestUpbitAPISellAll:
             assert result.uuid == "test-uuid-sell-all"
             assert result.side == OrderSide.ASK
 
-            # get_balance가 올바른 ticker로 호출되었는지 확인
-            mock_upbit_instance.get_balance.assert_called_once_with("KRW-BTC")
+            # 잔고는 전체 잔고 조회 한 번으로 확인
+            mock_upbit_instance.get_balances.assert_called_once_with()
 
             # sell_market_order가 올바른 volume으로 호출되었는지 확인
             mock_upbit_instance.sell_market_order.assert_called_once_with("KRW-BTC", 0.5)
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     def test_sell_all_보유_수량이_0일때_None_반환(self, mock_upbit_class):
         """보유 수량이 0일 때 None을 반환하고 에러를 발생시키지 않는다"""
         # Mock 설정
         mock_upbit_instance = MagicMock()
-        mock_upbit_instance.get_balance.return_value = 0.0  # 보유 수량 없음
+        mock_upbit_instance.get_balances.return_value = [balance_row("KRW", "1000000.0")]  # 보유 수량 없음
         mock_upbit_class.return_value = mock_upbit_instance
 
         with patch("src.upbit.upbit_api.UpbitConfig") as mock_config_class:
@@ -634,8 +691,8 @@ class TestUpbitAPISellAll:
             # 검증
             assert result is None
 
-            # get_balance는 호출되어야 함
-            mock_upbit_instance.get_balance.assert_called_once_with("KRW-ETH")
+            # 잔고 조회는 호출되어야 함
+            mock_upbit_instance.get_balances.assert_called_once_with()
 
             # sell_market_order는 호출되지 않아야 함
             mock_upbit_instance.sell_market_order.assert_not_called()
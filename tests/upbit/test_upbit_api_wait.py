@@ -1,5 +1,7 @@
 """업비트 API 주문 완료 대기 기능 테스트"""
 
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,12 +9,13 @@ import pytest
 from src.upbit.model.error import OrderTimeoutError
 from src.upbit.model.order import OrderResult, OrderSide, OrderState
 from src.upbit.upbit_api import UpbitAPI
+from src.upbit.upbit_websocket import UpbitOrderStream
 
 
 class TestUpbitAPIWaitForOrderCompletion:
     """UpbitAPI.wait_for_order_completion 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     @patch("src.upbit.upbit_api.time.sleep")
     def test_wait_for_order_completion_즉시_완료(self, mock_sleep, mock_upbit_class):
         """주문이 즉시 완료(done) 상태일 때 바로 반환한다"""
@@ -50,7 +53,7 @@ class TestUpbitAPIWaitForOrderCompletion:
             mock_upbit_instance.get_order.assert_called_once_with("test-uuid-done")
             mock_sleep.assert_not_called()  # 즉시 완료되어 sleep 불필요
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     @patch("src.upbit.upbit_api.time.sleep")
     def test_wait_for_order_completion_여러번_폴링_후_완료(self, mock_sleep, mock_upbit_class):
         """주문이 대기 상태에서 완료 상태로 변경될 때까지 폴링한다"""
@@ -124,7 +127,7 @@ class TestUpbitAPIWaitForOrderCompletion:
             assert mock_upbit_instance.get_order.call_count == 3
             assert mock_sleep.call_count == 2  # 2번 폴링 후 완료
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     @patch("src.upbit.upbit_api.time.sleep")
     @patch("src.upbit.upbit_api.time.time")
     def test_wait_for_order_completion_타임아웃시_예외_발생(self, mock_time, mock_sleep, mock_upbit_class):
@@ -164,10 +167,138 @@ class TestUpbitAPIWaitForOrderCompletion:
             assert "주문 완료 대기 시간 초과" in str(exc_info.value)
 
 
+class TestUpbitAPIWaitForOrderCompletionWithStream:
+    """체결 스트림을 사용한 주문 완료 대기 테스트"""
+
+    @staticmethod
+    def order_response(state: str) -> dict:
+        return {
+            "uuid": "test-uuid",
+            "side": "bid",
+            "ord_type": "price",
+            "price": "50000",
+            "state": state,
+            "market": "KRW-BTC",
+            "created_at": "2024-01-01T00:00:00+09:00",
+            "volume": "0.001",
+            "remaining_volume": "0",
+            "reserved_fee": "25",
+            "remaining_fee": "0",
+            "paid_fee": "25",
+            "locked": "0",
+            "executed_volume": "0.001",
+            "trades_count": 1,
+        }
+
+    @pytest.fixture
+    def order_stream(self):
+        stream = MagicMock(spec=UpbitOrderStream)
+        with patch.object(UpbitAPI, "order_stream", stream):
+            yield stream
+
+    @patch("src.upbit.upbit_api.UpbitClient")
+    @patch("src.upbit.upbit_api.time.sleep")
+    def test_스트림이_연결되어_있으면_완료_이벤트_후_한_번만_조회한다(self, mock_sleep, mock_upbit_class, order_stream):
+        future = Future()
+        future.set_result(OrderState.DONE)
+        order_stream.connected = True
+        order_stream.watch.return_value = future
+        mock_upbit_class.return_value.get_order.return_value = self.order_response("done")
+
+        result = UpbitAPI(MagicMock()).wait_for_order_completion("test-uuid")
+
+        assert result.state == OrderState.DONE
+        mock_upbit_class.return_value.get_order.assert_called_once_with("test-uuid")
+        mock_sleep.assert_not_called()
+        order_stream.discard.assert_called_once_with("test-uuid")
+
+    @patch("src.upbit.upbit_api.UpbitClient")
+    @patch("src.upbit.upbit_api.time.sleep")
+    def test_스트림이_끊겨_있으면_간격을_늘리며_폴링한다(self, mock_sleep, mock_upbit_class, order_stream):
+        order_stream.connected = False
+        order_stream.watch.return_value = Future()
+        mock_upbit_class.return_value.get_order.side_effect = [self.order_response("wait")] * 4 + [self.order_response("done")]
+
+        result = UpbitAPI(MagicMock()).wait_for_order_completion("test-uuid", poll_interval=0.5)
+
+        assert result.state == OrderState.DONE
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0, 2.0, 4.0]
+
+    @patch("src.upbit.upbit_api.UpbitClient")
+    @patch("src.upbit.upbit_api.time.sleep")
+    def test_스트림이_재연결되면_REST로_한_번_확인한다(self, mock_sleep, mock_upbit_class, order_stream):
+        # 끊긴 동안 체결 이벤트를 놓쳐 Future가 완료되지 않는 경우
+        future = MagicMock(spec=Future)
+        future.done.return_value = False
+        future.result.side_effect = lambda timeout: setattr(order_stream, "connections", 2)
+        order_stream.connected = True
+        order_stream.connections = 1
+        order_stream.watch.return_value = future
+        mock_upbit_class.return_value.get_order.return_value = self.order_response("done")
+
+        result = UpbitAPI(MagicMock()).wait_for_order_completion("test-uuid")
+
+        assert result.state == OrderState.DONE
+        mock_upbit_class.return_value.get_order.assert_called_once_with("test-uuid")
+        mock_sleep.assert_not_called()
+
+    @patch("src.upbit.upbit_api.UpbitClient")
+    @patch("src.upbit.upbit_api.time.time")
+    def test_스트림을_기다리는_동안에도_주기적으로_REST로_확인한다(self, mock_time, mock_upbit_class, order_stream):
+        future = MagicMock(spec=Future)
+        future.done.return_value = False
+        future.result.side_effect = FutureTimeoutError
+        order_stream.connected = True
+        order_stream.connections = 1
+        order_stream.watch.return_value = future
+        mock_time.side_effect = [0.0, 4.5, 4.6, 5.0, 5.0, 9.5, 9.6, 10.0]
+        mock_upbit_class.return_value.get_order.side_effect = [self.order_response("wait"), self.order_response("done")]
+
+        result = UpbitAPI(MagicMock()).wait_for_order_completion("test-uuid")
+
+        assert result.state == OrderState.DONE
+        assert mock_upbit_class.return_value.get_order.call_count == 2
+        # 다음 REST 확인 시각까지만 기다린다
+        assert [call.kwargs["timeout"] for call in future.result.call_args_list] == [0.5, 0.5]
+
+    @patch("src.upbit.upbit_api.UpbitClient")
+    @patch("src.upbit.upbit_api.time.sleep")
+    @patch("src.upbit.upbit_api.time.time")
+    def test_폴링_대기는_남은_시간을_넘지_않는다(self, mock_time, mock_sleep, mock_upbit_class):
+        mock_time.side_effect = [0.0, 29.0, 30.0]
+        mock_upbit_class.return_value.get_order.return_value = self.order_response("wait")
+
+        with pytest.raises(OrderTimeoutError):
+            UpbitAPI(MagicMock()).wait_for_order_completion("test-uuid", timeout=30.0, poll_interval=4.0)
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("src.upbit.upbit_api.UpbitClient")
+    @patch("src.upbit.upbit_api.time.sleep")
+    def test_완료되기_전에는_상태만_읽고_OrderResult를_만들지_않는다(self, mock_sleep, mock_upbit_class):
+        mock_upbit_class.return_value.get_order.side_effect = [self.order_response("wait")] * 3 + [self.order_response("done")]
+
+        with patch.object(OrderResult, "from_dict", wraps=OrderResult.from_dict) as mock_from_dict:
+            result = UpbitAPI(MagicMock()).wait_for_order_completion("test-uuid")
+
+        assert result.state == OrderState.DONE
+        assert mock_upbit_class.return_value.get_order.call_count == 4
+        mock_from_dict.assert_called_once()
+
+    @patch("src.upbit.upbit_api.UpbitClient")
+    def test_get_order_states는_주문별_상태만_반환한다(self, mock_upbit_class):
+        mock_upbit_class.return_value.get_orders.return_value = [self.order_response("wait") | {"uuid": "a"}, self.order_response("cancel") | {"uuid": "b"}]
+
+        states = UpbitAPI(MagicMock()).get_order_states(["a", "b"])
+
+        assert states == {"a": OrderState.WAIT, "b": OrderState.CANCEL}
+        mock_upbit_class.return_value.get_orders.assert_called_once_with(["a", "b"])
+
+
 class TestUpbitAPIBuyMarketOrderAndWait:
     """UpbitAPI.buy_market_order_and_wait 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     @patch("src.upbit.upbit_api.time.sleep")
     def test_buy_market_order_and_wait_정상_동작(self, mock_sleep, mock_upbit_class):
         """매수 주문 후 체결 완료까지 대기하여 완료된 OrderResult를 반환한다"""
@@ -232,7 +363,7 @@ class TestUpbitAPIBuyMarketOrderAndWait:
 class TestUpbitAPISellMarketOrderAndWait:
     """UpbitAPI.sell_market_order_and_wait 메서드 테스트"""
 
-    @patch("src.upbit.upbit_api.pyupbit.Upbit")
+    @patch("src.upbit.upbit_api.UpbitClient")
     @patch("src.upbit.upbit_api.time.sleep")
     def test_sell_market_order_and_wait_정상_동작(self, mock_sleep, mock_upbit_class):
         """매도 주문 후 체결 완료까지 대기하여 완료된 OrderResult를 반환한다"""
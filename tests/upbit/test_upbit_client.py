@@ -0,0 +1,197 @@
+"""업비트 REST 클라이언트 테스트"""
+
+import datetime
+import hashlib
+from unittest.mock import MagicMock
+from urllib.parse import urlencode
+
+import jwt
+import pytest
+
+from src.upbit.model.candle import CandleSchema
+from src.upbit.rate_limiter import UpbitRateLimiter
+from src.upbit.upbit_client import MAX_RATE_LIMIT_RETRIES, UpbitClient, create_session
+
+SECRET_KEY = "s" * 64
+
+
+def make_response(body, status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    return response
+
+
+def make_candle(kst: str, utc: str, price: float) -> dict:
+    return {
+        "candle_date_time_kst": kst,
+        "candle_date_time_utc": utc,
+        "opening_price": price,
+        "high_price": price + 10,
+        "low_price": price - 10,
+        "trade_price": price + 5,
+        "candle_acc_trade_volume": 1.5,
+        "candle_acc_trade_price": price * 1.5,
+    }
+
+
+@pytest.fixture
+def session():
+    return MagicMock()
+
+
+@pytest.fixture
+def client(session):
+    return UpbitClient("access", SECRET_KEY, session=session, rate_limiter=UpbitRateLimiter())
+
+
+class TestUpbitClientSession:
+    def test_세션은_커넥션_풀과_GET_재시도를_가진다(self):
+        session = create_session(retries=2, pool_size=8)
+
+        adapter = session.get_adapter("https://api.upbit.com")
+
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 2
+        assert "POST" not in adapter.max_retries.allowed_methods
+        # 429는 요청 수 제한기를 거쳐 클라이언트가 다시 보낸다
+        assert 429 not in adapter.max_retries.status_forcelist
+
+    def test_시세_조회는_같은_세션을_재사용한다(self, client, session):
+        session.request.return_value = make_response([{"trade_price": 100.0}])
+
+        client.get_current_price("KRW-BTC")
+        client.get_current_price("KRW-ETH")
+
+        assert session.request.call_count == 2
+        assert session.request.call_args.kwargs["timeout"] == client._timeout
+
+    def test_여러_마켓_현재가를_한_번에_조회한다(self, client, session):
+        session.request.return_value = make_response([{"market": "KRW-BTC", "trade_price": 100.0}, {"market": "KRW-ETH", "trade_price": 10.0}])
+
+        prices = client.get_current_prices(["KRW-BTC", "KRW-ETH"])
+
+        assert prices == {"KRW-BTC": 100.0, "KRW-ETH": 10.0}
+        session.request.assert_called_once()
+        assert session.request.call_args.kwargs["params"] == {"markets": "KRW-BTC,KRW-ETH"}
+
+
+class TestUpbitClientAuth:
+    def test_주문_본문의_query_hash로_서명한다(self, client, session):
+        session.request.return_value = make_response({"uuid": "abc"})
+
+        client.buy_market_order("KRW-BTC", 5000)
+
+        body = session.request.call_args.kwargs["json"]
+        token = session.request.call_args.kwargs["headers"]["Authorization"].removeprefix("Bearer ")
+        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS512"])
+
+        assert body == {"market": "KRW-BTC", "side": "bid", "price": "5000", "ord_type": "price"}
+        assert payload["access_key"] == "access"
+        assert payload["query_hash"] == hashlib.sha512(urlencode(body).encode()).hexdigest()
+        assert payload["query_hash_alg"] == "SHA512"
+
+    def test_쿼리가_없으면_query_hash를_넣지_않는다(self, client, session):
+        session.request.return_value = make_response([])
+
+        client.get_balances()
+
+        token = session.request.call_args.kwargs["headers"]["Authorization"].removeprefix("Bearer ")
+        assert "query_hash" not in jwt.decode(token, SECRET_KEY, algorithms=["HS512"])
+
+    def test_배열_쿼리는_대괄호를_인코딩하지_않고_서명한다(self, client, session):
+        session.request.return_value = make_response([])
+
+        client.get_orders(["a", "b"])
+
+        token = session.request.call_args.kwargs["headers"]["Authorization"].removeprefix("Bearer ")
+        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS512"])
+
+        assert session.request.call_args.kwargs["params"] == {"uuids[]": ["a", "b"]}
+        assert payload["query_hash"] == hashlib.sha512(b"uuids[]=a&uuids[]=b").hexdigest()
+
+    def test_키가_없으면_거래_API를_호출할_수_없다(self, session):
+        with pytest.raises(ValueError):
+            UpbitClient(session=session).get_balances()
+
+    def test_4xx_에러_본문을_그대로_반환한다(self, client, session):
+        error = {"error": {"name": "insufficient_funds_bid", "message": "주문가능한 금액(KRW)이 부족합니다."}}
+        session.request.return_value = make_response(error, status_code=400)
+
+        assert client.buy_market_order("KRW-BTC", 5000) == error
+
+
+class TestUpbitClientBalance:
+    def test_get_balance는_마켓_ID의_통화_잔고를_반환한다(self, client, session):
+        session.request.return_value = make_response(
+            [
+                {"currency": "KRW", "unit_currency": "KRW", "balance": "10000.0"},
+                {"currency": "BTC", "unit_currency": "KRW", "balance": "0.5"},
+            ]
+        )
+
+        assert client.get_balance("KRW-BTC") == 0.5
+        assert client.get_balance("KRW") == 10000.0
+        assert client.get_balance("ETH") == 0.0
+
+
+class TestUpbitClientOhlcv:
+    def test_200개_초과_요청은_to_커서로_이어서_조회한다(self, client, session):
+        first = [make_candle(f"2025-01-0{day}T09:00:00", f"2025-01-0{day}T00:00:00", 100.0 * day) for day in (9, 8)]
+        second = [make_candle("2025-01-07T09:00:00", "2025-01-07T00:00:00", 700.0)]
+        session.request.side_effect = [make_response(first), make_response(second)]
+
+        df = client.get_ohlcv("KRW-BTC", interval="day", count=202, to=datetime.datetime(2025, 1, 10))
+
+        assert session.request.call_args_list[0].kwargs["params"]["to"] == "2025-01-10 00:00:00"
+        assert session.request.call_args_list[0].kwargs["params"]["count"] == 200
+        assert session.request.call_args_list[1].kwargs["params"]["to"] == "2025-01-08 00:00:00"
+        assert session.request.call_args_list[1].kwargs["params"]["count"] == 2
+        assert list(df.index.strftime("%Y-%m-%d")) == ["2025-01-07", "2025-01-08", "2025-01-09"]
+        CandleSchema.validate(df)
+
+    def test_조회_실패시_None_반환(self, client, session):
+        session.request.side_effect = ConnectionError()
+
+        assert client.get_ohlcv("KRW-BTC") is None
+
+
+class TestUpbitClientRateLimit:
+    def test_Remaining_Req_헤더로_그룹_버킷을_갱신한다(self, client, session):
+        session.request.return_value = make_response([{"market": "KRW-BTC", "trade_price": 100.0}], headers={"Remaining-Req": "group=ticker; min=600; sec=0"})
+
+        client.get_current_price("KRW-BTC")
+
+        assert client.rate_limiter.bucket("ticker").tokens < 1
+
+    def test_주문은_order_그룹으로_제한한다(self, client, session):
+        session.request.return_value = make_response({"uuid": "abc"})
+
+        client.sell_market_order("KRW-BTC", 0.1)
+
+        assert client.rate_limiter.bucket("order").tokens < 8
+
+    @pytest.fixture
+    def rate_limiter(self):
+        rate_limiter = MagicMock(spec=UpbitRateLimiter)
+        rate_limiter.group_for.return_value = "order"
+        return rate_limiter
+
+    def test_429_응답이면_제한기를_거쳐_새로_서명해서_다시_보낸다(self, session, rate_limiter):
+        client = UpbitClient("access", SECRET_KEY, session=session, rate_limiter=rate_limiter)
+        session.request.side_effect = [make_response({"error": {"name": "too_many_requests"}}, status_code=429), make_response({"uuid": "abc"})]
+
+        assert client.buy_market_order("KRW-BTC", 5000) == {"uuid": "abc"}
+
+        assert rate_limiter.acquire.call_count == 2
+        assert [call.args[1] for call in rate_limiter.update.call_args_list] == [429, 200]
+        nonces = [jwt.decode(call.kwargs["headers"]["Authorization"].removeprefix("Bearer "), SECRET_KEY, algorithms=["HS512"])["nonce"] for call in session.request.call_args_list]
+        assert nonces[0] != nonces[1]
+
+    def test_429가_계속되면_최대_횟수만큼만_다시_보낸다(self, session, rate_limiter):
+        client = UpbitClient("access", SECRET_KEY, session=session, rate_limiter=rate_limiter)
+        session.request.return_value = make_response({"error": {"name": "too_many_requests"}}, status_code=429)
+
+        assert client.get_order("abc") == {"error": {"name": "too_many_requests"}}
+        assert session.request.call_count == MAX_RATE_LIMIT_RETRIES + 1
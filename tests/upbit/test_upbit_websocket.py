@@ -0,0 +1,224 @@
+"""업비트 실시간 시세 피드 테스트"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from websockets.asyncio.server import serve
+
+from src.common.metrics import InMemoryMetricsSink
+from src.upbit.model.order import OrderState
+from src.upbit.upbit_api import UpbitAPI
+from src.upbit.upbit_websocket import LastPriceTable, PriceTick, UpbitOrderStream, UpbitTickerFeed
+
+
+def ticker_message(ticker: str, price: float, trade_timestamp: int, stream_type: str = "ticker") -> str:
+    return json.dumps({"type": stream_type, "code": ticker, "trade_price": price, "trade_timestamp": trade_timestamp})
+
+
+class FakeUpbitServer:
+    """구독 메시지를 받으면 준비된 체결 메시지를 보내고 연결을 끊는 로컬 WebSocket 서버"""
+
+    def __init__(self, messages_per_connection: list[list[str]]) -> None:
+        self.messages_per_connection = messages_per_connection
+        self.subscriptions: list[list[dict]] = []
+        self.request_headers: list = []
+        self.port = 0
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "FakeUpbitServer":
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(5)
+
+    def _run(self) -> None:
+        self._loop.run_until_complete(self._serve())
+
+    async def _serve(self) -> None:
+        self._stop = asyncio.Event()
+        async with serve(self._handler, "127.0.0.1", 0) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._started.set()
+            await self._stop.wait()
+
+    async def _handler(self, connection) -> None:
+        self.request_headers.append(connection.request.headers)
+        self.subscriptions.append(json.loads(await connection.recv()))
+        index = len(self.subscriptions) - 1
+        messages = self.messages_per_connection[index] if index < len(self.messages_per_connection) else []
+
+        for message in messages:
+            await connection.send(message.encode())
+
+        if index < len(self.messages_per_connection) - 1:
+            return  # 연결 끊김
+        await self._stop.wait()
+
+
+def order_message(order_uuid: str, state: str) -> str:
+    return json.dumps({"type": "myOrder", "code": "KRW-BTC", "uuid": order_uuid, "state": state})
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestLastPriceTable:
+    def test_오래된_가격은_None을_반환한다(self):
+        table = LastPriceTable()
+        table.update(PriceTick("KRW-BTC", 100.0, 1, time.monotonic() - 20))
+
+        assert table.get("KRW-BTC", max_age=10) is None
+        assert table.get("KRW-BTC", max_age=30) == 100.0
+        assert table.age("KRW-BTC") == pytest.approx(20, abs=1)
+
+    def test_더_오래된_체결로는_덮어쓰지_않는다(self):
+        table = LastPriceTable()
+        table.update(PriceTick("KRW-BTC", 101.0, 2, time.monotonic()))
+        table.update(PriceTick("KRW-BTC", 100.0, 1, time.monotonic()))
+
+        assert table.get("KRW-BTC") == 101.0
+
+    def test_수신_전이면_None을_반환한다(self):
+        assert LastPriceTable().get("KRW-BTC") is None
+
+
+class TestUpbitTickerFeed:
+    def test_상태_메시지와_에러는_무시한다(self):
+        feed = UpbitTickerFeed(["KRW-BTC"])
+
+        feed._handle_message(json.dumps({"status": "UP"}))
+        feed._handle_message(json.dumps({"error": {"name": "INVALID_AUTH", "message": "..."}}))
+
+        assert feed.price("KRW-BTC") is None
+        assert feed.last_message_age() is not None
+
+    def test_ticker와_trade_스트림을_구독하고_체결가를_기록한다(self):
+        with FakeUpbitServer([[ticker_message("KRW-BTC", 100.0, 1), ticker_message("KRW-ETH", 10.0, 1, "trade")]]) as server:
+            feed = UpbitTickerFeed(["KRW-BTC", "KRW-ETH"], url=server.url)
+            feed.start()
+            try:
+                assert wait_until(lambda: feed.price("KRW-ETH") is not None)
+                assert feed.price("KRW-BTC") == 100.0
+                assert feed.connected
+            finally:
+                feed.stop()
+
+        subscription = server.subscriptions[0]
+        assert [stream["type"] for stream in subscription[1:-1]] == ["ticker", "trade"]
+        assert subscription[1]["codes"] == ["KRW-BTC", "KRW-ETH"]
+        assert not feed.connected
+
+    def test_연결이_끊기면_백오프_후_재연결한다(self):
+        metrics = InMemoryMetricsSink()
+        messages = [[ticker_message("KRW-BTC", 100.0, 1)], [ticker_message("KRW-BTC", 101.0, 2)]]
+
+        with FakeUpbitServer(messages) as server:
+            feed = UpbitTickerFeed(["KRW-BTC"], url=server.url, metrics_sink=metrics, initial_reconnect_delay=0.01)
+            feed.start()
+            try:
+                assert wait_until(lambda: feed.price("KRW-BTC") == 101.0)
+            finally:
+                feed.stop()
+
+        assert len(server.subscriptions) == 2
+        assert feed.connections == 2
+        assert metrics.counter("ws.reconnect") >= 1
+
+    def test_JSON이_아닌_메시지는_버리고_연결을_유지한다(self):
+        metrics = InMemoryMetricsSink()
+
+        with FakeUpbitServer([["not json", ticker_message("KRW-BTC", 100.0, 1)]]) as server:
+            feed = UpbitTickerFeed(["KRW-BTC"], url=server.url, metrics_sink=metrics)
+            feed.start()
+            try:
+                assert wait_until(lambda: feed.price("KRW-BTC") == 100.0)
+                assert feed.connections == 1
+            finally:
+                feed.stop()
+
+        assert metrics.counter("ws.message_error", stream="ticker") == 1
+
+
+class TestUpbitOrderStream:
+    def test_완료_이벤트가_오면_future를_완료한다(self):
+        stream = UpbitOrderStream("access", "secret")
+        future = stream.watch("order-1")
+
+        stream._handle_message(order_message("order-1", "trade"))
+        assert not future.done()
+
+        stream._handle_message(order_message("order-1", "done"))
+        assert future.result(timeout=0) == OrderState.DONE
+
+    def test_watch_전에_도착한_완료_이벤트도_전달한다(self):
+        """시장가 주문은 주문 응답보다 체결 이벤트가 먼저 올 수 있다"""
+        stream = UpbitOrderStream("access", "secret")
+
+        stream._handle_message(order_message("order-1", "cancel"))
+
+        assert stream.watch("order-1").result(timeout=0) == OrderState.CANCEL
+
+    def test_인증_헤더로_myOrder를_구독한다(self):
+        secret_key = "s" * 64
+        with FakeUpbitServer([[order_message("order-1", "done")]]) as server:
+            stream = UpbitOrderStream("access", secret_key, url=server.url)
+            future = stream.watch("order-1")
+            stream.start()
+            try:
+                assert future.result(timeout=5) == OrderState.DONE
+            finally:
+                stream.stop()
+
+        token = server.request_headers[0]["Authorization"].removeprefix("Bearer ")
+        assert jwt.decode(token, secret_key, algorithms=["HS512"])["access_key"] == "access"
+        assert server.subscriptions[0][1] == {"type": "myOrder"}
+
+
+class TestUpbitAPIPriceFeed:
+    @pytest.fixture
+    def price_feed(self):
+        feed = MagicMock(spec=UpbitTickerFeed)
+        with patch.object(UpbitAPI, "price_feed", feed):
+            yield feed
+
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_price")
+    def test_피드에_가격이_있으면_REST를_호출하지_않는다(self, mock_get_current_price, price_feed):
+        price_feed.price.return_value = 100.0
+
+        assert UpbitAPI.get_current_price("KRW-BTC") == 100.0
+        mock_get_current_price.assert_not_called()
+
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_price")
+    def test_피드_가격이_오래되었으면_REST로_조회한다(self, mock_get_current_price, price_feed):
+        price_feed.price.return_value = None
+        mock_get_current_price.return_value = 99.0
+
+        assert UpbitAPI.get_current_price("KRW-BTC") == 99.0
+
+    @patch("src.upbit.upbit_api.UpbitAPI.quotation_client.get_current_prices")
+    def test_get_current_prices는_피드에_없는_티커만_REST로_조회한다(self, mock_get_current_prices, price_feed):
+        price_feed.price.side_effect = lambda ticker: {"KRW-BTC": 100.0}.get(ticker)
+        mock_get_current_prices.return_value = {"KRW-ETH": 10.0}
+
+        assert UpbitAPI.get_current_prices(["KRW-BTC", "KRW-ETH"]) == {"KRW-BTC": 100.0, "KRW-ETH": 10.0}
+        mock_get_current_prices.assert_called_once_with(["KRW-ETH"])